@@ -60,6 +60,44 @@ options:
         - mutually exclusive with C(merge_type)
         default: False
         type: bool
+    server_side_apply:
+        description:
+        - When set, the object is applied with server-side apply, after a metadata-only read of the live object,
+          instead of being read whole, compared and patched.
+        - C(changed) is determined from metadata before and after the apply. The object is changed, if it did not
+          exist, or the apply changed the C(managedFields) entry of I(field_manager) or the C(generation) of the
+          object. Status writes of controllers (e.g. of a rollout or autoscaler) do not count as changes.
+        - mutually exclusive with C(apply), C(merge_type) and C(force)
+        - Ignored when I(state=absent).
+        type: dict
+        version_added: 1.1.0
+        suboptions:
+            field_manager:
+                description:
+                - Name of the manager, used to track field ownership.
+                type: str
+                default: sodalite.k8s
+            force_conflicts:
+                description:
+                - If set to C(yes), fields, owned by other managers, are taken over on conflict.
+                - If set to C(no), the request fails on conflicts.
+                type: bool
+                default: False
+    spec_hash:
+        description:
+        - If set to C(yes), hash of the object, built from module params, is stored in the
+          C(sodalite.k8s/spec-hash) annotation.
+        - When the live object carries the same hash, only its metadata is read and no write is made. C(method) is
+          set to C(skip) in this case.
+        - Changes, made to the object outside of this collection, are not detected, when hashes match. Use
+          I(force=yes) to write the object regardless of the hash.
+        - Ignored when I(state=absent).
+        - Without I(spec_hash), the whole live object is read and the write is skipped as well, when the object
+          already contains the definition, completed with server-side defaults. This does not apply to I(force=yes),
+          I(apply=yes) and I(merge_type=json).
+        type: bool
+        default: False
+        version_added: 1.1.0
 requirements:
   - "python >= 3.6"
   - "kubernetes >= 12.0.0"
@@ -0,0 +1,862 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    DOCUMENTATION = r'''
+options:
+    containers:
+        description:
+        - List of containers belonging to the pod.
+        - There must be at least one container in a Pod.
+        - Required with I(state=present).
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                - Name of the container specified as a DNS_LABEL.
+                - Each container in a pod must have a unique name (DNS_LABEL).
+                - Cannot be updated.
+                type: str
+                required: true
+            image:
+                description:
+                - Docker image name.
+                -  This field is optional to allow higher level config management to default or override
+                   container images.
+                - More info U(https://kubernetes.io/docs/concepts/containers/images)
+                type: str
+            image_pull_policy:
+                description:
+                - Image pull policy.
+                - Defaults to Always if :latest tag is specified, or IfNotPresent otherwise.
+                - Cannot be updated.
+                - More info U(https://kubernetes.io/docs/concepts/containers/images#updating-images)
+                type: str
+                choices: [ Always, Never, IfNotPresent ]
+            command:
+                description:
+                - Entrypoint array.
+                - Not executed within a shell.
+                - The docker image's ENTRYPOINT is used if this is not provided.
+                - Variable references $(VAR_NAME) are expanded using the container's environment.
+                - If a variable cannot be resolved, the reference in the input string will be unchanged.
+                - The $(VAR_NAME) syntax can be escaped with a double $$, ie $$(VAR_NAME).
+                - Escaped references will never be expanded, regardless of whether the variable exists or not.
+                - Cannot be updated.
+                - More info U(https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell)
+                type: list
+                elements: str
+            args:
+                description:
+                - Arguments to the entrypoint.
+                - The docker image's CMD is used if this is not provided.
+                - Variable references $(VAR_NAME) are expanded using the container's environment.
+                - If a variable cannot be resolved, the reference in the input string will be unchanged.
+                - The $(VAR_NAME) syntax can be escaped with a double $$, ie $$(VAR_NAME).
+                - Escaped references will never be expanded, regardless of whether the variable exists or not.
+                - Cannot be updated.
+                - More info U(https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell)
+                type: list
+                elements: str
+            working_dir:
+                description:
+                - Container's working directory.
+                - If not specified, the container runtime's default will be used, which might be configured in the
+                  container image.
+                - Cannot be updated.
+                type: str
+                aliases: [ workdir ]
+            ports:
+                description:
+                - List of ports to expose from the container.
+                - Exposing a port here gives the system additional information about the network connections a
+                  container uses, but is primarily informational.
+                - Not specifying a port here DOES NOT prevent that port from being exposed.
+                - Any port which is listening on the default "0.0.0.0" address inside a container will be accessible
+                  from the network.
+                - Cannot be updated.
+                type: list
+                elements: dict
+                suboptions:
+                    container_port:
+                        description:
+                        - Number of port to expose on the pod's IP address.
+                        - This must be a valid port number, 0 < x < 65536.
+                        type: int
+                        required: true
+                    host_ip:
+                        description:
+                        - What host IP to bind the external port to.
+                        type: str
+                    host_port:
+                        description:
+                        - Number of port to expose on the host.
+                        - If specified, this must be a valid port number, 0 < x < 65536.
+                        type: int
+                    name:
+                        description:
+                        - If specified, this must be an IANA_SVC_NAME and unique within the pod.
+                        - Each named port in a pod must have a unique name.
+                        - Name for the port that can be referred to by services.
+                        type: str
+                    protocol:
+                        description:
+                        - Protocol for port.
+                        type: str
+                        default: TCP
+                        choices: [ UDP, TCP, SCTP ]
+            env:
+                description:
+                - List of environment variables to set in the container.
+                - Cannot be updated.
+                type: list
+                elements: dict
+                suboptions:
+                    name:
+                        description:
+                        - Name of the environment variable.
+                        - Must be a C_IDENTIFIER.
+                        type: str
+                        required: true
+                    value:
+                        description:
+                        - Variable references $(VAR_NAME) are expanded using the previous defined environment variables
+                          in the container and any service environment variables.
+                        - If a variable cannot be resolved, the reference in the input string will be unchanged.
+                        - The $(VAR_NAME) syntax can be escaped with a double $$, ie $$(VAR_NAME).
+                        - Escaped references will never be expanded, regardless of whether the variable exists or not.
+                        type: str
+                    config_map:
+                        description:
+                        - Selects a key of a ConfigMap.
+                        type: dict
+                        suboptions:
+                            key:
+                                description:
+                                - The key to select.
+                                type: str
+                                required: true
+                            name:
+                                description:
+                                - Name of the referent.
+                                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
+                                type: str
+                            optional:
+                                description:
+                                - Specify whether the ConfigMap or its key must be defined.
+                                type: bool
+                    secret:
+                        description:
+                        - Selects a key of a secret in the pod's namespace.
+                        type: dict
+                        suboptions:
+                            key:
+                                description:
+                                - The key of the secret to select from.
+                                - Must be a valid secret key.
+                                type: str
+                                required: true
+                            name:
+                                description:
+                                - Name of the referent.
+                                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
+                                type: str
+                            optional:
+                                description:
+                                - Specify whether the Secret or its key must be defined.
+                                type: bool
+            env_from:
+                description:
+                - List of sources to populate environment variables in the container.
+                - The keys defined within a source must be a C_IDENTIFIER.
+                - All invalid keys will be reported as an event when the container is starting.
+                - When a key exists in multiple sources, the value associated with the last source will take precedence.
+                - Values defined by an Env with a duplicate key will take precedence.
+                - Cannot be updated.
+                type: list
+                elements: dict
+                suboptions:
+                    config_map:
+                        description:
+                        - The ConfigMap to select from.
+                        - The contents of the target ConfigMap's Data field will represent the key-value pairs as
+                          environment variables.
+                        type: dict
+                        suboptions:
+                            name:
+                                description:
+                                - Name of the referent.
+                                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
+                                type: str
+                                required: true
+                            optional:
+                                description:
+                                - Specify whether the ConfigMap must be defined.
+                                type: bool
+                    prefix:
+                        description:
+                        - An optional identifier to prepend to each key in the ConfigMap.
+                        - Must be a C_IDENTIFIER.
+                        type: str
+                    secret:
+                        description:
+                        - The Secret to select from.
+                        - The contents of the target Secret's Data field will represent the key-value pairs as
+                          environment variables.
+                        type: dict
+                        suboptions:
+                            name:
+                                description:
+                                - Name of the referent.
+                                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
+                                type: str
+                                required: true
+                            optional:
+                                description:
+                                - Specify whether the Secret must be defined.
+                                type: bool
+            volume_mounts:
+                description:
+                - Pod volumes to mount into the container's filesystem.
+                - Each VolumeMount describes a mounting of a Volume within a container.
+                - Cannot be updated.
+                type: list
+                elements: dict
+                suboptions:
+                    path:
+                        description:
+                        - Path within the container at which the volume should be mounted.
+                        - Must not contain ':'.
+                        type: str
+                        required: true
+                    name:
+                        description:
+                        - This must match the Name of a Volume.
+                        type: str
+                        required: true
+                    propagation:
+                        description:
+                        - determines how mounts are propagated from the host to container and the other way around.
+                        - More info U(https://kubernetes.io/docs/concepts/storage/volumes/#mount-propagation)
+                        type: str
+                        default: "None"
+                        choices: [None, HostToContainer, Bidirectional]
+                    read_only:
+                        description:
+                        - Mounted read-only if true, read-write otherwise (false or unspecified).
+                        type: bool
+                        default: false
+                    sub_path:
+                        description:
+                        - Path within the volume from which the container's volume should be mounted.
+                        - "\"\" means volume's root."
+                        type: str
+                    sub_path_expr:
+                        description:
+                        - Expanded path within the volume from which the container's volume should be mounted.
+                        - Behaves similarly to I(sub_path) but environment variable references $(VAR_NAME) are expanded
+                          using the container's environment.
+                        - "\"\" means volume's root."
+                        - I(sub_path_expr) and I(sub_path) are mutually exclusive.
+                        type: str
+            volume_devices:
+                description:
+                - The list of block devices to be used by the container.
+                - Each element describes a mapping of a raw block device within a container.
+                type: list
+                elements: dict
+                suboptions:
+                    path:
+                        description:
+                        - Path inside of the container that the device will be mapped to.
+                        type: str
+                        required: true
+                    name:
+                        description:
+                        - I(name) must match the name of a persistentVolumeClaim (pvc) in the pod.
+                        type: str
+                        required: true
+            resource_limits:
+                description:
+                - Limits describes the maximum amount of compute resources allowed.
+                - Dict of resource name to Quantity. Names are standard resources (C(cpu), C(memory),
+                  C(ephemeral-storage), C(hugepages-<size>), e.g. C(hugepages-2Mi)) or extended resources, qualified
+                  with a domain outside of C(kubernetes.io) (e.g. C(nvidia.com/gpu)). Any resource name is accepted
+                  since version 1.1.0, before only C(cpu) and C(memory).
+                - Containers with hugepages must also limit or request C(cpu) or C(memory).
+                - Quantities are stored in canonical form, like the API server does (e.g. C(1024Mi) as C(1Gi)), so
+                  equivalent values do not cause updates.
+                - More info U(https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/)
+                type: dict
+            resource_requests:
+                description:
+                - Requests describes the minimum amount of compute resources required.
+                - Dict of resource name to Quantity, with the same resource names as I(resource_limits).
+                - If I(resource_requests) is omitted for a container, it defaults to I(resource_limits) if that is
+                  explicitly specified, otherwise to an implementation-defined value.
+                - Requests must not exceed I(resource_limits).
+                - Hugepages and extended resources can not be overcommitted, their requests must be equal to
+                  I(resource_limits).
+                - Quantities are stored in canonical form, like the API server does (e.g. C(0.5) as C(500m)).
+                - More info U(https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/)
+                type: dict
+            readiness_probe:
+                description:
+                - Periodic probe of container service readiness.
+                - Container will be removed from service endpoints if the probe fails, and rolling updates wait for it
+                  to succeed.
+                - I(termination_grace_period_seconds) must not be set.
+                - More info U(https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes)
+                type: dict
+                version_added: 1.1.0
+                suboptions:
+                    http_get:
+                        description:
+                        - HTTP GET request to perform, the probe succeeds with status code 200 <= x < 400.
+                        - Exactly one of I(http_get), I(tcp_socket), I(exec) and I(grpc) must be present.
+                        type: dict
+                        suboptions:
+                            path:
+                                description:
+                                - Path to access on the HTTP server.
+                                - Defaults to C(/) on the server.
+                                type: str
+                            port:
+                                description:
+                                - Number or name of the port to access on the container.
+                                - Name must match the name of a port in I(ports) of the container.
+                                type: str
+                                required: true
+                            host:
+                                description:
+                                - Host name to connect to, defaults to the pod IP.
+                                type: str
+                            scheme:
+                                description:
+                                - Scheme to use for connecting to the host.
+                                type: str
+                                choices: [HTTP, HTTPS]
+                                default: HTTP
+                            http_headers:
+                                description:
+                                - Custom headers to set in the request.
+                                type: list
+                                elements: dict
+                                suboptions:
+                                    name:
+                                        description:
+                                        - Header field name.
+                                        type: str
+                                        required: true
+                                    value:
+                                        description:
+                                        - Header field value.
+                                        type: str
+                                        required: true
+                    tcp_socket:
+                        description:
+                        - TCP port to open, the probe succeeds, if the connection is established.
+                        type: dict
+                        suboptions:
+                            port:
+                                description:
+                                - Number or name of the port to access on the container.
+                                - Name must match the name of a port in I(ports) of the container.
+                                type: str
+                                required: true
+                            host:
+                                description:
+                                - Host name to connect to, defaults to the pod IP.
+                                type: str
+                    exec:
+                        description:
+                        - Command to execute in the container, the probe succeeds with exit status 0.
+                        type: dict
+                        suboptions:
+                            command:
+                                description:
+                                - Command line to execute inside the container, it is not run in a shell.
+                                type: list
+                                elements: str
+                                required: true
+                    grpc:
+                        description:
+                        - GRPC health check of the container.
+                        type: dict
+                        suboptions:
+                            port:
+                                description:
+                                - Port number of the gRPC service.
+                                type: int
+                                required: true
+                            service:
+                                description:
+                                - Name of the service to place in the gRPC HealthCheckRequest.
+                                type: str
+                    initial_delay_seconds:
+                        description:
+                        - Number of seconds after the container has started before the probe is initiated.
+                        type: int
+                    period_seconds:
+                        description:
+                        - How often (in seconds) to perform the probe.
+                        - Defaults to 10 seconds on the server.
+                        type: int
+                    timeout_seconds:
+                        description:
+                        - Number of seconds after which the probe times out.
+                        - Defaults to 1 second on the server.
+                        type: int
+                    success_threshold:
+                        description:
+                        - Minimum consecutive successes for the probe to be considered successful after having failed.
+                        - Defaults to 1 on the server.
+                        type: int
+                    failure_threshold:
+                        description:
+                        - Minimum consecutive failures for the probe to be considered failed after having succeeded.
+                        - Defaults to 3 on the server.
+                        type: int
+                    termination_grace_period_seconds:
+                        description:
+                        - Duration in seconds the pod needs to terminate gracefully upon probe failure.
+                        - Overrides the termination grace period of the pod for this probe.
+                        type: int
+            liveness_probe:
+                description:
+                - Periodic probe of container liveness.
+                - Container will be restarted if the probe fails.
+                - I(success_threshold) must be 1.
+                - More info U(https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes)
+                type: dict
+                version_added: 1.1.0
+                suboptions:
+                    http_get:
+                        description:
+                        - HTTP GET request to perform, the probe succeeds with status code 200 <= x < 400.
+                        - Exactly one of I(http_get), I(tcp_socket), I(exec) and I(grpc) must be present.
+                        type: dict
+                        suboptions:
+                            path:
+                                description:
+                                - Path to access on the HTTP server.
+                                - Defaults to C(/) on the server.
+                                type: str
+                            port:
+                                description:
+                                - Number or name of the port to access on the container.
+                                - Name must match the name of a port in I(ports) of the container.
+                                type: str
+                                required: true
+                            host:
+                                description:
+                                - Host name to connect to, defaults to the pod IP.
+                                type: str
+                            scheme:
+                                description:
+                                - Scheme to use for connecting to the host.
+                                type: str
+                                choices: [HTTP, HTTPS]
+                                default: HTTP
+                            http_headers:
+                                description:
+                                - Custom headers to set in the request.
+                                type: list
+                                elements: dict
+                                suboptions:
+                                    name:
+                                        description:
+                                        - Header field name.
+                                        type: str
+                                        required: true
+                                    value:
+                                        description:
+                                        - Header field value.
+                                        type: str
+                                        required: true
+                    tcp_socket:
+                        description:
+                        - TCP port to open, the probe succeeds, if the connection is established.
+                        type: dict
+                        suboptions:
+                            port:
+                                description:
+                                - Number or name of the port to access on the container.
+                                - Name must match the name of a port in I(ports) of the container.
+                                type: str
+                                required: true
+                            host:
+                                description:
+                                - Host name to connect to, defaults to the pod IP.
+                                type: str
+                    exec:
+                        description:
+                        - Command to execute in the container, the probe succeeds with exit status 0.
+                        type: dict
+                        suboptions:
+                            command:
+                                description:
+                                - Command line to execute inside the container, it is not run in a shell.
+                                type: list
+                                elements: str
+                                required: true
+                    grpc:
+                        description:
+                        - GRPC health check of the container.
+                        type: dict
+                        suboptions:
+                            port:
+                                description:
+                                - Port number of the gRPC service.
+                                type: int
+                                required: true
+                            service:
+                                description:
+                                - Name of the service to place in the gRPC HealthCheckRequest.
+                                type: str
+                    initial_delay_seconds:
+                        description:
+                        - Number of seconds after the container has started before the probe is initiated.
+                        type: int
+                    period_seconds:
+                        description:
+                        - How often (in seconds) to perform the probe.
+                        - Defaults to 10 seconds on the server.
+                        type: int
+                    timeout_seconds:
+                        description:
+                        - Number of seconds after which the probe times out.
+                        - Defaults to 1 second on the server.
+                        type: int
+                    success_threshold:
+                        description:
+                        - Minimum consecutive successes for the probe to be considered successful after having failed.
+                        - Defaults to 1 on the server.
+                        type: int
+                    failure_threshold:
+                        description:
+                        - Minimum consecutive failures for the probe to be considered failed after having succeeded.
+                        - Defaults to 3 on the server.
+                        type: int
+                    termination_grace_period_seconds:
+                        description:
+                        - Duration in seconds the pod needs to terminate gracefully upon probe failure.
+                        - Overrides the termination grace period of the pod for this probe.
+                        type: int
+            startup_probe:
+                description:
+                - Indicates that the pod has successfully initialized.
+                - Other probes are not run until it succeeds, container will be restarted if it fails, so
+                  slow-starting containers are not killed by I(liveness_probe).
+                - I(success_threshold) must be 1.
+                - More info U(https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes)
+                type: dict
+                version_added: 1.1.0
+                suboptions:
+                    http_get:
+                        description:
+                        - HTTP GET request to perform, the probe succeeds with status code 200 <= x < 400.
+                        - Exactly one of I(http_get), I(tcp_socket), I(exec) and I(grpc) must be present.
+                        type: dict
+                        suboptions:
+                            path:
+                                description:
+                                - Path to access on the HTTP server.
+                                - Defaults to C(/) on the server.
+                                type: str
+                            port:
+                                description:
+                                - Number or name of the port to access on the container.
+                                - Name must match the name of a port in I(ports) of the container.
+                                type: str
+                                required: true
+                            host:
+                                description:
+                                - Host name to connect to, defaults to the pod IP.
+                                type: str
+                            scheme:
+                                description:
+                                - Scheme to use for connecting to the host.
+                                type: str
+                                choices: [HTTP, HTTPS]
+                                default: HTTP
+                            http_headers:
+                                description:
+                                - Custom headers to set in the request.
+                                type: list
+                                elements: dict
+                                suboptions:
+                                    name:
+                                        description:
+                                        - Header field name.
+                                        type: str
+                                        required: true
+                                    value:
+                                        description:
+                                        - Header field value.
+                                        type: str
+                                        required: true
+                    tcp_socket:
+                        description:
+                        - TCP port to open, the probe succeeds, if the connection is established.
+                        type: dict
+                        suboptions:
+                            port:
+                                description:
+                                - Number or name of the port to access on the container.
+                                - Name must match the name of a port in I(ports) of the container.
+                                type: str
+                                required: true
+                            host:
+                                description:
+                                - Host name to connect to, defaults to the pod IP.
+                                type: str
+                    exec:
+                        description:
+                        - Command to execute in the container, the probe succeeds with exit status 0.
+                        type: dict
+                        suboptions:
+                            command:
+                                description:
+                                - Command line to execute inside the container, it is not run in a shell.
+                                type: list
+                                elements: str
+                                required: true
+                    grpc:
+                        description:
+                        - GRPC health check of the container.
+                        type: dict
+                        suboptions:
+                            port:
+                                description:
+                                - Port number of the gRPC service.
+                                type: int
+                                required: true
+                            service:
+                                description:
+                                - Name of the service to place in the gRPC HealthCheckRequest.
+                                type: str
+                    initial_delay_seconds:
+                        description:
+                        - Number of seconds after the container has started before the probe is initiated.
+                        type: int
+                    period_seconds:
+                        description:
+                        - How often (in seconds) to perform the probe.
+                        - Defaults to 10 seconds on the server.
+                        type: int
+                    timeout_seconds:
+                        description:
+                        - Number of seconds after which the probe times out.
+                        - Defaults to 1 second on the server.
+                        type: int
+                    success_threshold:
+                        description:
+                        - Minimum consecutive successes for the probe to be considered successful after having failed.
+                        - Defaults to 1 on the server.
+                        type: int
+                    failure_threshold:
+                        description:
+                        - Minimum consecutive failures for the probe to be considered failed after having succeeded.
+                        - Defaults to 3 on the server.
+                        type: int
+                    termination_grace_period_seconds:
+                        description:
+                        - Duration in seconds the pod needs to terminate gracefully upon probe failure.
+                        - Overrides the termination grace period of the pod for this probe.
+                        type: int
+    image_pull_secrets:
+        description:
+        - Optional list of references to secrets in the same namespace to use for pulling any of the images used by
+          the pod.
+        - If specified, these secrets will be passed to individual puller implementations for them to use.
+        - For example, in the case of docker, only C(DockerConfig) type secrets are honored.
+        - More info U(https://kubernetes.io/docs/concepts/containers/images#specifying-imagepullsecrets-on-a-pod)
+        type: list
+        elements: str
+    enable_service_links:
+        description:
+        - Indicates whether information about services should be injected into pod's environment variables, matching
+          the syntax of Docker links.
+        type: bool
+        default: true
+    volumes:
+        description:
+        - List of volumes that can be mounted by containers belonging to the pod.
+        - More info U(https://kubernetes.io/docs/concepts/storage/volumes)
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                - Volume's name. Must be a C(DNS_LABEL) and unique within the pod.
+                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
+                type: str
+                required: true
+            pvc:
+                description:
+                - A reference to a PersistentVolumeClaim (PVC) in the same namespace.
+                - This volume finds the bound PV and mounts that volume for the pod.
+                - It is, essentially, a wrapper around another type of volume that is owned by someone else
+                  (the system).
+                - More info U(https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims)
+                type: dict
+                suboptions:
+                    claim_name:
+                        description:
+                        - Name of a pvc in the same namespace as the pod using this volume.
+                        - More info U(https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims)
+                        type: str
+                        required: true
+                    read_only:
+                        description:
+                        - Will force the C(ReadOnly) setting in I(VolumeMounts).
+                        type: bool
+                        default: false
+            config_map:
+                description:
+                - Adapts a ConfigMap into a volume.
+                - The contents of the target ConfigMap's Data field will be presented in a volume as files using the
+                  keys in the C(Data) field as the file names, unless the items element is populated with specific
+                  mappings of keys to paths.
+                - ConfigMap volumes support ownership management and SELinux relabeling.
+                type: dict
+                suboptions:
+                    name:
+                        description:
+                        - Name of the referent.
+                        - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
+                        type: str
+                    optional:
+                        description:
+                        - Specify whether the ConfigMap or its keys must be defined.
+                        type: bool
+                    default_mode:
+                        description:
+                        - Mode bits used to set permissions on created files by default.
+                        - Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
+                        - Directories within the path are not affected by this setting.
+                        - This might be in conflict with other options that affect the file mode, like fsGroup, and
+                          the result can be other mode bits set.
+                        type: int
+                        default: 0644
+                    items:
+                        description:
+                        - If unspecified, each key-value pair in the Data field of the referenced ConfigMap will be
+                          projected into the volume as a file whose name is the key and content is the value.
+                        - If specified, the listed keys will be projected into the specified paths, and unlisted keys
+                          will not be present.
+                        - If a key is specified which is not present in the ConfigMap, the volume setup will error
+                          unless it is marked optional.
+                        - Paths must be relative and may not contain the '..' path or start with '..'.
+                        type: list
+                        elements: dict
+                        suboptions:
+                            key:
+                                description:
+                                - The key to project.
+                                type: str
+                                required: true
+                            path:
+                                description:
+                                - The relative path of the file to map the key to.
+                                - May not be an absolute path.
+                                - May not contain the path element '..'.
+                                - May not start with the string '..'.
+                                type: str
+                                required: true
+                            mode:
+                                description:
+                                - Mode bits used to set permissions on this file.
+                                - Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
+                                - If not specified, the volume I(default_mode) will be used.
+                                - This might be in conflict with other options that affect the file mode, like fsGroup,
+                                  and the result can be other mode bits set.
+                                type: int
+            secret:
+                description:
+                - Adapts a Secret into a volume.
+                - The contents of the target Secret's Data field will be presented in a volume as files using the
+                  keys in the C(Data) field as the file names, unless the items element is populated with specific
+                  mappings of keys to paths.
+                - Secret volumes support ownership management and SELinux relabeling.
+                type: dict
+                suboptions:
+                    name:
+                        description:
+                        - Name of the secret in the pod's namespace to use.
+                        - More info U(https://kubernetes.io/docs/concepts/storage/volumes#secret)
+                        type: str
+                    optional:
+                        description:
+                        - Specify whether the Secret or its keys must be defined.
+                        type: bool
+                    default_mode:
+                        description:
+                        - Mode bits used to set permissions on created files by default.
+                        - Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
+                        - Directories within the path are not affected by this setting.
+                        - This might be in conflict with other options that affect the file mode, like fsGroup, and
+                          the result can be other mode bits set.
+                        type: int
+                        default: 0644
+                    items:
+                        description:
+                        - If unspecified, each key-value pair in the Data field of the referenced Secret will be
+                          projected into the volume as a file whose name is the key and content is the value.
+                        - If specified, the listed keys will be projected into the specified paths, and unlisted keys
+                          will not be present.
+                        - If a key is specified which is not present in the Secret, the volume setup will error
+                          unless it is marked optional.
+                        - Paths must be relative and may not contain the '..' path or start with '..'.
+                        type: list
+                        elements: dict
+                        suboptions:
+                            key:
+                                description:
+                                - The key to project.
+                                type: str
+                                required: true
+                            path:
+                                description:
+                                - The relative path of the file to map the key to.
+                                - May not be an absolute path.
+                                - May not contain the path element '..'.
+                                - May not start with the string '..'.
+                                type: str
+                                required: true
+                            mode:
+                                description:
+                                - Mode bits used to set permissions on this file.
+                                - Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
+                                - If not specified, the volume I(default_mode) will be used.
+                                - This might be in conflict with other options that affect the file mode, like fsGroup,
+                                  and the result can be other mode bits set.
+                                type: int
+            empty_dir:
+                description:
+                - Temporary directory that shares a pod's lifetime.
+                - Only one of I(pvc), I(config_map), I(secret) and I(empty_dir) can be present.
+                - More info U(https://kubernetes.io/docs/concepts/storage/volumes#emptydir)
+                type: dict
+                version_added: 1.1.0
+                suboptions:
+                    medium:
+                        description:
+                        - What type of storage medium should back this directory.
+                        - The default C('') uses the node's default medium, C(Memory) a tmpfs.
+                        - C(HugePages) and C(HugePages-<size>) back the directory with pre-allocated huge pages, that
+                          containers must request in I(resource_limits) (e.g. C(hugepages-2Mi)). When containers
+                          use several sizes of huge pages, the size must be given in the medium.
+                        - More info U(https://kubernetes.io/docs/tasks/manage-hugepages/scheduling-hugepages/)
+                        type: str
+                        choices: ['', Memory, HugePages, HugePages-2Mi, HugePages-1Gi]
+                        default: ''
+                    size_limit:
+                        description:
+                        - Total amount of local storage required for this volume, as a Quantity.
+                        type: str
+'''
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    DOCUMENTATION = r'''
+options:
+    timings:
+        description:
+        - If set to C(yes), result holds C(timings) with durations of module phases (argspec parsing, definition,
+          validation, client construction, discovery, write and wait), number of HTTP requests and bytes sent and
+          received.
+        type: bool
+        default: False
+        version_added: 1.1.0
+'''
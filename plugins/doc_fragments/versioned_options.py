@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    DOCUMENTATION = r'''
+options:
+    versioned:
+        description:
+        - If set to C(yes), the object is created as an immutable version. Hash of its content (C(type), C(data),
+          C(binary_data) and C(string_data)) is appended to I(name) and C(immutable) is set.
+        - The generated name is returned in C(name), so other objects (e.g. Deployments) can refer to it. A change of
+          content creates a new object, unchanged content never triggers a write.
+        - Versions are labeled with C(sodalite.k8s/versioned-name=<name>), so I(name) must be no more than 63
+          characters.
+        - With I(state=absent), only the version with the given content is deleted.
+        type: bool
+        default: False
+        version_added: 1.1.0
+    keep_versions:
+        description:
+        - Number of newest versions, including the current one, that are kept when I(versioned=yes). Older versions
+          are deleted, after the current one is applied.
+        - Keep enough versions for pods of previous ReplicaSets, which may still refer to them.
+        type: int
+        default: 3
+        version_added: 1.1.0
+'''
@@ -39,6 +39,17 @@ UPDATE_ARG_SPEC = dict(
     apply=dict(
         type='bool',
         default=False
+    ),
+    server_side_apply=dict(
+        type='dict',
+        options=dict(
+            field_manager=dict(type='str', default='sodalite.k8s'),
+            force_conflicts=dict(type='bool', default=False)
+        )
+    ),
+    spec_hash=dict(
+        type='bool',
+        default=False
     )
 )
 
@@ -47,12 +58,22 @@ METADATA_ARG_SPEC = dict(
     annotations=dict(type='dict')
 )
 
+VERSIONED_ARG_SPEC = dict(
+    versioned=dict(type='bool', default=False),
+    keep_versions=dict(type='int', default=3)
+)
+
+TIMINGS_ARG_SPEC = dict(
+    timings=dict(type='bool', default=False)
+)
+
 
 def common_arg_spec():
     argument_spec = copy.deepcopy(COMMON_ARG_SPEC)
     argument_spec.update(copy.deepcopy(AUTH_ARG_SPEC))
     argument_spec.update(copy.deepcopy(WAIT_ARG_SPEC))
     argument_spec.update(copy.deepcopy(METADATA_ARG_SPEC))
+    argument_spec.update(copy.deepcopy(TIMINGS_ARG_SPEC))
     argument_spec['delete_options'] = dict(type='dict', default=None, options=copy.deepcopy(DELETE_OPTS_ARG_SPEC))
     return argument_spec
 
@@ -64,5 +85,8 @@ def update_arg_spec():
 
 
 UPDATE_MUTUALLY_EXCLUSIVE = [
-    ('merge_type', 'apply')
+    ('merge_type', 'apply'),
+    ('server_side_apply', 'apply'),
+    ('server_side_apply', 'merge_type'),
+    ('server_side_apply', 'force')
 ]
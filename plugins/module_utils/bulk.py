@@ -0,0 +1,49 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class ItemFailed(Exception):
+    pass
+
+
+class ItemExited(Exception):
+    """
+    Raised by exit_json of ItemModule, ends applying the item with result.
+    """
+
+    def __init__(self, result):
+        super(ItemExited, self).__init__("Item exited")
+        self.result = result
+
+
+class DefinitionError(Exception):
+    """
+    Raised by definition(), when params can not be turned into a definition, e.g. source files can not be read.
+    """
+
+
+class ItemModule:
+    """
+    Stands in for AnsibleModule of a single item, applied by a bulk module.
+    fail_json and exit_json raise ItemFailed and ItemExited, instead of exiting the process.
+    """
+
+    def __init__(self, module, argument_spec, params):
+        self.argument_spec = argument_spec
+        self.params = params
+        self.check_mode = module.check_mode
+        # K8sAnsibleMixin reads _diff directly, when it builds diffs of updates
+        self._diff = module._diff
+        self.warnings = list()
+        self.deprecate = module.deprecate
+        self.debug = module.debug
+
+    def fail_json(self, msg, **kwargs):
+        raise ItemFailed(msg)
+
+    def exit_json(self, **kwargs):
+        raise ItemExited(kwargs)
+
+    def warn(self, warning):
+        self.warnings.append(warning)
@@ -3,9 +3,18 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import base64
+import binascii
+import functools
 import re
 import ipaddress
 
+try:
+    binascii.a2b_base64(b'', strict_mode=True)
+    HAS_STRICT_BASE64 = True
+except TypeError:
+    # strict_mode was added in Python 3.11
+    HAS_STRICT_BASE64 = False
+
 
 class Base64:
 
@@ -17,12 +26,62 @@ class Base64:
     def decode(message):
         return base64.b64decode(message.encode('ascii')).decode('ascii')
 
+    # encoded bytes, validated at once; a multiple of 4, so only the last chunk may carry padding
+    chunk_size = 64 * 1024
+    chunk_pattern = re.compile(rb'[A-Za-z0-9+/]*')
+    last_chunk_pattern = re.compile(rb'[A-Za-z0-9+/]*={0,2}')
+
+    @staticmethod
+    def decoded_size(message):
+        """
+        Returns length of data, encoded in message (str or bytes), without decoding it.
+        """
+        tail = message[-2:]
+        if isinstance(tail, memoryview):
+            tail = tail.tobytes()
+        return len(message) // 4 * 3 - tail.count('=' if isinstance(tail, str) else b'=')
+
+    @staticmethod
+    def validate_chunk(chunk, last):
+        """
+        Validates chunk of encoded bytes (bytes or memoryview), decoded data is dropped right away.
+        """
+        if HAS_STRICT_BASE64:
+            if not last and chunk[-1:] == b'=':
+                return False
+            try:
+                binascii.a2b_base64(chunk, strict_mode=True)
+                return True
+            except binascii.Error:
+                return False
+        # Python < 3.11: the same strict alphabet and padding rules, checked with a pattern
+        return bool((Base64.last_chunk_pattern if last else Base64.chunk_pattern).fullmatch(chunk))
+
     @staticmethod
     def validate(message):
-        try:
-            return Base64.encode(Base64.decode(message)) == message
-        except Exception:
+        """
+        Checks, that message (str or bytes) is strict Base64 (no whitespace, correct padding) of arbitrary binary data.
+        Message is validated in chunks of chunk_size without copying it as a whole, so peak memory stays at about
+        chunk_size, regardless of the length of the message.
+        """
+        if isinstance(message, str):
+            view = message
+        elif isinstance(message, (bytes, bytearray, memoryview)):
+            view = memoryview(message).cast('B')
+        else:
             return False
+        if len(view) % 4:
+            return False
+        for offset in range(0, len(view), Base64.chunk_size):
+            chunk = view[offset:offset + Base64.chunk_size]
+            if isinstance(chunk, str):
+                try:
+                    chunk = chunk.encode('ascii')
+                except UnicodeEncodeError:
+                    return False
+            if not Base64.validate_chunk(chunk, offset + Base64.chunk_size >= len(view)):
+                return False
+        return True
 
 
 class Marshalling:
@@ -39,15 +98,127 @@ class Marshalling:
         return data
 
 
+@functools.total_ordering
+class Quantity:
+    """
+    Kubernetes resource quantity (e.g. '500m', '1.5Gi', '1e3'), held exactly as integer milli-units, with its format.
+    Quantities compare by value, so '1Gi' equals '1024Mi' and '0.5' equals '500m'.
+    Values, finer than milli-units (e.g. '1n'), are rounded up and are not exact.
+    """
+    BINARY_SI, DECIMAL_SI, DECIMAL_EXPONENT = 'BinarySI', 'DecimalSI', 'DecimalExponent'
+
+    # exponent suffix is matched before single letters, so '1E' is exa and '1E3' is 1000
+    pattern = re.compile(r'^([+-]?)([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+|[KMGTPE]i|[numkKMGTPE])?$')
+    binary_suffixes = dict(Ki=1, Mi=2, Gi=3, Ti=4, Pi=5, Ei=6)
+    # 'K' is not valid in Kubernetes, but has always been accepted here, as 'k'
+    decimal_suffixes = dict(n=-9, u=-6, m=-3, k=3, K=3, M=6, G=9, T=12, P=15, E=18)
+    binary_units = {power: suffix for suffix, power in binary_suffixes.items()}
+    decimal_units = {-3: 'm', 0: '', 3: 'k', 6: 'M', 9: 'G', 12: 'T', 15: 'P', 18: 'E'}
+
+    def __init__(self, milli, fmt=DECIMAL_SI, exact=True):
+        self.milli = milli
+        self.format = fmt
+        self.exact = exact
+
+    @staticmethod
+    def parse(value):
+        """
+        Parses str or int value. Raises ValueError, if value is not a quantity.
+        """
+        match = Quantity.pattern.match(str(value).strip())
+        if not match:
+            raise ValueError(f"{value} is not a quantity")
+        sign, number, suffix = match.groups()
+        whole, _, fraction = number.partition('.')
+        numerator, denominator = int(whole + fraction or '0') * 1000, 10 ** len(fraction)
+
+        fmt = Quantity.DECIMAL_SI
+        if suffix in Quantity.binary_suffixes:
+            fmt = Quantity.BINARY_SI
+            numerator *= 1024 ** Quantity.binary_suffixes[suffix]
+        elif suffix:
+            if suffix[0] in 'eE' and len(suffix) > 1:
+                fmt, exponent = Quantity.DECIMAL_EXPONENT, int(suffix[1:])
+            else:
+                exponent = Quantity.decimal_suffixes[suffix]
+            if exponent >= 0:
+                numerator *= 10 ** exponent
+            else:
+                denominator *= 10 ** -exponent
+
+        milli, remainder = divmod(numerator, denominator)
+        milli += 1 if remainder else 0
+        return Quantity(-milli if sign == '-' else milli, fmt, exact=not remainder)
+
+    @staticmethod
+    def canonicalize(value):
+        """
+        Returns canonical form of quantity value, as the API server stores it. Values, that are not exact quantities,
+        are returned unchanged, so they are reported by validation or passed to the server as they are.
+        """
+        try:
+            quantity = Quantity.parse(value)
+        except ValueError:
+            return value
+        return str(quantity) if quantity.exact else value
+
+    @staticmethod
+    def canonicalize_dict(quantities):
+        if not isinstance(quantities, dict):
+            return quantities
+        return {key: Quantity.canonicalize(value) if isinstance(value, str) else value
+                for key, value in quantities.items()}
+
+    def __str__(self):
+        sign, milli = ('-', -self.milli) if self.milli < 0 else ('', self.milli)
+        if milli == 0:
+            return '0'
+        if self.format == Quantity.BINARY_SI and milli % 1000 == 0 and milli >= 1024 * 1000:
+            value, power = milli // 1000, 0
+            while value % 1024 == 0 and power < 6:
+                value, power = value // 1024, power + 1
+            if power:
+                return f"{sign}{value}{Quantity.binary_units[power]}"
+        # fractional and small binary quantities fall back to decimal, like in Kubernetes
+        value, exponent = milli, -3
+        while value % 1000 == 0 and exponent < 18:
+            value, exponent = value // 1000, exponent + 3
+        if self.format == Quantity.DECIMAL_EXPONENT:
+            return f"{sign}{value}" + (f"e{exponent}" if exponent else '')
+        return f"{sign}{value}{Quantity.decimal_units[exponent]}"
+
+    def __repr__(self):
+        return f"Quantity('{self}')"
+
+    def __eq__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return self.milli == other.milli
+
+    def __lt__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return self.milli < other.milli
+
+    def __hash__(self):
+        return hash(self.milli)
+
+
 class Validators:
 
+    # patterns are compiled once, when module is imported
+    config_map_key_pattern = re.compile(r'^[a-zA-Z0-9_.-]+$')
+    dns_subdomain_pattern = re.compile(r'^[a-z0-9.-]+$')
+    dns_label_pattern = re.compile(r'^[a-z0-9-]+$')
+    c_identifier_pattern = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+    qualified_name_pattern = re.compile(r'^[A-Za-z0-9]([A-Za-z0-9_.-]{0,61}[A-Za-z0-9])?$')
+
     @staticmethod
     def config_map_key(key):
         """
         validates that key consist only of alphanumeric characters, '-', '_' or '.'.
         """
-        regex = re.compile(r'^[a-zA-Z0-9_.-]+$')
-        return bool(regex.match(str(key)))
+        return bool(Validators.config_map_key_pattern.match(str(key)))
 
     dns_subdomain_msg = "should be a lowercase DNS-1123 subdomain. It must consist of lower case alphanumeric " \
                         "characters, '-' or '.', and must start and end with an alphanumeric character."
@@ -65,8 +236,7 @@ class Validators:
             return True
 
         length_valid = len(value) <= 253
-        regex = re.compile(r'^[a-z0-9.-]+$')
-        second_constraint = bool(regex.match(str(value)))
+        second_constraint = bool(Validators.dns_subdomain_pattern.match(str(value)))
         first_char_alnum = value[0].isalnum()
         last_char_alnum = value[-1].isalnum()
         return length_valid and second_constraint and first_char_alnum and last_char_alnum
@@ -104,8 +274,7 @@ class Validators:
             return True
 
         length_valid = len(value) <= 63
-        regex = re.compile(r'^[a-z0-9-]+$')
-        second_constraint = bool(regex.match(str(value)))
+        second_constraint = bool(Validators.dns_label_pattern.match(str(value)))
         first_char_alnum = value[0].isalnum()
         last_char_alnum = value[-1].isalnum()
         return length_valid and second_constraint and first_char_alnum and last_char_alnum
@@ -152,8 +321,7 @@ class Validators:
         if not value:
             return True
         length_valid = len(value) <= 15
-        regex = re.compile(r'^[a-z0-9-]+$')
-        second_constraint = bool(regex.match(str(value)))
+        second_constraint = bool(Validators.dns_label_pattern.match(str(value)))
         first_last_alpha = value[0].isalnum() and value[-1].isalnum()
         no_adjacent_hyphens = '--' not in value
         one_alpha = any(char.isalpha() for char in value)
@@ -170,8 +338,7 @@ class Validators:
         - contains only alphanumeric characters or '_'
         - starts with alphabetic character or '_'
         """
-        regex = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
-        return bool(regex.match(str(value)))
+        return bool(Validators.c_identifier_pattern.match(str(value)))
 
     url_path_msg = "should be URL path (RFC 3986). It must start with '/', must not contain '//', '/./', '/../' and " \
                    "must not end with '/..', '/.'"
@@ -222,8 +389,7 @@ class Validators:
 
     @staticmethod
     def quantity(string):
-        regex = re.compile(r'^([+-]?[0-9.]+)([eEinumkKMGTP]*[-+]?[0-9]*)$')
-        return bool(regex.match(str(string)))
+        return bool(Quantity.pattern.match(str(string)))
 
     @staticmethod
     def string_quantity_dict(_dict):
@@ -235,6 +401,74 @@ class Validators:
         return all((isinstance(key, str) and isinstance(value, str) and Validators.quantity(value)
                     for key, value in _dict.items()))
 
+    resource_name_msg = "should be a standard resource name (cpu, memory, ephemeral-storage, hugepages-<size>) or " \
+                        "an extended resource name, qualified with a domain outside of kubernetes.io " \
+                        "(e.g. example.com/gpu)"
+    standard_resource_names = ('cpu', 'memory', 'ephemeral-storage')
+
+    @staticmethod
+    def resource_name(name):
+        """
+        validates name of a compute resource of a container.
+        - standard resources (cpu, memory, ephemeral-storage) and hugepages-<size> with a Quantity as size
+        - extended resources <domain>/<name>, domain is a DNS Subdomain outside of kubernetes.io
+        """
+        if not isinstance(name, str):
+            return False
+        if name.startswith('hugepages-'):
+            return Validators.quantity(name[len('hugepages-'):])
+        if '/' not in name:
+            return name in Validators.standard_resource_names
+        domain, _, local_name = name.partition('/')
+        native = domain == 'kubernetes.io' or domain.endswith('.kubernetes.io')
+        return not native and Validators.dns_subdomain(domain) and bool(domain) and \
+            bool(Validators.qualified_name_pattern.match(local_name))
+
+    @staticmethod
+    def overcommitable(name):
+        """
+        Returns False for hugepages and extended resources, whose requests must equal their limits.
+        """
+        return not (name.startswith('hugepages-') or '/' in name)
+
+    @staticmethod
+    def overcommitted_requests(resources):
+        """
+        Returns sorted names of resources, that may not be overcommitted, but are requested without limit or with a
+        request, that differs from the limit. Quantities, that are not valid, are skipped.
+        """
+        limits = resources.get('limits') or dict()
+        overcommitted = list()
+        for name, request in (resources.get('requests') or dict()).items():
+            if Validators.overcommitable(name):
+                continue
+            if name not in limits:
+                overcommitted.append(name)
+                continue
+            try:
+                if Quantity.parse(request) != Quantity.parse(limits[name]):
+                    overcommitted.append(name)
+            except ValueError:
+                continue
+        return sorted(overcommitted)
+
+    @staticmethod
+    def exceeding_requests(resources):
+        """
+        Returns sorted names of resources, requested over their limits. Quantities, that are not valid, are skipped.
+        """
+        limits = resources.get('limits') or dict()
+        exceeding = list()
+        for name, request in (resources.get('requests') or dict()).items():
+            if name not in limits:
+                continue
+            try:
+                if Quantity.parse(request) > Quantity.parse(limits[name]):
+                    exceeding.append(name)
+            except ValueError:
+                continue
+        return sorted(exceeding)
+
     port_msg = "should be a valid port number, 0 < x < 65536"
 
     @staticmethod
@@ -308,38 +542,282 @@ class Validators:
             return False
 
 
+class IpRanges:
+    """
+    Index of a list of IP ranges (CIDR blocks) or IP addresses, sorted by start address and size.
+    Ranges either are disjoint or one contains the other, so redundant entries (duplicates and ranges contained in
+    another entry) are found in a single pass over the sorted index. Building the index takes O(n log n).
+    Entries, that are not valid, are skipped and their indices kept in invalid.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.invalid = list()
+        networks = list()
+        for i, entry in enumerate(entries):
+            try:
+                network = ipaddress.ip_network(entry, strict=False)
+            except (TypeError, ValueError):
+                self.invalid.append(i)
+                continue
+            networks.append((network.version, int(network.network_address), network.prefixlen, i, network))
+        networks.sort()
+        self.networks = networks
+
+    def redundant(self):
+        """
+        Returns list of (index, covering_index) of entries, that are covered by an entry with a lower index or a
+        larger range.
+        """
+        redundant = list()
+        covering_version, covering_end, covering_index = None, -1, None
+        for version, start, prefixlen, i, network in self.networks:
+            end = int(network.broadcast_address)
+            if version == covering_version and end <= covering_end:
+                redundant.append((i, covering_index))
+            else:
+                covering_version, covering_end, covering_index = version, end, i
+        return redundant
+
+    def deduplicated(self):
+        """
+        Returns entries without redundant ones, in the original order.
+        """
+        redundant = {i for i, covering_index in self.redundant()}
+        return [entry for i, entry in enumerate(self.entries) if i not in redundant]
+
+    def collapsed(self):
+        """
+        Returns the smallest list of CIDR blocks, that cover the same addresses as entries (redundant entries are
+        removed, adjacent ones are merged). IPv4 blocks come first.
+        """
+        collapsed = list()
+        for version in (4, 6):
+            networks = [network for network_version, start, prefixlen, i, network in self.networks
+                        if network_version == version]
+            collapsed.extend(network.with_prefixlen for network in ipaddress.collapse_addresses(networks))
+        return collapsed
+
+
+class Path:
+    """
+    Accessor of values in k8s definition, compiled once from a '.' separated list of keys.
+    Key with '[]' suffix selects every item of a list and key with '{}' suffix selects every key of a dict.
+    Empty path selects the definition itself.
+    Paths are compiled into a tree: path with the same prefix share its parent, so RuleTable walks every prefix once.
+    """
+    KEY, ITEMS, KEYS = range(3)
+    _compiled = dict()
+
+    def __init__(self, parent, step, key):
+        self.parent = parent
+        self.step = step
+        self.key = key
+
+    @staticmethod
+    def compile(path):
+        steps = list()
+        for key in path.split('.') if path else list():
+            if key.endswith('[]'):
+                step = Path.ITEMS
+            elif key.endswith('{}'):
+                step = Path.KEYS
+            else:
+                steps.append((Path.KEY, key))
+                continue
+            if key[:-2]:
+                steps.append((Path.KEY, key[:-2]))
+            steps.append((step, None))
+
+        compiled = Path._compiled.get(())
+        if compiled is None:
+            compiled = Path._compiled[()] = Path(None, None, None)
+        for i in range(len(steps)):
+            parent, compiled = compiled, Path._compiled.get(tuple(steps[:i + 1]))
+            if compiled is None:
+                compiled = Path._compiled[tuple(steps[:i + 1])] = Path(parent, *steps[i])
+        return compiled
+
+    def apply(self, nodes):
+        """
+        Applies the last step of the path to list of (indices, node), selected by parent.
+        """
+        if self.step == Path.KEY:
+            key = self.key
+            return [(indices, node.get(key)) for indices, node in nodes if node is not None]
+        if self.step == Path.ITEMS:
+            return [(indices + (i,), item) for indices, node in nodes if node is not None
+                    for i, item in enumerate(node)]
+        return [(indices + (k,), k) for indices, node in nodes if node is not None for k in node]
+
+    def select(self, k8s_definition, selected=None):
+        """
+        Returns list of (indices, value) of selected values. Indices are list indices and dict keys on the way to the
+        value. Value of a missing last key is None, values under missing keys are not selected.
+        Selections of the path and its prefixes are stored in and reused from selected, when given.
+        """
+        if self.parent is None:
+            return [((), k8s_definition)]
+        if selected is None:
+            return self.apply(self.parent.select(k8s_definition))
+        nodes = selected.get(self)
+        if nodes is None:
+            nodes = selected[self] = self.apply(self.parent.select(k8s_definition, selected))
+        return nodes
+
+
+class Rule:
+    """
+    Checks every value, selected by path, with check. Values, that are not set, are skipped, unless rule is required.
+    Error message is msg, formatted with indices of the value (e.g. 'containers[{0}].ports[{1}].name ...'), or result
+    of msg(value, *indices), when msg is callable.
+    """
+
+    def __init__(self, path, check, msg, required=False):
+        self.path = Path.compile(path)
+        self.check = check
+        self.msg = msg
+        self.required = required
+
+    def message(self, value, indices):
+        if callable(self.msg):
+            return self.msg(value, *indices)
+        return self.msg.format(*indices)
+
+    def error(self, k8s_definition, selected=None):
+        """
+        Returns error message of the first value, that breaks the rule, or None.
+        """
+        for indices, value in self.path.select(k8s_definition, selected):
+            if value is None and not self.required:
+                continue
+            if not self.check(value):
+                return self.message(value, indices)
+        return None
+
+
+class Check(Rule):
+    """
+    Rule, spanning several fields: check(value) returns error message or None.
+    """
+
+    def __init__(self, path, check):
+        super(Check, self).__init__(path, check, None)
+
+    def error(self, k8s_definition, selected=None):
+        for indices, value in self.path.select(k8s_definition, selected):
+            if value is not None:
+                msg = self.check(value)
+                if msg:
+                    return msg
+        return None
+
+
+class Unique(Rule):
+    """
+    Values, selected by path, must be unique.
+    """
+
+    def __init__(self, path, msg):
+        super(Unique, self).__init__(path, None, msg)
+
+    def error(self, k8s_definition, selected=None):
+        seen = set()
+        for indices, value in self.path.select(k8s_definition, selected):
+            if value is None:
+                continue
+            if value in seen:
+                return self.message(value, indices)
+            seen.add(value)
+        return None
+
+
+class References(Rule):
+    """
+    Values, selected by path, must be among values, selected by target (mapped with key, when given).
+    """
+
+    def __init__(self, path, target, msg, key=None):
+        super(References, self).__init__(path, None, msg)
+        self.target = Path.compile(target)
+        self.key = key
+
+    def error(self, k8s_definition, selected=None):
+        targets = None
+        for indices, value in self.path.select(k8s_definition, selected):
+            if value is None:
+                continue
+            if targets is None:
+                # built once per validation, not once per reference
+                targets = {self.key(target) if self.key else target
+                           for _, target in self.target.select(k8s_definition, selected) if target is not None}
+            if value not in targets:
+                return self.message(value, indices)
+        return None
+
+
+class RuleTable:
+    """
+    Validation rules of a kind, compiled once, when module is imported.
+    """
+
+    def __init__(self, *rules):
+        self.rules = rules
+
+    def errors(self, k8s_definition):
+        """
+        Yields the first error message of every broken rule, in order of rules.
+        """
+        # rules share paths and their prefixes (e.g. spec.template.spec.containers[]), every prefix is walked once
+        selected = dict()
+        for rule in self.rules:
+            msg = rule.error(k8s_definition, selected)
+            if msg is not None:
+                yield msg
+
+    def validate(self, module, k8s_definition):
+        """
+        Fails module with the first error.
+        """
+        selected = dict()
+        for rule in self.rules:
+            msg = rule.error(k8s_definition, selected)
+            if msg is not None:
+                module.fail_json(msg=msg)
+                return
+
+
 class CommonValidation:
 
+    metadata_rules = RuleTable(
+        Rule('metadata.annotations', Validators.string_string_dict, "Annotations should be map[string]string"),
+        Rule('metadata.labels', Validators.string_string_dict, "Labels should be map[string]string"),
+    )
+
+    selector_operators = ('In', 'NotIn', 'Exists', 'DoesNotExist')
+    selector_rules = RuleTable(
+        Rule('spec.selector.matchExpressions[].operator',
+             lambda operator: operator in CommonValidation.selector_operators,
+             f"Every selector.match_expressions.operator should be chosen from ({', '.join(selector_operators)})",
+             required=True),
+        Rule('spec.selector.matchExpressions[]',
+             lambda expression: (expression.get('operator') in ('In', 'NotIn')) == bool(expression.get('values')),
+             "If in any selector.match_expressions operator is 'In' or 'NotIn', the values array must be non-empty. "
+             "If operator is 'Exists' or 'DoesNotExist', the values array must be empty."),
+        Rule('spec.selector.matchLabels', Validators.string_string_dict,
+             "Selector.match_labels should be map[string]string"),
+    )
+
     @staticmethod
     def metadata(module, k8s_definition):
         """
         validates metadata
         """
-        annotations = k8s_definition['metadata'].get('annotations', dict())
-        labels = k8s_definition['metadata'].get('labels', dict())
-        if not Validators.string_string_dict(annotations):
-            module.fail_json(msg="Annotations should be map[string]string")
-        if not Validators.string_string_dict(labels):
-            module.fail_json(msg="Labels should be map[string]string")
+        CommonValidation.metadata_rules.validate(module, k8s_definition)
 
     @staticmethod
     def selector(module, k8s_definition):
         """
         validates spec.selector section
         """
-        if 'selector' in k8s_definition['spec'].keys():
-            match_expressions = k8s_definition['spec']['selector'].get('matchExpressions', list())
-            for expression in match_expressions:
-                valid_operators = ('In', 'NotIn', 'Exists', 'DoesNotExist')
-                operator = expression.get('operator')
-                if operator not in valid_operators:
-                    module.fail_json(msg="Every selector.match_expressions.operator should be chosen "
-                                         "from {0}".format({', '.join(valid_operators)}))
-                values_condition = (operator in ('In', 'NotIn')) == bool(expression.get('values'))
-                if not values_condition:
-                    module.fail_json(msg="If in any selector.match_expressions operator is 'In' or 'NotIn', the values "
-                                         "array must be non-empty. If operator is 'Exists' or 'DoesNotExist', the "
-                                         "values array must be empty.")
-            match_labels = k8s_definition['spec']['selector'].get('matchLabels', dict())
-            if not Validators.string_string_dict(match_labels):
-                module.fail_json(msg="Selector.match_labels should be map[string]string")
+        CommonValidation.selector_rules.validate(module, k8s_definition)
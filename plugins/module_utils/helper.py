@@ -21,3 +21,75 @@ def clean_dict(d):
         return cleaned
 
     return d
+
+
+CONTAINER_TYPES = (dict, list)
+
+
+def pruned(d):
+    """
+    Removes keys without real data (None, empty dict or list) from d, in place. Returns d, or None if it is empty.
+    Meant for dicts, that are built for a definition, with values that are already pruned. Unlike clean_dict, nested
+    values are not visited and no copies are made.
+    """
+    empty = [key for key, value in d.items() if not value and (value is None or type(value) in CONTAINER_TYPES)]
+    for key in empty:
+        del d[key]
+    return d or None
+
+
+def pruned_copy(d):
+    """
+    Returns copy of d (e.g. params of a sub-option) without keys, that have no real data, or None if nothing is left.
+    d is not modified.
+    """
+    if not d:
+        return None
+    return {key: value for key, value in d.items()
+            if value or not (value is None or type(value) in CONTAINER_TYPES)} or None
+
+
+def pruned_list(items):
+    """
+    Returns list of items, that are not None, or None if there are none. items can be any iterable.
+    """
+    return [item for item in items if item is not None] or None
+
+
+def set_defaults(d, defaults):
+    """
+    Sets values of defaults, that are missing in d, recursively for nested dicts. Returns d.
+    """
+    for key, default in defaults.items():
+        if isinstance(default, dict) and isinstance(d.get(key), dict):
+            set_defaults(d[key], default)
+        elif key not in d:
+            d[key] = default
+    return d
+
+
+# zero values of scalar types, that the API server omits (omitempty fields, that are not pointers)
+OMITTED_ZEROS = (0, False, '')
+
+
+def omitted(value):
+    """
+    Checks, whether value is a zero value, that the API server does not return, e.g. readOnly: false or
+    minReadySeconds: 0.
+    """
+    return type(value) in (int, bool, str) and value in OMITTED_ZEROS
+
+
+def contains(actual, expected):
+    """
+    Checks, whether actual holds everything from expected: dicts recursively, lists item by item (same length and
+    order), other values must be equal. Keys with zero values in expected also match, if actual does not have them,
+    since the API server omits them, but they still have to match values, that actual has.
+    """
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(contains(actual[key], value) if key in actual else omitted(value)
+                                                for key, value in expected.items())
+    if isinstance(expected, list):
+        return isinstance(actual, list) and len(actual) == len(expected) and all(
+            contains(actual_item, expected_item) for actual_item, expected_item in zip(actual, expected))
+    return actual == expected
@@ -1,12 +1,126 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from ansible_collections.kubernetes.core.plugins.module_utils.common import (K8sAnsibleMixin, get_api_client)
+import copy
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from ansible.module_utils.common.dict_transformations import recursive_diff
 
-def execute_module(module, resource_definition):
-    k8s_ansible_mixin = K8sAnsibleMixin(module)
-    k8s_ansible_mixin.client = get_api_client(module=module)
+# K8sAnsibleMixin and get_api_client of kubernetes.core 2.x are looked up, when they are used, so helpers of this
+# module can be imported without them
+from ansible_collections.kubernetes.core.plugins.module_utils import common as k8s_common
+from ansible_collections.sodalite.k8s.plugins.module_utils.bulk import ItemExited, ItemFailed
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import contains
+from ansible_collections.sodalite.k8s.plugins.module_utils.rollout import rollout_metrics
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings, instrument
+from ansible_collections.sodalite.k8s.plugins.module_utils.versioned import VERSIONED_LABEL
+from ansible_collections.sodalite.k8s.plugins.module_utils.waiter import RolloutFailed, watch_wait
+
+try:
+    from kubernetes.dynamic.exceptions import DynamicApiError, ForbiddenError, NotFoundError
+    from kubernetes.dynamic.resource import Resource
+except ImportError:
+    # kubernetes import error is handled by K8sAnsibleMixin.check_library_version()
+    pass
+
+# kubernetes.core pools API clients by their configuration for the lifetime of the process. With AnsibleTurboModule
+# the process outlives a single task, so later tasks reuse the loaded kubeconfig, TLS session and keep-alive
+# connections of the first one. Hits and misses of that pool are counted here.
+_client_pool_stats = dict(hits=0, misses=0)
+_client_pool_lock = threading.Lock()
+
+
+def get_client(module):
+    """
+    Returns API client of module params from the client pool of kubernetes.core, which creates and pools a new one
+    on a miss.
+    """
+    pool = getattr(k8s_common.get_api_client, '_pool', None)
+    with _client_pool_lock:
+        size = None if pool is None else len(pool)
+        client = k8s_common.get_api_client(module=module)
+        _client_pool_stats['hits' if size is not None and len(pool) == size else 'misses'] += 1
+    return client
+
+
+RESOURCE_VERBS = ['create', 'delete', 'deletecollection', 'get', 'list', 'patch', 'update', 'watch']
+
+# (apiVersion, kind) of kinds, managed by this collection, mapped to their REST endpoint. Resources for these are
+# built directly, without API discovery round trips. Any other apiVersion/kind goes through discovery.
+TYPED_RESOURCES = {
+    ('v1', 'ConfigMap'): dict(name='configmaps', namespaced=True),
+    ('v1', 'Secret'): dict(name='secrets', namespaced=True),
+    ('v1', 'PersistentVolumeClaim'): dict(name='persistentvolumeclaims', namespaced=True,
+                                          subresources=dict(status='PersistentVolumeClaim')),
+    ('v1', 'Service'): dict(name='services', namespaced=True, subresources=dict(status='Service')),
+    ('v1', 'Namespace'): dict(name='namespaces', namespaced=False, subresources=dict(status='Namespace')),
+    ('apps/v1', 'Deployment'): dict(name='deployments', namespaced=True,
+                                    subresources=dict(scale='Scale', status='Deployment')),
+    ('apps/v1', 'StatefulSet'): dict(name='statefulsets', namespaced=True,
+                                     subresources=dict(scale='Scale', status='StatefulSet')),
+    ('apps/v1', 'DaemonSet'): dict(name='daemonsets', namespaced=True, subresources=dict(status='DaemonSet')),
+    ('batch/v1', 'Job'): dict(name='jobs', namespaced=True, subresources=dict(status='Job')),
+    ('networking.k8s.io/v1', 'Ingress'): dict(name='ingresses', namespaced=True, subresources=dict(status='Ingress')),
+    ('storage.k8s.io/v1', 'StorageClass'): dict(name='storageclasses', namespaced=False),
+}
+
+
+def typed_resource(client, api_version, kind):
+    """
+    Returns Resource for known apiVersion and kind, without API discovery.
+    Returns None for unknown ones.
+    """
+    resource_info = TYPED_RESOURCES.get((api_version, kind))
+    if resource_info is None:
+        return None
+    group, _, version = api_version.rpartition('/')
+    name = resource_info['name']
+    namespaced = resource_info['namespaced']
+    subresources = {
+        subresource: dict(kind=sub_kind, name=f"{name}/{subresource}", namespaced=namespaced,
+                          verbs=['get', 'patch', 'update'])
+        for subresource, sub_kind in (resource_info.get('subresources') or dict()).items()
+    }
+    return Resource(prefix='apis' if group else 'api', group=group, api_version=version, kind=kind,
+                    namespaced=namespaced, verbs=RESOURCE_VERBS, name=name, preferred=True, client=client,
+                    subresources=subresources)
+
+
+def client_pool_stats():
+    return dict(_client_pool_stats)
+
+
+def k8s_ansible_mixin_for(module, client, resource_definition, timings=None):
+    """
+    Returns K8sAnsibleMixin, configured to apply resource_definition with params of module over client.
+    """
+    timings = timings or Timings()
+    k8s_ansible_mixin = k8s_common.K8sAnsibleMixin(module)
+    k8s_ansible_mixin.client = client
+
+    discover_resource = k8s_ansible_mixin.find_resource
+
+    def find_resource(kind, api_version, fail=False):
+        with timings.phase('discovery'):
+            return typed_resource(k8s_ansible_mixin.client, api_version, kind) or \
+                discover_resource(kind, api_version, fail=fail)
+
+    poll = k8s_ansible_mixin.wait
+
+    def wait(resource, definition, sleep, timeout, state='present', condition=None, **kwargs):
+        with timings.phase('wait'):
+            if kwargs:
+                return poll(resource, definition, sleep, timeout, state=state, condition=condition, **kwargs)
+            try:
+                return watch_wait(k8s_ansible_mixin.client, resource, definition, timeout, state, condition)
+            except RolloutFailed as e:
+                k8s_ansible_mixin.fail_json(msg=str(e), reason=e.reason, pod=e.pod, result=e.k8s_object or dict())
+            except ForbiddenError:
+                # watch verb is not granted, fall back to polling
+                return poll(resource, definition, sleep, timeout, state=state, condition=condition)
 
     k8s_ansible_mixin.module = module
     k8s_ansible_mixin.module.params['resource_definition'] = resource_definition
@@ -22,6 +136,8 @@ def execute_module(module, resource_definition):
     k8s_ansible_mixin.exit_json = k8s_ansible_mixin.module.exit_json
     k8s_ansible_mixin.warn = k8s_ansible_mixin.module.warn
     k8s_ansible_mixin.warnings = []
+    k8s_ansible_mixin.find_resource = find_resource
+    k8s_ansible_mixin.wait = wait
 
     k8s_ansible_mixin.kind = resource_definition.get('kind')
     k8s_ansible_mixin.api_version = resource_definition.get('apiVersion')
@@ -29,5 +145,608 @@ def execute_module(module, resource_definition):
     k8s_ansible_mixin.namespace = k8s_ansible_mixin.params.get('namespace')
 
     k8s_ansible_mixin.check_library_version()
-    k8s_ansible_mixin.set_resource_definitions(module)
-    k8s_ansible_mixin.execute_module()
+    return k8s_ansible_mixin
+
+
+APPLY_PATCH_CONTENT_TYPE = 'application/apply-patch+yaml'
+STRATEGIC_MERGE_PATCH_CONTENT_TYPE = 'application/strategic-merge-patch+json'
+MERGE_PATCH_CONTENT_TYPE = 'application/merge-patch+json'
+PARTIAL_OBJECT_METADATA = 'application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1'
+PARTIAL_OBJECT_METADATA_LIST = 'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1'
+SPEC_HASH_ANNOTATION = 'sodalite.k8s/spec-hash'
+
+
+def get_metadata(client, resource, name, namespace):
+    """
+    Reads only metadata of an object (as PartialObjectMetadata). Returns None, if object does not exist.
+    """
+    try:
+        instance = client.request('get', resource.path(name=name, namespace=namespace),
+                                  header_params={'Accept': PARTIAL_OBJECT_METADATA})
+    except NotFoundError:
+        return None
+    return instance.to_dict().get('metadata') or dict()
+
+
+def comparable(k8s_object):
+    """
+    Returns copy of k8s_object without metadata, that changes on every write.
+    """
+    k8s_object = copy.deepcopy(k8s_object)
+    for key in ('resourceVersion', 'managedFields', 'generation'):
+        k8s_object['metadata'].pop(key, None)
+    return k8s_object
+
+
+def spec_hash(resource_definition):
+    """
+    Returns hash of canonical (key sorted, compact) JSON form of resource_definition.
+    """
+    canonical = json.dumps(resource_definition, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def stamp_spec_hash(resource_definition):
+    """
+    Stamps spec hash of resource_definition into its annotations and returns it.
+    """
+    digest = spec_hash(resource_definition)
+    resource_definition['metadata'].setdefault('annotations', dict())[SPEC_HASH_ANNOTATION] = digest
+    return digest
+
+
+def uses_spec_hash(params):
+    """
+    Versions of versioned objects never change content, so they are always written with spec hash.
+    """
+    return bool(params.get('spec_hash') or params.get('versioned')) and params.get('state') != 'absent'
+
+
+def skip_unchanged(k8s_ansible_mixin, resource, resource_definition, digest, live_metadata=None):
+    """
+    Returns result of a skipped write, if the live object carries the same spec hash, otherwise None.
+    live_metadata ({} for a missing object) can be passed from a metadata-only LIST, otherwise it is read.
+    """
+    metadata = resource_definition['metadata']
+    if live_metadata is None:
+        live_metadata = get_metadata(k8s_ansible_mixin.client, resource, metadata['name'], metadata.get('namespace'))
+    if not live_metadata or (live_metadata.get('annotations') or dict()).get(SPEC_HASH_ANNOTATION) != digest:
+        return None
+
+    k8s_object = dict(apiVersion=resource_definition['apiVersion'], kind=resource_definition['kind'],
+                      metadata=live_metadata)
+    return wait(k8s_ansible_mixin, resource, dict(changed=False, method='skip', result=k8s_object))
+
+
+def resumes_only(params):
+    """
+    Checks, whether params only resume a rollout batch (rollout_batch=commit without a pod template).
+    """
+    return params.get('rollout_batch') == 'commit' and not params.get('containers')
+
+
+def writes_partially(params):
+    """
+    Checks, whether only images, replicas or paused of the live object are patched, instead of writing the definition.
+    """
+    return bool(params.get('update_images') or params.get('scale_only') or resumes_only(params))
+
+
+def patches_in_place(params):
+    """
+    Checks, whether object is written with a merge patch, that leaves fields, missing in the definition, as they are.
+    Such a write does not change an object, that already contains the whole definition.
+    """
+    return not params.get('force') and not params.get('apply') and 'json' not in (params.get('merge_type') or list())
+
+
+def apply_in_place(k8s_ansible_mixin, resource, resource_definition):
+    """
+    Writes resource_definition from a single GET of the live object, instead of letting perform_action() of
+    K8sAnsibleMixin read it again. The write is skipped, if the live object already contains the (canonicalized)
+    definition. If it only differs in replicas, they are changed through the scale subresource. Otherwise the
+    definition is patched with the first merge type, that succeeds, or created, if the object does not exist.
+    Returns result of the action.
+    """
+    client = k8s_ansible_mixin.client
+    params = k8s_ansible_mixin.params
+    metadata = resource_definition['metadata']
+    kind, name, namespace = resource_definition['kind'], metadata['name'], metadata.get('namespace')
+    try:
+        live = client.get(resource, name=name, namespace=namespace).to_dict()
+    except NotFoundError:
+        live = None
+    query_params = [('dryRun', 'All')] if k8s_ansible_mixin.check_mode else list()
+
+    if live is None:
+        if params.get('state') == 'patched':
+            k8s_ansible_mixin.warn(f"resource 'kind={kind},name={name}' was not found but will not be created as "
+                                   f"'state' parameter has been set to 'patched'")
+            return dict(changed=False, result=dict())
+        try:
+            k8s_object = client.create(resource, resource_definition, namespace=namespace,
+                                       query_params=query_params).to_dict()
+        except DynamicApiError as exc:
+            k8s_ansible_mixin.fail_json(msg=f"Failed to create object: {exc.body}", error=exc.status,
+                                        status=exc.status, reason=exc.reason)
+        return wait(k8s_ansible_mixin, resource, dict(changed=True, method='create', result=k8s_object))
+
+    if contains(live, resource_definition):
+        return wait(k8s_ansible_mixin, resource, dict(changed=False, method='skip', result=live))
+    if replicas_only(resource, live, resource_definition):
+        return scale(k8s_ansible_mixin, resource, resource_definition, resource_definition['spec']['replicas'], live)
+
+    # custom resources do not support strategic merge, so merge is tried next by default, like kubernetes.core does
+    for merge_type in params.get('merge_type') or ['strategic-merge', 'merge']:
+        try:
+            k8s_object = client.patch(resource, resource_definition, name=name, namespace=namespace,
+                                      content_type=f"application/{merge_type}-patch+json",
+                                      query_params=query_params).to_dict()
+            break
+        except DynamicApiError as exc:
+            error = exc
+    else:
+        k8s_ansible_mixin.fail_json(msg=f"Failed to patch object: {error.body}", error=error.status,
+                                    status=error.status, reason=error.reason)
+
+    before, after = comparable(live), comparable(k8s_object)
+    result = dict(changed=before != after, method='patch', result=k8s_object)
+    if getattr(k8s_ansible_mixin.module, '_diff', False):
+        before, after = recursive_diff(before, after) or (dict(), dict())
+        result['diff'] = dict(before=before, after=after)
+    return wait(k8s_ansible_mixin, resource, result)
+
+
+def replicas_only(resource, k8s_object, resource_definition):
+    """
+    Checks, whether resource has a scale subresource and k8s_object contains resource_definition, except for
+    spec.replicas.
+    """
+    spec = resource_definition.get('spec') or dict()
+    if 'replicas' not in spec or 'scale' not in (getattr(resource, 'subresources', None) or dict()):
+        return False
+    live_spec = k8s_object.get('spec') or dict()
+    return contains(k8s_object, dict(resource_definition, spec=dict(spec, replicas=live_spec.get('replicas'))))
+
+
+def scale(k8s_ansible_mixin, resource, resource_definition, replicas, live=None):
+    """
+    Sets replicas of the live object with a single merge PATCH of its scale subresource, that neither sends nor
+    changes the rest of the object. live is read, if not passed. spec-hash annotation is removed with a second
+    PATCH, if present, since the object no longer matches the hashed definition.
+    Returns result of the action, with replicas before and after. result is live with the new replicas, since the
+    scale subresource returns a Scale object.
+    """
+    client = k8s_ansible_mixin.client
+    metadata = resource_definition['metadata']
+    kind, name, namespace = resource_definition['kind'], metadata['name'], metadata.get('namespace')
+    if live is None:
+        try:
+            live = client.get(resource, name=name, namespace=namespace).to_dict()
+        except NotFoundError:
+            k8s_ansible_mixin.fail_json(msg=f"{kind} {name} not found in namespace {namespace}, scale_only only "
+                                            f"scales existing objects")
+    before = (live.get('spec') or dict()).get('replicas')
+    if before == replicas:
+        return wait(k8s_ansible_mixin, resource, dict(changed=False, method='skip', result=live,
+                                                      replicas=dict(before=before, after=replicas)))
+
+    query_params = [('dryRun', 'All')] if k8s_ansible_mixin.check_mode else list()
+    try:
+        scaled = client.request('patch', resource.path(name=name, namespace=namespace) + '/scale',
+                                body={'spec': {'replicas': replicas}}, content_type=MERGE_PATCH_CONTENT_TYPE,
+                                query_params=query_params).to_dict()
+    except DynamicApiError as exc:
+        k8s_ansible_mixin.fail_json(msg=f"Failed to scale object: {exc.body}", error=exc.status, status=exc.status,
+                                    reason=exc.reason)
+    k8s_object = copy.deepcopy(live)
+    k8s_object['spec']['replicas'] = replicas
+    # scale shares resourceVersion with its object, waiting watches from it
+    k8s_object['metadata']['resourceVersion'] = scaled['metadata'].get('resourceVersion')
+    if SPEC_HASH_ANNOTATION in (live['metadata'].get('annotations') or dict()):
+        # object no longer matches the hashed definition, scale subresource can not change annotations
+        try:
+            k8s_object = client.patch(resource, {'metadata': {'annotations': {SPEC_HASH_ANNOTATION: None}}},
+                                      name=name, namespace=namespace, content_type=MERGE_PATCH_CONTENT_TYPE,
+                                      query_params=query_params).to_dict()
+        except DynamicApiError as exc:
+            k8s_ansible_mixin.fail_json(msg=f"Failed to patch object: {exc.body}", error=exc.status,
+                                        status=exc.status, reason=exc.reason)
+        # dry run does not see the dry run scale
+        k8s_object['spec']['replicas'] = replicas
+
+    result = dict(changed=True, method='scale', result=k8s_object, replicas=dict(before=before, after=replicas))
+    if getattr(k8s_ansible_mixin.module, '_diff', False):
+        result['diff'] = dict(before={'spec': {'replicas': before}}, after={'spec': {'replicas': replicas}})
+    return wait(k8s_ansible_mixin, resource, result)
+
+
+def resume(k8s_ansible_mixin, resource, resource_definition):
+    """
+    Resumes the live object, paused by a rollout batch, with a single merge PATCH of spec.paused, that neither sends
+    nor changes the rest of the object. Changes made while it was paused are rolled out at once.
+    Returns result of the action.
+    """
+    client = k8s_ansible_mixin.client
+    metadata = resource_definition['metadata']
+    kind, name, namespace = resource_definition['kind'], metadata['name'], metadata.get('namespace')
+    try:
+        live = client.get(resource, name=name, namespace=namespace).to_dict()
+    except NotFoundError:
+        k8s_ansible_mixin.fail_json(msg=f"{kind} {name} not found in namespace {namespace}, rollout_batch=commit "
+                                        f"only resumes existing objects")
+    if not (live.get('spec') or dict()).get('paused'):
+        return wait(k8s_ansible_mixin, resource, dict(changed=False, method='skip', result=live))
+
+    query_params = [('dryRun', 'All')] if k8s_ansible_mixin.check_mode else list()
+    try:
+        k8s_object = client.patch(resource, {'spec': {'paused': False}}, name=name, namespace=namespace,
+                                  content_type=MERGE_PATCH_CONTENT_TYPE, query_params=query_params).to_dict()
+    except DynamicApiError as exc:
+        k8s_ansible_mixin.fail_json(msg=f"Failed to patch object: {exc.body}", error=exc.status, status=exc.status,
+                                    reason=exc.reason)
+
+    result = dict(changed=True, method='patch', result=k8s_object)
+    if getattr(k8s_ansible_mixin.module, '_diff', False):
+        result['diff'] = dict(before={'spec': {'paused': True}}, after={'spec': {'paused': False}})
+    return wait(k8s_ansible_mixin, resource, result)
+
+
+def list_metadata(client, items):
+    """
+    Lists metadata of objects, that items with spec_hash refer to, with one metadata-only LIST per kind and namespace.
+    Only kinds and namespaces with more than one such item are listed.
+    Returns dict of (apiVersion, kind, namespace) -> dict of name -> metadata.
+    """
+    groups = dict()
+    for item_module, resource_definition in items:
+        params = item_module.params
+        if not uses_spec_hash(params) or params.get('force'):
+            continue
+        resource = typed_resource(client, resource_definition['apiVersion'], resource_definition['kind'])
+        if resource is None:
+            continue
+        namespace = params.get('namespace') if resource.namespaced else None
+        group = groups.setdefault((resource_definition['apiVersion'], resource_definition['kind'], namespace),
+                                  dict(resource=resource, count=0))
+        group['count'] += 1
+
+    listings = dict()
+    for (api_version, kind, namespace), group in groups.items():
+        if group['count'] < 2:
+            continue
+        try:
+            object_list = client.request('get', group['resource'].path(namespace=namespace),
+                                         header_params={'Accept': PARTIAL_OBJECT_METADATA_LIST}).to_dict()
+        except DynamicApiError:
+            # objects of this group are read one by one
+            continue
+        listings[(api_version, kind, namespace)] = {
+            k8s_object['metadata']['name']: k8s_object['metadata'] for k8s_object in object_list.get('items') or list()
+        }
+    return listings
+
+
+def missing_references(k8s_ansible_mixin, namespace, references):
+    """
+    Checks, that referenced objects exist in namespace, with one metadata-only LIST per kind. Kinds, that may not be
+    listed, are read with a metadata-only GET per name.
+    references is a dict of (apiVersion, kind) -> dict of name -> list of params, that refer to the object.
+    Returns list of messages about objects, that do not exist.
+    """
+    client = k8s_ansible_mixin.client
+    missing = list()
+    for (api_version, kind), names in references.items():
+        resource = k8s_ansible_mixin.find_resource(kind, api_version, fail=True)
+        try:
+            object_list = client.request('get', resource.path(namespace=namespace),
+                                         header_params={'Accept': PARTIAL_OBJECT_METADATA_LIST}).to_dict()
+            existing = {k8s_object['metadata']['name'] for k8s_object in object_list.get('items') or list()}
+        except ForbiddenError:
+            existing = {name for name in names if get_metadata(client, resource, name, namespace) is not None}
+        missing.extend(f"{kind} '{name}' not found in namespace '{namespace}' (referenced by {', '.join(params)})"
+                       for name, params in names.items() if name not in existing)
+    return missing
+
+
+def wait(k8s_ansible_mixin, resource, result):
+    """
+    Waits for result['result'], if wait param is set, and updates result with waiting outcome.
+    """
+    params = k8s_ansible_mixin.params
+    if not params.get('wait') or k8s_ansible_mixin.check_mode:
+        return result
+    success, result['result'], result['duration'] = k8s_ansible_mixin.wait(
+        resource, result['result'], params.get('wait_sleep'), params.get('wait_timeout'),
+        condition=params.get('wait_condition'))
+    if not success:
+        k8s_ansible_mixin.fail_json(msg="Object apply timed out", **result)
+    return result
+
+
+def rollout_result(k8s_ansible_mixin, result):
+    """
+    Adds latency metrics of the rollout to result of a Deployment, that was waited for.
+    """
+    params = k8s_ansible_mixin.params
+    k8s_object = result.get('result') or dict()
+    if (not params.get('wait') or k8s_ansible_mixin.check_mode or params.get('state') == 'absent'
+            or k8s_object.get('kind') != 'Deployment'):
+        return result
+    metrics = rollout_metrics(k8s_ansible_mixin.client, k8s_object)
+    if metrics:
+        result['rollout'] = metrics
+    return result
+
+
+def prune_versions(k8s_ansible_mixin, resource, resource_definition):
+    """
+    Deletes older versions of a versioned object, so only keep_versions newest ones (including the current one) are
+    left. Versions are ordered by creationTimestamp and the current one is never deleted.
+    Returns names of deleted versions, in check mode the ones that would be deleted.
+    """
+    client = k8s_ansible_mixin.client
+    metadata = resource_definition['metadata']
+    namespace = None
+    if resource.namespaced:
+        namespace = metadata.get('namespace') or k8s_ansible_mixin.params.get('namespace')
+    object_list = client.get(resource, namespace=namespace,
+                             label_selector=f"{VERSIONED_LABEL}={metadata['labels'][VERSIONED_LABEL]}").to_dict()
+    older = sorted((k8s_object['metadata'] for k8s_object in object_list.get('items') or list()
+                    if k8s_object['metadata']['name'] != metadata['name']),
+                   key=lambda version: (version.get('creationTimestamp') or '', version['name']), reverse=True)
+    pruned = [version['name'] for version in older[max(k8s_ansible_mixin.params.get('keep_versions'), 1) - 1:]]
+    if not k8s_ansible_mixin.check_mode:
+        for name in pruned:
+            try:
+                client.delete(resource, name=name, namespace=namespace)
+            except NotFoundError:
+                pass
+    return pruned
+
+
+def versioned_result(k8s_ansible_mixin, resource_definition, result):
+    """
+    Adds generated name and pruned versions to result of a versioned object.
+    """
+    params = k8s_ansible_mixin.params
+    if not params.get('versioned') or params.get('state') == 'absent':
+        return result
+    resource = k8s_ansible_mixin.find_resource(resource_definition['kind'], resource_definition['apiVersion'],
+                                               fail=True)
+    result['name'] = resource_definition['metadata']['name']
+    result['pruned'] = prune_versions(k8s_ansible_mixin, resource, resource_definition)
+    result['changed'] = result.get('changed', False) or bool(result['pruned'])
+    return result
+
+
+def apply_entry(metadata, field_manager):
+    """
+    Returns time and fields of the Apply entry of field_manager in managedFields of metadata, or None.
+    """
+    for entry in (metadata or dict()).get('managedFields') or list():
+        if entry.get('manager') == field_manager and entry.get('operation') == 'Apply':
+            return entry.get('time'), entry.get('fieldsV1')
+    return None
+
+
+def server_side_apply(k8s_ansible_mixin, resource, resource_definition):
+    """
+    Applies resource_definition with a server-side apply PATCH, after a metadata-only GET of the live object.
+    Object is changed, if it did not exist, or the apply changed the managedFields Apply entry of the field manager
+    (its time is only updated, when the apply changes any of its fields) or the generation of the object. Status
+    writes of controllers change neither. In check mode, the server-side dry run result is compared to the live object.
+    Returns result of the action.
+    """
+    params = k8s_ansible_mixin.params
+    client = k8s_ansible_mixin.client
+    check_mode = k8s_ansible_mixin.check_mode
+    metadata = resource_definition['metadata']
+    name, namespace = metadata['name'], metadata.get('namespace')
+    field_manager = params['server_side_apply']['field_manager']
+
+    query_params = [
+        ('fieldManager', field_manager),
+        ('force', 'true' if params['server_side_apply']['force_conflicts'] else 'false')
+    ]
+    existing = None
+    if check_mode:
+        query_params.append(('dryRun', 'All'))
+        try:
+            existing = client.get(resource, name=name, namespace=namespace).to_dict()
+        except NotFoundError:
+            pass
+    else:
+        live_metadata = get_metadata(client, resource, name, namespace)
+
+    try:
+        k8s_object = client.patch(resource, resource_definition, name=name, namespace=namespace,
+                                  content_type=APPLY_PATCH_CONTENT_TYPE, query_params=query_params).to_dict()
+    except DynamicApiError as exc:
+        k8s_ansible_mixin.fail_json(msg=f"Failed to apply object: {exc.body}", error=exc.status, status=exc.status,
+                                    reason=exc.reason)
+
+    if check_mode:
+        changed = existing is None or comparable(existing) != comparable(k8s_object)
+    else:
+        applied_metadata = k8s_object['metadata']
+        changed = live_metadata is None \
+            or apply_entry(live_metadata, field_manager) != apply_entry(applied_metadata, field_manager) \
+            or live_metadata.get('generation') != applied_metadata.get('generation')
+
+    return wait(k8s_ansible_mixin, resource, dict(changed=changed, method='apply', result=k8s_object))
+
+
+def containers_patch(containers):
+    return {'spec': {'template': {'spec': {'containers': containers}}}}
+
+
+def patch_images(k8s_ansible_mixin, resource, resource_definition, images):
+    """
+    Updates images of containers of the live object with a single strategic merge PATCH, that only holds names and
+    images of changed containers. spec-hash annotation is removed with it, since the object no longer matches the
+    hashed definition. The rest of the object is neither sent nor validated.
+    Returns result of the action, with diff of the changed images.
+    """
+    client = k8s_ansible_mixin.client
+    metadata = resource_definition['metadata']
+    kind, name, namespace = resource_definition['kind'], metadata['name'], metadata.get('namespace')
+    try:
+        live = client.get(resource, name=name, namespace=namespace).to_dict()
+    except NotFoundError:
+        k8s_ansible_mixin.fail_json(msg=f"{kind} {name} not found in namespace {namespace}, update_images only "
+                                        f"updates images of existing objects")
+    current = {container['name']: container.get('image')
+               for container in live['spec']['template']['spec'].get('containers') or list()}
+    unknown = [container for container in images if container not in current]
+    if unknown:
+        k8s_ansible_mixin.fail_json(msg=f"Containers {', '.join(unknown)} not found in {kind} {name}, its containers "
+                                        f"are {', '.join(current)}")
+
+    changed = [container for container, image in images.items() if current[container] != image]
+    if not changed:
+        return wait(k8s_ansible_mixin, resource, dict(changed=False, method='skip', result=live))
+
+    patch = containers_patch([dict(name=container, image=images[container]) for container in changed])
+    if SPEC_HASH_ANNOTATION in (live['metadata'].get('annotations') or dict()):
+        patch['metadata'] = {'annotations': {SPEC_HASH_ANNOTATION: None}}
+    query_params = [('dryRun', 'All')] if k8s_ansible_mixin.check_mode else list()
+    try:
+        k8s_object = client.patch(resource, patch, name=name, namespace=namespace,
+                                  content_type=STRATEGIC_MERGE_PATCH_CONTENT_TYPE, query_params=query_params).to_dict()
+    except DynamicApiError as exc:
+        k8s_ansible_mixin.fail_json(msg=f"Failed to patch object: {exc.body}", error=exc.status, status=exc.status,
+                                    reason=exc.reason)
+
+    result = dict(changed=True, method='patch', result=k8s_object)
+    if getattr(k8s_ansible_mixin.module, '_diff', False):
+        result['diff'] = dict(
+            before=containers_patch([dict(name=container, image=current[container]) for container in changed]),
+            after=containers_patch([dict(name=container, image=images[container]) for container in changed])
+        )
+    return wait(k8s_ansible_mixin, resource, result)
+
+
+def execute_module(module, resource_definition, timings=None, extra_result=None, references=None):
+    """
+    Creates, patches or deletes the object of resource_definition and exits the module.
+    extra_result holds module specific keys, that are added to the result.
+    references are objects, that must exist before the object is written (see missing_references()).
+    """
+    timings = timings or Timings()
+    with timings.phase('client'):
+        client = get_client(module)
+        if timings.enabled:
+            instrument(client)
+        k8s_ansible_mixin = k8s_ansible_mixin_for(module, client, resource_definition, timings)
+
+    def exit_json(**result):
+        result.update(extra_result or dict())
+        result = versioned_result(k8s_ansible_mixin, resource_definition, result)
+        result = rollout_result(k8s_ansible_mixin, result)
+        result['client_pool'] = client_pool_stats()
+        if timings.enabled:
+            result['timings'] = timings.as_dict()
+        module.exit_json(**result)
+
+    k8s_ansible_mixin.exit_json = exit_json
+
+    params = module.params
+    with timings.phase('write'):
+        if params.get('state') != 'absent':
+            digest = stamp_spec_hash(resource_definition) if uses_spec_hash(params) and not writes_partially(params) \
+                else None
+            resource = k8s_ansible_mixin.find_resource(resource_definition['kind'],
+                                                       resource_definition['apiVersion'], fail=True)
+            if resource.namespaced:
+                resource_definition['metadata'].setdefault('namespace', params.get('namespace'))
+            if params.get('update_images'):
+                exit_json(**patch_images(k8s_ansible_mixin, resource, resource_definition, params['update_images']))
+            if params.get('scale_only'):
+                exit_json(**scale(k8s_ansible_mixin, resource, resource_definition, params['replicas']))
+            if resumes_only(params):
+                exit_json(**resume(k8s_ansible_mixin, resource, resource_definition))
+            if references:
+                with timings.phase('validate'):
+                    missing = missing_references(k8s_ansible_mixin, resource_definition['metadata'].get('namespace'),
+                                                 references)
+                if missing:
+                    module.fail_json(msg='; '.join(missing))
+            if digest and not params.get('force'):
+                result = skip_unchanged(k8s_ansible_mixin, resource, resource_definition, digest)
+                if result:
+                    exit_json(**result)
+            if params.get('server_side_apply'):
+                exit_json(**server_side_apply(k8s_ansible_mixin, resource, resource_definition))
+            if patches_in_place(params):
+                exit_json(**apply_in_place(k8s_ansible_mixin, resource, resource_definition))
+
+        k8s_ansible_mixin.set_resource_definitions(module)
+        k8s_ansible_mixin.execute_module()
+
+
+def apply_item(item_module, client, resource_definition, listing=None):
+    """
+    Applies a single resource definition over shared client and returns result of the action.
+    listing is a dict of name -> metadata of objects of the same kind and namespace, if they were listed beforehand.
+    """
+    params = item_module.params
+    digest = stamp_spec_hash(resource_definition) if uses_spec_hash(params) else None
+    k8s_ansible_mixin = k8s_ansible_mixin_for(item_module, client, resource_definition)
+    resource = k8s_ansible_mixin.find_resource(resource_definition['kind'], resource_definition['apiVersion'],
+                                               fail=True)
+    if resource.namespaced:
+        resource_definition['metadata'].setdefault('namespace', params.get('namespace'))
+    if digest and not params.get('force'):
+        live_metadata = None if listing is None else listing.get(resource_definition['metadata']['name'], dict())
+        result = skip_unchanged(k8s_ansible_mixin, resource, resource_definition, digest, live_metadata)
+        if result:
+            return versioned_result(k8s_ansible_mixin, resource_definition, result)
+    if params.get('server_side_apply') and params.get('state') != 'absent':
+        result = server_side_apply(k8s_ansible_mixin, resource, resource_definition)
+    elif params.get('state') != 'absent' and patches_in_place(params):
+        result = apply_in_place(k8s_ansible_mixin, resource, resource_definition)
+    else:
+        result = k8s_ansible_mixin.perform_action(resource, resource_definition)
+    return versioned_result(k8s_ansible_mixin, resource_definition, result)
+
+
+def execute_bulk(module, items, max_workers):
+    """
+    Applies items concurrently over one shared client.
+    items is a list of (item_module, resource_definition) and a list of per-item results is returned, in same order.
+    """
+    client = get_client(module)
+    listings = list_metadata(client, items)
+
+    def apply(item):
+        item_module, resource_definition = item
+        status = dict(kind=resource_definition['kind'], name=resource_definition['metadata']['name'],
+                      changed=False, failed=False)
+        typed = typed_resource(client, resource_definition['apiVersion'], resource_definition['kind'])
+        namespace = item_module.params.get('namespace') if typed is not None and typed.namespaced else None
+        listing = listings.get((resource_definition['apiVersion'], resource_definition['kind'], namespace))
+        try:
+            try:
+                result = apply_item(item_module, client, resource_definition, listing)
+            except ItemExited as e:
+                result = e.result
+            status['changed'] = result.get('changed', False)
+            if result.get('method'):
+                status['method'] = result['method']
+            if result.get('pruned'):
+                status['pruned'] = result['pruned']
+        except ItemFailed as e:
+            status['failed'] = True
+            status['msg'] = str(e)
+        except Exception as e:
+            status['failed'] = True
+            status['msg'] = f"{type(e).__name__}: {e}"
+        if resource_definition['metadata'].get('namespace'):
+            status['namespace'] = resource_definition['metadata']['namespace']
+        if item_module.warnings:
+            status['warnings'] = item_module.warnings
+        return status
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(apply, items))
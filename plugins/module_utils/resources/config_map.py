@@ -0,0 +1,158 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import copy
+import mmap
+import os
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.bulk import DefinitionError
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE,
+                                                                               VERSIONED_ARG_SPEC)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Base64, Validators, CommonValidation,
+                                                                          Rule, RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy
+from ansible_collections.sodalite.k8s.plugins.module_utils.versioned import NAME_RULE, versioned_definition
+
+
+# Kubernetes rejects ConfigMaps with more than 1 MiB of data (keys and values of data and binaryData)
+MAX_DATA_SIZE = 1024 * 1024
+
+
+def source_files(params):
+    """
+    Returns list of (key, path) of from_files ('path' or 'key=path') and regular files in from_dir (sorted by name).
+    """
+    sources = list()
+    for source in params.get('from_files') or list():
+        key, sep, path = source.partition('=')
+        path = os.path.expanduser(path if sep else source)
+        sources.append((key if sep else os.path.basename(path), path))
+    from_dir = params.get('from_dir')
+    if from_dir:
+        try:
+            entries = sorted(os.scandir(from_dir), key=lambda entry: entry.name)
+        except OSError as e:
+            raise DefinitionError(f"Cannot read from_dir {from_dir}: {e.strerror}")
+        sources.extend((entry.name, entry.path) for entry in entries if entry.is_file())
+    return sources
+
+
+def data_size(data, binary_data):
+    """
+    Returns size of data, as counted by Kubernetes: keys and values, binary values decoded.
+    """
+    return (sum(len(key) + len(str(value).encode()) for key, value in data.items())
+            + sum(len(key) + Base64.decoded_size(value if isinstance(value, (str, bytes)) else str(value))
+                  for key, value in binary_data.items()))
+
+
+def read_file(path, size):
+    """
+    Reads file through mmap. Returns (text, None) for UTF-8 files and (None, Base64 of content) for other files.
+    """
+    if size == 0:
+        return '', None
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        try:
+            return str(content, 'utf-8'), None
+        except UnicodeDecodeError:
+            return None, base64.b64encode(content).decode('ascii')
+
+
+def load_sources(params, data, binary_data):
+    """
+    Adds content of source files to data (UTF-8 files) and binary_data (other files). Sizes of all files are checked
+    against MAX_DATA_SIZE before any file is read.
+    """
+    sources = source_files(params)
+    if not sources:
+        return
+    total = data_size(data, binary_data)
+    sizes = list()
+    keys = set(data) | set(binary_data)
+    for key, path in sources:
+        if key in keys:
+            raise DefinitionError(f"Key {key} (from {path}) is set more than once")
+        keys.add(key)
+        try:
+            sizes.append(os.stat(path).st_size)
+        except OSError as e:
+            raise DefinitionError(f"Cannot read {path}: {e.strerror}")
+        total += len(key) + sizes[-1]
+    if total > MAX_DATA_SIZE:
+        raise DefinitionError(f"ConfigMap data would be {total} bytes, which is more than limit of {MAX_DATA_SIZE} "
+                              f"bytes")
+
+    for (key, path), size in zip(sources, sizes):
+        try:
+            text, encoded = read_file(path, size)
+        except OSError as e:
+            raise DefinitionError(f"Cannot read {path}: {e.strerror}")
+        if text is not None:
+            data[key] = text
+        else:
+            binary_data[key] = encoded
+
+
+def definition(params):
+
+    data = params.get('data')
+    binary_data = params.get('binary_data')
+    if params.get('state') != 'absent' and (params.get('from_files') or params.get('from_dir')):
+        data, binary_data = dict(data or dict()), dict(binary_data or dict())
+        load_sources(params, data, binary_data)
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        "immutable": params.get('immutable'),
+        "binaryData": pruned_copy(binary_data),
+        "data": pruned_copy(data)
+    }
+
+    if params.get('versioned'):
+        return versioned_definition(pruned(body))
+    return pruned(body)
+
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    NAME_RULE,
+    Rule('data{}', Validators.config_map_key,
+         "Keys in data must consist of alphanumeric characters, '-', '_' or '.'"),
+    Rule('binaryData{}', Validators.config_map_key,
+         "Keys in binary_data must consist of alphanumeric characters, '-', '_' or '.'"),
+    Rule('', lambda k8s_definition: not (k8s_definition.get('data', dict()).keys() &
+                                         k8s_definition.get('binaryData', dict()).keys()),
+         "Keys in data and binary_data should not overlap"),
+    Rule('binaryData', Validators.string_byte_dict, "binary_data should be map[string][]byte"),
+)
+
+
+def validate(module, k8s_definition):
+
+    CommonValidation.metadata(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    argspec.update(dict(
+        data=dict(type='dict'),
+        binary_data=dict(type='dict'),
+        from_files=dict(type='list', elements='str'),
+        from_dir=dict(type='path'),
+        immutable=dict(type='bool', default=False)
+    ))
+    argspec.update(copy.deepcopy(VERSIONED_ARG_SPEC))
+    return argspec
+
+
+MUTUALLY_EXCLUSIVE = UPDATE_MUTUALLY_EXCLUSIVE
@@ -0,0 +1,100 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Marshalling,
+                                                                          Rule, RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy, set_defaults
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources import pod_template
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.pod_template import (  # noqa: F401
+    canonicalize_template, references, selector_definition, template_definition, validate_template)
+
+
+def definition(params):
+    update_strategy = params.get('update_strategy') or {}
+    body = {
+        "apiVersion": "apps/v1",
+        "kind": "DaemonSet",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        "spec": pruned({
+            'selector': selector_definition(params.get('selector')),
+            "template": template_definition(params),
+            'minReadySeconds': params.get('min_ready_seconds'),
+            'updateStrategy': pruned({
+                "type": update_strategy.get('type'),
+                "rollingUpdate": pruned({
+                    "maxSurge": update_strategy.get('max_surge'),
+                    "maxUnavailable": update_strategy.get('max_unavailable'),
+                })
+            }),
+            'revisionHistoryLimit': params.get('revision_history_limit'),
+        })
+    }
+    return pruned(body)
+
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    Rule('metadata.labels', bool, "state is present but all of the following are missing: labels", required=True),
+    Rule('spec.selector', bool, "state is present but all of the following are missing: selector", required=True),
+    Rule('spec.updateStrategy', lambda strategy: not (strategy['type'] == 'OnDelete' and 'rollingUpdate' in strategy),
+         "update_strategy.max_surge and update_strategy.max_unavailable can only be present if "
+         "update_strategy.type==RollingUpdate"),
+)
+
+
+def validate(module, k8s_definition):
+
+    CommonValidation.metadata(module, k8s_definition)
+    CommonValidation.selector(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+    validate_template(module, k8s_definition)
+
+
+# defaults, that the API server sets on every DaemonSet, see SetDefaults_DaemonSet
+ROLLING_UPDATE_DEFAULTS = dict(maxSurge='0', maxUnavailable='1')
+
+
+def canonicalize(k8s_definition):
+    """
+    Brings validated definition to the form, that the API server returns: server-side defaults are set and
+    IntOrString values are unmarshalled. Returns k8s_definition.
+    """
+    spec = k8s_definition['spec']
+    update_strategy = spec.setdefault('updateStrategy', dict())
+    update_strategy.setdefault('type', 'RollingUpdate')
+    if update_strategy['type'] == 'RollingUpdate':
+        rolling_update = set_defaults(update_strategy.setdefault('rollingUpdate', dict()), ROLLING_UPDATE_DEFAULTS)
+        for key, value in rolling_update.items():
+            rolling_update[key] = Marshalling.unmarshall_int_or_string(value)
+
+    canonicalize_template(spec['template'])
+    return k8s_definition
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    argspec.update(copy.deepcopy(pod_template.SELECTOR_ARG_SPEC))
+    argspec.update(pod_template.argument_spec())
+    argspec.update(dict(
+        min_ready_seconds=dict(type='int', default=0),
+        update_strategy=dict(type='dict', options=dict(
+            type=dict(type='str', choices=['OnDelete', 'RollingUpdate'], default='RollingUpdate'),
+            max_surge=dict(type='str'),
+            max_unavailable=dict(type='str')
+        )),
+        revision_history_limit=dict(type='int', default=10),
+        verify_references=dict(type='bool', default=False),
+    ))
+    return argspec
+
+
+MUTUALLY_EXCLUSIVE = UPDATE_MUTUALLY_EXCLUSIVE
@@ -0,0 +1,159 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Marshalling,
+                                                                          Rule, RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy, set_defaults
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources import pod_template
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.pod_template import (  # noqa: F401
+    canonicalize_template, references, selector_definition, template_definition, validate_template)
+
+
+def definition(params):
+    strategy = params.get('strategy') or {}
+    body = {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        "spec": pruned({
+            'selector': selector_definition(params.get('selector')),
+            "template": template_definition(params),
+            'replicas': params.get('replicas'),
+            'minReadySeconds': params.get('min_ready_seconds'),
+            'strategy': pruned({
+                "type": strategy.get('type'),
+                "rollingUpdate": pruned({
+                    "maxSurge": strategy.get('max_surge'),
+                    "maxUnavailable": strategy.get('max_unavailable'),
+                })
+            }),
+            'revisionHistoryLimit': params.get('revision_history_limit'),
+            'progressDeadlineSeconds': params.get('progress_deadline_seconds'),
+            'paused': BATCH_PAUSED.get(params.get('rollout_batch'), params.get('paused'))
+        })
+
+    }
+    return pruned(body)
+
+
+# paused of rollout_batch, that overrides paused param
+BATCH_PAUSED = dict(begin=True, commit=False)
+
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    # not required by argspec, since update_images and scale_only need neither
+    Rule('metadata.labels', bool, "state is present but all of the following are missing: labels", required=True),
+    Rule('spec.selector', bool, "state is present but all of the following are missing: selector", required=True),
+    Rule('spec.strategy', lambda strategy: not (strategy['type'] == 'Recreate' and 'rollingUpdate' in strategy),
+         "strategy.max_surge and strategy.max_unavailable can only be present if strategy.type==RollingUpdate"),
+)
+
+IMAGE_RULES = RuleTable(
+    Rule('update_images{}', Validators.dns_label,
+         lambda container, i: f"update_images key {container} {Validators.dns_label_msg}"),
+    Rule('update_images', lambda images: all(isinstance(image, str) and image for image in images.values()),
+         "update_images must map container names to images"),
+)
+
+
+def validate_images(module, params):
+    """
+    Validates update_images of params. The rest of the definition is not validated, since it is not sent.
+    """
+    IMAGE_RULES.validate(module, params)
+
+
+SCALE_RULES = RuleTable(
+    Rule('replicas', lambda replicas: replicas >= 0, "replicas must be greater than or equal to 0"),
+)
+
+
+def validate_scale(module, params):
+    """
+    Validates replicas of params. The rest of the definition is not validated, since only replicas are sent.
+    """
+    SCALE_RULES.validate(module, params)
+
+
+def validate(module, k8s_definition):
+
+    CommonValidation.metadata(module, k8s_definition)
+    CommonValidation.selector(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+    validate_template(module, k8s_definition)
+
+
+ROLLING_UPDATE_DEFAULTS = dict(maxSurge='25%', maxUnavailable='25%')
+
+
+def canonicalize(k8s_definition):
+    """
+    Brings validated definition to the form, that the API server returns: server-side defaults are set and
+    IntOrString values are unmarshalled. Returns k8s_definition.
+    """
+    spec = k8s_definition['spec']
+    strategy = spec.setdefault('strategy', dict())
+    strategy.setdefault('type', 'RollingUpdate')
+    if strategy['type'] == 'RollingUpdate':
+        rolling_update = set_defaults(strategy.setdefault('rollingUpdate', dict()), ROLLING_UPDATE_DEFAULTS)
+        for key, value in rolling_update.items():
+            rolling_update[key] = Marshalling.unmarshall_int_or_string(value)
+
+    canonicalize_template(spec['template'])
+    return k8s_definition
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    argspec.update(copy.deepcopy(pod_template.SELECTOR_ARG_SPEC))
+    argspec.update(pod_template.argument_spec())
+    argspec.update(dict(
+        # no default, so that scale_only requires replicas and patches keep replicas of the existing deployment
+        replicas=dict(type='int'),
+        min_ready_seconds=dict(type='int', default=0),
+        strategy=dict(type='dict', options=dict(
+            type=dict(type='str', choices=['Recreate', 'RollingUpdate'], default='RollingUpdate'),
+            max_surge=dict(type='str'),
+            max_unavailable=dict(type='str')
+        )),
+        revision_history_limit=dict(type='int', default=10),
+        progress_deadline_seconds=dict(type='int', default=600),
+        paused=dict(type='bool'),
+        rollout_batch=dict(type='str', choices=['begin', 'commit']),
+        verify_references=dict(type='bool', default=False),
+        update_images=dict(type='dict'),
+        scale_only=dict(type='bool', default=False),
+    ))
+    return argspec
+
+
+MUTUALLY_EXCLUSIVE = UPDATE_MUTUALLY_EXCLUSIVE + [
+    ('update_images', 'containers'),
+    ('update_images', 'apply'),
+    ('update_images', 'server_side_apply'),
+    ('update_images', 'force'),
+    ('scale_only', 'containers'),
+    ('scale_only', 'update_images'),
+    ('scale_only', 'apply'),
+    ('scale_only', 'server_side_apply'),
+    ('scale_only', 'force'),
+    ('rollout_batch', 'paused'),
+    ('rollout_batch', 'update_images'),
+    ('rollout_batch', 'scale_only'),
+    ('rollout_batch', 'apply'),
+    ('rollout_batch', 'server_side_apply'),
+]
+
+REQUIRED_IF = [
+    ('scale_only', True, ('replicas',))
+]
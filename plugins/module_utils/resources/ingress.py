@@ -0,0 +1,138 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Marshalling,
+                                                                          Rule, RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy, pruned_list
+
+
+def definition(params):
+
+    def get_port(port, _type):
+        """
+        makes sure port gets assigned to 'name' or 'number', depending on IntOrString unmarshalling
+        """
+        unmarshalled_port = Marshalling.unmarshall_int_or_string(port)
+        if isinstance(unmarshalled_port, _type):
+            return unmarshalled_port
+        return None
+
+    def ingress_backend(backend_service):
+        if backend_service is None:
+            return None
+        return pruned({
+            "service": pruned({
+                "name": backend_service.get('name'),
+                "port": pruned({
+                    # function get_port(port, _type) will make sure only one of (name, number) != None
+                    # (required by mutually exclusive condition)
+                    'name': get_port(backend_service.get('port'), str),
+                    'number': get_port(backend_service.get('port'), int),
+                })
+            })
+        })
+
+    body = {
+        "apiVersion": "networking.k8s.io/v1",
+        "kind": "Ingress",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        "spec": pruned({
+            "defaultBackend": ingress_backend(params.get('default_backend_service')),
+            "ingressClassName": params.get('ingress_class_name'),
+            "rules": pruned_list(
+                pruned({
+                    'host': rule.get('host'),
+                    'http': pruned({
+                        'paths': pruned_list(
+                            pruned({
+                                'backend': ingress_backend(path.get('backend_service')),
+                                'path': path.get('path'),
+                                'pathType': path.get('path_type')
+                            })
+                            for path in rule.get('paths') or list()
+                        )
+                    })
+                })
+                for rule in params.get('rules') or list()
+            ),
+            'tls': pruned_list(
+                pruned({
+                    'hosts': tls_config.get('hosts'),
+                    'secretName': tls_config.get('secret')
+                })
+                for tls_config in params.get('tls') or list()
+            )
+        })
+    }
+
+    return pruned(body)
+
+
+PORT_NUMBER_MSG = f"can be a port name or number. If it is a port number, it {Validators.port_msg}"
+PORT_NAME_MSG = f"can be a port name or number. If it is a port name, it {Validators.iana_svc_name_msg}"
+PATHS = 'spec.rules[].http.paths[]'
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    Rule('spec', lambda spec: bool(spec and (spec.get('defaultBackend') or spec.get('rules'))),
+         "At least one of (default_backend_service, rules) must be present. If present, 'rules'"
+         "must contain at least one element", required=True),
+    Rule('spec.defaultBackend.service.name', Validators.dns_label_1035,
+         f"default_backend_service.name {Validators.dns_label_1035_msg}"),
+    Rule('spec.defaultBackend.service.port.number', Validators.port, f"default_backend_service.port {PORT_NUMBER_MSG}"),
+    Rule('spec.defaultBackend.service.port.name', Validators.iana_svc_name,
+         f"default_backend_service.port {PORT_NAME_MSG}"),
+    Rule('spec.rules[].host', Validators.dns_subdomain_wildcard,
+         f"rules[{{0}}].host {Validators.dns_subdomain_wildcard_msg}"),
+    Rule('spec.rules[]', lambda rule: bool(rule.get('http', dict()).get('paths')),
+         "rules[{0}].paths must contain at least one parameter"),
+    Rule(f"{PATHS}.backend.service.name", Validators.dns_label_1035,
+         f"rules[{{0}}].paths[{{1}}].backend_service.name {Validators.dns_label_1035_msg}"),
+    Rule(f"{PATHS}.backend.service.port.number", Validators.port,
+         f"rules[{{0}}].paths[{{1}}].backend_service.port {PORT_NUMBER_MSG}"),
+    Rule(f"{PATHS}.backend.service.port.name", Validators.iana_svc_name,
+         f"rules[{{0}}].paths[{{1}}].backend_service.port {PORT_NAME_MSG}"),
+    Rule(f"{PATHS}.path", Validators.url_path, f"rules[{{0}}].paths[{{1}}].path {Validators.url_path_msg}"),
+    Rule('spec.tls[].secretName', Validators.dns_subdomain, f"tls[{{0}}].secret {Validators.dns_subdomain_msg}"),
+)
+
+
+def validate(module, k8s_definition):
+    CommonValidation.metadata(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    argspec.update(dict(
+        ingress_class_name=dict(type='str'),
+        default_backend_service=dict(type='dict', options=dict(
+            name=dict(type='str', required=True),
+            port=dict(type='str', required=True),
+        )),
+        rules=dict(type='list', elements='dict', options=dict(
+            host=dict(type='str'),
+            paths=dict(type='list', required=True, elements='dict', options=dict(
+                backend_service=dict(type='dict', required=True, options=dict(
+                    name=dict(type='str', required=True),
+                    port=dict(type='str', required=True),
+                )),
+                path=dict(type='str', default='/'),
+                path_type=dict(type='str', default='Prefix', choices=['Exact', 'Prefix']),
+            ))
+        )),
+        tls=dict(type='list', elements='dict', options=dict(
+            hosts=dict(type='list', elements='str'),
+            secret=dict(type='str', no_log=False)
+        ))
+    ))
+    return argspec
+
+
+MUTUALLY_EXCLUSIVE = UPDATE_MUTUALLY_EXCLUSIVE
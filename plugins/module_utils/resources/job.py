@@ -0,0 +1,115 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Check, Rule,
+                                                                          RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy, set_defaults
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources import pod_template
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.pod_template import (  # noqa: F401
+    canonicalize_template, references, template_definition, validate_template)
+
+
+def definition(params):
+    body = {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        "spec": pruned({
+            "template": template_definition(params),
+            'parallelism': params.get('parallelism'),
+            'completions': params.get('completions'),
+            'completionMode': params.get('completion_mode'),
+            'backoffLimit': params.get('backoff_limit'),
+            'activeDeadlineSeconds': params.get('active_deadline_seconds'),
+            'ttlSecondsAfterFinished': params.get('ttl_seconds_after_finished'),
+            'suspend': params.get('suspend'),
+        })
+    }
+    return pruned(body)
+
+
+# limit of completions and parallelism of Indexed Jobs, see ValidateJobSpec
+MAX_INDEXED_COMPLETIONS = 10 ** 5
+
+
+def indexed(spec):
+    """
+    Checks completions and parallelism of an Indexed Job.
+    """
+    if spec.get('completionMode') != 'Indexed':
+        return None
+    if spec.get('completions') is None:
+        return "completions is required with completion_mode=Indexed"
+    if spec['completions'] > MAX_INDEXED_COMPLETIONS:
+        return f"completions must be less than or equal to {MAX_INDEXED_COMPLETIONS} with completion_mode=Indexed"
+    if (spec.get('parallelism') or 0) > MAX_INDEXED_COMPLETIONS:
+        return f"parallelism must be less than or equal to {MAX_INDEXED_COMPLETIONS} with completion_mode=Indexed"
+    return None
+
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    Rule('spec.parallelism', lambda parallelism: parallelism >= 0, "parallelism must be greater than or equal to 0"),
+    Rule('spec.completions', lambda completions: completions >= 0, "completions must be greater than or equal to 0"),
+    Rule('spec.backoffLimit', lambda limit: limit >= 0, "backoff_limit must be greater than or equal to 0"),
+    Rule('spec.activeDeadlineSeconds', lambda seconds: seconds > 0, "active_deadline_seconds must be greater than 0"),
+    Rule('spec.ttlSecondsAfterFinished', lambda seconds: seconds >= 0,
+         "ttl_seconds_after_finished must be greater than or equal to 0"),
+    Check('spec', indexed),
+)
+
+
+def validate(module, k8s_definition):
+
+    CommonValidation.metadata(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+    validate_template(module, k8s_definition)
+
+
+# defaults, that the API server sets on every Job, see SetDefaults_Job
+JOB_DEFAULTS = dict(
+    backoffLimit=6,
+    completionMode='NonIndexed',
+    suspend=False
+)
+
+
+def canonicalize(k8s_definition):
+    """
+    Brings validated definition to the form, that the API server returns: server-side defaults are set.
+    Returns k8s_definition.
+    """
+    spec = set_defaults(k8s_definition['spec'], JOB_DEFAULTS)
+    if spec.get('completions') is None and spec.get('parallelism') is None:
+        spec['completions'] = 1
+    spec.setdefault('parallelism', 1)
+
+    canonicalize_template(spec['template'])
+    return k8s_definition
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    argspec.update(pod_template.argument_spec())
+    argspec.update(dict(
+        restart_policy=dict(type='str', choices=['OnFailure', 'Never'], default='Never'),
+        parallelism=dict(type='int'),
+        completions=dict(type='int'),
+        completion_mode=dict(type='str', choices=['NonIndexed', 'Indexed']),
+        backoff_limit=dict(type='int'),
+        active_deadline_seconds=dict(type='int'),
+        ttl_seconds_after_finished=dict(type='int'),
+        suspend=dict(type='bool'),
+        verify_references=dict(type='bool', default=False),
+    ))
+    return argspec
+
+
+MUTUALLY_EXCLUSIVE = UPDATE_MUTUALLY_EXCLUSIVE
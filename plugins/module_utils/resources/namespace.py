@@ -0,0 +1,55 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Rule,
+                                                                          RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy
+
+
+def definition(params):
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "Namespace",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        })
+    }
+
+    return pruned(body)
+
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+)
+
+
+def validate(module, k8s_definition):
+
+    CommonValidation.metadata(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+
+# label, that the API server sets on every namespace
+NAME_LABEL = 'kubernetes.io/metadata.name'
+
+
+def canonicalize(k8s_definition):
+    """
+    Adds the name label, that the API server sets. Returns k8s_definition.
+    """
+    metadata = k8s_definition['metadata']
+    metadata.setdefault('labels', dict()).setdefault(NAME_LABEL, metadata['name'])
+    return k8s_definition
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    return argspec
+
+
+MUTUALLY_EXCLUSIVE = UPDATE_MUTUALLY_EXCLUSIVE
@@ -0,0 +1,622 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+# Pod template of workload kinds (Deployment, StatefulSet, DaemonSet, Job): definition, validation, canonical form and
+# argspec of containers, volumes and the rest of the pod spec. Rules expect the template under spec.template of the
+# workload definition, as in all of these kinds.
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Marshalling,
+                                                                          Quantity, Check, Rule, RuleTable, References,
+                                                                          Unique)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import (pruned, pruned_copy, pruned_list,
+                                                                          set_defaults)
+
+
+def selector_definition(selector):
+    selector = selector or dict()
+    return pruned({
+        'matchExpressions': pruned_list(pruned_copy(expression)
+                                        for expression in selector.get('match_expressions') or list()),
+        'matchLabels': pruned_copy(selector.get('match_labels'))
+    })
+
+
+def template_definition(params):
+    """
+    Returns pod template of params, labeled and annotated like the workload itself.
+    """
+    return pruned({
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        'spec': pruned({
+            'containers': pruned_list(container_definition(container)
+                                      for container in params.get('containers') or list()),
+            'restartPolicy': params.get('restart_policy'),
+            'imagePullSecrets': pruned_list({'name': secret} for secret in params.get('image_pull_secrets') or list()),
+            'enableServiceLinks': params.get('enable_service_links'),
+            'volumes': pruned_list(volume_definition(volume) for volume in params.get('volumes') or list())
+        })
+    })
+
+
+def container_definition(container):
+    return pruned({
+        'name': container.get('name'),
+        'image': container.get('image'),
+        'imagePullPolicy': container.get('image_pull_policy'),
+        'command': container.get('command'),
+        'args': container.get('args'),
+        'workingDir': container.get('working_dir'),
+        'ports': pruned_list(
+            pruned({
+                'containerPort': port.get('container_port'),
+                'hostIP': port.get('host_ip'),
+                'hostPort': port.get('host_port'),
+                'name': port.get('name'),
+                'protocol': port.get('protocol'),
+            })
+            for port in container.get('ports') or list()
+        ),
+        'env': pruned_list(
+            pruned({
+                'name': env_var.get('name'),
+                'valueFrom': pruned({
+                    'configMapKeyRef': pruned_copy(env_var.get('config_map')),
+                    'secretKeyRef': pruned_copy(env_var.get('secret')),
+                }),
+                'value': env_var.get('value')
+            })
+            for env_var in container.get('env') or list()
+        ),
+        'envFrom': pruned_list(
+            pruned({
+                'configMapRef': pruned_copy(env_from_item.get('config_map')),
+                'prefix': env_from_item.get('prefix'),
+                'secretRef': pruned_copy(env_from_item.get('secret')),
+            })
+            for env_from_item in container.get('env_from') or list()
+        ),
+        'volumeMounts': pruned_list(
+            pruned({
+                'mountPath': volume_mount.get('path'),
+                'name': volume_mount.get('name'),
+                'mountPropagation': volume_mount.get('propagation'),
+                'readOnly': volume_mount.get('read_only'),
+                'subPath': volume_mount.get('sub_path'),
+                'subPathExpr': volume_mount.get('sub_path_expr'),
+            })
+            for volume_mount in container.get('volume_mounts') or list()
+        ),
+        'volumeDevices': pruned_list(
+            pruned({
+                'devicePath': volume_device.get('path'),
+                'name': volume_device.get('name')
+            })
+            for volume_device in container.get('volume_devices') or list()
+        ),
+        'resources': pruned({
+            'limits': quantities(container.get('resource_limits')),
+            'requests': quantities(container.get('resource_requests'))
+        }),
+        'readinessProbe': probe_definition(container.get('readiness_probe')),
+        'livenessProbe': probe_definition(container.get('liveness_probe')),
+        'startupProbe': probe_definition(container.get('startup_probe'))
+    })
+
+
+def quantities(resources):
+    """
+    Returns resources with canonical Quantities as values. Free-form YAML may hold numbers (e.g. cpu: 1), they are
+    quantities as strings.
+    """
+    resources = pruned_copy(resources)
+    if resources is None:
+        return None
+    return Quantity.canonicalize_dict({name: value if isinstance(value, str) else str(value)
+                                       for name, value in resources.items()})
+
+
+def probe_definition(probe):
+    if not probe:
+        return None
+    http_get = probe.get('http_get')
+    tcp_socket = probe.get('tcp_socket')
+    _exec = probe.get('exec')
+    grpc = probe.get('grpc')
+    return pruned({
+        'httpGet': http_get and pruned({
+            'path': http_get.get('path'),
+            'port': Marshalling.unmarshall_int_or_string(http_get.get('port')),
+            'host': http_get.get('host'),
+            'scheme': http_get.get('scheme'),
+            'httpHeaders': pruned_list(pruned_copy(header) for header in http_get.get('http_headers') or list())
+        }),
+        'tcpSocket': tcp_socket and pruned({
+            'port': Marshalling.unmarshall_int_or_string(tcp_socket.get('port')),
+            'host': tcp_socket.get('host')
+        }),
+        # empty command is kept, so that validation reports it
+        'exec': _exec and {'command': _exec.get('command')},
+        'grpc': grpc and pruned({
+            'port': grpc.get('port'),
+            'service': grpc.get('service')
+        }),
+        'initialDelaySeconds': probe.get('initial_delay_seconds'),
+        'periodSeconds': probe.get('period_seconds'),
+        'timeoutSeconds': probe.get('timeout_seconds'),
+        'successThreshold': probe.get('success_threshold'),
+        'failureThreshold': probe.get('failure_threshold'),
+        'terminationGracePeriodSeconds': probe.get('termination_grace_period_seconds')
+    })
+
+
+def volume_definition(volume):
+    pvc = volume.get('pvc')
+    config_map = volume.get('config_map')
+    secret = volume.get('secret')
+    empty_dir = volume.get('empty_dir')
+    return pruned({
+        'name': volume.get('name'),
+        'persistentVolumeClaim': pvc and pruned({
+            'claimName': pvc.get('claim_name'),
+            'readOnly': pvc.get('read_only')
+        }),
+        'configMap': config_map and pruned({
+            'name': config_map.get('name'),
+            'optional': config_map.get('optional'),
+            'defaultMode': config_map.get('default_mode'),
+            'items': pruned_list(pruned_copy(item) for item in config_map.get('items') or list()),
+        }),
+        'secret': secret and pruned({
+            'secretName': secret.get('name'),
+            'optional': secret.get('optional'),
+            'defaultMode': secret.get('default_mode'),
+            'items': pruned_list(pruned_copy(item) for item in secret.get('items') or list()),
+        }),
+        # medium '' (node default) keeps emptyDir from being pruned, canonical form drops it
+        'emptyDir': empty_dir and pruned({
+            'medium': empty_dir.get('medium'),
+            'sizeLimit': Quantity.canonicalize(empty_dir['size_limit']) if empty_dir.get('size_limit') else None
+        })
+    })
+
+
+def one_of(*keys):
+    return lambda item: sum(key in item for key in keys) == 1
+
+
+def one_of_value_from(*keys):
+    return lambda env_var: sum(['value' in env_var] + [key in env_var.get('valueFrom', dict()) for key in keys]) == 1
+
+
+CONTAINERS = 'spec.template.spec.containers[]'
+VOLUMES = 'spec.template.spec.volumes[]'
+RESOURCES = f"{CONTAINERS}.resources"
+# key of probe in container -> its param
+PROBES = dict(readinessProbe='readiness_probe', livenessProbe='liveness_probe', startupProbe='startup_probe')
+
+
+def port_or_name(port):
+    if isinstance(port, int):
+        return Validators.port(port)
+    return Validators.iana_svc_name(port)
+
+
+def unknown_probe_ports(container):
+    """
+    Returns sorted names of ports, that probes of container refer to, but container does not declare.
+    """
+    declared = {port.get('name') for port in container.get('ports') or list()}
+    unknown = set()
+    for key in PROBES:
+        probe = container.get(key) or dict()
+        for handler in ('httpGet', 'tcpSocket'):
+            port = (probe.get(handler) or dict()).get('port')
+            if isinstance(port, str) and port not in declared:
+                unknown.add(port)
+    return sorted(unknown)
+
+
+def invalid_names(resources):
+    return sorted(name for name in resources if not Validators.resource_name(name))
+
+
+def invalid_quantities(resources):
+    return sorted(name for name, value in resources.items() if not Validators.quantity(value))
+
+
+def hugepages(resources):
+    return any(name.startswith('hugepages-') for name in (resources.get('limits') or dict()))
+
+
+def hugepages_volumes(k8s_definition):
+    """
+    Checks, that containers provide hugepages for every emptyDir volume with medium HugePages(-<size>).
+    """
+    pod_spec = k8s_definition['spec']['template']['spec']
+    provided = {name[len('hugepages-'):]
+                for container in pod_spec.get('containers') or list()
+                for name in ((container.get('resources') or dict()).get('limits') or dict())
+                if name.startswith('hugepages-')}
+    for i, volume in enumerate(pod_spec.get('volumes') or list()):
+        medium = (volume.get('emptyDir') or dict()).get('medium') or ''
+        if not medium.startswith('HugePages'):
+            continue
+        size = medium[len('HugePages-'):]
+        if size and size not in provided:
+            return f"volumes[{i}].empty_dir.medium is {medium}, but no container has resource_limits.hugepages-{size}"
+        if not provided:
+            return f"volumes[{i}].empty_dir.medium is {medium}, but no container has hugepages in resource_limits"
+        if not size and len(provided) > 1:
+            return f"volumes[{i}].empty_dir.medium must be HugePages-<size>, when containers use several sizes of " \
+                   f"hugepages"
+    return None
+
+
+def probe_rules(key, param):
+    """
+    Returns rules of probe key of containers, reported as param.
+    """
+    probe = f"{CONTAINERS}.{key}"
+    rules = [
+        Rule(probe, one_of('httpGet', 'tcpSocket', 'exec', 'grpc'),
+             f"containers[{{0}}].{param} must have exactly one handler. "
+             f"Only one of (http_get, tcp_socket, exec, grpc) can be present."),
+        Rule(f"{probe}.httpGet.port", port_or_name,
+             f"containers[{{0}}].{param}.http_get.port should be a valid port number, 0 < x < 65536, or a port name"),
+        Rule(f"{probe}.httpGet.httpHeaders[].name", bool,
+             f"containers[{{0}}].{param}.http_get.http_headers[{{1}}].name must not be empty"),
+        Rule(f"{probe}.tcpSocket.port", port_or_name,
+             f"containers[{{0}}].{param}.tcp_socket.port should be a valid port number, 0 < x < 65536, "
+             f"or a port name"),
+        Rule(f"{probe}.exec.command", bool, f"containers[{{0}}].{param}.exec.command must not be empty"),
+        Rule(f"{probe}.grpc.port", Validators.port, f"containers[{{0}}].{param}.grpc.port {Validators.port_msg}"),
+        Rule(f"{probe}.initialDelaySeconds", lambda seconds: seconds >= 0,
+             f"containers[{{0}}].{param}.initial_delay_seconds must be greater than or equal to 0"),
+        Rule(f"{probe}.periodSeconds", lambda seconds: seconds > 0,
+             f"containers[{{0}}].{param}.period_seconds must be greater than 0"),
+        Rule(f"{probe}.timeoutSeconds", lambda seconds: seconds > 0,
+             f"containers[{{0}}].{param}.timeout_seconds must be greater than 0"),
+        Rule(f"{probe}.successThreshold", lambda threshold: threshold > 0,
+             f"containers[{{0}}].{param}.success_threshold must be greater than 0"),
+        Rule(f"{probe}.failureThreshold", lambda threshold: threshold > 0,
+             f"containers[{{0}}].{param}.failure_threshold must be greater than 0"),
+        Rule(f"{probe}.terminationGracePeriodSeconds", lambda seconds: seconds > 0,
+             f"containers[{{0}}].{param}.termination_grace_period_seconds must be greater than 0"),
+    ]
+    if key == 'readinessProbe':
+        # containers are not restarted on failed readiness
+        rules.append(Rule(f"{probe}.terminationGracePeriodSeconds", lambda seconds: False,
+                          f"containers[{{0}}].{param}.termination_grace_period_seconds must not be set"))
+    else:
+        rules.append(Rule(f"{probe}.successThreshold", lambda threshold: threshold == 1,
+                          f"containers[{{0}}].{param}.success_threshold must be 1"))
+    return rules
+
+
+POD_RULES = RuleTable(
+    # volumes first, containers reference them
+    Rule(f"{VOLUMES}.name", Validators.dns_label, f"volumes[{{0}}].name {Validators.dns_label_msg}"),
+    Rule(VOLUMES, one_of('persistentVolumeClaim', 'configMap', 'secret', 'emptyDir'),
+         "More then one volume source in volumes[{0}]. Only one of (pvc, config_map, secret, empty_dir) can be "
+         "present."),
+    Rule(f"{VOLUMES}.emptyDir.sizeLimit", Validators.quantity,
+         "volumes[{0}].empty_dir.size_limit should be a Quantity"),
+
+    Rule('spec.template.spec.containers', bool, "There must be at least one container in a Pod.", required=True),
+    Rule(f"{CONTAINERS}.name", Validators.dns_label, f"containers[{{0}}].name {Validators.dns_label_msg}"),
+    Rule(f"{CONTAINERS}.image", lambda image: image is not None, "containers[{0}].image is missing", required=True),
+
+    Rule(f"{CONTAINERS}.ports[].containerPort", Validators.port,
+         f"containers[{{0}}].ports[{{1}}].container_port {Validators.port_msg}"),
+    Rule(f"{CONTAINERS}.ports[].hostPort", Validators.port,
+         f"containers[{{0}}].ports[{{1}}].host_port {Validators.port_msg}"),
+    Rule(f"{CONTAINERS}.ports[].name", Validators.iana_svc_name,
+         f"containers[{{0}}].ports[{{1}}].name {Validators.iana_svc_name_msg}"),
+    Unique(f"{CONTAINERS}.ports[].name", "Duplicate port name found (containers[{0}].ports[{1}].name). "
+                                         "Each named port in a pod must have a unique name"),
+
+    Rule(f"{CONTAINERS}.env[].name", Validators.c_identifier,
+         f"containers[{{0}}].env[{{1}}].name {Validators.c_identifier_msg}"),
+    Rule(f"{CONTAINERS}.env[]", one_of_value_from('configMapKeyRef', 'secretKeyRef'),
+         "More then one value source in containers[{0}].env[{1}]. "
+         "Only one of (value, config_map, secret) can be present."),
+    Rule(f"{CONTAINERS}.env[].valueFrom.configMapKeyRef.name", Validators.dns_subdomain,
+         f"containers[{{0}}].env[{{1}}].config_map.name {Validators.dns_subdomain_msg}"),
+    Rule(f"{CONTAINERS}.env[].valueFrom.secretKeyRef.name", Validators.dns_subdomain,
+         f"containers[{{0}}].env[{{1}}].secret.name {Validators.dns_subdomain_msg}"),
+
+    Rule(f"{CONTAINERS}.envFrom[]", one_of('configMapRef', 'secretRef'),
+         "More then one value source in containers[{0}].env_from[{1}]. "
+         "Only one of (config_map, secret) can be present."),
+    Rule(f"{CONTAINERS}.envFrom[].configMapRef.name", Validators.dns_subdomain,
+         f"containers[{{0}}].env_from[{{1}}].config_map.name {Validators.dns_subdomain_msg}"),
+    Rule(f"{CONTAINERS}.envFrom[].secretRef.name", Validators.dns_subdomain,
+         f"containers[{{0}}].env_from[{{1}}].secret.name {Validators.dns_subdomain_msg}"),
+    Rule(f"{CONTAINERS}.envFrom[].prefix", Validators.c_identifier,
+         f"containers[{{0}}].env_from[{{1}}].prefix {Validators.c_identifier_msg}"),
+
+    References(f"{CONTAINERS}.volumeMounts[].name", f"{VOLUMES}.name",
+               "containers[{0}].volume_mounts[{1}].name not found. Every name should match the Name of a Volume."),
+    Rule(f"{CONTAINERS}.volumeMounts[].mountPath", lambda path: ':' not in path,
+         "containers[{0}].volume_mounts[{1}].path should not contain ':'"),
+    Rule(f"{CONTAINERS}.volumeMounts[]", lambda mount: not ('subPath' in mount and 'subPathExpr' in mount),
+         "sub_path and sub_path_expr in containers[{0}].volume_mounts[{1}] are mutually exclusive"),
+
+    References(f"{CONTAINERS}.volumeDevices[].name", f"{VOLUMES}.name",
+               "containers[{0}].volume_devices[{1}].name not found. Every name should match the Name of a Volume."),
+    References(f"{CONTAINERS}.volumeDevices[].name", VOLUMES,
+               "containers[{0}].volume_devices[{1}].name should match the name of a persistentVolumeClaim (pvc) "
+               "in the pod", key=lambda volume: volume['name'] if 'persistentVolumeClaim' in volume else None),
+    Rule(f"{CONTAINERS}.volumeDevices[].devicePath", lambda path: ':' not in path,
+         "containers[{0}].volume_devices[{1}].path should not contain ':'"),
+
+    Rule(f"{RESOURCES}.limits", lambda limits: not invalid_names(limits),
+         lambda limits, i: f"containers[{i}].resource_limits.{', '.join(invalid_names(limits))} "
+                           f"{Validators.resource_name_msg}"),
+    Rule(f"{RESOURCES}.requests", lambda requests: not invalid_names(requests),
+         lambda requests, i: f"containers[{i}].resource_requests.{', '.join(invalid_names(requests))} "
+                             f"{Validators.resource_name_msg}"),
+    Rule(f"{RESOURCES}.limits", lambda limits: not invalid_quantities(limits),
+         lambda limits, i: f"containers[{i}].resource_limits.{', '.join(invalid_quantities(limits))} "
+                           f"should be Quantities"),
+    Rule(f"{RESOURCES}.requests", lambda requests: not invalid_quantities(requests),
+         lambda requests, i: f"containers[{i}].resource_requests.{', '.join(invalid_quantities(requests))} "
+                             f"should be Quantities"),
+    Rule(RESOURCES, lambda resources: not Validators.overcommitted_requests(resources),
+         lambda resources, i: f"containers[{i}].resource_requests."
+                              f"{', '.join(Validators.overcommitted_requests(resources))} must be equal to "
+                              f"resource_limits, hugepages and extended resources may not be overcommitted"),
+    Rule(RESOURCES, lambda resources: not hugepages(resources) or any(
+        name in (resources.get(key) or dict()) for key in ('limits', 'requests') for name in ('cpu', 'memory')),
+         "containers[{0}] with hugepages in resource_limits must also have cpu or memory in resource_limits or "
+         "resource_requests"),
+    Rule(RESOURCES, lambda resources: not Validators.exceeding_requests(resources),
+         lambda resources, i: f"containers[{i}].resource_requests."
+                              f"{', '.join(Validators.exceeding_requests(resources))} must be less than or equal to "
+                              f"resource_limits"),
+
+    Check('spec', lambda spec: hugepages_volumes({'spec': spec})),
+
+    *probe_rules('readinessProbe', 'readiness_probe'),
+    *probe_rules('livenessProbe', 'liveness_probe'),
+    *probe_rules('startupProbe', 'startup_probe'),
+    Rule(CONTAINERS, lambda container: not unknown_probe_ports(container),
+         lambda container, i: f"containers[{i}] has no port named {', '.join(unknown_probe_ports(container))}. "
+                              f"Every named port of a probe should match the name of a port of the container."),
+)
+
+
+def validate_template(module, k8s_definition):
+    CommonValidation.metadata(module, k8s_definition['spec']['template'])
+    POD_RULES.validate(module, k8s_definition)
+
+
+def references(k8s_definition):
+    """
+    Collects ConfigMaps, Secrets and PersistentVolumeClaims, that the pod template requires (references, that are not
+    optional). Returns dict of (apiVersion, kind) -> dict of name -> list of params, that refer to the object.
+    """
+    referenced = dict()
+
+    def add(kind, ref, name_key, param):
+        if ref and ref.get(name_key) and not ref.get('optional'):
+            referenced.setdefault(('v1', kind), dict()).setdefault(ref[name_key], list()).append(param)
+
+    pod_spec = k8s_definition['spec']['template']['spec']
+    for i, container in enumerate(pod_spec.get('containers') or list()):
+        for j, env_var in enumerate(container.get('env') or list()):
+            value_from = env_var.get('valueFrom') or dict()
+            add('ConfigMap', value_from.get('configMapKeyRef'), 'name', f"containers[{i}].env[{j}].config_map")
+            add('Secret', value_from.get('secretKeyRef'), 'name', f"containers[{i}].env[{j}].secret")
+        for j, env_from_item in enumerate(container.get('envFrom') or list()):
+            add('ConfigMap', env_from_item.get('configMapRef'), 'name', f"containers[{i}].env_from[{j}].config_map")
+            add('Secret', env_from_item.get('secretRef'), 'name', f"containers[{i}].env_from[{j}].secret")
+    for i, volume in enumerate(pod_spec.get('volumes') or list()):
+        add('ConfigMap', volume.get('configMap'), 'name', f"volumes[{i}].config_map")
+        add('Secret', volume.get('secret'), 'secretName', f"volumes[{i}].secret")
+        add('PersistentVolumeClaim', volume.get('persistentVolumeClaim'), 'claimName', f"volumes[{i}].pvc")
+    return referenced
+
+
+# defaults, that the API server sets on every pod template, see SetDefaults_PodSpec and SetDefaults_Container
+POD_DEFAULTS = dict(
+    restartPolicy='Always',
+    dnsPolicy='ClusterFirst',
+    terminationGracePeriodSeconds=30,
+    schedulerName='default-scheduler'
+)
+CONTAINER_DEFAULTS = dict(
+    terminationMessagePath='/dev/termination-log',
+    terminationMessagePolicy='File'
+)
+PROBE_DEFAULTS = dict(
+    timeoutSeconds=1,
+    periodSeconds=10,
+    successThreshold=1,
+    failureThreshold=3
+)
+
+
+def image_pull_policy(image):
+    """
+    Returns default imagePullPolicy of image: Always for latest (or missing) tag, IfNotPresent otherwise.
+    """
+    if '@' in image:
+        return 'IfNotPresent'
+    tag = image.rpartition('/')[2].partition(':')[2]
+    return 'Always' if tag in ('', 'latest') else 'IfNotPresent'
+
+
+def canonicalize_template(template):
+    """
+    Sets server-side defaults of pod spec and containers of template. Returns template.
+    """
+    pod_spec = set_defaults(template['spec'], POD_DEFAULTS)
+    for container in pod_spec.get('containers') or list():
+        set_defaults(container, CONTAINER_DEFAULTS)
+        if container.get('image'):
+            container.setdefault('imagePullPolicy', image_pull_policy(container['image']))
+        for key in PROBES:
+            if container.get(key):
+                probe = set_defaults(container[key], PROBE_DEFAULTS)
+                if 'httpGet' in probe:
+                    probe['httpGet'].setdefault('path', '/')
+    for volume in pod_spec.get('volumes') or list():
+        if (volume.get('emptyDir') or dict()).get('medium') == '':
+            del volume['emptyDir']['medium']
+    return template
+
+
+SELECTOR_ARG_SPEC = dict(
+    selector=dict(type='dict', options=dict(
+        match_labels=dict(type='dict'),
+        match_expressions=dict(type='list', elements='dict', options=dict(
+            key=dict(type='str', required=True, no_log=False),
+            operator=dict(type='str', required=True, choices=['In', 'NotIn', 'Exists', 'DoesNotExist']),
+            values=dict(type='list', elements='str')
+        ))
+    )),
+)
+
+_arg_spec = None
+
+
+def argument_spec():
+    """
+    Returns argspec of the pod template. It is built once per process (and reused across tasks in turbo mode), so it
+    is shared by all callers and must not be changed.
+    """
+    global _arg_spec
+    if _arg_spec is None:
+        probe_options = dict(
+            http_get=dict(type='dict', options=dict(
+                path=dict(type='str'),
+                port=dict(type='str', required=True),
+                host=dict(type='str'),
+                scheme=dict(type='str', choices=['HTTP', 'HTTPS'], default='HTTP'),
+                http_headers=dict(type='list', elements='dict', options=dict(
+                    name=dict(type='str', required=True),
+                    value=dict(type='str', required=True)
+                ))
+            )),
+            tcp_socket=dict(type='dict', options=dict(
+                port=dict(type='str', required=True),
+                host=dict(type='str')
+            )),
+            exec=dict(type='dict', options=dict(
+                command=dict(type='list', elements='str', required=True)
+            )),
+            grpc=dict(type='dict', options=dict(
+                port=dict(type='int', required=True),
+                service=dict(type='str')
+            )),
+            initial_delay_seconds=dict(type='int'),
+            period_seconds=dict(type='int'),
+            timeout_seconds=dict(type='int'),
+            success_threshold=dict(type='int'),
+            failure_threshold=dict(type='int'),
+            termination_grace_period_seconds=dict(type='int')
+        )
+        _arg_spec = dict(
+            # TODO init_container spec
+            containers=dict(type='list', elements='dict', options=dict(
+                name=dict(type='str', required=True),
+                image=dict(type='str'),
+                image_pull_policy=dict(type='str', choices=['Always', 'Never', 'IfNotPresent']),
+                command=dict(type='list', elements='str'),
+                args=dict(type='list', elements='str'),
+                working_dir=dict(type='str', aliases=['workdir']),
+                ports=dict(type='list', elements='dict', options=dict(
+                    container_port=dict(type='int', required=True),
+                    host_ip=dict(type='str'),
+                    host_port=dict(type='int'),
+                    name=dict(type='str'),
+                    protocol=dict(type='str', choices=['UDP', 'TCP', 'SCTP'], default='TCP')
+                )),
+                env=dict(type='list', elements='dict', options=dict(
+                    name=dict(type='str', required=True),
+                    value=dict(type='str'),
+                    config_map=dict(type='dict', options=dict(
+                        key=dict(type='str', required=True, no_log=False),
+                        name=dict(type='str'),
+                        optional=dict(type='bool')
+                    )),
+                    # TODO resources_field_ref, field_ref
+                    secret=dict(type='dict', no_log=False, options=dict(
+                        key=dict(type='str', required=True, no_log=False),
+                        name=dict(type='str'),
+                        optional=dict(type='bool')
+                    ))
+                )),
+                env_from=dict(type='list', elements='dict', options=dict(
+                    config_map=dict(type='dict', options=dict(
+                        name=dict(type='str', required=True),
+                        optional=dict(type='bool')
+                    )),
+                    prefix=dict(type='str'),
+                    secret=dict(type='dict', no_log=False, options=dict(
+                        name=dict(type='str', required=True),
+                        optional=dict(type='bool')
+                    ))
+                )),
+                volume_mounts=dict(type='list', elements='dict', options=dict(
+                    path=dict(type='str', required=True),
+                    name=dict(type='str', required=True),
+                    propagation=dict(type='str', choices=['None', 'HostToContainer', 'Bidirectional'], default='None'),
+                    read_only=dict(type='bool', default=False),
+                    sub_path=dict(type='str'),
+                    sub_path_expr=dict(type='str')
+                )),
+                volume_devices=dict(type='list', elements='dict', options=dict(
+                    path=dict(type='str', required=True),
+                    name=dict(type='str', required=True)
+                )),
+                resource_limits=dict(type='dict'),
+                resource_requests=dict(type='dict'),
+                readiness_probe=dict(type='dict', options=probe_options),
+                liveness_probe=dict(type='dict', options=probe_options),
+                startup_probe=dict(type='dict', options=probe_options)
+                # TODO add lifecycle, securityContext, stdin, stdinOnce, terminationMessagePath,
+                #      terminationMessagePolicy, tty
+            )),
+            image_pull_secrets=dict(type='list', elements='str', no_log=False),
+            enable_service_links=dict(type='bool', default=True),
+            volumes=dict(type='list', elements='dict', options=dict(
+                name=dict(type='str', required=True),
+                pvc=dict(type='dict', options=dict(
+                    claim_name=dict(type='str', required=True),
+                    read_only=dict(type='bool', default=False)
+                )),
+                config_map=dict(type='dict', options=dict(
+                    name=dict(type='str'),
+                    optional=dict(type='bool'),
+                    default_mode=dict(type='int', default=0o644),
+                    items=dict(type='list', elements='dict', options=dict(
+                        key=dict(type='str', required=True, no_log=False),
+                        path=dict(type='str', required=True),
+                        mode=dict(type='int')
+                    ))
+                )),
+                secret=dict(type='dict', no_log=False, options=dict(
+                    name=dict(type='str'),
+                    optional=dict(type='bool'),
+                    default_mode=dict(type='int', default=0o644),
+                    items=dict(type='list', elements='dict', options=dict(
+                        key=dict(type='str', required=True, no_log=False),
+                        path=dict(type='str', required=True),
+                        mode=dict(type='int')
+                    ))
+                )),
+                empty_dir=dict(type='dict', options=dict(
+                    medium=dict(type='str', choices=['', 'Memory', 'HugePages', 'HugePages-2Mi', 'HugePages-1Gi'],
+                                default=''),
+                    size_limit=dict(type='str')
+                ))
+            )),
+            # TODO lifecycle, scheduling
+        )
+    return _arg_spec
@@ -0,0 +1,80 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import common_arg_spec
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Quantity,
+                                                                          Rule, RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy, pruned_list
+
+
+def definition(params):
+    selector = params.get('selector') or {}
+    body = {
+        "apiVersion": "v1",
+        "kind": "PersistentVolumeClaim",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        'spec': pruned({
+            'accessModes': params.get('access_modes'),
+            'selector': pruned({
+                'matchExpressions': pruned_list(pruned_copy(expression)
+                                                for expression in selector.get('match_expressions') or list()),
+                'matchLabels': pruned_copy(selector.get('match_labels'))
+            }),
+            'resources': pruned({
+                'requests': pruned_copy(Quantity.canonicalize_dict({
+                    'storage': params.get('storage_request')
+                })),
+                'limits': pruned_copy(Quantity.canonicalize_dict({
+                    'storage': params.get('storage_limit')
+                }))
+            }),
+            'volumeName': params.get('volume_name'),
+            'storageClassName': params.get('storage_class_name'),
+            'volumeMode': params.get('volume_mode')
+        })
+    }
+    return pruned(body)
+
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    Rule('spec.accessModes', bool, "Access_modes should have at least 1 element", required=True),
+    Rule('spec.resources.limits', Validators.string_quantity_dict, "Storage_limit should be map[string]Quantity"),
+    Rule('spec.resources.requests', Validators.string_quantity_dict, "Storage_request should be map[string]Quantity"),
+)
+
+
+def validate(module, k8s_definition):
+    CommonValidation.metadata(module, k8s_definition)
+    CommonValidation.selector(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+
+def argument_spec():
+    argspec = common_arg_spec()
+    argspec.update(dict(
+        access_modes=dict(type='list', elements='str', choices=['ReadWriteOnce', 'ReadOnlyMany', 'ReadWriteMany']),
+        selector=dict(type='dict', options=dict(
+            match_labels=dict(type='dict'),
+            match_expressions=dict(type='list', elements='dict', options=dict(
+                key=dict(type='str', required=True, no_log=False),
+                operator=dict(type='str', required=True, choices=['In', 'NotIn', 'Exists', 'DoesNotExist']),
+                values=dict(type='list', elements='str')
+            ))
+        )),
+        storage_request=dict(type='str'),
+        storage_limit=dict(type='str'),
+        volume_name=dict(type='str'),
+        storage_class_name=dict(type='str'),
+        volume_mode=dict(type='str', choices=['Filesystem', 'Block'], default='Filesystem')
+    ))
+    return argspec
+
+
+REQUIRED_IF = [
+    ('state', 'present', ('access_modes', 'storage_request'))
+]
@@ -0,0 +1,80 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import copy
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE,
+                                                                               VERSIONED_ARG_SPEC)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Rule,
+                                                                          RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy
+from ansible_collections.sodalite.k8s.plugins.module_utils.versioned import NAME_RULE, versioned_definition
+
+
+def definition(params):
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        "immutable": params.get('immutable'),
+        "type": params.get('type'),
+        "stringData": pruned_copy(params.get('string_data')),
+        "data": pruned_copy(params.get('data')),
+    }
+
+    if params.get('versioned'):
+        return versioned_definition(pruned(body))
+    return pruned(body)
+
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    NAME_RULE,
+    Rule('data{}', Validators.config_map_key,
+         "Keys in data must consist of alphanumeric characters, '-', '_' or '.'"),
+    Rule('stringData{}', Validators.config_map_key,
+         "Keys in string_data must consist of alphanumeric characters, '-', '_' or '.'"),
+    Rule('data', Validators.string_byte_dict, "data should be map[string][]byte"),
+    Rule('stringData', Validators.string_string_dict, "string_data should be map[string]string"),
+)
+
+
+def validate(module, k8s_definition):
+
+    CommonValidation.metadata(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+
+def canonicalize(k8s_definition):
+    """
+    Merges stringData into data, like the API server does, since stringData is never returned.
+    Returns k8s_definition.
+    """
+    string_data = k8s_definition.pop('stringData', None)
+    if string_data:
+        data = k8s_definition.setdefault('data', dict())
+        for key, value in string_data.items():
+            data[key] = base64.b64encode(str(value).encode()).decode('ascii')
+    return k8s_definition
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    argspec.update(dict(
+        data=dict(type='dict'),
+        string_data=dict(type='dict'),
+        type=dict(type='str', default='Opaque'),
+        immutable=dict(type='bool', default=False)
+    ))
+    argspec.update(copy.deepcopy(VERSIONED_ARG_SPEC))
+    return argspec
+
+
+MUTUALLY_EXCLUSIVE = UPDATE_MUTUALLY_EXCLUSIVE
@@ -0,0 +1,293 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, IpRanges,
+                                                                          Marshalling, Check, Rule, RuleTable, Unique)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy, pruned_list
+
+from copy import deepcopy
+
+
+# params and fields of lists of IP addresses and ranges, that can be collapsed
+IP_LIST_FIELDS = (('external_ips', 'externalIPs'), ('load_balancer_source_ranges', 'loadBalancerSourceRanges'))
+
+
+def collapse(entries, method):
+    """
+    Returns entries, collapsed by method of their IpRanges index. Lists with invalid entries are returned unchanged,
+    validation reports them.
+    """
+    if not entries:
+        return entries
+    index = IpRanges(entries)
+    return entries if index.invalid else method(index)
+
+
+def definition(params):
+    external_ips = params.get('external_ips')
+    source_ranges = params.get('load_balancer_source_ranges')
+    if params.get('collapse_ranges'):
+        # external IPs must stay single addresses, so only redundant ones are removed
+        external_ips = collapse(external_ips, IpRanges.deduplicated)
+        source_ranges = collapse(source_ranges, IpRanges.collapsed)
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        'spec': pruned({
+            'selector': pruned_copy(params.get('selector')),
+            'ports': pruned_list(
+                pruned({
+                    'port': port_obj.get('port'),
+                    'targetPort': Marshalling.unmarshall_int_or_string(port_obj.get('target_port')),
+                    'protocol': port_obj.get('protocol'),
+                    'name': port_obj.get('name'),
+                    'nodePort': port_obj.get('node_port'),
+                })
+                for port_obj in params.get('ports') or list()
+            ),
+            'type': params.get('type'),
+            'ipFamilies': params.get('ip_families'),
+            'ipFamilyPolicy': params.get('ip_families_policy'),
+            'clusterIP': params.get('cluster_ip')
+            or (params.get('cluster_ips')[0] if params.get('cluster_ips') else None),  # adds clusterIP[0] to clusterIP
+            'clusterIPs': params.get('cluster_ips'),
+            'externalIPs': external_ips,
+            'loadBalancerIP': params.get('load_balancer_ip'),
+            'loadBalancerSourceRanges': source_ranges,
+            'loadBalancerClass': params.get('load_balancer_class'),
+            'externalName': params.get('external_name'),
+            'externalTrafficPolicy': params.get('external_traffic_policy'),
+            'internalTrafficPolicy': params.get('internal_traffic_policy'),
+            'healthCheckNodePort': params.get('health_check_node_port'),
+            'publishNotReadyAddresses': params.get('publish_not_ready_addresses'),
+            'sessionAffinity': params.get('session_affinity'),
+            'sessionAffinityConfig': pruned({
+                'clientIP': pruned({
+                    'timeoutSeconds': params.get('session_affinity_timeout')
+                })
+            })
+        })
+    }
+    return pruned(body)
+
+
+def unnamed_port(ports):
+    """
+    Returns error, if service has more then one port and any of them is not named.
+    """
+    if len(ports) > 1:
+        for i, port in enumerate(ports):
+            if port.get('name') is None:
+                return f"ports[{i}].name is not set, but should be, since service has more then one port"
+    return None
+
+
+def cluster_ips_family(cluster_ips):
+    """
+    Returns error, if both cluster_ips are of the same family.
+    """
+    if len(cluster_ips) == 2 and (
+            Validators.ipv4_address(cluster_ips[0]) and Validators.ipv4_address(cluster_ips[1]) or
+            Validators.ipv6_address(cluster_ips[0]) and Validators.ipv6_address(cluster_ips[1])):
+        return "One IP in cluster_ips must be IPv4 and other IPv6"
+    return None
+
+
+def cluster_ips_address(spec):
+    """
+    Returns error, if cluster_ips and cluster_ip are not addresses of ip_families.
+    """
+    ip_families = spec.get('ipFamilies') or list()
+    ip_validation, ip_validation_msg = \
+        (Validators.ip_address, Validators.ip_address_msg) if len(ip_families) != 1 else \
+        (Validators.ipv4_address, Validators.ipv4_address_msg) if ip_families[0] == 'IPv4' else \
+        (Validators.ipv6_address, Validators.ipv6_address_msg)
+
+    for i, cluster_ip_item in enumerate(spec.get('clusterIPs') or list()):
+        if not (cluster_ip_item in (None, "None", "") or ip_validation(cluster_ip_item)):
+            return f'cluster_ips[{i}] {ip_validation_msg}, None or "" when "ip_families" is' \
+                   f' {ip_families or "not specified"}'
+
+    cluster_ip = spec.get('clusterIP')
+    if not (cluster_ip in (None, "None", "") or ip_validation(cluster_ip)):
+        return f'cluster_ip {ip_validation_msg}, None or "" when "ip_families" is {ip_families or "not specified"}'
+    return None
+
+
+def is_external_name(spec):
+    return spec.get('type') == 'ExternalName'
+
+
+# cluster_ips are verified before cluster_ip; if cluster_ip had not been defined, it could be just copied from
+# cluster_ips[0]. Validating cluster_ips first will make user get the right error message (with reference to
+# cluster_ips[0], not cluster_ip)
+RULES = RuleTable(
+    # for some reason, name should be a RFC 1035 Label Names
+    Rule('metadata.name', Validators.dns_label_1035, f"name {Validators.dns_label_1035_msg}"),
+
+    Rule('spec', lambda spec: not (spec.get('selector') and is_external_name(spec)),
+         "selector is not allowed with type='ExternalName'"),
+    Rule('spec.selector', Validators.string_string_dict, "selector should be map[string]string"),
+
+    Rule('spec.ports', bool, "ports must have at least one element", required=True),
+    Rule('spec.ports[].port', Validators.port, f"ports[{{0}}].port {Validators.port_msg}"),
+    Rule('spec.ports[].targetPort',
+         lambda target_port: not isinstance(target_port, int) or Validators.port(target_port),
+         f"ports[{{0}}].target_port is a number and {Validators.port_msg}"),
+    Rule('spec.ports[].targetPort',
+         lambda target_port: not isinstance(target_port, str) or Validators.iana_svc_name(target_port),
+         f"ports[{{0}}].target_port is a name and {Validators.iana_svc_name_msg}"),
+    Unique('spec.ports[].name', "Duplicate port name found (ports[{0}].name). "
+                                "Each named port in a service must have a unique name"),
+    Rule('spec.ports[].name', Validators.dns_label, f"ports[{{0}}].name {Validators.dns_label_msg}"),
+    Check('spec.ports', unnamed_port),
+    Rule('spec.ports[].nodePort', Validators.port, f"ports[{{0}}].node_port {Validators.port_msg}"),
+
+    Rule('spec', lambda spec: not (is_external_name(spec) and (spec.get('ipFamilies') or spec.get('ipFamilyPolicy'))),
+         "ip_families and ip_families_policy are not allowed with type='ExternalName'"),
+    Rule('spec.ipFamilies', lambda ip_families: len(ip_families) <= 2,
+         "ip_families field may hold a maximum of two entries (dual-stack families, in either order)"),
+    Rule('spec.ipFamilies', lambda ip_families: not (len(ip_families) == 2 and ip_families[0] == ip_families[1]),
+         "The same IP Family cannot be specified more than once"),
+    Rule('spec', lambda spec: not (len(spec.get('ipFamilies') or list()) == 2 and
+                                   spec.get('ipFamilyPolicy') == 'SingleStack'),
+         "ip_families_policy must be set to 'RequireDualStack' or 'PreferDualStack' when multiple ip_families are "
+         "specified"),
+
+    Rule('spec', lambda spec: not (is_external_name(spec) and (spec.get('clusterIP') or spec.get('clusterIPs'))),
+         "cluster_ip and cluster_ips are not allowed with type='ExternalName'"),
+    Rule('spec.clusterIPs', lambda cluster_ips: len(cluster_ips) <= 2,
+         "cluster_ips field may hold a maximum of two entries (dual-stack IPs, in either order. First IP will also "
+         "be copied to ClusterIP field)"),
+    Rule('spec', lambda spec: not (len(spec.get('clusterIPs') or list()) == 2 and
+                                   spec.get('ipFamilyPolicy') == 'SingleStack'),
+         "ip_families_policy must be set to 'RequireDualStack' or 'PreferDualStack' when multiple cluster_ips are "
+         "specified"),
+    Check('spec.clusterIPs', cluster_ips_family),
+    Check('spec', cluster_ips_address),
+
+    Rule('spec.externalIPs[]', Validators.ip_address, f"external_ips[{{0}}] {Validators.ip_address_msg}"),
+
+    Rule('spec', lambda spec: spec.get('type') == 'LoadBalancer' or not (
+        spec.get('loadBalancerIP') or spec.get('loadBalancerSourceRanges') or spec.get('loadBalancerClass')),
+         "load_balancer_ip, load_balancer_source_ranges and load_balancer_class are only valid with "
+         "type='LoadBalancer'"),
+    Rule('spec.loadBalancerIP', Validators.ip_address, f"load_balancer_ip {Validators.ip_address_msg}"),
+    Rule('spec.loadBalancerSourceRanges[]', Validators.ip_range,
+         f"load_balancer_source_ranges[{{0}}] {Validators.ip_range_msg}"),
+
+    Rule('spec', lambda spec: not spec.get('externalName') or is_external_name(spec),
+         "external_name is only valid with type='ExternalName'"),
+    Rule('spec.externalName', Validators.dns_subdomain, f"external_name {Validators.dns_subdomain_msg}"),
+
+    Rule('spec.healthCheckNodePort', lambda port: not port or Validators.port(port),
+         f"health_check_node_port {Validators.port_msg}"),
+    Rule('spec', lambda spec: not spec.get('healthCheckNodePort') or (
+        spec.get('type') == 'LoadBalancer' and spec.get('externalTrafficPolicy') == 'Local'),
+         "health_check_node_port is only valid with type='LoadBalancer' and external_traffic_policy='Local'"),
+
+    Rule('spec', lambda spec: not (spec.get('sessionAffinityConfig', dict()).get('clientIP', dict()).get(
+        'timeoutSeconds') and spec.get('sessionAffinity') != 'ClientIP'),
+         "session_affinity_timeout can only be used with session_affinity='ClientIP'"),
+    Rule('spec.sessionAffinityConfig.clientIP.timeoutSeconds', lambda timeout: not timeout or 0 < timeout <= 86400,
+         'session_affinity_timeout must be 0 < x <= 86400'),
+)
+
+
+def validate(module, k8s_definition):
+    CommonValidation.metadata(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+    warn_redundant(module, k8s_definition)
+
+
+def warn_redundant(module, k8s_definition):
+    """
+    Warns about duplicate IP addresses and IP ranges, that are covered by another range of the same list.
+    """
+    for param, field in IP_LIST_FIELDS:
+        entries = k8s_definition['spec'].get(field)
+        if not entries:
+            continue
+        redundant = IpRanges(entries).redundant()
+        if redundant:
+            i, covering = min(redundant)
+            module.warn(f"{len(redundant)} of {len(entries)} entries of {param} are redundant, e.g. {param}[{i}] "
+                        f"({entries[i]}) is covered by {param}[{covering}] ({entries[covering]}). "
+                        f"Set collapse_ranges=yes to remove them.")
+
+
+def removed_entries(params, k8s_definition):
+    """
+    Returns number of entries per list of IP addresses and ranges, that were removed by collapse_ranges.
+    """
+    spec = k8s_definition['spec']
+    return {param: len(params.get(param) or list()) - len(spec.get(field) or list()) for param, field in IP_LIST_FIELDS}
+
+
+# default of sessionAffinityConfig.clientIP.timeoutSeconds (3 hours)
+DEFAULT_SESSION_AFFINITY_TIMEOUT = 10800
+
+
+def canonicalize(k8s_definition):
+    """
+    Brings validated definition to the form, that the API server returns (see SetDefaults_Service).
+    Returns k8s_definition.
+    """
+    spec = k8s_definition['spec']
+    for port in spec.get('ports') or list():
+        port.setdefault('targetPort', port.get('port'))
+    if spec.get('type') in ('NodePort', 'LoadBalancer'):
+        spec.setdefault('externalTrafficPolicy', 'Cluster')
+    if spec.get('sessionAffinity') == 'ClientIP':
+        spec.setdefault('sessionAffinityConfig', dict()).setdefault('clientIP', dict()).setdefault(
+            'timeoutSeconds', DEFAULT_SESSION_AFFINITY_TIMEOUT)
+    return k8s_definition
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    argspec.update(dict(
+        selector=dict(type='dict'),
+        ports=dict(type='list', elements='dict', options=dict(
+            port=dict(type='int', required=True),
+            target_port=dict(type='str'),
+            protocol=dict(type='str', choices=['UDP', 'TCP', 'SCTP'], default='TCP'),
+            name=dict(type='str'),
+            node_port=dict(type='int')
+        )),
+        type=dict(type='str', default='ClusterIP', choices=['ExternalName', 'ClusterIP', 'NodePort', 'LoadBalancer']),
+        ip_families=dict(type='list', elements='str', choices=['IPv4', 'IPv6']),
+        ip_families_policy=dict(type='str', choices=['SingleStack', 'PreferDualStack', 'RequireDualStack'], ),
+        cluster_ip=dict(type='str'),
+        cluster_ips=dict(type='list', elements='str'),
+        external_ips=dict(type='list', elements='str'),
+        load_balancer_ip=dict(type='str'),
+        load_balancer_source_ranges=dict(type='list', elements='str'),
+        collapse_ranges=dict(type='bool', default=False),
+        load_balancer_class=dict(type='str'),
+        external_name=dict(type='str'),
+        external_traffic_policy=dict(type='str', choices=['Local', 'Cluster']),
+        internal_traffic_policy=dict(type='str', choices=['Local', 'Cluster'], default='Cluster'),
+        health_check_node_port=dict(type='int'),
+        publish_not_ready_addresses=dict(type='bool', default=False),
+        session_affinity=dict(type='str', choices=['ClientIP', 'None'], default='None'),
+        session_affinity_timeout=dict(type='int')
+
+    ))
+    return argspec
+
+
+REQUIRED_IF = [
+    ('state', 'present', ('ports',))
+]
+
+MUTUALLY_EXCLUSIVE = deepcopy(UPDATE_MUTUALLY_EXCLUSIVE)
+MUTUALLY_EXCLUSIVE.append(('cluster_ip', 'cluster_ips'))
@@ -0,0 +1,152 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
+                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Marshalling,
+                                                                          Rule, RuleTable, Unique)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy, pruned_list
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources import pod_template, pvc
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.pod_template import (  # noqa: F401
+    canonicalize_template, references, selector_definition, template_definition, validate_template)
+
+
+def definition(params):
+    update_strategy = params.get('update_strategy') or {}
+    body = {
+        "apiVersion": "apps/v1",
+        "kind": "StatefulSet",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        "spec": pruned({
+            'selector': selector_definition(params.get('selector')),
+            'serviceName': params.get('service_name'),
+            "template": template_definition(params),
+            'volumeClaimTemplates': pruned_list(claim_definition(claim)
+                                                for claim in params.get('volume_claim_templates') or list()),
+            'replicas': params.get('replicas'),
+            'minReadySeconds': params.get('min_ready_seconds'),
+            'podManagementPolicy': params.get('pod_management_policy'),
+            'updateStrategy': pruned({
+                "type": update_strategy.get('type'),
+                "rollingUpdate": pruned({
+                    "partition": update_strategy.get('partition'),
+                    "maxUnavailable": update_strategy.get('max_unavailable'),
+                })
+            }),
+            'revisionHistoryLimit': params.get('revision_history_limit'),
+        })
+    }
+    return pruned(body)
+
+
+def claim_definition(claim):
+    """
+    Returns PersistentVolumeClaim, that the controller creates for every pod, built like in the pvc module.
+    """
+    return pvc.definition(claim)
+
+
+CLAIMS = 'spec.volumeClaimTemplates[]'
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    Rule('metadata.labels', bool, "state is present but all of the following are missing: labels", required=True),
+    Rule('spec.selector', bool, "state is present but all of the following are missing: selector", required=True),
+    Rule('spec.serviceName', Validators.dns_label, f"service_name {Validators.dns_label_msg}"),
+    Rule('spec.replicas', lambda replicas: replicas >= 0, "replicas must be greater than or equal to 0"),
+    Rule('spec.updateStrategy', lambda strategy: not (strategy['type'] == 'OnDelete' and 'rollingUpdate' in strategy),
+         "update_strategy.partition and update_strategy.max_unavailable can only be present if "
+         "update_strategy.type==RollingUpdate"),
+    Rule('spec.updateStrategy.rollingUpdate.partition', lambda partition: partition >= 0,
+         "update_strategy.partition must be greater than or equal to 0"),
+    Rule(f"{CLAIMS}.metadata.name", Validators.dns_label,
+         f"volume_claim_templates[{{0}}].name {Validators.dns_label_msg}"),
+    Unique(f"{CLAIMS}.metadata.name", "Duplicate name found (volume_claim_templates[{0}].name)"),
+)
+
+
+def with_claim_volumes(k8s_definition):
+    """
+    Returns definition, in which volume claim templates are also volumes of the pod template, as the controller adds
+    them to every pod. Containers mount them like any other volume.
+    """
+    spec = k8s_definition['spec']
+    claims = spec.get('volumeClaimTemplates')
+    if not claims:
+        return k8s_definition
+    template = spec['template']
+    volumes = (template['spec'].get('volumes') or list()) + [
+        {'name': claim['metadata']['name'], 'persistentVolumeClaim': {'claimName': claim['metadata']['name']}}
+        for claim in claims
+    ]
+    return dict(k8s_definition, spec=dict(spec, template=dict(template, spec=dict(template['spec'], volumes=volumes))))
+
+
+def validate(module, k8s_definition):
+
+    CommonValidation.metadata(module, k8s_definition)
+    CommonValidation.selector(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+    for claim in k8s_definition['spec'].get('volumeClaimTemplates') or list():
+        pvc.validate(module, claim)
+
+    validate_template(module, with_claim_volumes(k8s_definition))
+
+
+def canonicalize(k8s_definition):
+    """
+    Brings validated definition to the form, that the API server returns: server-side defaults are set and
+    IntOrString values are unmarshalled. Returns k8s_definition.
+    """
+    spec = k8s_definition['spec']
+    update_strategy = spec.setdefault('updateStrategy', dict())
+    update_strategy.setdefault('type', 'RollingUpdate')
+    if update_strategy['type'] == 'RollingUpdate':
+        rolling_update = update_strategy.setdefault('rollingUpdate', dict())
+        rolling_update.setdefault('partition', 0)
+        if 'maxUnavailable' in rolling_update:
+            rolling_update['maxUnavailable'] = Marshalling.unmarshall_int_or_string(rolling_update['maxUnavailable'])
+
+    canonicalize_template(spec['template'])
+    return k8s_definition
+
+
+def argument_spec():
+    argspec = update_arg_spec()
+    argspec.update(copy.deepcopy(pod_template.SELECTOR_ARG_SPEC))
+    argspec.update(pod_template.argument_spec())
+    argspec.update(dict(
+        service_name=dict(type='str'),
+        volume_claim_templates=dict(type='list', elements='dict', options=dict(
+            name=dict(type='str', required=True),
+            labels=dict(type='dict'),
+            annotations=dict(type='dict'),
+            access_modes=dict(type='list', elements='str', required=True,
+                              choices=['ReadWriteOnce', 'ReadOnlyMany', 'ReadWriteMany']),
+            storage_request=dict(type='str', required=True),
+            storage_limit=dict(type='str'),
+            storage_class_name=dict(type='str'),
+            volume_mode=dict(type='str', choices=['Filesystem', 'Block'], default='Filesystem')
+        )),
+        # no default, so that patches keep replicas of the existing statefulset
+        replicas=dict(type='int'),
+        min_ready_seconds=dict(type='int', default=0),
+        pod_management_policy=dict(type='str', choices=['OrderedReady', 'Parallel'], default='OrderedReady'),
+        update_strategy=dict(type='dict', options=dict(
+            type=dict(type='str', choices=['OnDelete', 'RollingUpdate'], default='RollingUpdate'),
+            partition=dict(type='int'),
+            max_unavailable=dict(type='str')
+        )),
+        revision_history_limit=dict(type='int', default=10),
+        verify_references=dict(type='bool', default=False),
+    ))
+    return argspec
+
+
+MUTUALLY_EXCLUSIVE = UPDATE_MUTUALLY_EXCLUSIVE
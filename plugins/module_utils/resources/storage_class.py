@@ -0,0 +1,62 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import common_arg_spec
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import (Validators, CommonValidation, Rule,
+                                                                          RuleTable)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import pruned, pruned_copy, pruned_list
+
+
+def definition(params):
+    body = {
+        "apiVersion": "storage.k8s.io/v1",
+        "kind": "StorageClass",
+        "metadata": pruned({
+            "name": params.get('name'),
+            "labels": pruned_copy(params.get('labels')),
+            "annotations": pruned_copy(params.get('annotations'))
+        }),
+        'provisioner': params.get('provisioner'),
+        'allowVolumeExpansion': params.get('allow_volume_expansion'),
+        'allowedTopologies': pruned_list([
+            pruned({
+                'matchLabelExpressions': pruned_list(pruned_copy(expression)
+                                                     for expression in params.get('allowed_topologies') or list())
+            })
+        ]),
+        'mountOptions': params.get('mount_options'),
+        'parameters': pruned_copy(params.get('parameters')),
+        'reclaimPolicy': params.get('reclaim_policy'),
+        'volumeBindingMode': params.get('volume_binding_mode')
+    }
+    return pruned(body)
+
+
+RULES = RuleTable(
+    Rule('metadata.name', Validators.dns_subdomain, f"'name' {Validators.dns_subdomain_msg}"),
+    Rule('parameters', Validators.string_string_dict, "parameters should be map[string]string"),
+)
+
+
+def validate(module, k8s_definition):
+    CommonValidation.metadata(module, k8s_definition)
+    RULES.validate(module, k8s_definition)
+
+
+def argument_spec():
+    argspec = common_arg_spec()
+    # StorageClass is not namespaced object
+    argspec.pop('namespace')
+    argspec.update(dict(
+        provisioner=dict(type='str', required=True),
+        allow_volume_expansion=dict(type='bool'),
+        allowed_topologies=dict(type='list', elements='dict', options=dict(
+            key=dict(type='str', required=True, no_log=False),
+            values=dict(type='list', elements='str', required=True)
+        )),
+        mount_options=dict(type='list', elements='str'),
+        parameters=dict(type='dict'),
+        reclaim_policy=dict(type='str', choices=['Retain', 'Delete', 'Recycle'], default='Delete'),
+        volume_binding_mode=dict(type='str', choices=['Immediate', 'WaitForFirstConsumer'], default='Immediate'),
+    ))
+    return argspec
@@ -0,0 +1,120 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from datetime import datetime
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.waiter import list_items, new_replica_set
+
+try:
+    from kubernetes.dynamic.exceptions import DynamicApiError
+except ImportError:
+    # kubernetes import error is handled by K8sAnsibleMixin.check_library_version()
+    pass
+
+
+def parse_time(timestamp):
+    """
+    Parses Time or MicroTime of Kubernetes (RFC 3339, UTC). Returns None for None.
+    """
+    if not timestamp:
+        return None
+    timestamp = timestamp.rstrip('Z')
+    return datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%S.%f' if '.' in timestamp else '%Y-%m-%dT%H:%M:%S')
+
+
+def seconds(since, until):
+    if since is None or until is None:
+        return None
+    return round((parse_time(until) - parse_time(since)).total_seconds(), 3)
+
+
+def condition_time(pod, condition_type):
+    """
+    Returns lastTransitionTime of condition of pod, if it is True.
+    """
+    for condition in (pod.get('status') or dict()).get('conditions') or list():
+        if condition.get('type') == condition_type and str(condition.get('status')).lower() == 'true':
+            return condition.get('lastTransitionTime')
+    return None
+
+
+def event_time(event):
+    return event.get('eventTime') or event.get('firstTimestamp') or event.get('lastTimestamp')
+
+
+def pod_timestamps(pod, events):
+    """
+    Returns timestamps of milestones of pod: creation, scheduling, start and end of image pulls (from events), start of
+    the last container and readiness. Missing milestones are None.
+    """
+    pulling = sorted(event_time(event) for event in events if event.get('reason') == 'Pulling' and event_time(event))
+    pulled = sorted(event_time(event) for event in events if event.get('reason') == 'Pulled' and event_time(event))
+    started = sorted(((container.get('state') or dict()).get('running') or dict()).get('startedAt')
+                     for container in (pod.get('status') or dict()).get('containerStatuses') or list()
+                     if ((container.get('state') or dict()).get('running') or dict()).get('startedAt'))
+    return dict(
+        name=pod['metadata']['name'],
+        node=(pod.get('spec') or dict()).get('nodeName'),
+        created=pod['metadata'].get('creationTimestamp'),
+        scheduled=condition_time(pod, 'PodScheduled'),
+        pulling=pulling[0] if pulling else None,
+        pulled=pulled[-1] if pulled else None,
+        started=started[-1] if started else None,
+        ready=condition_time(pod, 'Ready')
+    )
+
+
+def pod_events(client, namespace, pods):
+    """
+    Lists events of pods, with one LIST per pod, that selects its events by name on the server, so that events of other
+    objects in the namespace are not transferred. Returns dict of pod uid -> events.
+    """
+    events_by_pod = dict()
+    for pod in pods:
+        metadata = pod['metadata']
+        field_selector = f"involvedObject.kind=Pod,involvedObject.name={metadata['name']}"
+        events = client.request('get', f"/api/v1/namespaces/{namespace}/events",
+                                query_params=[('fieldSelector', field_selector)]).to_dict().get('items') or list()
+        # events of an earlier pod with the same name are left out
+        uid = metadata.get('uid')
+        events_by_pod[uid] = [event for event in events if (event.get('involvedObject') or dict()).get('uid') == uid]
+    return events_by_pod
+
+
+def rollout_metrics(client, deployment):
+    """
+    Returns latency metrics of the rollout of the new ReplicaSet of deployment, with one LIST of ReplicaSets and pods
+    each, and one LIST of events per pod. Durations are seconds since creation of the new ReplicaSet, timestamps are
+    server time. Returns None, if there is no new ReplicaSet or it may not be read.
+    """
+    metadata = deployment['metadata']
+    namespace = metadata['namespace']
+    try:
+        replica_set = new_replica_set(client, deployment)
+        if replica_set is None:
+            return None
+        pods = list_items(client, f"/api/v1/namespaces/{namespace}/pods", replica_set['spec']['selector'])
+        try:
+            events_by_pod = pod_events(client, namespace, pods)
+        except DynamicApiError:
+            # events may not be listed, pulls are left out
+            events_by_pod = dict()
+    except DynamicApiError:
+        return None
+
+    timestamps = sorted((pod_timestamps(pod, events_by_pod.get(pod['metadata'].get('uid'), list())) for pod in pods),
+                        key=lambda pod: pod['created'] or '')
+
+    start = replica_set['metadata'].get('creationTimestamp')
+    ready = sorted(pod['ready'] for pod in timestamps if pod['ready'])
+    replicas = (deployment.get('spec') or dict()).get('replicas', 1)
+    time_to_available = None
+    if ready and len(ready) >= replicas:
+        time_to_available = round(seconds(start, ready[-1]) + (deployment['spec'].get('minReadySeconds') or 0), 3)
+    return dict(
+        replica_set=replica_set['metadata']['name'],
+        started=start,
+        time_to_first_ready=seconds(start, ready[0]) if ready else None,
+        time_to_available=time_to_available,
+        pods=timestamps
+    )
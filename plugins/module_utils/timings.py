@@ -0,0 +1,111 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import threading
+import time
+from contextlib import contextmanager
+
+# Timings of the module, running in the current thread. API clients are shared (see client pool), so HTTP traffic
+# is attributed to the module through this thread-local instead of through the client.
+_active = threading.local()
+
+
+class Timings:
+    """
+    Collects monotonic durations of module phases and HTTP traffic of the API client.
+    Duration of a phase excludes durations of phases, nested in it.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.phases = dict()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._open = list()
+
+    def activate(self, enabled):
+        """
+        Makes these Timings current for the thread. HTTP traffic is only counted, when enabled.
+        """
+        self.enabled = bool(enabled)
+        _active.timings = self if self.enabled else None
+
+    @contextmanager
+    def phase(self, name):
+        self._open.append([name, time.monotonic(), 0.0])
+        try:
+            yield
+        finally:
+            name, start, nested = self._open.pop()
+            elapsed = time.monotonic() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - nested
+            if self._open:
+                self._open[-1][2] += elapsed
+
+    def as_dict(self):
+        """
+        Returns durations of phases in seconds and HTTP counters. Phases, that are still open, count up to now.
+        """
+        now = time.monotonic()
+        phases = dict(self.phases)
+        inner = 0.0
+        for name, start, nested in reversed(self._open):
+            phases[name] = phases.get(name, 0.0) + now - start - nested - inner
+            inner = now - start
+        return dict(
+            phases={name: round(duration, 6) for name, duration in phases.items()},
+            requests=self.requests,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received
+        )
+
+
+def count_response(response, timings):
+    """
+    Counts bytes of response, that are received through read() and, for chunked responses (e.g. of a watch), through
+    read_chunked(). stream() of urllib3 reads through one of both.
+    """
+    read = response.read
+
+    def counted_read(*args, **kwargs):
+        data = read(*args, **kwargs)
+        timings.bytes_received += len(data or b'')
+        return data
+
+    response.read = counted_read
+    read_chunked = getattr(response, 'read_chunked', None)
+    if read_chunked is not None:
+        def counted_read_chunked(*args, **kwargs):
+            for chunk in read_chunked(*args, **kwargs):
+                timings.bytes_received += len(chunk or b'')
+                yield chunk
+
+        response.read_chunked = counted_read_chunked
+    # responses of older clients are preloaded and never read again
+    timings.bytes_received += len(getattr(response, '_body', None) or b'')
+    return response
+
+
+def instrument(client):
+    """
+    Wraps connection pool of client, so requests, made while Timings of the current thread are enabled, are counted.
+    Client is instrumented only once, also when it is reused from the client pool.
+    """
+    pool_manager = getattr(getattr(getattr(client, 'client', None), 'rest_client', None), 'pool_manager', None)
+    if pool_manager is None or getattr(pool_manager, 'sodalite_instrumented', False):
+        return
+    request = pool_manager.request
+
+    def counted_request(method, url, *args, **kwargs):
+        timings = getattr(_active, 'timings', None)
+        if timings is None:
+            return request(method, url, *args, **kwargs)
+        timings.requests += 1
+        body = kwargs.get('body')
+        if body is not None:
+            timings.bytes_sent += len(body.encode() if isinstance(body, str) else body)
+        return count_response(request(method, url, *args, **kwargs), timings)
+
+    pool_manager.request = counted_request
+    pool_manager.sodalite_instrumented = True
@@ -0,0 +1,41 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import Check
+
+# Label, that ties versions of a ConfigMap or Secret to the name, they were created from. Old versions are found by it.
+VERSIONED_LABEL = 'sodalite.k8s/versioned-name'
+# Fields, that make up content of a version
+CONTENT_KEYS = ('type', 'data', 'binaryData', 'stringData')
+HASH_LENGTH = 10
+MAX_LABEL_VALUE_LENGTH = 63
+
+# label key contains '.', so it is checked on labels
+NAME_RULE = Check('metadata.labels', lambda labels: (
+    f"With versioned, 'name' must be no more than {MAX_LABEL_VALUE_LENGTH} characters"
+    if len(labels.get(VERSIONED_LABEL) or '') > MAX_LABEL_VALUE_LENGTH else None))
+
+
+def content_hash(k8s_definition):
+    """
+    Returns hash of canonical (key sorted, compact) JSON form of content of k8s_definition.
+    """
+    content = {key: k8s_definition[key] for key in CONTENT_KEYS if k8s_definition.get(key) is not None}
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:HASH_LENGTH]
+
+
+def versioned_definition(k8s_definition):
+    """
+    Turns k8s_definition into an immutable version: hash of content is appended to the name and the original name is
+    kept in VERSIONED_LABEL. Returns k8s_definition.
+    """
+    metadata = k8s_definition['metadata']
+    name = metadata['name']
+    metadata.setdefault('labels', dict())[VERSIONED_LABEL] = name
+    metadata['name'] = f"{name}-{content_hash(k8s_definition)}"
+    k8s_definition['immutable'] = True
+    return k8s_definition
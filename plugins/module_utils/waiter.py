@@ -0,0 +1,335 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import math
+import time
+from contextlib import closing
+
+try:
+    from kubernetes.dynamic.exceptions import DynamicApiError
+    from kubernetes.watch.watch import iter_resp_lines
+    from urllib3.exceptions import HTTPError
+except ImportError:
+    # kubernetes import error is handled by K8sAnsibleMixin.check_library_version()
+    pass
+
+HTTP_GONE = 410
+RECONNECT_DELAY = 1
+# Slack on top of timeoutSeconds, after which a stalled watch connection is dropped on the client side
+READ_TIMEOUT_SLACK = 5
+# Seconds between checks of pods of a rollout. Pods do not change the watched object, so they are listed.
+ROLLOUT_CHECK_INTERVAL = 3
+REVISION_ANNOTATION = 'deployment.kubernetes.io/revision'
+# Reasons of waiting containers, that do not resolve without a change of the pod template or referenced objects
+FAILED_WAITING_REASONS = ('ErrImagePull', 'ImagePullBackOff', 'InvalidImageName', 'CrashLoopBackOff',
+                          'CreateContainerConfigError', 'CreateContainerError')
+
+
+class WatchError(Exception):
+    """
+    Error event, received on watch stream.
+    """
+
+
+class RolloutFailed(Exception):
+    """
+    Rollout of the watched object can not succeed. reason is a Kubernetes reason, pod is name of the failed pod, if any.
+    """
+
+    def __init__(self, msg, reason, pod=None, k8s_object=None):
+        super(RolloutFailed, self).__init__(msg)
+        self.reason = reason
+        self.pod = pod
+        self.k8s_object = k8s_object
+
+
+def deployment_ready(deployment):
+    spec = deployment.get('spec') or dict()
+    status = deployment.get('status') or dict()
+    return bool(
+        status
+        and spec.get('replicas', 1) == (status.get('replicas') or 0)
+        and status.get('availableReplicas') == status.get('replicas')
+        and status.get('observedGeneration') == deployment['metadata'].get('generation')
+        and not status.get('unavailableReplicas')
+    )
+
+
+def daemonset_ready(daemonset):
+    status = daemonset.get('status') or dict()
+    return bool(
+        status
+        and status.get('desiredNumberScheduled') is not None
+        and (status.get('updatedNumberScheduled') or 0) == status['desiredNumberScheduled']
+        and status.get('numberReady') == status['desiredNumberScheduled']
+        and status.get('observedGeneration') == daemonset['metadata'].get('generation')
+        and not status.get('numberUnavailable')
+    )
+
+
+def statefulset_ready(statefulset):
+    spec = statefulset.get('spec') or dict()
+    status = statefulset.get('status') or dict()
+    replicas = spec.get('replicas', 1)
+    if not status or status.get('observedGeneration') != statefulset['metadata'].get('generation'):
+        return False
+    if (spec.get('updateStrategy') or dict()).get('type') == 'OnDelete':
+        return status.get('replicas') == replicas
+    return bool(
+        status.get('updateRevision') == status.get('currentRevision')
+        and (status.get('updatedReplicas') or 0) == replicas
+        and (status.get('readyReplicas') or 0) == replicas
+        and status.get('replicas') == replicas
+    )
+
+
+def pod_ready(pod):
+    status = pod.get('status') or dict()
+    return bool(
+        status.get('containerStatuses') is not None
+        and all(container.get('ready') for container in status['containerStatuses'])
+    )
+
+
+def condition_met(condition, k8s_object):
+    """
+    Checks, whether status of k8s_object has condition, given as wait_condition (type, status and optional reason).
+    """
+    conditions = [c for c in (k8s_object.get('status') or dict()).get('conditions') or list()
+                  if c.get('type') == condition['type']]
+    if not conditions:
+        return False
+    if str(conditions[0].get('status')).lower() != str(condition.get('status', True)).lower():
+        return False
+    return not condition.get('reason') or conditions[0].get('reason') == condition['reason']
+
+
+def job_complete(job):
+    return condition_met(dict(type='Complete'), job)
+
+
+READY = dict(
+    DaemonSet=daemonset_ready,
+    Deployment=deployment_ready,
+    Job=job_complete,
+    Pod=pod_ready,
+    StatefulSet=statefulset_ready
+)
+
+
+def label_selector(selector):
+    """
+    Returns labelSelector query parameter for a LabelSelector (matchLabels and matchExpressions).
+    """
+    requirements = [f"{key}={value}" for key, value in (selector.get('matchLabels') or dict()).items()]
+    for expression in selector.get('matchExpressions') or list():
+        key, operator = expression['key'], expression['operator']
+        if operator == 'Exists':
+            requirements.append(key)
+        elif operator == 'DoesNotExist':
+            requirements.append(f"!{key}")
+        else:
+            requirements.append(f"{key} {operator.lower()} ({','.join(expression.get('values') or list())})")
+    return ','.join(requirements)
+
+
+def list_items(client, path, selector):
+    return client.request('get', path, query_params=[('labelSelector', label_selector(selector))]).to_dict().get(
+        'items') or list()
+
+
+def pod_failure(pod):
+    """
+    Returns (container name, reason, message) of the first container of pod, that waits for a reason in
+    FAILED_WAITING_REASONS, or None.
+    """
+    status = pod.get('status') or dict()
+    for container in (status.get('initContainerStatuses') or list()) + (status.get('containerStatuses') or list()):
+        waiting = (container.get('state') or dict()).get('waiting') or dict()
+        if waiting.get('reason') in FAILED_WAITING_REASONS:
+            return container.get('name'), waiting['reason'], waiting.get('message')
+    return None
+
+
+def new_replica_set(client, deployment):
+    """
+    Returns ReplicaSet of the current revision of deployment, or None if it was not created yet.
+    """
+    metadata = deployment['metadata']
+    revision = (metadata.get('annotations') or dict()).get(REVISION_ANNOTATION)
+    path = f"/apis/apps/v1/namespaces/{metadata['namespace']}/replicasets"
+    for replica_set in list_items(client, path, deployment['spec']['selector']):
+        rs_metadata = replica_set['metadata']
+        if (any(owner.get('uid') == metadata.get('uid') for owner in rs_metadata.get('ownerReferences') or list())
+                and (rs_metadata.get('annotations') or dict()).get(REVISION_ANNOTATION) == revision):
+            return replica_set
+    return None
+
+
+def deployment_failure(client, deployment):
+    """
+    Returns RolloutFailed, when deployment exceeded its progress deadline or a pod of its new ReplicaSet is stuck
+    (see FAILED_WAITING_REASONS). Returns None, while the rollout can still succeed.
+    """
+    if deployment is None:
+        return None
+    name = deployment['metadata']['name']
+    for condition in (deployment.get('status') or dict()).get('conditions') or list():
+        if condition.get('type') == 'Progressing' and condition.get('reason') == 'ProgressDeadlineExceeded':
+            return RolloutFailed(f"Deployment {name} exceeded its progress deadline: {condition.get('message')}",
+                                 'ProgressDeadlineExceeded', k8s_object=deployment)
+    if (deployment.get('status') or dict()).get('observedGeneration') != deployment['metadata'].get('generation'):
+        # new ReplicaSet is not there yet
+        return None
+
+    replica_set = new_replica_set(client, deployment)
+    if replica_set is None:
+        return None
+    path = f"/api/v1/namespaces/{deployment['metadata']['namespace']}/pods"
+    for pod in list_items(client, path, replica_set['spec']['selector']):
+        failure = pod_failure(pod)
+        if failure:
+            container, reason, message = failure
+            pod_name = pod['metadata']['name']
+            return RolloutFailed(f"Rollout of Deployment {name} failed, container {container} of pod {pod_name} is in "
+                                 f"{reason}: {message}", reason, pod=pod_name, k8s_object=deployment)
+    return None
+
+
+def job_failure(client, job):
+    """
+    Returns RolloutFailed, when job failed (e.g. reached its backoff limit or deadline) or one of its pods is stuck
+    (see FAILED_WAITING_REASONS). Returns None, while the job can still complete.
+    """
+    if job is None:
+        return None
+    name = job['metadata']['name']
+    for condition in (job.get('status') or dict()).get('conditions') or list():
+        if condition.get('type') == 'Failed' and str(condition.get('status')).lower() == 'true':
+            return RolloutFailed(f"Job {name} failed: {condition.get('message')}", condition.get('reason'),
+                                 k8s_object=job)
+    if not (job.get('spec') or dict()).get('selector'):
+        # selector is set by the API server, when the job is created
+        return None
+
+    path = f"/api/v1/namespaces/{job['metadata']['namespace']}/pods"
+    for pod in list_items(client, path, job['spec']['selector']):
+        failure = pod_failure(pod)
+        if failure:
+            container, reason, message = failure
+            pod_name = pod['metadata']['name']
+            return RolloutFailed(f"Job {name} failed, container {container} of pod {pod_name} is in {reason}: "
+                                 f"{message}", reason, pod=pod_name, k8s_object=job)
+    return None
+
+
+ROLLOUT_FAILURE = dict(
+    Deployment=deployment_failure,
+    Job=job_failure
+)
+
+
+def predicate(kind, state='present', condition=None):
+    """
+    Returns function, that checks, whether observed object (None, when it does not exist) reached the desired state.
+    """
+    if state == 'absent':
+        return lambda k8s_object: k8s_object is None
+    if condition and condition.get('type'):
+        return lambda k8s_object: k8s_object is not None and condition_met(condition, k8s_object)
+    ready = READY.get(kind)
+    if ready:
+        return lambda k8s_object: k8s_object is not None and ready(k8s_object)
+    return lambda k8s_object: k8s_object is not None
+
+
+def list_object(client, resource, name, namespace):
+    """
+    Lists object by name. Returns the object (None, when it does not exist) and resourceVersion of the list.
+    """
+    object_list = client.get(resource, namespace=namespace, field_selector=f"metadata.name={name}").to_dict()
+    items = object_list.get('items') or list()
+    return (items[0] if items else None), object_list['metadata']['resourceVersion']
+
+
+def watch_events(client, resource, name, namespace, resource_version, timeout):
+    """
+    Streams watch events of a single object, starting after resource_version. Bookmarks are requested, so
+    resource_version can be kept current while the object does not change.
+    """
+    timeout_seconds = max(1, int(math.ceil(timeout)))
+    response = client.request(
+        'get', resource.path(namespace=namespace), serialize=False, _preload_content=False,
+        _request_timeout=(READ_TIMEOUT_SLACK, timeout_seconds + READ_TIMEOUT_SLACK),
+        query_params=[('watch', 'true'), ('allowWatchBookmarks', 'true'), ('fieldSelector', f"metadata.name={name}"),
+                      ('resourceVersion', resource_version), ('timeoutSeconds', timeout_seconds)])
+    try:
+        for line in iter_resp_lines(response):
+            if line:
+                yield json.loads(line)
+    finally:
+        response.close()
+        response.release_conn()
+
+
+def watch_wait(client, resource, definition, timeout, state='present', condition=None):
+    """
+    Waits until object, that definition refers to, reaches state (and condition), or timeout passes.
+    Object is watched from resourceVersion of definition, usually the object returned by the write, or listed first,
+    if definition carries none. Dropped connections are resumed from the last seen resourceVersion, expired ones
+    (410 Gone) are listed again.
+    Rollouts of kinds in ROLLOUT_FAILURE are checked every ROLLOUT_CHECK_INTERVAL seconds and RolloutFailed is raised,
+    as soon as they can not succeed.
+    Returns success, last seen object and duration of waiting in seconds.
+    """
+    start = time.monotonic()
+    ready = predicate(definition['kind'], state, condition)
+    failure = ROLLOUT_FAILURE.get(definition['kind']) if state == 'present' else None
+    next_check = start + ROLLOUT_CHECK_INTERVAL
+    metadata = definition.get('metadata') or dict()
+    name = metadata['name']
+    namespace = metadata.get('namespace') if resource.namespaced else None
+    resource_version = metadata.get('resourceVersion')
+    k8s_object = definition if resource_version is not None else None
+
+    while True:
+        if resource_version is None:
+            k8s_object, resource_version = list_object(client, resource, name, namespace)
+        if ready(k8s_object):
+            return True, k8s_object or dict(), round(time.monotonic() - start, 3)
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0:
+            return False, k8s_object or dict(), round(time.monotonic() - start, 3)
+        if failure and time.monotonic() >= next_check:
+            try:
+                error = failure(client, k8s_object)
+            except DynamicApiError:
+                # e.g. pods may not be listed, rollout is only watched
+                error, failure = None, None
+            if error:
+                raise error
+            next_check = time.monotonic() + ROLLOUT_CHECK_INTERVAL
+        if failure:
+            remaining = min(remaining, max(0, next_check - time.monotonic()))
+
+        try:
+            with closing(watch_events(client, resource, name, namespace, resource_version, remaining)) as events:
+                for event in events:
+                    if event['type'] == 'ERROR':
+                        if event['object'].get('code') != HTTP_GONE:
+                            raise WatchError(event['object'].get('message'))
+                        resource_version = None
+                        break
+                    resource_version = event['object']['metadata']['resourceVersion']
+                    if event['type'] == 'BOOKMARK':
+                        continue
+                    k8s_object = None if event['type'] == 'DELETED' else event['object']
+                    if ready(k8s_object):
+                        break
+        except DynamicApiError as e:
+            if e.status != HTTP_GONE:
+                raise
+            resource_version = None
+        except (HTTPError, WatchError):
+            time.sleep(max(0, min(RECONNECT_DELAY, timeout - (time.monotonic() - start))))
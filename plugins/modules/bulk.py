@@ -0,0 +1,277 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2021, Mihael Trajbarič <mihael.trajbaric@xlab.si>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: bulk
+
+short_description: Applies many k8s objects in one task
+
+version_added: "1.1.0"
+
+description: Applies many k8s objects of kinds, supported by this collection, in a single task. Every item is built
+             and validated exactly like in the module of its kind. All items are validated before any of them is
+             applied. Items are then applied concurrently over one shared API client.
+
+extends_documentation_fragment:
+    - kubernetes.core.k8s_auth_options
+
+options:
+    items:
+        description:
+            - List of objects to apply.
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+            kind:
+                description:
+                    - Module, used to build and validate the object.
+                type: str
+                required: true
+                choices: [ config_map, daemonset, deployment, ingress, job, namespace, pvc, secret, service, statefulset,
+                           storage_class ]
+            params:
+                description:
+                    - Params of the object, the same as params of module from I(kind).
+                    - Connection params (I(host), I(kubeconfig), ...) of this task apply to all items, since they share
+                      its client. Items with connection params are rejected.
+                    - Items are always applied whole, so I(update_images), I(scale_only), I(rollout_batch) and
+                      I(verify_references) are not supported and such items are rejected.
+                type: dict
+                required: true
+    max_workers:
+        description:
+            - Maximum number of items, applied concurrently.
+        type: int
+        default: 8
+
+requirements:
+  - "python >= 3.6"
+  - "ansible-core >= 2.11"
+  - "kubernetes >= 12.0.0"
+  - "PyYAML >= 3.11"
+  - "jsonpatch"
+
+author:
+    - Mihael Trajbarič (@mihaTrajbaric)
+'''
+EXAMPLES = r'''
+- name: Create configs and a deployment, that uses them
+  sodalite.k8s.bulk:
+    max_workers: 16
+    items:
+      - kind: config_map
+        params:
+          name: xopera-config
+          spec_hash: true
+          data:
+            db_ip: postgres-service
+      - kind: secret
+        params:
+          name: xopera-secret
+          string_data:
+            db_password: secret
+      - kind: deployment
+        params:
+          name: xopera-rest-api
+          labels:
+            app: xopera
+          selector:
+            match_labels:
+              app: xopera
+          containers:
+            - name: xopera-rest-api
+              image: xopera-rest-api:latest
+              env_from:
+                - config_map:
+                    name: xopera-config
+                - secret:
+                    name: xopera-secret
+'''
+
+RETURN = r'''
+results:
+  description:
+  - Status of every item, in the same order as I(items).
+  returned: always
+  type: list
+  elements: dict
+  contains:
+     kind:
+       description: Kind of the object.
+       returned: always
+       type: str
+       sample: ConfigMap
+     name:
+       description:
+       - Name of the object.
+       - Generated name (with hash of content) of versioned config_map and secret items.
+       returned: always
+       type: str
+     namespace:
+       description: Namespace of the object.
+       returned: when object is namespaced
+       type: str
+     changed:
+       description: Whether the object was changed.
+       returned: always
+       type: bool
+     failed:
+       description: Whether applying the object failed.
+       returned: always
+       type: bool
+     method:
+       description:
+       - Method, used to apply the object.
+       - C(skip) when object was not written, since its I(spec_hash) matched the live object or the live object
+         already contained the definition.
+       returned: when object was applied
+       type: str
+       sample: create
+     pruned:
+       description: Older versions of a versioned object, that were deleted.
+       returned: when versions were pruned
+       type: list
+       elements: str
+       version_added: 1.1.0
+     msg:
+       description: Error message.
+       returned: when item failed
+       type: str
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+'''
+
+import copy
+
+from ansible_collections.kubernetes.core.plugins.module_utils.args_common import AUTH_ARG_SPEC
+from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
+from ansible_collections.sodalite.k8s.plugins.module_utils.bulk import DefinitionError, ItemModule, ItemFailed
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources import (config_map, daemonset, deployment,
+                                                                             ingress, job, namespace, pvc, secret,
+                                                                             service, statefulset, storage_class)
+
+try:
+    from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+    HAS_ARGUMENT_SPEC_VALIDATOR = True
+except ImportError:
+    HAS_ARGUMENT_SPEC_VALIDATOR = False
+
+KINDS = dict(
+    config_map=config_map,
+    daemonset=daemonset,
+    deployment=deployment,
+    ingress=ingress,
+    job=job,
+    namespace=namespace,
+    pvc=pvc,
+    secret=secret,
+    service=service,
+    statefulset=statefulset,
+    storage_class=storage_class
+)
+
+
+# options of kind modules, that change how the object is written, instead of what is written. Items are always
+# applied whole, so these are rejected.
+UNSUPPORTED_OPTIONS = ('update_images', 'scale_only', 'rollout_batch', 'verify_references')
+# connection params of the task apply to all items, since items share its client
+CONNECTION_OPTIONS = tuple(AUTH_ARG_SPEC)
+
+
+def item_validator(kind):
+    resource = KINDS[kind]
+    return ArgumentSpecValidator(resource.argument_spec(),
+                                 mutually_exclusive=getattr(resource, 'MUTUALLY_EXCLUSIVE', None),
+                                 required_if=getattr(resource, 'REQUIRED_IF', None))
+
+
+def prepare(module, items):
+    """
+    Builds and validates definitions of all items.
+    Returns list of (item_module, k8s_definition) and list of errors.
+    """
+    validators = dict()
+    prepared = list()
+    errors = list()
+
+    for i, item in enumerate(items):
+        kind = item['kind']
+        if kind not in validators:
+            validators[kind] = item_validator(kind)
+        unsupported = [option for option in UNSUPPORTED_OPTIONS if item['params'].get(option)]
+        if unsupported:
+            errors.append(f"items[{i}] ({kind} {item['params'].get('name')}): {', '.join(unsupported)} not supported "
+                          f"by bulk, use {kind} module instead")
+            continue
+        connection = [option for option in CONNECTION_OPTIONS if option in item['params']]
+        if connection:
+            errors.append(f"items[{i}] ({kind} {item['params'].get('name')}): {', '.join(connection)} not supported "
+                          f"in items, set them on the bulk task instead")
+            continue
+        validation_result = validators[kind].validate(copy.deepcopy(item['params']))
+        if validation_result.error_messages:
+            errors.append(f"items[{i}] ({kind}): {'; '.join(validation_result.error_messages)}")
+            continue
+
+        params = validation_result.validated_parameters
+        item_module = ItemModule(module, validators[kind].argument_spec, params)
+        try:
+            k8s_def = KINDS[kind].definition(params)
+            if params.get('state') != 'absent':
+                KINDS[kind].validate(item_module, k8s_def)
+                if hasattr(KINDS[kind], 'canonicalize'):
+                    KINDS[kind].canonicalize(k8s_def)
+        except (ItemFailed, DefinitionError) as e:
+            errors.append(f"items[{i}] ({kind} {params.get('name')}): {e}")
+            continue
+        prepared.append((item_module, k8s_def))
+
+    return prepared, errors
+
+
+def main():
+    argspec = copy.deepcopy(AUTH_ARG_SPEC)
+    argspec.update(dict(
+        items=dict(type='list', elements='dict', required=True, options=dict(
+            kind=dict(type='str', required=True, choices=list(KINDS.keys())),
+            params=dict(type='dict', required=True)
+        )),
+        max_workers=dict(type='int', default=8)
+    ))
+
+    module = AnsibleModule(argument_spec=argspec, supports_check_mode=True)
+    if not HAS_ARGUMENT_SPEC_VALIDATOR:
+        module.fail_json(msg="bulk module requires ansible-core >= 2.11")
+    if module.params.get('max_workers') < 1:
+        module.fail_json(msg="max_workers must be a positive integer")
+
+    from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_bulk, client_pool_stats
+
+    prepared, errors = prepare(module, module.params.get('items'))
+    if errors:
+        module.fail_json(msg=f"{len(errors)} of {len(module.params.get('items'))} items are invalid, nothing was "
+                             f"applied", errors=errors)
+
+    results = execute_bulk(module, prepared, module.params.get('max_workers'))
+    changed = any(result['changed'] for result in results)
+    failed = [result for result in results if result['failed']]
+    if failed:
+        module.fail_json(msg=f"{len(failed)} of {len(results)} items failed", changed=changed, results=results)
+    module.exit_json(changed=changed, results=results, client_pool=client_pool_stats())
+
+
+if __name__ == '__main__':
+    main()
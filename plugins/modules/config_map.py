@@ -19,6 +19,8 @@ description: Creates k8s ConfigMap which holds configuration data for pods to co
 extends_documentation_fragment:
     - sodalite.k8s.common_update_options
     - sodalite.k8s.metadata_options
+    - sodalite.k8s.timings_options
+    - sodalite.k8s.versioned_options
     - kubernetes.core.k8s_auth_options
     - kubernetes.core.k8s_wait_options
     - kubernetes.core.k8s_delete_options
@@ -40,6 +42,23 @@ options:
            - The keys stored in C(binary_data) must not overlap with the ones in the C(data) field, this is enforced
              during validation process.
         type: dict
+    from_files:
+        description:
+            - Files on the managed node, which are added to the ConfigMap, given as C(path) or C(key=path).
+            - Key defaults to the file name.
+            - UTF-8 files are added to C(data), other files to C(binary_data).
+            - Files are read with mmap when the module runs, so their content does not pass through Ansible variables.
+            - Keys must not repeat keys of C(data), C(binary_data) or other files.
+            - Size of all data must not exceed 1 MiB, which is checked before any file is read.
+        type: list
+        elements: str
+        version_added: 1.1.0
+    from_dir:
+        description:
+            - Directory on the managed node. Every regular file in it (not recursively) is added, like with
+              C(from_files), under its file name.
+        type: path
+        version_added: 1.1.0
     immutable:
         description:
             - If set to C(true), ensures that data stored in the ConfigMap cannot be updated (only object metadata
@@ -80,6 +99,37 @@ EXAMPLES = r'''
     name: binary-config
     binary_data:
       db_ip: cG9zdGdyZXMtc2VydmljZQ==
+# Create config from files
+- name: Config from templates and assets
+  sodalite.k8s.config_map:
+    name: xOpera-files
+    from_files:
+      - /etc/xopera/settings.yaml
+      - logo.png=/srv/assets/logo-v2.png
+    from_dir: /etc/xopera/conf.d
+# Create a new version of config on every change of content and refer to it from a Deployment
+- name: Versioned config
+  sodalite.k8s.config_map:
+    name: xOpera-config
+    versioned: yes
+    keep_versions: 5
+    data:
+      db_ip: postgres-service
+  register: config
+- name: Deployment, that uses current version of config
+  sodalite.k8s.deployment:
+    name: xOpera-rest-api
+    labels:
+      app: rest-api
+    selector:
+      match_labels:
+        app: rest-api
+    containers:
+      - name: rest-api
+        image: xopera/rest-api
+        env_from:
+          - config_map:
+              name: "{{ config.name }}"
 # Create config with metadata
 - name: Labels and annotations
   sodalite.k8s.config_map:
@@ -127,81 +177,79 @@ result:
        returned: success
        type: dict
      duration:
-       description: elapsed time of task in seconds
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
        returned: when C(wait) is true
-       type: int
-       sample: 48
+       type: float
+       sample: 4.217
      error:
        description: error while trying to create/delete the object.
        returned: error
        type: dict
+name:
+  description:
+  - Name of the applied version, with hash of content appended.
+  returned: when I(versioned=yes)
+  type: str
+  version_added: 1.1.0
+  sample: app-config-5d41402abc
+pruned:
+  description:
+  - Names of older versions, that were deleted (in check mode, that would be deleted).
+  returned: when I(versioned=yes)
+  type: list
+  elements: str
+  version_added: 1.1.0
+  sample: ["app-config-7d793037a0"]
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
 '''
 
 from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
-from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
-                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
-from ansible_collections.sodalite.k8s.plugins.module_utils.common import Validators, CommonValidation
-from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
-
-
-def definition(params):
-
-    body = {
-        "apiVersion": "v1",
-        "kind": "ConfigMap",
-        "metadata": {
-            "name": params.get('name'),
-            "labels": params.get('labels'),
-            "annotations": params.get('annotations')
-        },
-        "immutable": params.get('immutable'),
-        "binaryData": params.get('binary_data'),
-        "data": params.get('data')
-    }
-
-    return clean_dict(body)
-
-
-def validate(module, k8s_definition):
-
-    CommonValidation.metadata(module, k8s_definition)
-
-    if not Validators.dns_subdomain(k8s_definition['metadata']['name']):
-        module.fail_json(msg=f"'name' {Validators.dns_subdomain_msg}")
-
-    data = k8s_definition.get('data', dict())
-    binary_data = k8s_definition.get('binaryData', dict())
-
-    data_keys_valid = all((Validators.config_map_key(key) for key in data.keys()))
-    binary_data_keys_valid = all((Validators.config_map_key(key) for key in binary_data.keys()))
-    keys_unique = len(set(list(data.keys()) + list(binary_data.keys()))) == len(data.keys()) + len(binary_data.keys())
-
-    if not data_keys_valid:
-        module.fail_json(msg="Keys in data must consist of alphanumeric characters, '-', '_' or '.'")
-    if not binary_data_keys_valid:
-        module.fail_json(msg="Keys in binary_data must consist of alphanumeric characters, '-', '_' or '.'")
-    if not keys_unique:
-        module.fail_json(msg="Keys in data and binary_data should not overlap")
-    if not Validators.string_byte_dict(binary_data):
-        module.fail_json(msg="binary_data should be map[string][]byte")
+from ansible_collections.sodalite.k8s.plugins.module_utils.bulk import DefinitionError
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.config_map import (argument_spec, definition,
+                                                                                        validate, MUTUALLY_EXCLUSIVE)
 
 
 def main():
-    argspec = update_arg_spec()
-    argspec.update(dict(
-        data=dict(type='dict'),
-        binary_data=dict(type='dict'),
-        immutable=dict(type='bool', default=False)
-    ))
-
-    module = AnsibleModule(argument_spec=argspec, mutually_exclusive=UPDATE_MUTUALLY_EXCLUSIVE, supports_check_mode=True)
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
     from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
 
-    k8s_def = definition(module.params)
+    with timings.phase('definition'):
+        try:
+            k8s_def = definition(module.params)
+        except DefinitionError as e:
+            module.fail_json(msg=str(e))
     if module.params.get('state') != 'absent':
-        validate(module, k8s_def)
+        with timings.phase('validate'):
+            validate(module, k8s_def)
 
-    execute_module(module, k8s_def)
+    execute_module(module, k8s_def, timings)
 
 
 if __name__ == '__main__':
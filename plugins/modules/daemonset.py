@@ -0,0 +1,217 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2021, Mihael Trajbarič <mihael.trajbaric@xlab.si>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: daemonset
+
+short_description: Creates k8s DaemonSet
+
+version_added: "1.1.0"
+
+description: Creates k8s DaemonSet, runs a copy of a pod on every node (or on every node, selected by the pod
+             template), e.g. node-local caches, log collectors or monitoring agents.
+
+extends_documentation_fragment:
+    - sodalite.k8s.common_update_options
+    - sodalite.k8s.metadata_options
+    - sodalite.k8s.selector_options
+    - sodalite.k8s.pod_template_options
+    - sodalite.k8s.timings_options
+    - kubernetes.core.k8s_auth_options
+    - kubernetes.core.k8s_wait_options
+    - kubernetes.core.k8s_delete_options
+
+options:
+    min_ready_seconds:
+        description:
+        - Minimum number of seconds for which a newly created pod should be ready without any of its container crashing,
+          for it to be considered available.
+        type: int
+        default: 0
+    update_strategy:
+        description:
+        - The strategy to use to replace existing pods with new ones.
+        type: dict
+        suboptions:
+            type:
+                description:
+                - C(RollingUpdate) replaces pods node by node, C(OnDelete) only replaces pods, when they are deleted.
+                type: str
+                default: RollingUpdate
+                choices: [ OnDelete, RollingUpdate ]
+            max_surge:
+                description:
+                - Present only if I(type=RollingUpdate).
+                - The maximum number of nodes, that run an updated pod next to the old one during the update.
+                - Value can be an absolute number (ex. C(5)) or a percentage of nodes (ex. C(10%)).
+                - This can not be 0 if I(max_unavailable=0).
+                type: str
+            max_unavailable:
+                description:
+                - Present only if I(type=RollingUpdate).
+                - The maximum number of nodes, whose pod can be unavailable during the update.
+                - Value can be an absolute number (ex. C(5)) or a percentage of nodes (ex. C(10%)).
+                - This can not be 0 if I(max_surge=0).
+                type: str
+    revision_history_limit:
+        description:
+        - The maximum number of revisions that will be maintained in the DaemonSet's revision history.
+        type: int
+        default: 10
+    verify_references:
+        description:
+        - Fails before the daemonset is written, when a ConfigMap, Secret or PersistentVolumeClaim, that is referenced
+          in I(containers[].env), I(containers[].env_from) or I(volumes), does not exist in the namespace.
+        - Objects of each kind are listed once (metadata only), not read one by one. References with I(optional=yes)
+          are not verified.
+        - Ignored when I(state=absent) and by M(sodalite.k8s.bulk).
+        type: bool
+        default: false
+
+notes:
+- Containers, volumes and the rest of the pod template are built and validated like in M(sodalite.k8s.deployment).
+- With I(wait=yes), the task waits until the updated pod is ready on every node.
+
+seealso:
+- name: K8s DaemonSet documentation
+  description: Documentation about DaemonSet concept on kubernetes website
+  link: https://kubernetes.io/docs/concepts/workloads/controllers/daemonset/
+- name: K8s DaemonSet API reference
+  description: API reference for K8s DaemonSet resource on kubernetes website
+  link: https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/daemon-set-v1/
+
+author:
+    - Mihael Trajbarič (@mihaTrajbaric)
+'''
+
+EXAMPLES = r'''
+# Run a node-local cache on every node
+- name: DaemonSet with a host port
+  sodalite.k8s.daemonset:
+    name: node-cache
+    state: present
+    labels:
+      app: node-cache
+    selector:
+      match_labels:
+        app: node-cache
+    containers:
+      - name: cache
+        image: redis:7
+        ports:
+          - name: redis
+            container_port: 6379
+            host_port: 6379
+        resource_limits:
+          memory: 512Mi
+    update_strategy:
+      type: RollingUpdate
+      max_unavailable: 10%
+    wait: yes
+
+# Remove DaemonSet
+- name: Remove daemonset
+  sodalite.k8s.daemonset:
+    name: node-cache
+    state: absent
+'''
+
+RETURN = r'''
+result:
+  description:
+  - The created, patched, or otherwise present object. Will be empty in the case of a deletion.
+  returned: success
+  type: complex
+  contains:
+     api_version:
+       description: The versioned schema of this representation of an object.
+       returned: success
+       type: str
+     kind:
+       description: Represents the REST resource this object represents.
+       returned: success
+       type: str
+     metadata:
+       description: Standard object metadata. Includes name, namespace, annotations, labels, etc.
+       returned: success
+       type: dict
+     spec:
+       description: Specific attributes of the object.
+       returned: success
+       type: dict
+     status:
+       description: Current status details for the object.
+       returned: success
+       type: dict
+     duration:
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
+       returned: when C(wait) is true
+       type: float
+       sample: 4.217
+     error:
+       description: error while trying to create/delete the object.
+       returned: error
+       type: dict
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
+'''
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.daemonset import (argument_spec, canonicalize,
+                                                                                       definition, references, validate,
+                                                                                       MUTUALLY_EXCLUSIVE)
+
+
+def main():
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
+    from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
+
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
+    if module.params.get('state') != 'absent':
+        with timings.phase('validate'):
+            validate(module, k8s_def)
+        with timings.phase('definition'):
+            canonicalize(k8s_def)
+
+    verified = None
+    if module.params.get('verify_references') and module.params.get('state') != 'absent':
+        verified = references(k8s_def)
+
+    execute_module(module, k8s_def, timings, references=verified)
+
+
+if __name__ == '__main__':
+    main()
@@ -21,6 +21,8 @@ description: Creates k8s Deployment, provides declarative updates for Pods and R
 extends_documentation_fragment:
     - sodalite.k8s.common_update_options
     - sodalite.k8s.metadata_options
+    - sodalite.k8s.pod_template_options
+    - sodalite.k8s.timings_options
     - kubernetes.core.k8s_auth_options
     - kubernetes.core.k8s_wait_options
     - kubernetes.core.k8s_delete_options
@@ -32,8 +34,8 @@ options:
         - The result of C(match_labels) and C(match_expressions) are ANDed.
         - An empty label selector matches all objects.
         - A null label selector matches no objects.
+        - Required with I(state=present), unless I(update_images) or I(scale_only) is set.
         type: dict
-        required: true
         suboptions:
             match_labels:
                 description:
@@ -72,491 +74,15 @@ options:
                         - This array is replaced during a strategic merge patch.
                         type: list
                         elements: str
-    containers:
-        description:
-        - List of containers belonging to the pod.
-        - There must be at least one container in a Pod.
-        type: list
-        elements: dict
-        required: true
-        suboptions:
-            name:
-                description:
-                - Name of the container specified as a DNS_LABEL.
-                - Each container in a pod must have a unique name (DNS_LABEL).
-                - Cannot be updated.
-                type: str
-                required: true
-            image:
-                description:
-                - Docker image name.
-                -  This field is optional to allow higher level config management to default or override
-                   container images.
-                - More info U(https://kubernetes.io/docs/concepts/containers/images)
-                type: str
-            image_pull_policy:
-                description:
-                - Image pull policy.
-                - Defaults to Always if :latest tag is specified, or IfNotPresent otherwise.
-                - Cannot be updated.
-                - More info U(https://kubernetes.io/docs/concepts/containers/images#updating-images)
-                type: str
-                choices: [ Always, Never, IfNotPresent ]
-            command:
-                description:
-                - Entrypoint array.
-                - Not executed within a shell.
-                - The docker image's ENTRYPOINT is used if this is not provided.
-                - Variable references $(VAR_NAME) are expanded using the container's environment.
-                - If a variable cannot be resolved, the reference in the input string will be unchanged.
-                - The $(VAR_NAME) syntax can be escaped with a double $$, ie $$(VAR_NAME).
-                - Escaped references will never be expanded, regardless of whether the variable exists or not.
-                - Cannot be updated.
-                - More info U(https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell)
-                type: list
-                elements: str
-            args:
-                description:
-                - Arguments to the entrypoint.
-                - The docker image's CMD is used if this is not provided.
-                - Variable references $(VAR_NAME) are expanded using the container's environment.
-                - If a variable cannot be resolved, the reference in the input string will be unchanged.
-                - The $(VAR_NAME) syntax can be escaped with a double $$, ie $$(VAR_NAME).
-                - Escaped references will never be expanded, regardless of whether the variable exists or not.
-                - Cannot be updated.
-                - More info U(https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell)
-                type: list
-                elements: str
-            working_dir:
-                description:
-                - Container's working directory.
-                - If not specified, the container runtime's default will be used, which might be configured in the
-                  container image.
-                - Cannot be updated.
-                type: str
-                aliases: [ workdir ]
-            ports:
-                description:
-                - List of ports to expose from the container.
-                - Exposing a port here gives the system additional information about the network connections a
-                  container uses, but is primarily informational.
-                - Not specifying a port here DOES NOT prevent that port from being exposed.
-                - Any port which is listening on the default "0.0.0.0" address inside a container will be accessible
-                  from the network.
-                - Cannot be updated.
-                type: list
-                elements: dict
-                suboptions:
-                    container_port:
-                        description:
-                        - Number of port to expose on the pod's IP address.
-                        - This must be a valid port number, 0 < x < 65536.
-                        type: int
-                        required: true
-                    host_ip:
-                        description:
-                        - What host IP to bind the external port to.
-                        type: str
-                    host_port:
-                        description:
-                        - Number of port to expose on the host.
-                        - If specified, this must be a valid port number, 0 < x < 65536.
-                        type: int
-                    name:
-                        description:
-                        - If specified, this must be an IANA_SVC_NAME and unique within the pod.
-                        - Each named port in a pod must have a unique name.
-                        - Name for the port that can be referred to by services.
-                        type: str
-                    protocol:
-                        description:
-                        - Protocol for port.
-                        type: str
-                        default: TCP
-                        choices: [ UDP, TCP, SCTP ]
-            env:
-                description:
-                - List of environment variables to set in the container.
-                - Cannot be updated.
-                type: list
-                elements: dict
-                suboptions:
-                    name:
-                        description:
-                        - Name of the environment variable.
-                        - Must be a C_IDENTIFIER.
-                        type: str
-                        required: true
-                    value:
-                        description:
-                        - Variable references $(VAR_NAME) are expanded using the previous defined environment variables
-                          in the container and any service environment variables.
-                        - If a variable cannot be resolved, the reference in the input string will be unchanged.
-                        - The $(VAR_NAME) syntax can be escaped with a double $$, ie $$(VAR_NAME).
-                        - Escaped references will never be expanded, regardless of whether the variable exists or not.
-                        type: str
-                    config_map:
-                        description:
-                        - Selects a key of a ConfigMap.
-                        type: dict
-                        suboptions:
-                            key:
-                                description:
-                                - The key to select.
-                                type: str
-                                required: true
-                            name:
-                                description:
-                                - Name of the referent.
-                                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
-                                type: str
-                            optional:
-                                description:
-                                - Specify whether the ConfigMap or its key must be defined.
-                                type: bool
-                    secret:
-                        description:
-                        - Selects a key of a secret in the pod's namespace.
-                        type: dict
-                        suboptions:
-                            key:
-                                description:
-                                - The key of the secret to select from.
-                                - Must be a valid secret key.
-                                type: str
-                                required: true
-                            name:
-                                description:
-                                - Name of the referent.
-                                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
-                                type: str
-                            optional:
-                                description:
-                                - Specify whether the Secret or its key must be defined.
-                                type: bool
-            env_from:
-                description:
-                - List of sources to populate environment variables in the container.
-                - The keys defined within a source must be a C_IDENTIFIER.
-                - All invalid keys will be reported as an event when the container is starting.
-                - When a key exists in multiple sources, the value associated with the last source will take precedence.
-                - Values defined by an Env with a duplicate key will take precedence.
-                - Cannot be updated.
-                type: list
-                elements: dict
-                suboptions:
-                    config_map:
-                        description:
-                        - The ConfigMap to select from.
-                        - The contents of the target ConfigMap's Data field will represent the key-value pairs as
-                          environment variables.
-                        type: dict
-                        suboptions:
-                            name:
-                                description:
-                                - Name of the referent.
-                                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
-                                type: str
-                                required: true
-                            optional:
-                                description:
-                                - Specify whether the ConfigMap must be defined.
-                                type: bool
-                    prefix:
-                        description:
-                        - An optional identifier to prepend to each key in the ConfigMap.
-                        - Must be a C_IDENTIFIER.
-                        type: str
-                    secret:
-                        description:
-                        - The Secret to select from.
-                        - The contents of the target Secret's Data field will represent the key-value pairs as
-                          environment variables.
-                        type: dict
-                        suboptions:
-                            name:
-                                description:
-                                - Name of the referent.
-                                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
-                                type: str
-                                required: true
-                            optional:
-                                description:
-                                - Specify whether the Secret must be defined.
-                                type: bool
-            volume_mounts:
-                description:
-                - Pod volumes to mount into the container's filesystem.
-                - Each VolumeMount describes a mounting of a Volume within a container.
-                - Cannot be updated.
-                type: list
-                elements: dict
-                suboptions:
-                    path:
-                        description:
-                        - Path within the container at which the volume should be mounted.
-                        - Must not contain ':'.
-                        type: str
-                        required: true
-                    name:
-                        description:
-                        - This must match the Name of a Volume.
-                        type: str
-                        required: true
-                    propagation:
-                        description:
-                        - determines how mounts are propagated from the host to container and the other way around.
-                        - More info U(https://kubernetes.io/docs/concepts/storage/volumes/#mount-propagation)
-                        type: str
-                        default: "None"
-                        choices: [None, HostToContainer, Bidirectional]
-                    read_only:
-                        description:
-                        - Mounted read-only if true, read-write otherwise (false or unspecified).
-                        type: bool
-                        default: false
-                    sub_path:
-                        description:
-                        - Path within the volume from which the container's volume should be mounted.
-                        - "\"\" means volume's root."
-                        type: str
-                    sub_path_expr:
-                        description:
-                        - Expanded path within the volume from which the container's volume should be mounted.
-                        - Behaves similarly to I(sub_path) but environment variable references $(VAR_NAME) are expanded
-                          using the container's environment.
-                        - "\"\" means volume's root."
-                        - I(sub_path_expr) and I(sub_path) are mutually exclusive.
-                        type: str
-            volume_devices:
-                description:
-                - The list of block devices to be used by the container.
-                - Each element describes a mapping of a raw block device within a container.
-                type: list
-                elements: dict
-                suboptions:
-                    path:
-                        description:
-                        - Path inside of the container that the device will be mapped to.
-                        type: str
-                        required: true
-                    name:
-                        description:
-                        - I(name) must match the name of a persistentVolumeClaim (pvc) in the pod.
-                        type: str
-                        required: true
-            resource_limits:
-                description:
-                - Limits describes the maximum amount of compute resources allowed.
-                - More info U(https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/)
-                type: dict
-                suboptions:
-                    cpu:
-                        description:
-                        - Maximum CPU resources.
-                        - Must be in cpu units;
-                        - More info U(https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/#meaning-of-cpu)
-                        type: str
-                    memory:
-                        description:
-                        - Maximum memory resources.
-                        - Must be in memory units;
-                        - More info U(https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/#meaning-of-memory)
-                        type: str
-            resource_requests:
-                description:
-                - Requests describes the minimum amount of compute resources required.
-                - If I(resource_requests) is omitted for a container, it defaults to I(resource_limits) if that is
-                  explicitly specified, otherwise to an implementation-defined value.
-                - More info U(https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/)
-                type: dict
-                suboptions:
-                    cpu:
-                        description:
-                        - Requested CPU resources.
-                        - Must be in cpu units;
-                        - More info U(https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/#meaning-of-cpu)
-                        type: str
-                    memory:
-                        description:
-                        - Requested memory resources.
-                        - Must be in memory units;
-                        - More info U(https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/#meaning-of-memory)
-                        type: str
-    image_pull_secrets:
-        description:
-        - Optional list of references to secrets in the same namespace to use for pulling any of the images used by
-          this C(deployment).
-        - If specified, these secrets will be passed to individual puller implementations for them to use.
-        - For example, in the case of docker, only C(DockerConfig) type secrets are honored.
-        - More info U(https://kubernetes.io/docs/concepts/containers/images#specifying-imagepullsecrets-on-a-pod)
-        type: list
-        elements: str
-    enable_service_links:
-        description:
-        - Indicates whether information about services should be injected into pod's environment variables, matching
-          the syntax of Docker links.
-        type: bool
-        default: true
-    volumes:
-        description:
-        - List of volumes that can be mounted by containers belonging to the pod.
-        - More info U(https://kubernetes.io/docs/concepts/storage/volumes)
-        type: list
-        elements: dict
-        suboptions:
-            name:
-                description:
-                - Volume's name. Must be a C(DNS_LABEL) and unique within the pod.
-                - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
-                type: str
-                required: true
-            pvc:
-                description:
-                - A reference to a PersistentVolumeClaim (PVC) in the same namespace.
-                - This volume finds the bound PV and mounts that volume for the pod.
-                - It is, essentially, a wrapper around another type of volume that is owned by someone else
-                  (the system).
-                - More info U(https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims)
-                type: dict
-                suboptions:
-                    claim_name:
-                        description:
-                        - Name of a pvc in the same namespace as the pod using this volume.
-                        - More info U(https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims)
-                        type: str
-                        required: true
-                    read_only:
-                        description:
-                        - Will force the C(ReadOnly) setting in I(VolumeMounts).
-                        type: bool
-                        default: false
-            config_map:
-                description:
-                - Adapts a ConfigMap into a volume.
-                - The contents of the target ConfigMap's Data field will be presented in a volume as files using the
-                  keys in the C(Data) field as the file names, unless the items element is populated with specific
-                  mappings of keys to paths.
-                - ConfigMap volumes support ownership management and SELinux relabeling.
-                type: dict
-                suboptions:
-                    name:
-                        description:
-                        - Name of the referent.
-                        - More info U(https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names)
-                        type: str
-                    optional:
-                        description:
-                        - Specify whether the ConfigMap or its keys must be defined.
-                        type: bool
-                    default_mode:
-                        description:
-                        - Mode bits used to set permissions on created files by default.
-                        - Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
-                        - Directories within the path are not affected by this setting.
-                        - This might be in conflict with other options that affect the file mode, like fsGroup, and
-                          the result can be other mode bits set.
-                        type: int
-                        default: 0644
-                    items:
-                        description:
-                        - If unspecified, each key-value pair in the Data field of the referenced ConfigMap will be
-                          projected into the volume as a file whose name is the key and content is the value.
-                        - If specified, the listed keys will be projected into the specified paths, and unlisted keys
-                          will not be present.
-                        - If a key is specified which is not present in the ConfigMap, the volume setup will error
-                          unless it is marked optional.
-                        - Paths must be relative and may not contain the '..' path or start with '..'.
-                        type: list
-                        elements: dict
-                        suboptions:
-                            key:
-                                description:
-                                - The key to project.
-                                type: str
-                                required: true
-                            path:
-                                description:
-                                - The relative path of the file to map the key to.
-                                - May not be an absolute path.
-                                - May not contain the path element '..'.
-                                - May not start with the string '..'.
-                                type: str
-                                required: true
-                            mode:
-                                description:
-                                - Mode bits used to set permissions on this file.
-                                - Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
-                                - If not specified, the volume I(default_mode) will be used.
-                                - This might be in conflict with other options that affect the file mode, like fsGroup,
-                                  and the result can be other mode bits set.
-                                type: int
-            secret:
-                description:
-                - Adapts a Secret into a volume.
-                - The contents of the target Secret's Data field will be presented in a volume as files using the
-                  keys in the C(Data) field as the file names, unless the items element is populated with specific
-                  mappings of keys to paths.
-                - Secret volumes support ownership management and SELinux relabeling.
-                type: dict
-                suboptions:
-                    name:
-                        description:
-                        - Name of the secret in the pod's namespace to use.
-                        - More info U(https://kubernetes.io/docs/concepts/storage/volumes#secret)
-                        type: str
-                    optional:
-                        description:
-                        - Specify whether the Secret or its keys must be defined.
-                        type: bool
-                    default_mode:
-                        description:
-                        - Mode bits used to set permissions on created files by default.
-                        - Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
-                        - Directories within the path are not affected by this setting.
-                        - This might be in conflict with other options that affect the file mode, like fsGroup, and
-                          the result can be other mode bits set.
-                        type: int
-                        default: 0644
-                    items:
-                        description:
-                        - If unspecified, each key-value pair in the Data field of the referenced Secret will be
-                          projected into the volume as a file whose name is the key and content is the value.
-                        - If specified, the listed keys will be projected into the specified paths, and unlisted keys
-                          will not be present.
-                        - If a key is specified which is not present in the Secret, the volume setup will error
-                          unless it is marked optional.
-                        - Paths must be relative and may not contain the '..' path or start with '..'.
-                        type: list
-                        elements: dict
-                        suboptions:
-                            key:
-                                description:
-                                - The key to project.
-                                type: str
-                                required: true
-                            path:
-                                description:
-                                - The relative path of the file to map the key to.
-                                - May not be an absolute path.
-                                - May not contain the path element '..'.
-                                - May not start with the string '..'.
-                                type: str
-                                required: true
-                            mode:
-                                description:
-                                - Mode bits used to set permissions on this file.
-                                - Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
-                                - If not specified, the volume I(default_mode) will be used.
-                                - This might be in conflict with other options that affect the file mode, like fsGroup,
-                                  and the result can be other mode bits set.
-                                type: int
     replicas:
         description:
         - Number of desired pods.
         - This is a pointer to distinguish between explicit zero and not specified.
+        - When the existing deployment contains the rest of the definition and only replicas differ, they are changed
+          through the C(scale) subresource, see I(scale_only).
+        - When omitted, the API server sets 1 on a new deployment and an existing deployment keeps its replicas.
+        - Required with I(scale_only=yes).
         type: int
-        default: 1
     min_ready_seconds:
         description:
         - Minimum number of seconds for which a newly created pod should be ready without any of its container crashing,
@@ -610,8 +136,67 @@ options:
     paused:
         description:
         - Indicates that the deployment is paused.
+        - When not set, a new deployment is not paused and an existing deployment stays paused or not, so tasks between
+          I(rollout_batch=begin) and I(rollout_batch=commit) do not resume it.
+        type: bool
+    rollout_batch:
+        description:
+        - Collapses changes of several tasks on the same deployment into a single rollout.
+        - C(begin) pauses the deployment with the write of this task. Later tasks, that leave I(paused) unset, change
+          the paused deployment without rolling out their changes.
+        - C(commit) resumes the deployment with the write of this task, so all changes since C(begin) are rolled out
+          at once. Without I(containers), the deployment is only resumed with a single patch and the rest of the
+          definition is neither validated nor sent. This is not supported by M(sodalite.k8s.bulk).
+        - Tasks with I(server_side_apply) in between must set I(paused=yes), since a field omitted from an apply is
+          reset.
+        - Mutually exclusive with I(paused), I(update_images), I(scale_only), I(apply) and I(server_side_apply).
+          Ignored when I(state=absent).
+        type: str
+        choices: [ begin, commit ]
+        version_added: 1.1.0
+    verify_references:
+        description:
+        - Fails before the deployment is written, when a ConfigMap, Secret or PersistentVolumeClaim, that is referenced
+          in I(containers[].env), I(containers[].env_from) or I(volumes), does not exist in the namespace.
+        - Objects of each kind are listed once (metadata only), not read one by one. References with I(optional=yes)
+          are not verified.
+        - Without it, pods of such deployment are stuck in C(CreateContainerConfigError) or C(ContainerCreating).
+        - Ignored when I(state=absent) and by M(sodalite.k8s.bulk).
+        type: bool
+        default: false
+        version_added: 1.1.0
+    update_images:
+        description:
+        - Map of container name to image. Updates only images of these containers of the existing deployment.
+        - Sends a single strategic merge patch, that holds names and images of changed containers, instead of the whole
+          deployment. The rest of the definition is neither validated nor sent, so only I(name) and I(namespace) are
+          needed. Task fails, when the deployment or one of the containers does not exist.
+        - Deployment is not changed, when all containers already run these images.
+        - Removes the I(spec_hash) annotation, since the deployment no longer matches the hashed definition.
+        - Mutually exclusive with I(containers), I(apply), I(server_side_apply) and I(force). Ignored when
+          I(state=absent). Not supported by M(sodalite.k8s.bulk).
+        type: dict
+        version_added: 1.1.0
+    scale_only:
+        description:
+        - Only sets I(replicas) of the existing deployment, with a single merge patch of its C(scale) subresource,
+          instead of sending the whole deployment. The rest of the definition is neither validated nor sent, so only
+          I(name), I(namespace) and I(replicas) are needed. Task fails, when the deployment does not exist.
+        - Leaves the pod template alone, so it does not conflict with controllers, that own the template.
+        - Removes the I(spec_hash) annotation with a second patch, if present, since the deployment no longer matches
+          the hashed definition.
+        - Mutually exclusive with I(containers), I(update_images), I(apply), I(server_side_apply) and I(force). Ignored
+          when I(state=absent). Not supported by M(sodalite.k8s.bulk).
         type: bool
         default: false
+        version_added: 1.1.0
+
+notes:
+- With I(wait=yes), pods of the new ReplicaSet are checked every few seconds while the rollout is watched. The task
+  fails as soon as the deployment exceeds I(progress_deadline_seconds) or a container of the new pods is stuck in
+  C(ErrImagePull), C(ImagePullBackOff), C(InvalidImageName), C(CrashLoopBackOff), C(CreateContainerConfigError) or
+  C(CreateContainerError), instead of waiting for I(wait_timeout). Returned C(reason) and C(pod) name the failure.
+- Failed rollouts are only detected, when pods and ReplicaSets in the namespace may be listed.
 
 seealso:
 - name: K8s Deployment documentation
@@ -728,6 +313,53 @@ EXAMPLES = r'''
           - secret:
               name: db_2_secret
             prefix: DB_2_
+    # fail right away, if postgres-db-config or db_2_secret is missing
+    verify_references: yes
+
+# Bump image of a single container
+- name: Update image
+  sodalite.k8s.deployment:
+    name: getting-started
+    update_images:
+      getting-started-container: docker/getting-started:v2
+    wait: yes
+
+# One rollout for several tasks
+- name: Pause deployment and change environment
+  sodalite.k8s.deployment:
+    name: getting-started
+    labels:
+      app: getting-started
+    selector:
+      match_labels:
+        app: getting-started
+    containers:
+      - name: getting-started-container
+        image: docker/getting-started
+        env:
+          - name: MODE
+            value: batch
+    rollout_batch: begin
+
+- name: Change image without rollout
+  sodalite.k8s.deployment:
+    name: getting-started
+    update_images:
+      getting-started-container: docker/getting-started:v2
+
+- name: Roll out all changes at once
+  sodalite.k8s.deployment:
+    name: getting-started
+    rollout_batch: commit
+    wait: yes
+
+# Change replica count only
+- name: Scale deployment
+  sodalite.k8s.deployment:
+    name: getting-started
+    replicas: 5
+    scale_only: yes
+    wait: yes
 
 # Volumes
 - name: Minimal example
@@ -800,6 +432,61 @@ EXAMPLES = r'''
           cpu: 0.1
           memory: 2Gi
 
+# Hugepages, mounted from an emptyDir volume
+- name: Minimal example with hugepages
+  sodalite.k8s.deployment:
+    name: getting-started
+    state: present
+    labels:
+      app: getting-started
+    selector:
+      match_labels:
+        app: getting-started
+    containers:
+      - name: getting-started-container
+        image: docker/getting-started
+        resource_limits:
+          hugepages-2Mi: 100Mi
+          memory: 1Gi
+        volume_mounts:
+          - name: hugepages
+            path: /hugepages
+    volumes:
+      - name: hugepages
+        empty_dir:
+          medium: HugePages
+
+# Probes: traffic only to ready pods, slow start is not killed by liveness probe
+- name: Minimal example with probes
+  sodalite.k8s.deployment:
+    name: getting-started
+    state: present
+    labels:
+      app: getting-started
+    selector:
+      match_labels:
+        app: getting-started
+    containers:
+      - name: getting-started-container
+        image: docker/getting-started
+        ports:
+          - name: http
+            container_port: 80
+        readiness_probe:
+          http_get:
+            path: /
+            port: http
+          period_seconds: 5
+        liveness_probe:
+          tcp_socket:
+            port: http
+        startup_probe:
+          http_get:
+            path: /
+            port: http
+          period_seconds: 5
+          failure_threshold: 60
+
 # k8s options
 - name: Minimal example with k8s options
   sodalite.k8s.deployment:
@@ -868,411 +555,142 @@ result:
        returned: success
        type: dict
      duration:
-       description: elapsed time of task in seconds
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
        returned: when C(wait) is true
-       type: int
-       sample: 48
+       type: float
+       sample: 4.217
      error:
        description: error while trying to create/delete the object.
        returned: error
        type: dict
+reason:
+  description:
+  - Reason, why the rollout can not succeed. One of C(ProgressDeadlineExceeded), or waiting reason of a container
+    of the new ReplicaSet (C(ErrImagePull), C(ImagePullBackOff), C(InvalidImageName), C(CrashLoopBackOff),
+    C(CreateContainerConfigError), C(CreateContainerError)).
+  returned: when C(wait) is true and the rollout failed
+  type: str
+  version_added: 1.1.0
+  sample: ImagePullBackOff
+rollout:
+  description:
+  - Latency metrics of the rollout of the new ReplicaSet, taken from pod conditions and events.
+  - Durations are seconds since the new ReplicaSet was created, timestamps are server time (UTC, 1s resolution).
+  - Image pulls are only reported, when events in the namespace may be listed.
+  returned: when C(wait) is true and the rollout succeeded
+  type: complex
+  version_added: 1.1.0
+  contains:
+     replica_set:
+       description: Name of the new ReplicaSet.
+       type: str
+       sample: getting-started-7d4b9c8f6d
+     started:
+       description: Creation timestamp of the new ReplicaSet.
+       type: str
+       sample: "2024-05-02T10:00:00Z"
+     time_to_first_ready:
+       description: Seconds until the first pod of the new ReplicaSet was ready.
+       type: float
+       sample: 12.0
+     time_to_available:
+       description:
+       - Seconds until all replicas of the new ReplicaSet were ready, plus I(min_ready_seconds).
+       - C(null), when not all replicas are ready.
+       type: float
+       sample: 25.0
+     pods:
+       description:
+       - Timestamps of pods of the new ReplicaSet, ordered by creation. C(created), C(scheduled), C(pulling) (first
+         image pull started), C(pulled) (last image pulled), C(started) (last container started) and C(ready).
+       - Missing milestones are C(null), e.g. C(pulling) when the image was already present.
+       type: list
+       elements: dict
+       sample: [{"name": "getting-started-7d4b9c8f6d-x2m9q", "node": "node-1", "created": "2024-05-02T10:00:01Z",
+                 "scheduled": "2024-05-02T10:00:01Z", "pulling": "2024-05-02T10:00:03Z",
+                 "pulled": "2024-05-02T10:00:08Z", "started": "2024-05-02T10:00:09Z",
+                 "ready": "2024-05-02T10:00:12Z"}]
+replicas:
+  description:
+  - Replica count before and after the task, when replicas were set through the C(scale) subresource.
+  returned: when I(scale_only=yes) or only replicas differed from the existing deployment
+  type: dict
+  version_added: 1.1.0
+  sample: {"before": 2, "after": 5}
+pod:
+  description:
+  - Name of the pod, that failed the rollout.
+  returned: when C(wait) is true and a pod of the rollout failed
+  type: str
+  version_added: 1.1.0
+  sample: getting-started-7d4b9c8f6d-x2m9q
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
 '''
 
 from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
-from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
-                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
-from ansible_collections.sodalite.k8s.plugins.module_utils.common import Validators, CommonValidation
-from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
-
-
-def definition(params):
-    body = {
-        "apiVersion": "apps/v1",
-        "kind": "Deployment",
-        "metadata": {
-            "name": params.get('name'),
-            "labels": params.get('labels'),
-            "annotations": params.get('annotations')
-        },
-        "spec": {
-            'selector': {
-                'matchExpressions': (params.get('selector') or {}).get('match_expressions'),
-                'matchLabels': (params.get('selector') or {}).get('match_labels')
-            },
-            "template": {
-                "metadata": {
-                    "name": params.get('name'),
-                    "labels": params.get('labels'),
-                    "annotations": params.get('annotations')
-                },
-                'spec': {
-                    'containers': [
-                        {
-                            'name': container.get('name'),
-                            'image': container.get('image'),
-                            'imagePullPolicy': container.get('image_pull_policy'),
-                            'command': container.get('command'),
-                            'args': container.get('args'),
-                            'workingDir': container.get('working_dir'),
-                            'ports': [
-                                {
-                                    'containerPort': port.get('container_port'),
-                                    'hostIP': port.get('host_ip'),
-                                    'hostPort': port.get('host_port'),
-                                    'name': port.get('name'),
-                                    'protocol': port.get('protocol'),
-                                }
-                                for port in container.get('ports') or list()
-                            ],
-                            'env': [
-                                {
-                                    'name': env_var.get('name'),
-                                    'valueFrom': {
-                                        'configMapKeyRef': env_var.get('config_map'),
-                                        'secretKeyRef': env_var.get('secret'),
-                                    },
-                                    'value': env_var.get('value')
-                                }
-                                for env_var in container.get('env') or list()
-                            ],
-                            'envFrom': [
-                                {
-                                    'configMapRef': env_from_item.get('config_map'),
-                                    'prefix': env_from_item.get('prefix'),
-                                    'secretRef': env_from_item.get('secret'),
-                                }
-                                for env_from_item in container.get('env_from') or list()
-                            ],
-                            'volumeMounts': [
-                                {
-                                    'mountPath': volume_mount.get('path'),
-                                    'name': volume_mount.get('name'),
-                                    'mountPropagation': volume_mount.get('propagation'),
-                                    'readOnly': volume_mount.get('read_only'),
-                                    'subPath': volume_mount.get('sub_path'),
-                                    'subPathExpr': volume_mount.get('sub_path_expr'),
-                                }
-                                for volume_mount in container.get('volume_mounts') or list()
-                            ],
-                            'volumeDevices': [
-                                {
-                                    'devicePath': volume_device.get('path'),
-                                    'name': volume_device.get('name')
-                                }
-                                for volume_device in container.get('volume_devices') or list()
-                            ],
-                            'resources': {
-                                'limits': container.get('resource_limits'),
-                                'requests': container.get('resource_requests')
-                            }
-                        }
-                        for container in params.get('containers') or list()
-                    ],
-                    'imagePullSecrets': [{'name': secret} for secret in params.get('image_pull_secrets') or list()],
-                    'enableServiceLinks': params.get('enable_service_links'),
-                    'volumes': [
-                        {
-                            'name': volume.get('name'),
-                            'persistentVolumeClaim': {
-                                'claimName': (volume.get('pvc') or {}).get('claim_name'),
-                                'readOnly': (volume.get('pvc') or {}).get('read_only')
-                            },
-                            'configMap': {
-                                'name': (volume.get('config_map') or {}).get('name'),
-                                'optional': (volume.get('config_map') or {}).get('optional'),
-                                'defaultMode': (volume.get('config_map') or {}).get('default_mode'),
-                                'items': (volume.get('config_map') or {}).get('items'),
-                            },
-                            'secret': {
-                                'secretName': (volume.get('secret') or {}).get('name'),
-                                'optional': (volume.get('secret') or {}).get('optional'),
-                                'defaultMode': (volume.get('secret') or {}).get('default_mode'),
-                                'items': (volume.get('secret') or {}).get('items'),
-                            }
-                        }
-                        for volume in params.get('volumes') or list()
-                    ]
-                }
-            },
-            'replicas': params.get('replicas'),
-            'minReadySeconds': params.get('min_ready_seconds'),
-            'strategy': {
-                "type": (params.get('strategy') or {}).get('type'),
-                "rollingUpdate": {
-                    "maxSurge": (params.get('strategy') or {}).get('max_surge'),
-                    "maxUnavailable": (params.get('strategy') or {}).get('max_unavailable'),
-                }
-            },
-            'revisionHistoryLimit': params.get('revision_history_limit'),
-            'progressDeadlineSeconds': params.get('progress_deadline_seconds'),
-            'paused': params.get('paused')
-        }
-
-    }
-    return clean_dict(body)
-
-
-def validate(module, k8s_definition):
-
-    CommonValidation.metadata(module, k8s_definition)
-    CommonValidation.selector(module, k8s_definition)
-
-    if not Validators.dns_subdomain(k8s_definition['metadata']['name']):
-        module.fail_json(msg=f"'name' {Validators.dns_subdomain_msg}")
-
-    strategy = k8s_definition.get('spec').get('strategy')
-    if strategy and strategy['type'] == 'Recreate' and 'rollingUpdate' in strategy.keys():
-        module.fail_json(msg="strategy.max_surge and strategy.max_unavailable can only be present "
-                             "if strategy.type==RollingUpdate")
-
-    pod_definition = k8s_definition['spec']['template']
-    CommonValidation.metadata(module, pod_definition)
-
-    # to verify unique port names
-    port_names = list()
-    containers = pod_definition['spec'].get('containers') or list()
-
-    if len(containers) < 1:
-        module.fail_json(msg="There must be at least one container in a Pod.")
-
-    for i, container in enumerate(containers):
-        if not Validators.dns_label(container['name']):
-            module.fail_json(msg=f"containers[{i}].name {Validators.dns_label_msg}")
-
-        if 'image' not in container.keys():
-            module.fail_json(msg=f"containers[{i}].image is missing")
-
-        for j, port in enumerate(container.get('ports', list())):
-            if not Validators.port(port.get('containerPort')):
-                module.fail_json(msg=f"containers[{i}].ports[{j}].container_port {Validators.port_msg}")
-            if not Validators.port(port.get('hostPort')):
-                module.fail_json(msg=f"containers[{i}].ports[{j}].host_port {Validators.port_msg}")
-            name = port.get('name')
-            if not Validators.iana_svc_name(name):
-                module.fail_json(msg=f"containers[{i}].ports[{j}].name {Validators.iana_svc_name_msg}")
-            if name in port_names:
-                module.fail_json(msg=f"Duplicate port name found (containers[{i}].ports[{j}].name)."
-                                     f" Each named port in a pod must have a unique name")
-            if name:
-                port_names.append(name)
-
-        for j, env_var in enumerate(container.get('env', list())):
-            if not Validators.c_identifier(env_var.get('name')):
-                module.fail_json(msg=f"containers[{i}].env[{j}].name {Validators.c_identifier_msg}")
-            modes = [
-                'value' in env_var,
-                'configMapKeyRef' in env_var.get('valueFrom', {}),
-                'secretKeyRef' in env_var.get('valueFrom', {})
-            ]
-            if sum(modes) != 1:
-                module.fail_json(msg=f"More then one value source in containers[{i}].env[{j}]. "
-                                     f"Only one of (value, config_map, secret) can be present.")
-
-            if not Validators.dns_subdomain(env_var.get('valueFrom', {}).get('configMapKeyRef', {}).get('name')):
-                module.fail_json(msg=f"containers[{i}].env[{j}].config_map.name {Validators.dns_subdomain_msg}")
-
-            if not Validators.dns_subdomain(env_var.get('valueFrom', {}).get('secretKeyRef', {}).get('name')):
-                module.fail_json(msg=f"containers[{i}].env[{j}].secret.name {Validators.dns_subdomain_msg}")
-
-        for j, env_from_item in enumerate(container.get('envFrom', list())):
-            modes = [
-                'configMapRef' in env_from_item,
-                'secretRef' in env_from_item
-            ]
-            if sum(modes) != 1:
-                module.fail_json(msg=f"More then one value source in containers[{i}].env_from[{j}]. "
-                                     f"Only one of (config_map, secret) can be present.")
-
-            if not Validators.dns_subdomain(env_from_item.get('configMapRef', {}).get('name')):
-                module.fail_json(msg=f"containers[{i}].env_from[{j}].config_map.name {Validators.dns_subdomain_msg}")
-
-            if not Validators.dns_subdomain(env_from_item.get('secretRef', {}).get('name')):
-                module.fail_json(msg=f"containers[{i}].env_from[{j}].secret.name {Validators.dns_subdomain_msg}")
-
-            if not Validators.c_identifier(env_from_item.get('prefix')):
-                module.fail_json(msg=f"containers[{i}].env_from[{j}].prefix {Validators.c_identifier_msg}")
-
-        # dict of <volume_name>: <volume_type>
-        volumes = pod_definition['spec'].get('volumes') or list()
-        volume_dict = {volume['name']: next(iter((volume.keys() - {'name'})))
-                       for volume in volumes}
-        for j, volume_mount in enumerate(container.get('volumeMounts', list())):
-            if volume_mount.get('name') not in volume_dict.keys():
-                module.fail_json(msg=f"containers[{i}].volume_mounts[{j}].name not found. Every name should match the "
-                                     f"Name of a Volume.")
-            if ':' in volume_mount.get('mountPath'):
-                module.fail_json(msg=f"containers[{i}].volume_mounts[{j}].path should not contain ':'")
-
-            sub_path_mutually_exclusive_violation = sum(['subPath' in volume_mount, 'subPathExpr' in volume_mount]) > 1
-            if sub_path_mutually_exclusive_violation:
-                module.fail_json(msg=f"sub_path and sub_path_expr in containers[{i}].volume_mounts[{j}] are mutually"
-                                     f" exclusive")
-
-        for j, volume_device in enumerate(container.get('volumeDevices', list())):
-            name = volume_device.get('name')
-            if name not in volume_dict.keys():
-                module.fail_json(msg=f"containers[{i}].volume_devices[{j}].name not found. Every name should match the "
-                                     f"Name of a Volume.")
-            elif volume_dict.get(name) != 'persistentVolumeClaim':
-                module.fail_json(msg=f"containers[{i}].volume_devices[{j}].name should match the name of a "
-                                     f"persistentVolumeClaim (pvc) in the pod")
-
-            if ':' in volume_device.get('devicePath'):
-                module.fail_json(msg=f"containers[{i}].volume_devices[{j}].path should not contain ':'")
-
-        if not Validators.string_quantity_dict((container.get('resources') or {}).get('limits')):
-            module.fail_json(msg="resource_limits.cpu and resource_limits.memory should be Quantities")
-
-        if not Validators.string_quantity_dict((container.get('resources') or {}).get('requests')):
-            module.fail_json(msg="resource_requests.cpu and resource_requests.memory should be Quantities")
-
-    for i, volume in enumerate(pod_definition['spec'].get('volumes') or list()):
-        if not Validators.dns_label(volume['name']):
-            module.fail_json(msg=f"volumes[{i}].name {Validators.dns_label_msg}")
-
-        modes = [
-            'persistentVolumeClaim' in volume,
-            'configMap' in volume,
-            'secret' in volume
-        ]
-        if sum(modes) != 1:
-            module.fail_json(msg=f"More then one volume source in volumes[{i}]. "
-                                 f"Only one of (pvc, config_map, secret) can be present.")
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.deployment import (argument_spec, canonicalize,
+                                                                                        definition, references,
+                                                                                        validate, validate_images,
+                                                                                        validate_scale,
+                                                                                        MUTUALLY_EXCLUSIVE, REQUIRED_IF)
 
 
 def main():
-    argspec = update_arg_spec()
-    argspec.update(dict(
-        selector=dict(type='dict', required=True, options=dict(
-            match_labels=dict(type='dict'),
-            match_expressions=dict(type='list', elements='dict', options=dict(
-                key=dict(type='str', required=True, no_log=False),
-                operator=dict(type='str', required=True, choices=['In', 'NotIn', 'Exists', 'DoesNotExist']),
-                values=dict(type='list', elements='str')
-            ))
-        )),
-        # TODO init_container spec
-        containers=dict(type='list', required=True, elements='dict', options=dict(
-            name=dict(type='str', required=True),
-            image=dict(type='str'),
-            image_pull_policy=dict(type='str', choices=['Always', 'Never', 'IfNotPresent']),
-            command=dict(type='list', elements='str'),
-            args=dict(type='list', elements='str'),
-            working_dir=dict(type='str', aliases=['workdir']),
-            ports=dict(type='list', elements='dict', options=dict(
-                container_port=dict(type='int', required=True),
-                host_ip=dict(type='str'),
-                host_port=dict(type='int'),
-                name=dict(type='str'),
-                protocol=dict(type='str', choices=['UDP', 'TCP', 'SCTP'], default='TCP')
-            )),
-            env=dict(type='list', elements='dict', options=dict(
-                name=dict(type='str', required=True),
-                value=dict(type='str'),
-                config_map=dict(type='dict', options=dict(
-                    key=dict(type='str', required=True, no_log=False),
-                    name=dict(type='str'),
-                    optional=dict(type='bool')
-                )),
-                # TODO resources_field_ref, field_ref
-                secret=dict(type='dict', no_log=False, options=dict(
-                    key=dict(type='str', required=True, no_log=False),
-                    name=dict(type='str'),
-                    optional=dict(type='bool')
-                ))
-            )),
-            env_from=dict(type='list', elements='dict', options=dict(
-                config_map=dict(type='dict', options=dict(
-                    name=dict(type='str', required=True),
-                    optional=dict(type='bool')
-                )),
-                prefix=dict(type='str'),
-                secret=dict(type='dict', no_log=False, options=dict(
-                    name=dict(type='str', required=True),
-                    optional=dict(type='bool')
-                ))
-            )),
-            volume_mounts=dict(type='list', elements='dict', options=dict(
-                path=dict(type='str', required=True),
-                name=dict(type='str', required=True),
-                propagation=dict(type='str', choices=['None', 'HostToContainer', 'Bidirectional'], default='None'),
-                read_only=dict(type='bool', default=False),
-                sub_path=dict(type='str'),
-                sub_path_expr=dict(type='str')
-            )),
-            volume_devices=dict(type='list', elements='dict', options=dict(
-                path=dict(type='str', required=True),
-                name=dict(type='str', required=True)
-            )),
-            resource_limits=dict(type='dict', options=dict(
-                cpu=dict(type='str'),
-                memory=dict(type='str')
-                # TODO could also add hugepages
-            )),
-            resource_requests=dict(type='dict', options=dict(
-                cpu=dict(type='str'),
-                memory=dict(type='str')
-                # TODO could also add hugepages
-            ))
-            # TODO add lifecycle, livenessProbe, readinessProbe, startupProbe, securityContext, stdin, stdinOnce,
-            #      terminationMessagePath, terminationMessagePolicy, tty
-        )),
-        image_pull_secrets=dict(type='list', elements='str', no_log=False),
-        enable_service_links=dict(type='bool', default=True),
-        volumes=dict(type='list', elements='dict', options=dict(
-            name=dict(type='str', required=True),
-            pvc=dict(type='dict', options=dict(
-                claim_name=dict(type='str', required=True),
-                read_only=dict(type='bool', default=False)
-            )),
-            config_map=dict(type='dict', options=dict(
-                name=dict(type='str'),
-                optional=dict(type='bool'),
-                default_mode=dict(type='int', default=0o644),
-                items=dict(type='list', elements='dict', options=dict(
-                    key=dict(type='str', required=True, no_log=False),
-                    path=dict(type='str', required=True),
-                    mode=dict(type='int')
-                ))
-            )),
-            secret=dict(type='dict', no_log=False, options=dict(
-                name=dict(type='str'),
-                optional=dict(type='bool'),
-                default_mode=dict(type='int', default=0o644),
-                items=dict(type='list', elements='dict', options=dict(
-                    key=dict(type='str', required=True, no_log=False),
-                    path=dict(type='str', required=True),
-                    mode=dict(type='int')
-                ))
-            ))
-        )),
-        # TODO lifecycle, scheduling
-        replicas=dict(type='int', default=1),
-        min_ready_seconds=dict(type='int', default=0),
-        strategy=dict(type='dict', options=dict(
-            type=dict(type='str', choices=['Recreate', 'RollingUpdate'], default='RollingUpdate'),
-            max_surge=dict(type='str'),
-            max_unavailable=dict(type='str')
-        )),
-        revision_history_limit=dict(type='int', default=10),
-        progress_deadline_seconds=dict(type='int', default=600),
-        paused=dict(type='bool', default=False),
-    ))
-    required_if = [
-        ('state', 'present', ('labels',))
-    ]
-
-    module = AnsibleModule(argument_spec=argspec,
-                           required_if=required_if,
-                           mutually_exclusive=UPDATE_MUTUALLY_EXCLUSIVE,
-                           supports_check_mode=True)
-    from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
-
-    k8s_def = definition(module.params)
-    if module.params.get('state') != 'absent':
-        validate(module, k8s_def)
-
-    execute_module(module, k8s_def)
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                               required_if=REQUIRED_IF,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
+    from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import (
+        execute_module, resumes_only, writes_partially)
+
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
+    if module.params.get('state') != 'absent' and module.params.get('update_images'):
+        # only images are sent, rest of the definition is neither validated nor written
+        with timings.phase('validate'):
+            validate_images(module, module.params)
+    elif module.params.get('state') != 'absent' and module.params.get('scale_only'):
+        # only replicas are sent through the scale subresource
+        with timings.phase('validate'):
+            validate_scale(module, module.params)
+    elif module.params.get('state') != 'absent' and not resumes_only(module.params):
+        # without containers, rollout_batch=commit only resumes the deployment, nothing to validate
+        with timings.phase('validate'):
+            validate(module, k8s_def)
+        with timings.phase('definition'):
+            canonicalize(k8s_def)
+
+    verified = None
+    if module.params.get('verify_references') and module.params.get('state') != 'absent' and \
+            not writes_partially(module.params):
+        verified = references(k8s_def)
+
+    execute_module(module, k8s_def, timings, references=verified)
 
 
 if __name__ == '__main__':
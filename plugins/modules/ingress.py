@@ -20,6 +20,7 @@ description: Creates k8s Ingress, which is s a collection of rules that allow in
 extends_documentation_fragment:
     - sodalite.k8s.common_update_options
     - sodalite.k8s.metadata_options
+    - sodalite.k8s.timings_options
     - kubernetes.core.k8s_auth_options
     - kubernetes.core.k8s_wait_options
     - kubernetes.core.k8s_delete_options
@@ -230,173 +231,60 @@ result:
        returned: success
        type: dict
      duration:
-       description: elapsed time of task in seconds
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
        returned: when C(wait) is true
-       type: int
-       sample: 48
+       type: float
+       sample: 4.217
      error:
        description: error while trying to create/delete the object.
        returned: error
        type: dict
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
 '''
 
 from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
-from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
-                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
-from ansible_collections.sodalite.k8s.plugins.module_utils.common import Validators, CommonValidation, Marshalling
-from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
-
-
-def definition(params):
-
-    def get_port(port, _type):
-        """
-        makes sure port gets assigned to 'name' or 'number', depending on IntOrString unmarshalling
-        """
-        unmarshalled_port = Marshalling.unmarshall_int_or_string(port)
-        if isinstance(unmarshalled_port, _type):
-            return unmarshalled_port
-        return None
-
-    def ingress_backend(backend_service):
-        if backend_service is None:
-            return None
-        return {
-            "service": {
-                "name": backend_service.get('name'),
-                "port": {
-                    # function get_port(port, _type) will make sure only one of (name, number) != None
-                    # (required by mutually exclusive condition)
-                    'name': get_port(backend_service.get('port'), str),
-                    'number': get_port(backend_service.get('port'), int),
-                }
-            }
-        }
-
-    body = {
-        "apiVersion": "networking.k8s.io/v1",
-        "kind": "Ingress",
-        "metadata": {
-            "name": params.get('name'),
-            "labels": params.get('labels'),
-            "annotations": params.get('annotations')
-        },
-        "spec": {
-            "defaultBackend": ingress_backend(params.get('default_backend_service')),
-            "ingressClassName": params.get('ingress_class_name'),
-            "rules": [
-                {
-                    'host': rule.get('host'),
-                    'http': {
-                        'paths': [
-                            {
-                                'backend': ingress_backend(path.get('backend_service')),
-                                'path': path.get('path'),
-                                'pathType': path.get('path_type')
-                            }
-                            for path in rule.get('paths') or list()
-                        ]
-                    }
-                }
-                for rule in params.get('rules') or list()
-            ],
-            'tls': [
-                {
-                    'hosts': tls_config.get('hosts'),
-                    'secretName': tls_config.get('secret')
-                }
-                for tls_config in params.get('tls') or list()
-            ]
-        }
-    }
-
-    return clean_dict(body)
-
-
-def validate(module, k8s_definition):
-    CommonValidation.metadata(module, k8s_definition)
-
-    if not Validators.dns_subdomain(k8s_definition['metadata']['name']):
-        module.fail_json(msg=f"'name' {Validators.dns_subdomain_msg}")
-
-    spec = k8s_definition.get('spec', dict())
-    if not (spec.get('defaultBackend') or spec.get('rules')):
-        module.fail_json(msg="At least one of (default_backend_service, rules) must be present. If present, 'rules'"
-                             "must contain at least one element")
-
-    default_backend_service = spec.get('defaultBackend', dict()).get('service', dict())
-    if not Validators.dns_label_1035(default_backend_service.get('name')):
-        module.fail_json(msg=f"default_backend_service.name {Validators.dns_label_1035_msg}")
-    if not Validators.port(default_backend_service.get('port', dict()).get('number')):
-        module.fail_json(msg=f"default_backend_service.port can be a port name or number. If it is a port number, "
-                             f"it {Validators.port_msg}")
-    if not Validators.iana_svc_name(default_backend_service.get('port', dict()).get('name')):
-        module.fail_json(msg=f"default_backend_service.port can be a port name or number. If it is a port name, "
-                             f"it {Validators.iana_svc_name_msg}")
-
-    for i, rule in enumerate(spec.get('rules', list())):
-        if not Validators.dns_subdomain_wildcard(rule.get('host')):
-            module.fail_json(msg=f'rules[{i}].host {Validators.dns_subdomain_wildcard_msg}')
-
-        paths = rule.get('http', dict()).get('paths')
-        if not paths:
-            module.fail_json(msg=f'rules[{i}].paths must contain at least one parameter')
-
-        for j, path in enumerate(paths):
-            backend_service = path.get('backend').get('service')
-            if not Validators.dns_label_1035(backend_service.get('name')):
-                module.fail_json(msg=f"rules[{i}].paths[{j}].backend_service.name {Validators.dns_label_1035_msg}")
-            if not Validators.port(backend_service.get('port').get('number')):
-                module.fail_json(
-                    msg=f"rules[{i}].paths[{j}].backend_service.port can be a port name or number. If it is a port "
-                        f"number, it {Validators.port_msg}")
-            if not Validators.iana_svc_name(backend_service.get('port').get('name')):
-                module.fail_json(
-                    msg=f"rules[{i}].paths[{j}].backend_service.port can be a port name or number. If it is a port "
-                        f"name, it {Validators.iana_svc_name_msg}")
-            if not Validators.url_path(path.get('path')):
-                module.fail_json(msg=f"rules[{i}].paths[{j}].path {Validators.url_path_msg}")
-
-    for i, tls_conf in enumerate(spec.get('tls', list())):
-        if not Validators.dns_subdomain(tls_conf.get('secretName')):
-            module.fail_json(msg=f"tls[{i}].secret {Validators.dns_subdomain_msg}")
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.ingress import (argument_spec, definition,
+                                                                                     validate, MUTUALLY_EXCLUSIVE)
 
 
 def main():
-    argspec = update_arg_spec()
-    argspec.update(dict(
-        ingress_class_name=dict(type='str'),
-        default_backend_service=dict(type='dict', options=dict(
-            name=dict(type='str', required=True),
-            port=dict(type='str', required=True),
-        )),
-        rules=dict(type='list', elements='dict', options=dict(
-            host=dict(type='str'),
-            paths=dict(type='list', required=True, elements='dict', options=dict(
-                backend_service=dict(type='dict', required=True, options=dict(
-                    name=dict(type='str', required=True),
-                    port=dict(type='str', required=True),
-                )),
-                path=dict(type='str', default='/'),
-                path_type=dict(type='str', default='Prefix', choices=['Exact', 'Prefix']),
-            ))
-        )),
-        tls=dict(type='list', elements='dict', options=dict(
-            hosts=dict(type='list', elements='str'),
-            secret=dict(type='str', no_log=False)
-        ))
-    ))
-
-    module = AnsibleModule(argument_spec=argspec,
-                           mutually_exclusive=UPDATE_MUTUALLY_EXCLUSIVE,
-                           supports_check_mode=True)
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
     from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
 
-    k8s_def = definition(module.params)
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
     if module.params.get('state') != 'absent':
-        validate(module, k8s_def)
+        with timings.phase('validate'):
+            validate(module, k8s_def)
 
-    execute_module(module, k8s_def)
+    execute_module(module, k8s_def, timings)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,252 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2021, Mihael Trajbarič <mihael.trajbaric@xlab.si>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: job
+
+short_description: Creates k8s Job
+
+version_added: "1.1.0"
+
+description: Creates k8s Job, runs pods until a number of them completed successfully, e.g. batch and data-parallel
+             workloads.
+
+extends_documentation_fragment:
+    - sodalite.k8s.common_update_options
+    - sodalite.k8s.metadata_options
+    - sodalite.k8s.pod_template_options
+    - sodalite.k8s.timings_options
+    - kubernetes.core.k8s_auth_options
+    - kubernetes.core.k8s_wait_options
+    - kubernetes.core.k8s_delete_options
+
+options:
+    restart_policy:
+        description:
+        - Restart policy of the containers of the pods.
+        - C(Never) replaces failed pods, C(OnFailure) restarts failed containers in the same pod.
+        type: str
+        choices: [ OnFailure, Never ]
+        default: Never
+    parallelism:
+        description:
+        - The maximum number of pods, that run at any time.
+        - Defaults to 1 on the API server.
+        - Can be updated, C(0) stops the job until it is increased again.
+        type: int
+    completions:
+        description:
+        - The number of pods, that must complete successfully, for the job to complete.
+        - When neither I(completions) nor I(parallelism) is set, both default to 1. When only I(completions) is not set,
+          the job completes once any pod completed successfully (work queue).
+        - Required with I(completion_mode=Indexed).
+        type: int
+    completion_mode:
+        description:
+        - C(NonIndexed) completes the job after I(completions) successful pods, that are all alike.
+        - C(Indexed) gives every pod a completion index from C(0) to I(completions)-1 (annotation
+          C(batch.kubernetes.io/job-completion-index) and env variable C(JOB_COMPLETION_INDEX)) and completes the job,
+          when there is one successful pod per index. Pods may pick their slice of data by it.
+        - Defaults to C(NonIndexed) on the API server. Cannot be updated.
+        type: str
+        choices: [ NonIndexed, Indexed ]
+    backoff_limit:
+        description:
+        - The number of retries, before the job is marked as failed.
+        - Defaults to 6 on the API server.
+        type: int
+    active_deadline_seconds:
+        description:
+        - Duration in seconds relative to the start time, that the job may be active, before it is terminated and
+          marked as failed.
+        type: int
+    ttl_seconds_after_finished:
+        description:
+        - Seconds after the job finished (completed or failed), after which it is deleted automatically.
+        type: int
+    suspend:
+        description:
+        - Suspends the job. Running pods are terminated and no pods are created, until it is resumed.
+        type: bool
+    verify_references:
+        description:
+        - Fails before the job is written, when a ConfigMap, Secret or PersistentVolumeClaim, that is referenced
+          in I(containers[].env), I(containers[].env_from) or I(volumes), does not exist in the namespace.
+        - Objects of each kind are listed once (metadata only), not read one by one. References with I(optional=yes)
+          are not verified.
+        - Ignored when I(state=absent) and by M(sodalite.k8s.bulk).
+        type: bool
+        default: false
+
+notes:
+- Containers, volumes and the rest of the pod template are built and validated like in M(sodalite.k8s.deployment).
+- The pod template of a job can not be updated. Write the job with a different name or delete it first, to change it.
+- With I(wait=yes), the task waits until the job completes. It fails as soon as the job failed (e.g. reached
+  I(backoff_limit)) or a container of its pods is stuck in C(ErrImagePull), C(ImagePullBackOff),
+  C(InvalidImageName), C(CrashLoopBackOff), C(CreateContainerConfigError) or C(CreateContainerError). Returned
+  C(reason) and C(pod) name the failure. A suspended job is waited for until I(wait_timeout).
+
+seealso:
+- name: K8s Job documentation
+  description: Documentation about Job concept on kubernetes website
+  link: https://kubernetes.io/docs/concepts/workloads/controllers/job/
+- name: K8s Job API reference
+  description: API reference for K8s Job resource on kubernetes website
+  link: https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/job-v1/
+
+author:
+    - Mihael Trajbarič (@mihaTrajbaric)
+'''
+
+EXAMPLES = r'''
+# Run a single pod to completion
+- name: Minimal example
+  sodalite.k8s.job:
+    name: pi
+    state: present
+    containers:
+      - name: pi
+        image: perl:5.34
+        command: ["perl", "-Mbignum=bpi", "-wle", "print bpi(2000)"]
+    backoff_limit: 4
+    wait: yes
+
+# Process 100 shards, 10 at a time, every pod reads its shard from JOB_COMPLETION_INDEX
+- name: Indexed job
+  sodalite.k8s.job:
+    name: process-shards
+    state: present
+    labels:
+      app: process-shards
+    containers:
+      - name: worker
+        image: registry.example.com/shard-worker:1.0
+        args: ["--shard", "$(JOB_COMPLETION_INDEX)"]
+    completion_mode: Indexed
+    completions: 100
+    parallelism: 10
+    restart_policy: OnFailure
+    ttl_seconds_after_finished: 3600
+    wait: yes
+    wait_timeout: 3600
+
+# Remove Job
+- name: Remove job
+  sodalite.k8s.job:
+    name: pi
+    state: absent
+'''
+
+RETURN = r'''
+result:
+  description:
+  - The created, patched, or otherwise present object. Will be empty in the case of a deletion.
+  returned: success
+  type: complex
+  contains:
+     api_version:
+       description: The versioned schema of this representation of an object.
+       returned: success
+       type: str
+     kind:
+       description: Represents the REST resource this object represents.
+       returned: success
+       type: str
+     metadata:
+       description: Standard object metadata. Includes name, namespace, annotations, labels, etc.
+       returned: success
+       type: dict
+     spec:
+       description: Specific attributes of the object.
+       returned: success
+       type: dict
+     status:
+       description: Current status details for the object.
+       returned: success
+       type: dict
+     duration:
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
+       returned: when C(wait) is true
+       type: float
+       sample: 4.217
+     error:
+       description: error while trying to create/delete the object.
+       returned: error
+       type: dict
+reason:
+  description:
+  - Reason, why the job can not complete. Reason of its C(Failed) condition (e.g. C(BackoffLimitExceeded),
+    C(DeadlineExceeded)), or waiting reason of a container of its pods (C(ErrImagePull), C(ImagePullBackOff),
+    C(InvalidImageName), C(CrashLoopBackOff), C(CreateContainerConfigError), C(CreateContainerError)).
+  returned: when C(wait) is true and the job failed
+  type: str
+  sample: BackoffLimitExceeded
+pod:
+  description:
+  - Name of the pod, that failed the job.
+  returned: when C(wait) is true and a pod of the job is stuck
+  type: str
+  sample: process-shards-3-x2m9q
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
+'''
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.job import (argument_spec, canonicalize,
+                                                                                 definition, references, validate,
+                                                                                 MUTUALLY_EXCLUSIVE)
+
+
+def main():
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
+    from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
+
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
+    if module.params.get('state') != 'absent':
+        with timings.phase('validate'):
+            validate(module, k8s_def)
+        with timings.phase('definition'):
+            canonicalize(k8s_def)
+
+    verified = None
+    if module.params.get('verify_references') and module.params.get('state') != 'absent':
+        verified = references(k8s_def)
+
+    execute_module(module, k8s_def, timings, references=verified)
+
+
+if __name__ == '__main__':
+    main()
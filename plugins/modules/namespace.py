@@ -22,6 +22,7 @@ description: Creates k8s Namespace, which are virtual clusters backed by the sam
 extends_documentation_fragment:
     - sodalite.k8s.common_update_options
     - sodalite.k8s.metadata_options
+    - sodalite.k8s.timings_options
     - kubernetes.core.k8s_auth_options
     - kubernetes.core.k8s_wait_options
     - kubernetes.core.k8s_delete_options
@@ -86,56 +87,63 @@ result:
        returned: success
        type: dict
      duration:
-       description: elapsed time of task in seconds
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
        returned: when C(wait) is true
-       type: int
-       sample: 48
+       type: float
+       sample: 4.217
      error:
        description: error while trying to create/delete the object.
        returned: error
        type: dict
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
 '''
 
 from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
-from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
-                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
-from ansible_collections.sodalite.k8s.plugins.module_utils.common import Validators, CommonValidation
-from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
-
-
-def definition(params):
-
-    body = {
-        "apiVersion": "v1",
-        "kind": "Namespace",
-        "metadata": {
-            "name": params.get('name'),
-            "labels": params.get('labels'),
-            "annotations": params.get('annotations')
-        }
-    }
-
-    return clean_dict(body)
-
-
-def validate(module, k8s_definition):
-
-    CommonValidation.metadata(module, k8s_definition)
-
-    if not Validators.dns_subdomain(k8s_definition['metadata']['name']):
-        module.fail_json(msg=f"'name' {Validators.dns_subdomain_msg}")
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.namespace import (argument_spec, canonicalize,
+                                                                                       definition, validate,
+                                                                                       MUTUALLY_EXCLUSIVE)
 
 
 def main():
-    argspec = update_arg_spec()
-
-    module = AnsibleModule(argument_spec=argspec, mutually_exclusive=UPDATE_MUTUALLY_EXCLUSIVE, supports_check_mode=True)
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
     from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
 
-    k8s_def = definition(module.params)
-    validate(module, k8s_def)
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
+    with timings.phase('validate'):
+        validate(module, k8s_def)
+    if module.params.get('state') != 'absent':
+        with timings.phase('definition'):
+            canonicalize(k8s_def)
 
-    execute_module(module, k8s_def)
+    execute_module(module, k8s_def, timings)
 
 
 if __name__ == '__main__':
@@ -19,6 +19,7 @@ description: Creates k8s PersistentVolumeClaim, which is a user's request for an
 extends_documentation_fragment:
     - sodalite.k8s.common_options
     - sodalite.k8s.metadata_options
+    - sodalite.k8s.timings_options
     - kubernetes.core.k8s_auth_options
     - kubernetes.core.k8s_wait_options
     - kubernetes.core.k8s_delete_options
@@ -81,6 +82,7 @@ options:
         description:
         - Describes the minimum amount of compute resources required.
         - Required when I(state=present)
+        - Quantity is stored in canonical form, like the API server does (e.g. C(1024Mi) as C(1Gi)).
         type: str
     storage_limit:
         description:
@@ -207,107 +209,60 @@ result:
        returned: success
        type: dict
      duration:
-       description: elapsed time of task in seconds
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
        returned: when C(wait) is true
-       type: int
-       sample: 48
+       type: float
+       sample: 4.217
      error:
        description: error while trying to create/delete the object.
        returned: error
        type: dict
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
 '''
 
 from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
-from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import common_arg_spec
-from ansible_collections.sodalite.k8s.plugins.module_utils.common import Validators, CommonValidation
-from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
-
-
-def definition(params):
-
-    body = {
-        "apiVersion": "v1",
-        "kind": "PersistentVolumeClaim",
-        "metadata": {
-            "name": params.get('name'),
-            "labels": params.get('labels'),
-            "annotations": params.get('annotations')
-        },
-        'spec': {
-            'accessModes': params.get('access_modes'),
-            'selector': {
-                'matchExpressions': (params.get('selector') or {}).get('match_expressions'),
-                'matchLabels': (params.get('selector') or {}).get('match_labels')
-            },
-            'resources': {
-                'requests': {
-                    'storage': params.get('storage_request')
-                },
-                'limits': {
-                    'storage': params.get('storage_limit')
-                }
-            },
-            'volumeName': params.get('volume_name'),
-            'storageClassName': params.get('storage_class_name'),
-            'volumeMode': params.get('volume_mode')
-        }
-    }
-    return clean_dict(body)
-
-
-def validate(module, k8s_definition):
-    CommonValidation.metadata(module, k8s_definition)
-    CommonValidation.selector(module, k8s_definition)
-
-    if not Validators.dns_subdomain(k8s_definition['metadata']['name']):
-        module.fail_json(msg=f"'name' {Validators.dns_subdomain_msg}")
-
-    access_modes = k8s_definition['spec'].get('accessModes', list())
-    if not access_modes:
-        module.fail_json(msg="Access_modes should have at least 1 element")
-
-    if 'resources' in k8s_definition['spec'].keys():
-        limits = k8s_definition['spec']['resources'].get('limits', dict())
-        if not Validators.string_quantity_dict(limits):
-            module.fail_json(msg="Storage_limit should be map[string]Quantity")
-
-        requests = k8s_definition['spec']['resources'].get('requests', dict())
-        if not Validators.string_quantity_dict(requests):
-            module.fail_json(msg="Storage_request should be map[string]Quantity")
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.pvc import (argument_spec, definition, validate,
+                                                                                 REQUIRED_IF)
 
 
 def main():
-    argspec = common_arg_spec()
-    argspec.update(dict(
-        access_modes=dict(type='list', elements='str', choices=['ReadWriteOnce', 'ReadOnlyMany', 'ReadWriteMany']),
-        selector=dict(type='dict', options=dict(
-            match_labels=dict(type='dict'),
-            match_expressions=dict(type='list', elements='dict', options=dict(
-                key=dict(type='str', required=True, no_log=False),
-                operator=dict(type='str', required=True, choices=['In', 'NotIn', 'Exists', 'DoesNotExist']),
-                values=dict(type='list', elements='str')
-            ))
-        )),
-        storage_request=dict(type='str'),
-        storage_limit=dict(type='str'),
-        volume_name=dict(type='str'),
-        storage_class_name=dict(type='str'),
-        volume_mode=dict(type='str', choices=['Filesystem', 'Block'], default='Filesystem')
-    ))
-    required_if = [
-        ('state', 'present', ('access_modes', 'storage_request'))
-    ]
-
-    module = AnsibleModule(argument_spec=argspec,
-                           required_if=required_if,
-                           supports_check_mode=True)
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               required_if=REQUIRED_IF,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
     from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
 
-    k8s_def = definition(module.params)
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
     if module.params.get('state') != 'absent':
-        validate(module, k8s_def)
+        with timings.phase('validate'):
+            validate(module, k8s_def)
 
-    execute_module(module, k8s_def)
+    execute_module(module, k8s_def, timings)
 
 
 if __name__ == '__main__':
@@ -21,6 +21,7 @@ description: Creates k8s Service which is a named abstraction of software servic
 extends_documentation_fragment:
     - sodalite.k8s.common_update_options
     - sodalite.k8s.metadata_options
+    - sodalite.k8s.timings_options
     - kubernetes.core.k8s_auth_options
     - kubernetes.core.k8s_wait_options
     - kubernetes.core.k8s_delete_options
@@ -177,6 +178,17 @@ options:
         - This field will be ignored if the cloud-provider does not support the feature.
         type: list
         elements: str
+    collapse_ranges:
+        description:
+        - Removes redundant entries, before the service is sent.
+        - Duplicate addresses are removed from I(external_ips), order of the rest is kept.
+        - I(load_balancer_source_ranges) are replaced with the smallest sorted list of CIDR blocks, that covers the same
+          addresses. Duplicate ranges and ranges contained in another one are removed, adjacent ranges are merged.
+        - Number of removed entries is returned in C(removed_entries).
+        - Without it, redundant entries are reported as a warning.
+        type: bool
+        default: False
+        version_added: 1.1.0
     load_balancer_class:
         description:
         - Can be used only with I(type=LoadBalancer).
@@ -334,6 +346,20 @@ EXAMPLES = r'''
       - 77.103.0.0/16
     load_balancer_class: internal-vip
 
+- name: Load balancer with a generated allow-list, without redundant ranges
+  sodalite.k8s.service:
+    name: service-allow-list
+    state: present
+    type: LoadBalancer
+    labels:
+      app: nginx
+    selector:
+      app: nginx
+    ports:
+    - port: 443
+    load_balancer_source_ranges: "{{ allowed_ranges }}"
+    collapse_ranges: yes
+
 - name: External name
   sodalite.k8s.service:
     name: service-external-name
@@ -409,272 +435,76 @@ result:
        returned: success
        type: dict
      duration:
-       description: elapsed time of task in seconds
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
        returned: when C(wait) is true
-       type: int
-       sample: 48
+       type: float
+       sample: 4.217
      error:
        description: error while trying to create/delete the object.
        returned: error
        type: dict
+removed_entries:
+  description:
+  - Number of entries, that were removed from I(external_ips) and I(load_balancer_source_ranges) by I(collapse_ranges).
+  returned: when I(collapse_ranges=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"external_ips": 0, "load_balancer_source_ranges": 1412}
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
 '''
 
 from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
-from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import (update_arg_spec,
-                                                                               UPDATE_MUTUALLY_EXCLUSIVE)
-from ansible_collections.sodalite.k8s.plugins.module_utils.common import Validators, CommonValidation, Marshalling
-from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
-
-from copy import deepcopy
-
-
-def definition(params):
-
-    body = {
-        "apiVersion": "v1",
-        "kind": "Service",
-        "metadata": {
-            "name": params.get('name'),
-            "labels": params.get('labels'),
-            "annotations": params.get('annotations')
-        },
-        'spec': {
-            'selector': params.get('selector'),
-            'ports': [
-                {
-                    'port': port_obj.get('port'),
-                    'targetPort': Marshalling.unmarshall_int_or_string(port_obj.get('target_port')),
-                    'protocol': port_obj.get('protocol'),
-                    'name': port_obj.get('name'),
-                    'nodePort': port_obj.get('node_port'),
-                }
-                for port_obj in params.get('ports') or list()
-            ],
-            'type': params.get('type'),
-            'ipFamilies': params.get('ip_families'),
-            'ipFamilyPolicy': params.get('ip_families_policy'),
-            'clusterIP': params.get('cluster_ip')
-            or (params.get('cluster_ips')[0] if params.get('cluster_ips') else None),  # adds clusterIP[0] to clusterIP
-            'clusterIPs': params.get('cluster_ips'),
-            'externalIPs': params.get('external_ips'),
-            'loadBalancerIP': params.get('load_balancer_ip'),
-            'loadBalancerSourceRanges': params.get('load_balancer_source_ranges'),
-            'loadBalancerClass': params.get('load_balancer_class'),
-            'externalName': params.get('external_name'),
-            'externalTrafficPolicy': params.get('external_traffic_policy'),
-            'internalTrafficPolicy': params.get('internal_traffic_policy'),
-            'healthCheckNodePort': params.get('health_check_node_port'),
-            'publishNotReadyAddresses': params.get('publish_not_ready_addresses'),
-            'sessionAffinity': params.get('session_affinity'),
-            'sessionAffinityConfig': {
-                'clientIP': {
-                    'timeoutSeconds': params.get('session_affinity_timeout')
-                }
-            }
-        }
-    }
-    return clean_dict(body)
-
-
-def validate(module, k8s_definition):
-    CommonValidation.metadata(module, k8s_definition)
-    # for some reason, name should be a RFC 1035 Label Names
-    if not Validators.dns_label_1035(k8s_definition['metadata']['name']):
-        module.fail_json(msg=f"name {Validators.dns_label_1035_msg}")
-
-    service_type = k8s_definition.get('spec').get('type')
-
-    selector = k8s_definition.get('spec').get('selector')
-
-    if selector:
-        if service_type == 'ExternalName':
-            module.fail_json(msg="selector is not allowed with type='ExternalName'")
-        if not Validators.string_string_dict(selector):
-            module.fail_json(msg="selector should be map[string]string")
-
-    # validate spec
-    spec = k8s_definition['spec']
-
-    # validate unique port names
-    port_names = list()
-
-    ports = spec.get('ports') or list()
-
-    if len(ports) < 1:
-        module.fail_json(msg="ports must have at least one element")
-
-    for i, port_obj in enumerate(ports):
-
-        if not Validators.port(port_obj.get('port')):
-            module.fail_json(msg=f"ports[{i}].port {Validators.port_msg}")
-
-        target_port = port_obj.get('targetPort')
-        if isinstance(target_port, int) and not Validators.port(target_port):
-            module.fail_json(msg=f"ports[{i}].target_port is a number and {Validators.port_msg}")
-        if isinstance(target_port, str) and not Validators.iana_svc_name(target_port):
-            module.fail_json(msg=f"ports[{i}].target_port is a name and {Validators.iana_svc_name_msg}")
-
-        port_name = port_obj.get('name')
-        if port_name in port_names:
-            module.fail_json(msg=f"Duplicate port name found (ports[{i}].name). "
-                                 f"Each named port in a service must have a unique name")
-        if port_name:
-            port_names.append(port_name)
-        if not Validators.dns_label(port_name):
-            module.fail_json(msg=f"ports[{i}].name {Validators.dns_label_msg}")
-        if len(ports) > 1 and port_name is None:
-            module.fail_json(msg=f"ports[{i}].name is not set, but should be, since service has more then one port")
-
-        if not Validators.port(port_obj.get('nodePort')):
-            module.fail_json(msg=f"ports[{i}].node_port {Validators.port_msg}")
-
-    ip_families = spec.get('ipFamilies') or list()
-    ip_families_policy = spec.get('ipFamilyPolicy')
-
-    if service_type == 'ExternalName' and (ip_families or ip_families_policy):
-        module.fail_json(msg="ip_families and ip_families_policy are not allowed with type='ExternalName'")
-
-    if ip_families:
-        if len(ip_families) > 2:
-            module.fail_json(msg='ip_families field may hold a maximum of two entries '
-                                 '(dual-stack families, in either order)')
-        if len(ip_families) == 2 and ip_families[0] == ip_families[1]:
-            module.fail_json(msg='The same IP Family cannot be specified more than once')
-
-        if len(ip_families) == 2 and ip_families_policy == 'SingleStack':
-            module.fail_json(msg="ip_families_policy must be set to 'RequireDualStack' or 'PreferDualStack'"
-                                 " when multiple ip_families are specified")
-
-    # first verify cluster_ips; if cluster_ip had not been defined, it could be just copied from cluster_ips[0].
-    # Validating cluster_ips first will make user get the right error message (with reference to cluster_ips[0],
-    # not cluster_ip)
-
-    cluster_ip = spec.get('clusterIP')
-    cluster_ips = spec.get('clusterIPs') or []
-    if service_type == 'ExternalName' and (cluster_ip or cluster_ips):
-        module.fail_json(msg="cluster_ip and cluster_ips are not allowed with type='ExternalName'")
-
-    if cluster_ips:
-        if len(cluster_ips) > 2:
-            module.fail_json(msg='cluster_ips field may hold a maximum of two entries '
-                                 '(dual-stack IPs, in either order. First IP will also be copied to ClusterIP field)')
-        if len(cluster_ips) == 2:
-            if ip_families_policy == 'SingleStack':
-                module.fail_json(msg="ip_families_policy must be set to 'RequireDualStack' or 'PreferDualStack'"
-                                     " when multiple cluster_ips are specified")
-
-            # check if one is IPv4 and other IPv6
-            if Validators.ipv4_address(cluster_ips[0]) and Validators.ipv4_address(cluster_ips[1]) or \
-                    Validators.ipv6_address(cluster_ips[0]) and Validators.ipv6_address(cluster_ips[1]):
-                module.fail_json(msg="One IP in cluster_ips must be IPv4 and other IPv6")
-
-    ip_validation = \
-        Validators.ip_address if len(ip_families) != 1 else \
-        Validators.ipv4_address if ip_families[0] == 'IPv4' else \
-        Validators.ipv6_address
-
-    ip_validation_msg = \
-        Validators.ip_address_msg if len(ip_families) != 1 else \
-        Validators.ipv4_address_msg if ip_families[0] == 'IPv4' else \
-        Validators.ipv6_address_msg
-
-    for i, cluster_ip_item in enumerate(cluster_ips):
-
-        if not (cluster_ip_item in (None, "None", "") or ip_validation(cluster_ip_item)):
-            module.fail_json(msg=f'cluster_ips[{i}] {ip_validation_msg}, None or "" when "ip_families" is'
-                                 f' {ip_families or "not specified"}')
-
-    if not (cluster_ip in (None, "None", "") or ip_validation(cluster_ip)):
-        module.fail_json(msg=f'cluster_ip {ip_validation_msg}, None or "" when "ip_families" is'
-                             f' {ip_families or "not specified"}')
-
-    for i, external_ip in enumerate(spec.get('externalIPs') or []):
-        if not Validators.ip_address(external_ip):
-            module.fail_json(msg=f'external_ips[{i}] {Validators.ip_address_msg}')
-
-    if service_type != 'LoadBalancer' and (spec.get('loadBalancerIP') or
-                                           spec.get('loadBalancerSourceRanges') or
-                                           spec.get('loadBalancerClass')):
-        module.fail_json(msg="load_balancer_ip, load_balancer_source_ranges and load_balancer_class "
-                             "are only valid with type='LoadBalancer'")
-
-    if not Validators.ip_address(spec.get('loadBalancerIP')):
-        module.fail_json(msg=f'load_balancer_ip {Validators.ip_address_msg}')
-    for i, ip_range in enumerate(spec.get('loadBalancerSourceRanges') or list()):
-        if not Validators.ip_range(ip_range):
-            module.fail_json(msg=f'load_balancer_source_ranges[{i}] {Validators.ip_range_msg}')
-
-    external_name = spec.get('externalName')
-    if external_name:
-        if service_type != 'ExternalName':
-            module.fail_json(msg="external_name is only valid with type='ExternalName'")
-        if not Validators.dns_subdomain(external_name):
-            module.fail_json(msg=f'external_name {Validators.dns_subdomain_msg}')
-
-    health_check_node_port = spec.get('healthCheckNodePort')
-    external_traffic_policy = spec.get('externalTrafficPolicy')
-    if health_check_node_port:
-        if not (service_type == 'LoadBalancer' and external_traffic_policy == 'Local'):
-            module.fail_json(msg="health_check_node_port is only valid with type='LoadBalancer' "
-                                 "and external_traffic_policy='Local'")
-        if not Validators.port(health_check_node_port):
-            module.fail_json(msg=f'health_check_node_port {Validators.port_msg}')
-
-    session_affinity_timeout = spec.get('sessionAffinityConfig', dict()).get('clientIP', dict()).get('timeoutSeconds')
-
-    if session_affinity_timeout:
-        if spec.get('sessionAffinity') != 'ClientIP':
-            module.fail_json(msg="session_affinity_timeout can only be used with session_affinity='ClientIP'")
-        if not 0 < session_affinity_timeout <= 86400:
-            module.fail_json(msg='session_affinity_timeout must be 0 < x <= 86400')
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.service import (argument_spec, canonicalize,
+                                                                                     definition, removed_entries,
+                                                                                     validate, REQUIRED_IF,
+                                                                                     MUTUALLY_EXCLUSIVE)
 
 
 def main():
-    argspec = update_arg_spec()
-    argspec.update(dict(
-        selector=dict(type='dict'),
-        ports=dict(type='list', elements='dict', options=dict(
-            port=dict(type='int', required=True),
-            target_port=dict(type='str'),
-            protocol=dict(type='str', choices=['UDP', 'TCP', 'SCTP'], default='TCP'),
-            name=dict(type='str'),
-            node_port=dict(type='int')
-        )),
-        type=dict(type='str', default='ClusterIP', choices=['ExternalName', 'ClusterIP', 'NodePort', 'LoadBalancer']),
-        ip_families=dict(type='list', elements='str', choices=['IPv4', 'IPv6']),
-        ip_families_policy=dict(type='str', choices=['SingleStack', 'PreferDualStack', 'RequireDualStack'], ),
-        cluster_ip=dict(type='str'),
-        cluster_ips=dict(type='list', elements='str'),
-        external_ips=dict(type='list', elements='str'),
-        load_balancer_ip=dict(type='str'),
-        load_balancer_source_ranges=dict(type='list', elements='str'),
-        load_balancer_class=dict(type='str'),
-        external_name=dict(type='str'),
-        external_traffic_policy=dict(type='str', choices=['Local', 'Cluster']),
-        internal_traffic_policy=dict(type='str', choices=['Local', 'Cluster'], default='Cluster'),
-        health_check_node_port=dict(type='int'),
-        publish_not_ready_addresses=dict(type='bool', default=False),
-        session_affinity=dict(type='str', choices=['ClientIP', 'None'], default='None'),
-        session_affinity_timeout=dict(type='int')
-
-    ))
-    required_if = [
-        ('state', 'present', ('ports',))
-    ]
-    mutually_exclusive = deepcopy(UPDATE_MUTUALLY_EXCLUSIVE)
-    mutually_exclusive.append(('cluster_ip', 'cluster_ips'))
-
-    module = AnsibleModule(argument_spec=argspec,
-                           required_if=required_if,
-                           mutually_exclusive=mutually_exclusive,
-                           supports_check_mode=True)
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               required_if=REQUIRED_IF,
+                               mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
     from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
 
-    k8s_def = definition(module.params)
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
     if module.params.get('state') != 'absent':
-        validate(module, k8s_def)
+        with timings.phase('validate'):
+            validate(module, k8s_def)
+        with timings.phase('definition'):
+            canonicalize(k8s_def)
+
+    extra_result = None
+    if module.params.get('collapse_ranges') and module.params.get('state') != 'absent':
+        extra_result = dict(removed_entries=removed_entries(module.params, k8s_def))
 
-    execute_module(module, k8s_def)
+    execute_module(module, k8s_def, timings, extra_result)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,309 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2021, Mihael Trajbarič <mihael.trajbaric@xlab.si>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: statefulset
+
+short_description: Creates k8s StatefulSet
+
+version_added: "1.1.0"
+
+description: Creates k8s StatefulSet, manages pods with a sticky identity (stable names, network identity and storage),
+             that are created, scaled and updated in order.
+
+extends_documentation_fragment:
+    - sodalite.k8s.common_update_options
+    - sodalite.k8s.metadata_options
+    - sodalite.k8s.selector_options
+    - sodalite.k8s.pod_template_options
+    - sodalite.k8s.timings_options
+    - kubernetes.core.k8s_auth_options
+    - kubernetes.core.k8s_wait_options
+    - kubernetes.core.k8s_delete_options
+
+options:
+    service_name:
+        description:
+        - Name of the (headless) service, that governs this StatefulSet and gives its pods their network identity
+          C(<pod name>.<service name>).
+        - The service must exist before the StatefulSet and is not created by this module.
+        type: str
+    volume_claim_templates:
+        description:
+        - PersistentVolumeClaims, that the controller creates for every pod, named C(<name>-<pod name>).
+        - Every claim is mounted like a volume of the same name, so I(containers[].volume_mounts[].name) and
+          I(containers[].volume_devices[].name) may refer to it.
+        - Claims are kept, when pods or the StatefulSet are deleted.
+        - Cannot be updated.
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                - Name of the claim and of the volume, that mounts it.
+                type: str
+                required: true
+            labels:
+                description:
+                - Labels of the claims.
+                type: dict
+            annotations:
+                description:
+                - Annotations of the claims.
+                type: dict
+            access_modes:
+                description:
+                - Desired access modes the volume should have.
+                type: list
+                elements: str
+                choices: [ ReadWriteOnce, ReadOnlyMany, ReadWriteMany ]
+                required: true
+            storage_request:
+                description:
+                - Minimum amount of storage, e.g. C(10Gi).
+                type: str
+                required: true
+            storage_limit:
+                description:
+                - Maximum amount of storage.
+                type: str
+            storage_class_name:
+                description:
+                - Name of the StorageClass required by the claim.
+                type: str
+            volume_mode:
+                description:
+                - Defines what type of volume is required by the claim.
+                type: str
+                choices: [ Filesystem, Block ]
+                default: Filesystem
+    replicas:
+        description:
+        - Number of desired pods.
+        - When the existing statefulset contains the rest of the definition and only replicas differ, they are changed
+          through the C(scale) subresource.
+        - When omitted, the API server sets 1 on a new statefulset and an existing statefulset keeps its replicas.
+        type: int
+    min_ready_seconds:
+        description:
+        - Minimum number of seconds for which a newly created pod should be ready without any of its container crashing,
+          for it to be considered available.
+        type: int
+        default: 0
+    pod_management_policy:
+        description:
+        - C(OrderedReady) creates pods one by one in order and removes them in reverse order, each waiting for the
+          previous one to be ready.
+        - C(Parallel) creates and removes all pods at once.
+        - Cannot be updated.
+        type: str
+        choices: [ OrderedReady, Parallel ]
+        default: OrderedReady
+    update_strategy:
+        description:
+        - The strategy to use to replace existing pods with new ones.
+        type: dict
+        suboptions:
+            type:
+                description:
+                - C(RollingUpdate) replaces pods in reverse order.
+                - C(OnDelete) only replaces pods, when they are deleted.
+                type: str
+                default: RollingUpdate
+                choices: [ OnDelete, RollingUpdate ]
+            partition:
+                description:
+                - Present only if I(type=RollingUpdate).
+                - Only pods with an ordinal greater than or equal to I(partition) are updated, for staged rollouts.
+                type: int
+            max_unavailable:
+                description:
+                - Present only if I(type=RollingUpdate).
+                - The maximum number of pods that can be unavailable during the update.
+                - Value can be an absolute number (ex. C(5)) or a percentage of desired pods (ex. C(10%)).
+                - Requires the C(MaxUnavailableStatefulSet) feature gate of the cluster.
+                type: str
+    revision_history_limit:
+        description:
+        - The maximum number of revisions that will be maintained in the StatefulSet's revision history.
+        type: int
+        default: 10
+    verify_references:
+        description:
+        - Fails before the statefulset is written, when a ConfigMap, Secret or PersistentVolumeClaim, that is referenced
+          in I(containers[].env), I(containers[].env_from) or I(volumes), does not exist in the namespace.
+        - Objects of each kind are listed once (metadata only), not read one by one. References with I(optional=yes)
+          are not verified.
+        - Ignored when I(state=absent) and by M(sodalite.k8s.bulk).
+        type: bool
+        default: false
+
+notes:
+- Containers, volumes and the rest of the pod template are built and validated like in M(sodalite.k8s.deployment).
+- With I(wait=yes), the task waits until all replicas run the current revision and are ready.
+
+seealso:
+- name: K8s StatefulSet documentation
+  description: Documentation about StatefulSet concept on kubernetes website
+  link: https://kubernetes.io/docs/concepts/workloads/controllers/statefulset/
+- name: K8s StatefulSet API reference
+  description: API reference for K8s StatefulSet resource on kubernetes website
+  link: https://kubernetes.io/docs/reference/kubernetes-api/workload-resources/stateful-set-v1/
+
+author:
+    - Mihael Trajbarič (@mihaTrajbaric)
+'''
+
+EXAMPLES = r'''
+# Create replicated database with a volume per pod
+- name: StatefulSet with volume claim templates
+  sodalite.k8s.statefulset:
+    name: postgres
+    state: present
+    labels:
+      app: postgres
+    selector:
+      match_labels:
+        app: postgres
+    service_name: postgres
+    replicas: 3
+    containers:
+      - name: postgres
+        image: postgres:14
+        ports:
+          - name: postgres
+            container_port: 5432
+        volume_mounts:
+          - name: data
+            path: /var/lib/postgresql/data
+    volume_claim_templates:
+      - name: data
+        access_modes:
+          - ReadWriteOnce
+        storage_request: 10Gi
+    wait: yes
+
+# Update only pods with ordinal 2 and above
+- name: Staged rollout
+  sodalite.k8s.statefulset:
+    name: postgres
+    labels:
+      app: postgres
+    selector:
+      match_labels:
+        app: postgres
+    service_name: postgres
+    replicas: 3
+    containers:
+      - name: postgres
+        image: postgres:15
+    update_strategy:
+      type: RollingUpdate
+      partition: 2
+
+# Remove StatefulSet
+- name: Remove statefulset
+  sodalite.k8s.statefulset:
+    name: postgres
+    state: absent
+'''
+
+RETURN = r'''
+result:
+  description:
+  - The created, patched, or otherwise present object. Will be empty in the case of a deletion.
+  returned: success
+  type: complex
+  contains:
+     api_version:
+       description: The versioned schema of this representation of an object.
+       returned: success
+       type: str
+     kind:
+       description: Represents the REST resource this object represents.
+       returned: success
+       type: str
+     metadata:
+       description: Standard object metadata. Includes name, namespace, annotations, labels, etc.
+       returned: success
+       type: dict
+     spec:
+       description: Specific attributes of the object.
+       returned: success
+       type: dict
+     status:
+       description: Current status details for the object.
+       returned: success
+       type: dict
+     duration:
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
+       returned: when C(wait) is true
+       type: float
+       sample: 4.217
+     error:
+       description: error while trying to create/delete the object.
+       returned: error
+       type: dict
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
+'''
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.statefulset import (argument_spec, canonicalize,
+                                                                                         definition, references,
+                                                                                         validate, MUTUALLY_EXCLUSIVE)
+
+
+def main():
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
+    from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
+
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
+    if module.params.get('state') != 'absent':
+        with timings.phase('validate'):
+            validate(module, k8s_def)
+        with timings.phase('definition'):
+            canonicalize(k8s_def)
+
+    verified = None
+    if module.params.get('verify_references') and module.params.get('state') != 'absent':
+        verified = references(k8s_def)
+
+    execute_module(module, k8s_def, timings, references=verified)
+
+
+if __name__ == '__main__':
+    main()
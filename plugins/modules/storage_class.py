@@ -21,6 +21,7 @@ description: Creates k8s PersistentVolumeClaim, which describes the parameters f
 extends_documentation_fragment:
     - sodalite.k8s.common_options_no_namespace
     - sodalite.k8s.metadata_options
+    - sodalite.k8s.timings_options
     - kubernetes.core.k8s_auth_options
     - kubernetes.core.k8s_wait_options
     - kubernetes.core.k8s_delete_options
@@ -177,83 +178,59 @@ result:
        returned: success
        type: dict
      duration:
-       description: elapsed time of task in seconds
+       description:
+       - Time in seconds, spent waiting for the object.
+       - Object is watched, so waiting ends as soon as the object is ready. I(wait_sleep) only applies, when watching
+         the object is not permitted.
        returned: when C(wait) is true
-       type: int
-       sample: 48
+       type: float
+       sample: 4.217
      error:
        description: error while trying to create/delete the object.
        returned: error
        type: dict
+client_pool:
+  description:
+  - Hit and miss counters of the API client pool, cumulative for the process running the module.
+  - Clients are only reused (hits) when the module runs in a persistent process, see C(cloud.common) turbo mode,
+    enabled with C(ENABLE_TURBO_MODE=1).
+  returned: success
+  type: dict
+  sample: {"hits": 41, "misses": 1}
+timings:
+  description:
+  - Durations of module phases in seconds and HTTP traffic of the task.
+  - Phases are C(argspec), C(definition), C(validate), C(client), C(discovery), C(write) and C(wait). Duration of
+    C(write) excludes C(discovery) and C(wait).
+  returned: when I(timings=yes)
+  type: dict
+  version_added: 1.1.0
+  sample: {"phases": {"argspec": 0.0021, "definition": 0.0001, "validate": 0.0003, "client": 0.0412,
+           "discovery": 0.0001, "write": 0.0187, "wait": 3.1022}, "requests": 3, "bytes_sent": 1204,
+           "bytes_received": 6931}
 '''
 
 from ansible_collections.sodalite.k8s.plugins.module_utils.ansiblemodule import AnsibleModule
-from ansible_collections.sodalite.k8s.plugins.module_utils.args_common import common_arg_spec
-from ansible_collections.sodalite.k8s.plugins.module_utils.common import Validators, CommonValidation
-from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
-
-
-def definition(params):
-    body = {
-        "apiVersion": "storage.k8s.io/v1",
-        "kind": "StorageClass",
-        "metadata": {
-            "name": params.get('name'),
-            "labels": params.get('labels'),
-            "annotations": params.get('annotations')
-        },
-        'provisioner': params.get('provisioner'),
-        'allowVolumeExpansion': params.get('allow_volume_expansion'),
-        'allowedTopologies': [
-            {
-                'matchLabelExpressions': params.get('allowed_topologies')
-            }
-        ],
-        'mountOptions': params.get('mount_options'),
-        'parameters': params.get('parameters'),
-        'reclaimPolicy': params.get('reclaim_policy'),
-        'volumeBindingMode': params.get('volume_binding_mode')
-    }
-    return clean_dict(body)
-
-
-def validate(module, k8s_definition):
-    CommonValidation.metadata(module, k8s_definition)
-
-    if not Validators.dns_subdomain(k8s_definition['metadata']['name']):
-        module.fail_json(msg=f"'name' {Validators.dns_subdomain_msg}")
-
-    parameters = k8s_definition.get('parameters', dict())
-    if not Validators.string_string_dict(parameters):
-        module.fail_json(msg="parameters should be map[string]string")
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.storage_class import (argument_spec, definition,
+                                                                                           validate)
 
 
 def main():
-    argspec = common_arg_spec()
-    # StorageClass is not namespaced object
-    argspec.pop('namespace')
-    argspec.update(dict(
-        provisioner=dict(type='str', required=True),
-        allow_volume_expansion=dict(type='bool'),
-        allowed_topologies=dict(type='list', elements='dict', options=dict(
-            key=dict(type='str', required=True, no_log=False),
-            values=dict(type='list', elements='str', required=True)
-        )),
-        mount_options=dict(type='list', elements='str'),
-        parameters=dict(type='dict'),
-        reclaim_policy=dict(type='str', choices=['Retain', 'Delete', 'Recycle'], default='Delete'),
-        volume_binding_mode=dict(type='str', choices=['Immediate', 'WaitForFirstConsumer'], default='Immediate'),
-    ))
-
-    module = AnsibleModule(argument_spec=argspec,
-                           supports_check_mode=True)
+    timings = Timings()
+    with timings.phase('argspec'):
+        module = AnsibleModule(argument_spec=argument_spec(),
+                               supports_check_mode=True)
+    timings.activate(module.params.get('timings'))
     from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import execute_module
 
-    k8s_def = definition(module.params)
+    with timings.phase('definition'):
+        k8s_def = definition(module.params)
     if module.params.get('state') != 'absent':
-        validate(module, k8s_def)
+        with timings.phase('validate'):
+            validate(module, k8s_def)
 
-    execute_module(module, k8s_def)
+    execute_module(module, k8s_def, timings)
 
 
 if __name__ == '__main__':
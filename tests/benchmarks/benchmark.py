@@ -0,0 +1,302 @@
+"""
+Microbenchmarks of definition() and validate() of all modules, on synthetic params of realistic and extreme size.
+
+Run from the root of the collection, checked out as ansible_collections/sodalite/k8s:
+
+    make benchmark BENCHMARK_ARGS="--output baseline.json"
+    make benchmark BENCHMARK_ARGS="--baseline baseline.json --threshold 0.2"
+
+Results are written as JSON (seconds per call, peak memory allocated by a call in bytes, and number and size of the
+memory blocks, that its result holds, from tracemalloc snapshot statistics).
+With --baseline, every case is compared with the baseline and the script exits with status 1, when median of any case
+is slower than baseline by more than --threshold.
+
+Every case also measures the builders of legacy.py (phase clean_dict), the way definitions were built before they were
+built pruned: filled with None for every missing param, then cleaned by clean_dict(), which visits and copies the
+whole tree once more. The ratio of the two phases shows what building pruned saves, on the machine at hand:
+
+    make benchmark BENCHMARK_ARGS="deployment/extreme --output pruned.json"
+
+Base64 values of binary_data and data are validated in chunks of Base64.chunk_size (64 KiB), so peak memory of
+validate() in the binary cases stays at a few chunks, regardless of the size of the payload (16 MiB).
+"""
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import base64
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+
+import legacy
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible_collections.sodalite.k8s.plugins.module_utils.bulk import ItemModule
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources import (config_map, daemonset, deployment,
+                                                                             ingress, job, namespace, pvc, secret,
+                                                                             service, statefulset, storage_class)
+
+LABELS = {'app.kubernetes.io/name': 'bench', 'app.kubernetes.io/part-of': 'benchmark', 'tier': 'backend'}
+
+
+def config_map_params(keys):
+    return dict(name='bench-config', labels=LABELS, data={f"key-{i}.properties": f"value-{i}" for i in range(keys)})
+
+
+def binary_params(size, keys=4):
+    value = base64.b64encode(bytes(range(256)) * (size // 256 // keys)).decode('ascii')
+    return dict(name='bench-binary', labels=LABELS, binary_data={f"blob-{i}.bin": value for i in range(keys)})
+
+
+def binary_secret_params(size, keys=4):
+    value = base64.b64encode(bytes(range(256)) * (size // 256 // keys)).decode('ascii')
+    return dict(name='bench-binary', labels=LABELS, data={f"blob-{i}.bin": value for i in range(keys)})
+
+
+def secret_params(keys):
+    value = base64.b64encode(b'secret-value').decode()
+    return dict(name='bench-secret', labels=LABELS, data={f"key_{i}": value for i in range(keys)},
+                string_data={f"plain_{i}": 'secret' for i in range(keys // 10)})
+
+
+def pod_template_params(containers, volumes):
+    volume_list = list()
+    for i in range(volumes):
+        if i % 3 == 0:
+            volume_list.append(dict(name=f"volume-{i}", pvc=dict(claim_name=f"claim-{i}")))
+        elif i % 3 == 1:
+            volume_list.append(dict(name=f"volume-{i}", config_map=dict(
+                name=f"config-{i}", items=[dict(key='app.conf', path='app.conf', mode=0o600)])))
+        else:
+            volume_list.append(dict(name=f"volume-{i}", secret=dict(name=f"secret-{i}")))
+    container_list = [
+        dict(
+            name=f"container-{i}",
+            image=f"registry.example.com/bench/app-{i}:1.0.{i}",
+            command=['/bin/app'],
+            args=['--listen', f":{8000 + i}"],
+            ports=[dict(container_port=8000 + i, name=f"http-{i}")],
+            env=[dict(name=f"ENV_{j}", value=str(j)) for j in range(5)] + [
+                dict(name='CONFIG_KEY', config_map=dict(name='bench-config', key='key')),
+                dict(name='SECRET_KEY', secret=dict(name='bench-secret', key='key'))
+            ],
+            env_from=[dict(config_map=dict(name='bench-config')), dict(secret=dict(name='bench-secret'))],
+            volume_mounts=[dict(name=f"volume-{j}", path=f"/mnt/volume-{j}")
+                           for j in range(i % max(volumes, 1), min(volumes, i % max(volumes, 1) + 3))],
+            resource_limits=dict(cpu='500m', memory='512Mi'),
+            resource_requests=dict(cpu='250m', memory='256Mi')
+        ) for i in range(containers)
+    ]
+    return dict(labels=LABELS, containers=container_list, volumes=volume_list)
+
+
+def deployment_params(containers, volumes):
+    return dict(pod_template_params(containers, volumes), name='bench-deployment', selector=dict(match_labels=LABELS),
+                replicas=3, strategy=dict(type='RollingUpdate', max_surge='25%', max_unavailable='1'))
+
+
+def statefulset_params(containers, volumes, claims):
+    return dict(pod_template_params(containers, volumes), name='bench-statefulset', selector=dict(match_labels=LABELS),
+                service_name='bench', replicas=3, update_strategy=dict(type='RollingUpdate', partition=1),
+                volume_claim_templates=[dict(name=f"data-{i}", access_modes=['ReadWriteOnce'], storage_request='10Gi',
+                                             storage_class_name='standard') for i in range(claims)])
+
+
+def daemonset_params(containers, volumes):
+    return dict(pod_template_params(containers, volumes), name='bench-daemonset', selector=dict(match_labels=LABELS),
+                update_strategy=dict(type='RollingUpdate', max_unavailable='1'))
+
+
+def job_params(containers, volumes):
+    return dict(pod_template_params(containers, volumes), name='bench-job', completions=10, parallelism=2,
+                backoff_limit=3, ttl_seconds_after_finished=3600)
+
+
+def service_params(ports):
+    return dict(name='bench-service', labels=LABELS, selector=LABELS, type='NodePort',
+                ports=[dict(port=1000 + i, target_port=str(2000 + i), name=f"port-{i}") for i in range(ports)])
+
+
+def ingress_params(paths, hosts):
+    per_host = max(paths // hosts, 1)
+    return dict(name='bench-ingress', labels=LABELS, ingress_class_name='nginx',
+                default_backend_service=dict(name='default', port='80'),
+                rules=[dict(host=f"host-{h}.example.com", paths=[
+                    dict(path=f"/api/v{p}", path_type='Prefix', backend_service=dict(name=f"svc-{p}", port='http'))
+                    for p in range(per_host)]) for h in range(hosts)],
+                tls=[dict(hosts=[f"host-{h}.example.com"], secret='bench-tls') for h in range(hosts)])
+
+
+def pvc_params():
+    return dict(name='bench-claim', labels=LABELS, access_modes=['ReadWriteOnce'], storage_request='10Gi',
+                storage_limit='20Gi', storage_class_name='standard',
+                selector=dict(match_expressions=[dict(key='tier', operator='In', values=['backend', 'db'])]))
+
+
+def storage_class_params():
+    return dict(name='bench-storage', labels=LABELS, provisioner='kubernetes.io/aws-ebs',
+                parameters=dict(type='io1', iopsPerGB='10', fsType='ext4'), allow_volume_expansion=True,
+                allowed_topologies=[dict(key='topology.kubernetes.io/zone', values=['eu-west-1a', 'eu-west-1b'])])
+
+
+def namespace_params():
+    return dict(name='bench-namespace', labels=LABELS, annotations={'owner': 'benchmark'})
+
+
+CASES = [
+    ('config_map', 'realistic', config_map, lambda: config_map_params(20)),
+    ('config_map', 'extreme', config_map, lambda: config_map_params(50000)),
+    ('config_map', 'binary', config_map, lambda: binary_params(16 * 1024 * 1024)),
+    ('secret', 'realistic', secret, lambda: secret_params(10)),
+    ('secret', 'extreme', secret, lambda: secret_params(10000)),
+    ('secret', 'binary', secret, lambda: binary_secret_params(16 * 1024 * 1024)),
+    ('deployment', 'realistic', deployment, lambda: deployment_params(3, 6)),
+    ('deployment', 'extreme', deployment, lambda: deployment_params(200, 500)),
+    ('statefulset', 'realistic', statefulset, lambda: statefulset_params(2, 4, 2)),
+    ('statefulset', 'extreme', statefulset, lambda: statefulset_params(200, 500, 100)),
+    ('daemonset', 'realistic', daemonset, lambda: daemonset_params(2, 4)),
+    ('daemonset', 'extreme', daemonset, lambda: daemonset_params(200, 500)),
+    ('job', 'realistic', job, lambda: job_params(1, 2)),
+    ('job', 'extreme', job, lambda: job_params(200, 500)),
+    ('service', 'realistic', service, lambda: service_params(4)),
+    ('service', 'extreme', service, lambda: service_params(1000)),
+    ('ingress', 'realistic', ingress, lambda: ingress_params(20, 2)),
+    ('ingress', 'extreme', ingress, lambda: ingress_params(5000, 50)),
+    ('pvc', 'realistic', pvc, pvc_params),
+    ('storage_class', 'realistic', storage_class, storage_class_params),
+    ('namespace', 'realistic', namespace, namespace_params),
+]
+
+
+def prepare(resource, raw_params):
+    """
+    Fills defaults, like AnsibleModule would. Returns item module and params.
+    """
+    validator = ArgumentSpecValidator(resource.argument_spec(),
+                                      mutually_exclusive=getattr(resource, 'MUTUALLY_EXCLUSIVE', None),
+                                      required_if=getattr(resource, 'REQUIRED_IF', None))
+    result = validator.validate(raw_params)
+    if result.error_messages:
+        raise ValueError('; '.join(result.error_messages))
+    params = result.validated_parameters
+    module = SimpleNamespace(check_mode=False, _diff=False, deprecate=print, debug=print)
+    return ItemModule(module, validator.argument_spec, params), params
+
+
+def measure(func, repeat, min_time):
+    """
+    Returns seconds per call of func: min and median over repeat rounds, each lasting at least min_time.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    rounds = [timer.timeit(number) / number for _ in range(repeat)]
+    return dict(min=min(rounds), median=statistics.median(rounds), number=number, repeat=repeat)
+
+
+def memory(func):
+    """
+    Returns peak memory in bytes, allocated by a single call of func, and number and size of memory blocks, that are
+    still allocated after it (by its result).
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        stats = snapshot.statistics('filename')
+        del result
+        return dict(peak_bytes=peak, blocks=sum(stat.count for stat in stats),
+                    block_bytes=sum(stat.size for stat in stats))
+    finally:
+        tracemalloc.stop()
+
+
+def run(selected, repeat, min_time):
+    results = dict()
+    for kind, size, resource, build in CASES:
+        if selected and not any(s in f"{kind}/{size}" for s in selected):
+            continue
+        item_module, params = prepare(resource, build())
+        k8s_definition = resource.definition(params)
+        resource.validate(item_module, k8s_definition)
+
+        phases = dict(definition=lambda: resource.definition(params),
+                      validate=lambda: resource.validate(item_module, k8s_definition))
+        # comparison case: pruned builders against None-filled ones, cleaned afterwards
+        legacy_definition = getattr(legacy, kind, None)
+        if legacy_definition is not None:
+            phases['clean_dict'] = lambda: clean_dict(legacy_definition(params))
+        for phase, func in phases.items():
+            case = f"{kind}/{size}/{phase}"
+            results[case] = measure(func, repeat, min_time)
+            results[case].update(memory(func))
+            result = results[case]
+            print(f"{case:<40} {result['median'] * 1e6:>14.1f} us {result['peak_bytes'] / 1024:>10.1f} KiB peak "
+                  f"{result['blocks']:>10} blocks", file=sys.stderr)
+        if legacy_definition is not None:
+            ratio = results[f"{kind}/{size}/clean_dict"]['median'] / results[f"{kind}/{size}/definition"]['median']
+            print(f"{f'{kind}/{size}':<40} {ratio:>14.2f} x  clean_dict / definition", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns list of (case, ratio) of cases, that are slower than baseline by more than threshold.
+    """
+    regressions = list()
+    print(f"\n{'case':<40} {'baseline us':>14} {'current us':>14} {'ratio':>8}", file=sys.stderr)
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+        ratio = result['median'] / baseline[case]['median']
+        flag = ' REGRESSION' if ratio > 1 + threshold else ''
+        print(f"{case:<40} {baseline[case]['median'] * 1e6:>14.1f} {result['median'] * 1e6:>14.1f} {ratio:>8.2f}{flag}",
+              file=sys.stderr)
+        if flag:
+            regressions.append((case, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('cases', nargs='*', help="run only cases, that contain any of these strings")
+    parser.add_argument('--output', help="file to write JSON results to, stdout by default")
+    parser.add_argument('--baseline', help="JSON results to compare with")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed slowdown ratio (default: 0.2)")
+    parser.add_argument('--repeat', type=int, default=5, help="number of rounds per case (default: 5)")
+    parser.add_argument('--min-time', type=float, default=0.2, help="minimal duration of a round in seconds")
+    args = parser.parse_args()
+
+    results = run(args.cases, args.repeat, args.min_time)
+    report = dict(
+        created=time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        results=results
+    )
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)['results'], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
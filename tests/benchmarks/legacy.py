@@ -0,0 +1,361 @@
+"""
+Definition builders of the modules, as they were before definitions were built pruned: every field of the body is
+filled, with None for missing params, and the body is then cleaned by clean_dict() (by the caller here, see phase
+clean_dict of benchmark.py). Kept to benchmark building pruned against this way.
+
+File sources and versioned definitions of config maps and secrets are left out, benchmark params use neither.
+"""
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import Marshalling, Quantity
+
+
+def config_map(params):
+
+    data = params.get('data')
+    binary_data = params.get('binary_data')
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {
+            "name": params.get('name'),
+            "labels": params.get('labels'),
+            "annotations": params.get('annotations')
+        },
+        "immutable": params.get('immutable'),
+        "binaryData": binary_data,
+        "data": data
+    }
+    return body
+
+
+def secret(params):
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "metadata": {
+            "name": params.get('name'),
+            "labels": params.get('labels'),
+            "annotations": params.get('annotations')
+        },
+        "immutable": params.get('immutable'),
+        "type": params.get('type'),
+        "stringData": params.get('string_data'),
+        "data": params.get('data'),
+    }
+    return body
+
+
+def deployment(params):
+    body = {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {
+            "name": params.get('name'),
+            "labels": params.get('labels'),
+            "annotations": params.get('annotations')
+        },
+        "spec": {
+            'selector': {
+                'matchExpressions': (params.get('selector') or {}).get('match_expressions'),
+                'matchLabels': (params.get('selector') or {}).get('match_labels')
+            },
+            "template": {
+                "metadata": {
+                    "name": params.get('name'),
+                    "labels": params.get('labels'),
+                    "annotations": params.get('annotations')
+                },
+                'spec': {
+                    'containers': [
+                        {
+                            'name': container.get('name'),
+                            'image': container.get('image'),
+                            'imagePullPolicy': container.get('image_pull_policy'),
+                            'command': container.get('command'),
+                            'args': container.get('args'),
+                            'workingDir': container.get('working_dir'),
+                            'ports': [
+                                {
+                                    'containerPort': port.get('container_port'),
+                                    'hostIP': port.get('host_ip'),
+                                    'hostPort': port.get('host_port'),
+                                    'name': port.get('name'),
+                                    'protocol': port.get('protocol'),
+                                }
+                                for port in container.get('ports') or list()
+                            ],
+                            'env': [
+                                {
+                                    'name': env_var.get('name'),
+                                    'valueFrom': {
+                                        'configMapKeyRef': env_var.get('config_map'),
+                                        'secretKeyRef': env_var.get('secret'),
+                                    },
+                                    'value': env_var.get('value')
+                                }
+                                for env_var in container.get('env') or list()
+                            ],
+                            'envFrom': [
+                                {
+                                    'configMapRef': env_from_item.get('config_map'),
+                                    'prefix': env_from_item.get('prefix'),
+                                    'secretRef': env_from_item.get('secret'),
+                                }
+                                for env_from_item in container.get('env_from') or list()
+                            ],
+                            'volumeMounts': [
+                                {
+                                    'mountPath': volume_mount.get('path'),
+                                    'name': volume_mount.get('name'),
+                                    'mountPropagation': volume_mount.get('propagation'),
+                                    'readOnly': volume_mount.get('read_only'),
+                                    'subPath': volume_mount.get('sub_path'),
+                                    'subPathExpr': volume_mount.get('sub_path_expr'),
+                                }
+                                for volume_mount in container.get('volume_mounts') or list()
+                            ],
+                            'volumeDevices': [
+                                {
+                                    'devicePath': volume_device.get('path'),
+                                    'name': volume_device.get('name')
+                                }
+                                for volume_device in container.get('volume_devices') or list()
+                            ],
+                            'resources': {
+                                'limits': Quantity.canonicalize_dict(container.get('resource_limits')),
+                                'requests': Quantity.canonicalize_dict(container.get('resource_requests'))
+                            }
+                        }
+                        for container in params.get('containers') or list()
+                    ],
+                    'imagePullSecrets': [{'name': secret} for secret in params.get('image_pull_secrets') or list()],
+                    'enableServiceLinks': params.get('enable_service_links'),
+                    'volumes': [
+                        {
+                            'name': volume.get('name'),
+                            'persistentVolumeClaim': {
+                                'claimName': (volume.get('pvc') or {}).get('claim_name'),
+                                'readOnly': (volume.get('pvc') or {}).get('read_only')
+                            },
+                            'configMap': {
+                                'name': (volume.get('config_map') or {}).get('name'),
+                                'optional': (volume.get('config_map') or {}).get('optional'),
+                                'defaultMode': (volume.get('config_map') or {}).get('default_mode'),
+                                'items': (volume.get('config_map') or {}).get('items'),
+                            },
+                            'secret': {
+                                'secretName': (volume.get('secret') or {}).get('name'),
+                                'optional': (volume.get('secret') or {}).get('optional'),
+                                'defaultMode': (volume.get('secret') or {}).get('default_mode'),
+                                'items': (volume.get('secret') or {}).get('items'),
+                            }
+                        }
+                        for volume in params.get('volumes') or list()
+                    ]
+                }
+            },
+            'replicas': params.get('replicas'),
+            'minReadySeconds': params.get('min_ready_seconds'),
+            'strategy': {
+                "type": (params.get('strategy') or {}).get('type'),
+                "rollingUpdate": {
+                    "maxSurge": (params.get('strategy') or {}).get('max_surge'),
+                    "maxUnavailable": (params.get('strategy') or {}).get('max_unavailable'),
+                }
+            },
+            'revisionHistoryLimit': params.get('revision_history_limit'),
+            'progressDeadlineSeconds': params.get('progress_deadline_seconds'),
+            'paused': params.get('paused')
+        }
+
+    }
+    return body
+
+
+def service(params):
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {
+            "name": params.get('name'),
+            "labels": params.get('labels'),
+            "annotations": params.get('annotations')
+        },
+        'spec': {
+            'selector': params.get('selector'),
+            'ports': [
+                {
+                    'port': port_obj.get('port'),
+                    'targetPort': Marshalling.unmarshall_int_or_string(port_obj.get('target_port')),
+                    'protocol': port_obj.get('protocol'),
+                    'name': port_obj.get('name'),
+                    'nodePort': port_obj.get('node_port'),
+                }
+                for port_obj in params.get('ports') or list()
+            ],
+            'type': params.get('type'),
+            'ipFamilies': params.get('ip_families'),
+            'ipFamilyPolicy': params.get('ip_families_policy'),
+            'clusterIP': params.get('cluster_ip')
+            or (params.get('cluster_ips')[0] if params.get('cluster_ips') else None),  # adds clusterIP[0] to clusterIP
+            'clusterIPs': params.get('cluster_ips'),
+            'externalIPs': params.get('external_ips'),
+            'loadBalancerIP': params.get('load_balancer_ip'),
+            'loadBalancerSourceRanges': params.get('load_balancer_source_ranges'),
+            'loadBalancerClass': params.get('load_balancer_class'),
+            'externalName': params.get('external_name'),
+            'externalTrafficPolicy': params.get('external_traffic_policy'),
+            'internalTrafficPolicy': params.get('internal_traffic_policy'),
+            'healthCheckNodePort': params.get('health_check_node_port'),
+            'publishNotReadyAddresses': params.get('publish_not_ready_addresses'),
+            'sessionAffinity': params.get('session_affinity'),
+            'sessionAffinityConfig': {
+                'clientIP': {
+                    'timeoutSeconds': params.get('session_affinity_timeout')
+                }
+            }
+        }
+    }
+    return body
+
+
+def ingress(params):
+
+    def get_port(port, _type):
+        """
+        makes sure port gets assigned to 'name' or 'number', depending on IntOrString unmarshalling
+        """
+        unmarshalled_port = Marshalling.unmarshall_int_or_string(port)
+        if isinstance(unmarshalled_port, _type):
+            return unmarshalled_port
+        return None
+
+    def ingress_backend(backend_service):
+        if backend_service is None:
+            return None
+        return {
+            "service": {
+                "name": backend_service.get('name'),
+                "port": {
+                    # function get_port(port, _type) will make sure only one of (name, number) != None
+                    # (required by mutually exclusive condition)
+                    'name': get_port(backend_service.get('port'), str),
+                    'number': get_port(backend_service.get('port'), int),
+                }
+            }
+        }
+
+    body = {
+        "apiVersion": "networking.k8s.io/v1",
+        "kind": "Ingress",
+        "metadata": {
+            "name": params.get('name'),
+            "labels": params.get('labels'),
+            "annotations": params.get('annotations')
+        },
+        "spec": {
+            "defaultBackend": ingress_backend(params.get('default_backend_service')),
+            "ingressClassName": params.get('ingress_class_name'),
+            "rules": [
+                {
+                    'host': rule.get('host'),
+                    'http': {
+                        'paths': [
+                            {
+                                'backend': ingress_backend(path.get('backend_service')),
+                                'path': path.get('path'),
+                                'pathType': path.get('path_type')
+                            }
+                            for path in rule.get('paths') or list()
+                        ]
+                    }
+                }
+                for rule in params.get('rules') or list()
+            ],
+            'tls': [
+                {
+                    'hosts': tls_config.get('hosts'),
+                    'secretName': tls_config.get('secret')
+                }
+                for tls_config in params.get('tls') or list()
+            ]
+        }
+    }
+
+    return body
+
+
+def pvc(params):
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "PersistentVolumeClaim",
+        "metadata": {
+            "name": params.get('name'),
+            "labels": params.get('labels'),
+            "annotations": params.get('annotations')
+        },
+        'spec': {
+            'accessModes': params.get('access_modes'),
+            'selector': {
+                'matchExpressions': (params.get('selector') or {}).get('match_expressions'),
+                'matchLabels': (params.get('selector') or {}).get('match_labels')
+            },
+            'resources': {
+                'requests': Quantity.canonicalize_dict({
+                    'storage': params.get('storage_request')
+                }),
+                'limits': Quantity.canonicalize_dict({
+                    'storage': params.get('storage_limit')
+                })
+            },
+            'volumeName': params.get('volume_name'),
+            'storageClassName': params.get('storage_class_name'),
+            'volumeMode': params.get('volume_mode')
+        }
+    }
+    return body
+
+
+def storage_class(params):
+    body = {
+        "apiVersion": "storage.k8s.io/v1",
+        "kind": "StorageClass",
+        "metadata": {
+            "name": params.get('name'),
+            "labels": params.get('labels'),
+            "annotations": params.get('annotations')
+        },
+        'provisioner': params.get('provisioner'),
+        'allowVolumeExpansion': params.get('allow_volume_expansion'),
+        'allowedTopologies': [
+            {
+                'matchLabelExpressions': params.get('allowed_topologies')
+            }
+        ],
+        'mountOptions': params.get('mount_options'),
+        'parameters': params.get('parameters'),
+        'reclaimPolicy': params.get('reclaim_policy'),
+        'volumeBindingMode': params.get('volume_binding_mode')
+    }
+    return body
+
+
+def namespace(params):
+
+    body = {
+        "apiVersion": "v1",
+        "kind": "Namespace",
+        "metadata": {
+            "name": params.get('name'),
+            "labels": params.get('labels'),
+            "annotations": params.get('annotations')
+        }
+    }
+
+    return body
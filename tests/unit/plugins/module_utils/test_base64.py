@@ -1,6 +1,11 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import base64
+
+import pytest
+
+from ansible_collections.sodalite.k8s.plugins.module_utils import common
 from ansible_collections.sodalite.k8s.plugins.module_utils.common import Base64
 
 
@@ -12,6 +17,42 @@ def test_decode():
     assert Base64.decode('cG9zdGdyZXM=') == 'postgres'
 
 
+@pytest.mark.parametrize('payload', [b'', b'p', b'po', b'pos', b'postgres'])
+def test_decoded_size(payload):
+    encoded = base64.b64encode(payload)
+    assert Base64.decoded_size(encoded.decode('ascii')) == len(payload)
+    assert Base64.decoded_size(encoded) == len(payload)
+    assert Base64.decoded_size(bytearray(encoded)) == len(payload)
+    assert Base64.decoded_size(memoryview(encoded)) == len(payload)
+
+
 def test_validate():
     assert Base64.validate('cG9zdGdyZXM=')
     assert not Base64.validate('foo')
+
+
+def test_validate_binary():
+    payload = bytes(range(256)) * 10
+    assert Base64.validate(base64.b64encode(payload).decode('ascii'))
+    assert Base64.validate(base64.b64encode(payload))
+    assert Base64.validate('')
+
+
+def test_validate_strict():
+    assert not Base64.validate('cG9zdGdyZXM')
+    assert not Base64.validate('cG9zdGdy\nZXM=')
+    assert not Base64.validate('cG9z=GdyZXM=')
+    assert not Base64.validate('cG9zdGdyZXM=====')
+    assert not Base64.validate('cG9zdGdyZXMé')
+    assert not Base64.validate(None)
+
+
+@pytest.mark.parametrize('strict_mode', [True, False])
+def test_validate_chunks(monkeypatch, strict_mode):
+    monkeypatch.setattr(common, 'HAS_STRICT_BASE64', strict_mode and common.HAS_STRICT_BASE64)
+    monkeypatch.setattr(Base64, 'chunk_size', 8)
+    assert Base64.validate(base64.b64encode(b'0123456789abcdef').decode('ascii'))
+    assert Base64.validate(base64.b64encode(b'0123456789abcdef'))
+    # padding at the end of a chunk, that is not the last one
+    assert not Base64.validate('cG9zdGc=cG9zdGdy')
+    assert not Base64.validate('cG9zdGdyZXM*cG9z')
@@ -1,7 +1,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import clean_dict, contains, pruned, \
+    pruned_copy, pruned_list, set_defaults
 
 
 def test_idempotency():
@@ -47,3 +48,48 @@ def test_remove_none():
         }
     }
     assert clean_dict(test) == result
+
+
+def test_pruned():
+    d = {'none': None, 'dict': {}, 'list': [], 'zero': 0, 'false': False, 'string': '', 'nested': {'foo': None}}
+    assert pruned(d) is d
+    assert d == {'zero': 0, 'false': False, 'string': '', 'nested': {'foo': None}}
+    assert pruned({'foo': pruned({'bar': None})}) is None
+
+
+def test_pruned_copy():
+    params = {'key': 'foo', 'optional': None, 'items': []}
+    assert pruned_copy(params) == {'key': 'foo'}
+    assert params == {'key': 'foo', 'optional': None, 'items': []}
+    assert pruned_copy({'optional': None}) is None
+    assert pruned_copy(None) is None
+
+
+def test_pruned_list():
+    assert pruned_list(pruned({'name': name}) for name in ('foo', None, 'bar')) == [{'name': 'foo'}, {'name': 'bar'}]
+    assert pruned_list(iter([None])) is None
+    assert pruned_list([]) is None
+
+
+def test_set_defaults():
+    d = {'a': 1, 'nested': {'b': 2}}
+    assert set_defaults(d, {'a': 0, 'c': 3, 'nested': {'b': 0, 'd': 4}}) == {
+        'a': 1, 'c': 3, 'nested': {'b': 2, 'd': 4}
+    }
+
+
+def test_contains():
+    live = {'metadata': {'name': 'foo', 'uid': '1'}, 'spec': {'ports': [{'port': 80, 'protocol': 'TCP'}]}}
+    assert contains(live, {'metadata': {'name': 'foo'}, 'spec': {'ports': [{'port': 80}]}})
+    assert not contains(live, {'metadata': {'name': 'bar'}})
+    assert not contains(live, {'spec': {'ports': [{'port': 80}, {'port': 81}]}})
+    assert not contains(live, {'spec': {'selector': {'app': 'foo'}}})
+    assert not contains(live, {'spec': {'ports': {'port': 80}}})
+
+
+def test_contains_omitted_zeros():
+    live = {'spec': {'replicas': 0, 'volumeMounts': [{'name': 'data', 'readOnly': True}]}}
+    assert contains(live, {'spec': {'replicas': 0, 'minReadySeconds': 0, 'paused': False, 'subPath': ''}})
+    assert not contains(live, {'spec': {'volumeMounts': [{'name': 'data', 'readOnly': False}]}})
+    assert not contains(live, {'spec': {'selector': {}}})
+    assert not contains(live, {'spec': {'minReadySeconds': 10}})
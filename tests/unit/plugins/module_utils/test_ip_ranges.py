@@ -0,0 +1,39 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import IpRanges
+
+RANGES = ['10.0.0.0/16', '2001:db8::/32', '10.0.1.0/24', 'foo', '10.0.0.0/16', '192.168.0.0/25', '192.168.0.128/25',
+          '2001:db8:1::/48', '10.1.0.0/16']
+
+
+def test_invalid():
+    assert IpRanges(RANGES).invalid == [3]
+    assert IpRanges(['10.0.0.1/24']).invalid == []  # host bits are allowed, like Validators.ip_range
+
+
+def test_redundant():
+    assert sorted(IpRanges(RANGES).redundant()) == [(2, 0), (4, 0), (7, 1)]
+    assert IpRanges(['10.0.0.0/24', '10.0.1.0/24']).redundant() == []
+    # larger range covers smaller ones, also when it comes later
+    assert IpRanges(['10.0.1.0/24', '10.0.0.0/8']).redundant() == [(0, 1)]
+    # IPv4 and IPv6 ranges with the same numeric value do not cover each other
+    assert IpRanges(['0.0.0.0/0', '::/96']).redundant() == []
+
+
+def test_deduplicated():
+    assert IpRanges(['1.2.3.4', '5.6.7.8', '1.2.3.4', '2001:db8::1']).deduplicated() == [
+        '1.2.3.4', '5.6.7.8', '2001:db8::1']
+
+
+def test_collapsed():
+    valid = [entry for entry in RANGES if entry != 'foo']
+    assert IpRanges(valid).collapsed() == ['10.0.0.0/15', '192.168.0.0/24', '2001:db8::/32']
+
+
+def test_many_ranges():
+    ranges = [f"10.{i // 256}.{i % 256}.0/24" for i in range(4096)] + ['10.0.0.0/12']
+    index = IpRanges(ranges)
+    assert len(index.redundant()) == 4096
+    assert index.collapsed() == ['10.0.0.0/12']
@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+
+from unittest.mock import MagicMock
+from ansible_collections.sodalite.k8s.plugins.module_utils.bulk import ItemExited, ItemFailed, ItemModule
+
+
+def test_item_module():
+    module = MagicMock(check_mode=True, _diff=True)
+    item_module = ItemModule(module, dict(), dict(name='foo'))
+    assert item_module.check_mode is True
+    # attributes of AnsibleModule, that K8sAnsibleMixin uses
+    assert item_module._diff is True
+    item_module.deprecate('foo', version='2.0.0')
+    module.deprecate.assert_called_once_with('foo', version='2.0.0')
+    item_module.debug('foo')
+    module.debug.assert_called_once_with('foo')
+
+    with pytest.raises(ItemFailed, match='foo failed'):
+        item_module.fail_json(msg='foo failed', changed=False)
+    with pytest.raises(ItemExited) as exited:
+        item_module.exit_json(changed=True, method='create')
+    assert exited.value.result == dict(changed=True, method='create')
+
+    item_module.warn('foo')
+    assert item_module.warnings == ['foo']
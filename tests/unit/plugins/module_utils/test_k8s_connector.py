@@ -0,0 +1,771 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+from unittest.mock import MagicMock
+
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import DynamicApiError, ForbiddenError, NotFoundError
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.k8s_connector import (
+    APPLY_PATCH_CONTENT_TYPE, MERGE_PATCH_CONTENT_TYPE, PARTIAL_OBJECT_METADATA, PARTIAL_OBJECT_METADATA_LIST,
+    SPEC_HASH_ANNOTATION, STRATEGIC_MERGE_PATCH_CONTENT_TYPE, apply_in_place, list_metadata, missing_references,
+    patch_images, prune_versions, replicas_only, resume, scale, server_side_apply, skip_unchanged, typed_resource,
+    versioned_result)
+from ansible_collections.sodalite.k8s.plugins.module_utils.versioned import VERSIONED_LABEL
+
+
+class Failed(Exception):
+    pass
+
+
+def api_error(error, status, reason):
+    return error(ApiException(status=status, reason=reason))
+
+
+def mixin(check_mode=False, diff=False, **params):
+    """
+    Returns K8sAnsibleMixin stand-in over a mocked DynamicClient. fail_json raises Failed.
+    """
+    k8s_ansible_mixin = MagicMock()
+    k8s_ansible_mixin.params = dict(dict(wait=False), **params)
+    k8s_ansible_mixin.check_mode = check_mode
+    k8s_ansible_mixin.module._diff = diff
+    k8s_ansible_mixin.fail_json.side_effect = Failed
+    return k8s_ansible_mixin
+
+
+def returns(mock, *k8s_objects):
+    """
+    Makes mock return k8s_objects (or raise them, if they are exceptions) as ResourceInstances, one per call.
+    """
+    mock.side_effect = [k8s_object if isinstance(k8s_object, Exception) else
+                        MagicMock(to_dict=MagicMock(return_value=k8s_object)) for k8s_object in k8s_objects]
+
+
+def deployment(resource_version='1', **spec):
+    return {
+        'apiVersion': 'apps/v1', 'kind': 'Deployment',
+        'metadata': {'name': 'foo', 'namespace': 'default', 'resourceVersion': resource_version},
+        'spec': dict(dict(replicas=1), **spec)
+    }
+
+
+def definition(**spec):
+    return {'apiVersion': 'apps/v1', 'kind': 'Deployment', 'metadata': {'name': 'foo', 'namespace': 'default'},
+            'spec': dict(dict(replicas=1), **spec)}
+
+
+@pytest.fixture
+def resource():
+    return typed_resource(MagicMock(), 'apps/v1', 'Deployment')
+
+
+def applied(k8s_object, time, fields=None, manager='sodalite.k8s', generation=1):
+    k8s_object['metadata']['generation'] = generation
+    k8s_object['metadata']['managedFields'] = [
+        {'manager': 'kube-controller-manager', 'operation': 'Update', 'time': '2024-05-02T10:00:00Z'},
+        {'manager': manager, 'operation': 'Apply', 'time': time, 'fieldsV1': fields or {'f:spec': {'f:replicas': {}}}},
+    ]
+    return k8s_object
+
+
+class TestServerSideApply:
+    params = dict(server_side_apply=dict(field_manager='sodalite.k8s', force_conflicts=False))
+
+    def test_changed(self, resource):
+        k8s_ansible_mixin = mixin(**self.params)
+        client = k8s_ansible_mixin.client
+        returns(client.request, applied(deployment('2'), '2024-05-02T10:00:00Z'))
+        returns(client.patch, applied(deployment('3'), '2024-05-02T11:00:00Z', generation=2))
+
+        result = server_side_apply(k8s_ansible_mixin, resource, definition())
+
+        assert result['changed'] is True
+        assert result['method'] == 'apply'
+        # metadata-only GET of the live object, then the apply
+        assert client.request.call_args[0] == ('get', '/apis/apps/v1/namespaces/default/deployments/foo')
+        assert client.request.call_args[1]['header_params'] == {'Accept': PARTIAL_OBJECT_METADATA}
+        assert client.patch.call_args[1]['content_type'] == APPLY_PATCH_CONTENT_TYPE
+        assert client.patch.call_args[1]['query_params'] == [('fieldManager', 'sodalite.k8s'), ('force', 'false')]
+        client.get.assert_not_called()
+
+    def test_created(self, resource):
+        k8s_ansible_mixin = mixin(**self.params)
+        returns(k8s_ansible_mixin.client.request, api_error(NotFoundError, 404, 'Not Found'))
+        returns(k8s_ansible_mixin.client.patch, applied(deployment('1'), '2024-05-02T10:00:00Z'))
+
+        assert server_side_apply(k8s_ansible_mixin, resource, definition())['changed'] is True
+
+    def test_unchanged(self, resource):
+        k8s_ansible_mixin = mixin(**self.params)
+        # a no-op apply leaves the Apply entry and generation alone, controllers bumped resourceVersion meanwhile
+        returns(k8s_ansible_mixin.client.request, applied(deployment('2'), '2024-05-02T10:00:00Z'))
+        returns(k8s_ansible_mixin.client.patch, applied(deployment('9'), '2024-05-02T10:00:00Z'))
+
+        assert server_side_apply(k8s_ansible_mixin, resource, definition())['changed'] is False
+
+    def test_changed_within_same_second(self, resource):
+        k8s_ansible_mixin = mixin(**self.params)
+        # entries are dated in seconds, changed fields or generation still tell
+        returns(k8s_ansible_mixin.client.request, applied(deployment('2'), '2024-05-02T10:00:00Z'),
+                applied(deployment('3'), '2024-05-02T10:00:00Z'))
+        returns(k8s_ansible_mixin.client.patch,
+                applied(deployment('3'), '2024-05-02T10:00:00Z', fields={'f:spec': {'f:paused': {}}}),
+                applied(deployment('4'), '2024-05-02T10:00:00Z', generation=2))
+
+        assert server_side_apply(k8s_ansible_mixin, resource, definition())['changed'] is True
+        assert server_side_apply(k8s_ansible_mixin, resource, definition())['changed'] is True
+
+    def test_other_manager(self, resource):
+        k8s_ansible_mixin = mixin(**self.params)
+        returns(k8s_ansible_mixin.client.request, applied(deployment('2'), '2024-05-02T10:00:00Z', manager='kubectl'))
+        returns(k8s_ansible_mixin.client.patch, applied(deployment('3'), '2024-05-02T11:00:00Z', manager='kubectl'))
+
+        assert server_side_apply(k8s_ansible_mixin, resource, definition())['changed'] is False
+
+    def test_force_conflicts(self, resource):
+        k8s_ansible_mixin = mixin(server_side_apply=dict(field_manager='ci', force_conflicts=True))
+        returns(k8s_ansible_mixin.client.request, applied(deployment('2'), '2024-05-02T10:00:00Z', manager='other'))
+        returns(k8s_ansible_mixin.client.patch, applied(deployment('3'), '2024-05-02T11:00:00Z', manager='ci'))
+
+        assert server_side_apply(k8s_ansible_mixin, resource, definition())['changed'] is True
+        assert k8s_ansible_mixin.client.patch.call_args[1]['query_params'] == [('fieldManager', 'ci'),
+                                                                               ('force', 'true')]
+
+    def test_check_mode(self, resource):
+        k8s_ansible_mixin = mixin(check_mode=True, **self.params)
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('2'), deployment('2'), api_error(NotFoundError, 404, 'Not Found'))
+        returns(client.patch, deployment('2'), deployment('2', replicas=3), deployment('2'))
+
+        assert server_side_apply(k8s_ansible_mixin, resource, definition())['changed'] is False
+        assert server_side_apply(k8s_ansible_mixin, resource, definition(replicas=3))['changed'] is True
+        assert server_side_apply(k8s_ansible_mixin, resource, definition())['changed'] is True
+        assert ('dryRun', 'All') in client.patch.call_args[1]['query_params']
+        client.request.assert_not_called()
+
+    def test_error(self, resource):
+        k8s_ansible_mixin = mixin(**self.params)
+        returns(k8s_ansible_mixin.client.request, applied(deployment('2'), '2024-05-02T10:00:00Z'))
+        returns(k8s_ansible_mixin.client.patch, api_error(DynamicApiError, 409, 'Conflict'))
+
+        with pytest.raises(Failed):
+            server_side_apply(k8s_ansible_mixin, resource, definition())
+        assert k8s_ansible_mixin.fail_json.call_args[1]['status'] == 409
+
+
+class TestSkipUnchanged:
+
+    @staticmethod
+    def metadata(digest, resource_version='2'):
+        return {'name': 'foo', 'namespace': 'default', 'resourceVersion': resource_version,
+                'annotations': {SPEC_HASH_ANNOTATION: digest}}
+
+    def test_unchanged(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.request, {'metadata': self.metadata('abc')})
+
+        result = skip_unchanged(k8s_ansible_mixin, resource, definition(), 'abc')
+
+        assert result['changed'] is False
+        assert result['method'] == 'skip'
+        assert result['result']['metadata']['resourceVersion'] == '2'
+        # only metadata is read
+        assert client.request.call_args[0] == ('get', '/apis/apps/v1/namespaces/default/deployments/foo')
+        assert client.request.call_args[1]['header_params'] == {'Accept': PARTIAL_OBJECT_METADATA}
+
+    def test_changed(self, resource):
+        k8s_ansible_mixin = mixin()
+        returns(k8s_ansible_mixin.client.request, {'metadata': self.metadata('abc')},
+                api_error(NotFoundError, 404, 'Not Found'))
+
+        assert skip_unchanged(k8s_ansible_mixin, resource, definition(), 'def') is None
+        assert skip_unchanged(k8s_ansible_mixin, resource, definition(), 'abc') is None
+
+    def test_listed_metadata(self, resource):
+        k8s_ansible_mixin = mixin()
+
+        result = skip_unchanged(k8s_ansible_mixin, resource, definition(), 'abc', self.metadata('abc'))
+        assert result['changed'] is False
+        # missing from listing
+        assert skip_unchanged(k8s_ansible_mixin, resource, definition(), 'abc', dict()) is None
+        k8s_ansible_mixin.client.request.assert_not_called()
+
+    def test_wait(self, resource):
+        k8s_ansible_mixin = mixin(wait=True, wait_sleep=1, wait_timeout=10, wait_condition=None)
+        returns(k8s_ansible_mixin.client.request, {'metadata': self.metadata('abc')})
+        k8s_ansible_mixin.wait.return_value = (True, deployment('2'), 0.1)
+
+        result = skip_unchanged(k8s_ansible_mixin, resource, definition(), 'abc')
+
+        assert result['result'] == deployment('2')
+        assert result['duration'] == 0.1
+
+
+class TestListMetadata:
+
+    @staticmethod
+    def item(name, namespace='default', kind='ConfigMap', **params):
+        item_module = MagicMock(params=dict(dict(name=name, namespace=namespace, spec_hash=True, state='present'),
+                                            **params))
+        return item_module, {'apiVersion': 'v1', 'kind': kind, 'metadata': {'name': name}}
+
+    def test_grouped(self):
+        client = MagicMock()
+        returns(client.request, {'items': [{'metadata': {'name': 'foo', 'resourceVersion': '1'}},
+                                           {'metadata': {'name': 'bar', 'resourceVersion': '2'}}]})
+        items = [
+            self.item('foo'), self.item('bar'), self.item('baz'),
+            # single items of their kind and namespace are read one by one
+            self.item('foo', namespace='other'),
+            self.item('foo', kind='Secret'),
+            # without spec hash or forced, nothing is compared
+            self.item('qux', spec_hash=False), self.item('quux', spec_hash=False),
+            self.item('foo', namespace='forced', force=True), self.item('bar', namespace='forced', force=True),
+        ]
+
+        listings = list_metadata(client, items)
+
+        assert listings == {('v1', 'ConfigMap', 'default'): {
+            'foo': {'name': 'foo', 'resourceVersion': '1'},
+            'bar': {'name': 'bar', 'resourceVersion': '2'}
+        }}
+        client.request.assert_called_once()
+        assert client.request.call_args[0] == ('get', '/api/v1/namespaces/default/configmaps')
+        assert client.request.call_args[1]['header_params'] == {'Accept': PARTIAL_OBJECT_METADATA_LIST}
+
+    def test_cluster_scoped(self):
+        client = MagicMock()
+        returns(client.request, {'items': []})
+        items = [self.item('foo', kind='Namespace'), self.item('bar', kind='Namespace', namespace='other')]
+
+        assert list_metadata(client, items) == {('v1', 'Namespace', None): dict()}
+        assert client.request.call_args[0] == ('get', '/api/v1/namespaces')
+
+    def test_list_denied(self):
+        client = MagicMock()
+        returns(client.request, api_error(DynamicApiError, 403, 'Forbidden'))
+
+        assert list_metadata(client, [self.item('foo'), self.item('bar')]) == dict()
+
+
+class TestPruneVersions:
+
+    @staticmethod
+    def version(name, created):
+        return {'metadata': {'name': name, 'creationTimestamp': created, 'labels': {VERSIONED_LABEL: 'config'}}}
+
+    @staticmethod
+    def current():
+        return {'apiVersion': 'v1', 'kind': 'ConfigMap',
+                'metadata': {'name': 'config-d', 'namespace': 'default', 'labels': {VERSIONED_LABEL: 'config'}}}
+
+    def versions(self):
+        return {'items': [
+            self.version('config-a', '2021-01-01T00:00:00Z'),
+            self.version('config-c', '2021-01-03T00:00:00Z'),
+            self.version('config-d', '2021-01-04T00:00:00Z'),
+            self.version('config-b', '2021-01-02T00:00:00Z'),
+        ]}
+
+    @pytest.fixture
+    def config_maps(self):
+        return typed_resource(MagicMock(), 'v1', 'ConfigMap')
+
+    def test_prune(self, config_maps):
+        k8s_ansible_mixin = mixin(keep_versions=2, namespace='default')
+        client = k8s_ansible_mixin.client
+        returns(client.get, self.versions())
+        client.delete.side_effect = [None, api_error(NotFoundError, 404, 'Not Found')]
+
+        # current version and the newest older one are kept, deleted ones are ignored
+        assert prune_versions(k8s_ansible_mixin, config_maps, self.current()) == ['config-b', 'config-a']
+        assert client.get.call_args[1] == dict(namespace='default', label_selector=f"{VERSIONED_LABEL}=config")
+        assert [call[1]['name'] for call in client.delete.call_args_list] == ['config-b', 'config-a']
+
+    def test_keep_current(self, config_maps):
+        k8s_ansible_mixin = mixin(keep_versions=0, namespace='default')
+        returns(k8s_ansible_mixin.client.get, self.versions())
+
+        assert prune_versions(k8s_ansible_mixin, config_maps, self.current()) == ['config-c', 'config-b', 'config-a']
+
+    def test_nothing_to_prune(self, config_maps):
+        k8s_ansible_mixin = mixin(keep_versions=5, namespace='default')
+        returns(k8s_ansible_mixin.client.get, self.versions())
+
+        assert prune_versions(k8s_ansible_mixin, config_maps, self.current()) == []
+        k8s_ansible_mixin.client.delete.assert_not_called()
+
+    def test_check_mode(self, config_maps):
+        k8s_ansible_mixin = mixin(check_mode=True, keep_versions=3, namespace='default')
+        returns(k8s_ansible_mixin.client.get, self.versions())
+
+        assert prune_versions(k8s_ansible_mixin, config_maps, self.current()) == ['config-a']
+        k8s_ansible_mixin.client.delete.assert_not_called()
+
+    def test_versioned_result(self, config_maps):
+        k8s_ansible_mixin = mixin(versioned=True, keep_versions=3, namespace='default', state='present')
+        k8s_ansible_mixin.find_resource.return_value = config_maps
+        returns(k8s_ansible_mixin.client.get, self.versions())
+
+        result = versioned_result(k8s_ansible_mixin, self.current(), dict(changed=False, method='skip'))
+
+        assert result == dict(changed=True, method='skip', name='config-d', pruned=['config-a'])
+
+    def test_not_versioned(self):
+        k8s_ansible_mixin = mixin(versioned=False, state='present')
+
+        assert versioned_result(k8s_ansible_mixin, self.current(), dict(changed=False)) == dict(changed=False)
+        k8s_ansible_mixin.client.get.assert_not_called()
+
+
+class TestApplyInPlace:
+
+    def test_contained(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        # server omits minReadySeconds: 0 and adds defaults and status
+        returns(client.get, dict(deployment('7', revisionHistoryLimit=10), status={'replicas': 1}))
+
+        result = apply_in_place(k8s_ansible_mixin, resource, definition(minReadySeconds=0, revisionHistoryLimit=10))
+
+        assert result['changed'] is False
+        assert result['method'] == 'skip'
+        assert client.get.call_args[1] == dict(name='foo', namespace='default')
+        client.patch.assert_not_called()
+
+    def test_changed(self, resource):
+        k8s_ansible_mixin = mixin(diff=True)
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('7', minReadySeconds=30))
+        returns(client.patch, deployment('8', minReadySeconds=0))
+
+        result = apply_in_place(k8s_ansible_mixin, resource, definition(minReadySeconds=0))
+
+        assert result['changed'] is True
+        assert result['method'] == 'patch'
+        assert result['result']['metadata']['resourceVersion'] == '8'
+        assert result['diff'] == dict(before={'spec': {'minReadySeconds': 30}}, after={'spec': {'minReadySeconds': 0}})
+        # live object is read once and patched from it
+        client.get.assert_called_once()
+        assert client.patch.call_args[0][1] == definition(minReadySeconds=0)
+        assert client.patch.call_args[1] == dict(name='foo', namespace='default',
+                                                 content_type=STRATEGIC_MERGE_PATCH_CONTENT_TYPE, query_params=[])
+
+    def test_merge_fallback(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('7', minReadySeconds=30))
+        returns(client.patch, api_error(DynamicApiError, 415, 'Unsupported Media Type'),
+                deployment('8', minReadySeconds=0))
+
+        result = apply_in_place(k8s_ansible_mixin, resource, definition(minReadySeconds=0))
+
+        assert result['changed'] is True
+        assert [call[1]['content_type'] for call in client.patch.call_args_list] == [
+            STRATEGIC_MERGE_PATCH_CONTENT_TYPE, MERGE_PATCH_CONTENT_TYPE]
+
+    def test_patch_error(self, resource):
+        k8s_ansible_mixin = mixin(merge_type=['merge'])
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('7', minReadySeconds=30))
+        returns(client.patch, api_error(DynamicApiError, 422, 'Unprocessable Entity'))
+
+        with pytest.raises(Failed):
+            apply_in_place(k8s_ansible_mixin, resource, definition(minReadySeconds=0))
+
+        assert client.patch.call_args[1]['content_type'] == MERGE_PATCH_CONTENT_TYPE
+        assert k8s_ansible_mixin.fail_json.call_args[1]['status'] == 422
+
+    def test_check_mode(self, resource):
+        k8s_ansible_mixin = mixin(check_mode=True)
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('7', minReadySeconds=30))
+        returns(client.patch, deployment('7', minReadySeconds=0))
+
+        result = apply_in_place(k8s_ansible_mixin, resource, definition(minReadySeconds=0))
+
+        assert result['changed'] is True
+        assert client.patch.call_args[1]['query_params'] == [('dryRun', 'All')]
+
+    def test_not_found(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.get, api_error(NotFoundError, 404, 'Not Found'))
+        returns(client.create, deployment('1'))
+
+        result = apply_in_place(k8s_ansible_mixin, resource, definition())
+
+        assert result == dict(changed=True, method='create', result=deployment('1'))
+        assert client.create.call_args[0][1] == definition()
+        assert client.create.call_args[1] == dict(namespace='default', query_params=[])
+        client.patch.assert_not_called()
+
+    def test_not_found_patched(self, resource):
+        k8s_ansible_mixin = mixin(state='patched')
+        client = k8s_ansible_mixin.client
+        returns(client.get, api_error(NotFoundError, 404, 'Not Found'))
+
+        result = apply_in_place(k8s_ansible_mixin, resource, definition())
+
+        assert result == dict(changed=False, result=dict())
+        k8s_ansible_mixin.warn.assert_called_once()
+        client.create.assert_not_called()
+
+    def test_replicas_only(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('7', minReadySeconds=30))
+        returns(client.request, {'metadata': {'resourceVersion': '8'}, 'spec': {'replicas': 3}})
+
+        result = apply_in_place(k8s_ansible_mixin, resource, definition(replicas=3, minReadySeconds=30))
+
+        assert result['method'] == 'scale'
+        assert result['replicas'] == dict(before=1, after=3)
+        client.patch.assert_not_called()
+
+    def test_wait(self, resource):
+        k8s_ansible_mixin = mixin(wait=True, wait_sleep=1, wait_timeout=5)
+        returns(k8s_ansible_mixin.client.get, deployment('7'))
+        k8s_ansible_mixin.wait.return_value = (True, deployment('7'), 0.5)
+
+        result = apply_in_place(k8s_ansible_mixin, resource, definition())
+
+        assert result['duration'] == 0.5
+        k8s_ansible_mixin.wait.assert_called_once()
+
+
+class TestMissingReferences:
+    references = {
+        ('v1', 'ConfigMap'): {'app-config': ['containers[0].env[0]'],
+                              'other-config': ['containers[0].env_from[0]', 'volumes[1]']},
+        ('v1', 'Secret'): {'app-secret': ['volumes[0]']},
+    }
+
+    @staticmethod
+    def k8s_ansible_mixin():
+        k8s_ansible_mixin = mixin()
+        k8s_ansible_mixin.find_resource.side_effect = lambda kind, api_version, fail=False: typed_resource(
+            k8s_ansible_mixin.client, api_version, kind)
+        return k8s_ansible_mixin
+
+    @staticmethod
+    def listed(*names):
+        return {'kind': 'PartialObjectMetadataList', 'items': [{'metadata': {'name': name}} for name in names]}
+
+    def test_all_found(self):
+        k8s_ansible_mixin = self.k8s_ansible_mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.request, self.listed('app-config', 'other-config', 'unrelated'), self.listed('app-secret'))
+
+        assert missing_references(k8s_ansible_mixin, 'default', self.references) == []
+        # one metadata-only LIST per kind
+        assert [call[0] for call in client.request.call_args_list] == [
+            ('get', '/api/v1/namespaces/default/configmaps'), ('get', '/api/v1/namespaces/default/secrets')]
+        assert all(call[1]['header_params'] == {'Accept': PARTIAL_OBJECT_METADATA_LIST}
+                   for call in client.request.call_args_list)
+
+    def test_missing(self):
+        k8s_ansible_mixin = self.k8s_ansible_mixin()
+        returns(k8s_ansible_mixin.client.request, self.listed('app-config'), self.listed())
+
+        assert missing_references(k8s_ansible_mixin, 'default', self.references) == [
+            "ConfigMap 'other-config' not found in namespace 'default' "
+            "(referenced by containers[0].env_from[0], volumes[1])",
+            "Secret 'app-secret' not found in namespace 'default' (referenced by volumes[0])",
+        ]
+
+    def test_list_forbidden(self):
+        k8s_ansible_mixin = self.k8s_ansible_mixin()
+        client = k8s_ansible_mixin.client
+        # secrets may not be listed, they are read by name
+        returns(client.request, self.listed('app-config', 'other-config'), api_error(ForbiddenError, 403, 'Forbidden'),
+                api_error(NotFoundError, 404, 'Not Found'))
+
+        assert missing_references(k8s_ansible_mixin, 'default', self.references) == [
+            "Secret 'app-secret' not found in namespace 'default' (referenced by volumes[0])"]
+        assert client.request.call_args[0] == ('get', '/api/v1/namespaces/default/secrets/app-secret')
+        assert client.request.call_args[1]['header_params'] == {'Accept': PARTIAL_OBJECT_METADATA}
+
+    def test_error(self):
+        k8s_ansible_mixin = self.k8s_ansible_mixin()
+        returns(k8s_ansible_mixin.client.request, api_error(DynamicApiError, 500, 'Internal Server Error'))
+
+        with pytest.raises(DynamicApiError):
+            missing_references(k8s_ansible_mixin, 'default', self.references)
+
+
+def with_containers(k8s_object, annotations=None, **images):
+    k8s_object['spec']['template'] = {'spec': {'containers': [dict(name=name, image=image)
+                                                              for name, image in images.items()]}}
+    if annotations:
+        k8s_object['metadata']['annotations'] = annotations
+    return k8s_object
+
+
+class TestPatchImages:
+
+    def test_patch_changed(self, resource):
+        k8s_ansible_mixin = mixin(diff=True)
+        client = k8s_ansible_mixin.client
+        returns(client.get, with_containers(deployment('1'), app='app:1', sidecar='proxy:1'))
+        returns(client.patch, with_containers(deployment('2'), app='app:2', sidecar='proxy:1'))
+
+        result = patch_images(k8s_ansible_mixin, resource, definition(), dict(app='app:2', sidecar='proxy:1'))
+
+        assert result['changed'] is True
+        assert result['method'] == 'patch'
+        # only changed containers are sent
+        assert client.patch.call_args[0][1] == {'spec': {'template': {'spec': {'containers': [
+            {'name': 'app', 'image': 'app:2'}]}}}}
+        assert client.patch.call_args[1]['content_type'] == STRATEGIC_MERGE_PATCH_CONTENT_TYPE
+        assert client.patch.call_args[1]['query_params'] == []
+        assert result['diff']['before']['spec']['template']['spec']['containers'] == [{'name': 'app', 'image': 'app:1'}]
+        assert result['diff']['after']['spec']['template']['spec']['containers'] == [{'name': 'app', 'image': 'app:2'}]
+
+    def test_removes_spec_hash(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.get, with_containers(deployment('1'), {SPEC_HASH_ANNOTATION: 'abc'}, app='app:1'))
+        returns(client.patch, with_containers(deployment('2'), app='app:2'))
+
+        patch_images(k8s_ansible_mixin, resource, definition(), dict(app='app:2'))
+
+        assert client.patch.call_args[0][1]['metadata'] == {'annotations': {SPEC_HASH_ANNOTATION: None}}
+
+    def test_unchanged(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.get, with_containers(deployment('1'), app='app:1'))
+
+        result = patch_images(k8s_ansible_mixin, resource, definition(), dict(app='app:1'))
+
+        assert result == dict(changed=False, method='skip', result=with_containers(deployment('1'), app='app:1'))
+        client.patch.assert_not_called()
+
+    def test_check_mode(self, resource):
+        k8s_ansible_mixin = mixin(check_mode=True)
+        client = k8s_ansible_mixin.client
+        returns(client.get, with_containers(deployment('1'), app='app:1'))
+        returns(client.patch, with_containers(deployment('1'), app='app:2'))
+
+        assert patch_images(k8s_ansible_mixin, resource, definition(), dict(app='app:2'))['changed'] is True
+        assert client.patch.call_args[1]['query_params'] == [('dryRun', 'All')]
+
+    def test_unknown_container(self, resource):
+        k8s_ansible_mixin = mixin()
+        returns(k8s_ansible_mixin.client.get, with_containers(deployment('1'), app='app:1'))
+
+        with pytest.raises(Failed):
+            patch_images(k8s_ansible_mixin, resource, definition(), dict(app='app:2', proxy='proxy:2'))
+        assert k8s_ansible_mixin.fail_json.call_args[1]['msg'] == \
+            "Containers proxy not found in Deployment foo, its containers are app"
+        k8s_ansible_mixin.client.patch.assert_not_called()
+
+    def test_not_found(self, resource):
+        k8s_ansible_mixin = mixin()
+        returns(k8s_ansible_mixin.client.get, api_error(NotFoundError, 404, 'Not Found'))
+
+        with pytest.raises(Failed):
+            patch_images(k8s_ansible_mixin, resource, definition(), dict(app='app:2'))
+        assert 'update_images only updates images of existing' in k8s_ansible_mixin.fail_json.call_args[1]['msg']
+
+    def test_error(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.get, with_containers(deployment('1'), app='app:1'))
+        returns(client.patch, api_error(DynamicApiError, 422, 'Unprocessable Entity'))
+
+        with pytest.raises(Failed):
+            patch_images(k8s_ansible_mixin, resource, definition(), dict(app='app:2'))
+        assert k8s_ansible_mixin.fail_json.call_args[1]['status'] == 422
+
+
+def scaled(resource_version, replicas):
+    return {'kind': 'Scale', 'metadata': {'name': 'foo', 'resourceVersion': resource_version},
+            'spec': {'replicas': replicas}}
+
+
+class TestScale:
+
+    def test_scale(self, resource):
+        k8s_ansible_mixin = mixin(diff=True)
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('1', minReadySeconds=30))
+        returns(client.request, scaled('2', 3))
+
+        result = scale(k8s_ansible_mixin, resource, definition(), 3)
+
+        assert result['changed'] is True
+        assert result['method'] == 'scale'
+        assert result['replicas'] == dict(before=1, after=3)
+        assert result['result'] == deployment('2', replicas=3, minReadySeconds=30)
+        assert result['diff'] == dict(before={'spec': {'replicas': 1}}, after={'spec': {'replicas': 3}})
+        assert client.request.call_args[0] == ('patch', '/apis/apps/v1/namespaces/default/deployments/foo/scale')
+        assert client.request.call_args[1] == dict(body={'spec': {'replicas': 3}},
+                                                   content_type=MERGE_PATCH_CONTENT_TYPE, query_params=[])
+        client.patch.assert_not_called()
+
+    def test_unchanged(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+
+        result = scale(k8s_ansible_mixin, resource, definition(), 1, live=deployment('4'))
+
+        assert result['changed'] is False
+        assert result['method'] == 'skip'
+        client.get.assert_not_called()
+        client.request.assert_not_called()
+
+    def test_removes_spec_hash(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        live = deployment('1')
+        live['metadata']['annotations'] = {SPEC_HASH_ANNOTATION: 'abc'}
+        returns(client.request, scaled('2', 0))
+        returns(client.patch, deployment('3', replicas=0))
+
+        result = scale(k8s_ansible_mixin, resource, definition(), 0, live=live)
+
+        assert client.patch.call_args[0][1] == {'metadata': {'annotations': {SPEC_HASH_ANNOTATION: None}}}
+        assert result['result']['spec']['replicas'] == 0
+
+    def test_check_mode(self, resource):
+        k8s_ansible_mixin = mixin(check_mode=True)
+        client = k8s_ansible_mixin.client
+        returns(client.request, scaled('1', 3))
+
+        assert scale(k8s_ansible_mixin, resource, definition(), 3, live=deployment('1'))['changed'] is True
+        assert client.request.call_args[1]['query_params'] == [('dryRun', 'All')]
+
+    def test_not_found(self, resource):
+        k8s_ansible_mixin = mixin()
+        returns(k8s_ansible_mixin.client.get, api_error(NotFoundError, 404, 'Not Found'))
+
+        with pytest.raises(Failed):
+            scale(k8s_ansible_mixin, resource, definition(), 3)
+        assert 'scale_only only scales existing objects' in k8s_ansible_mixin.fail_json.call_args[1]['msg']
+
+    def test_error(self, resource):
+        k8s_ansible_mixin = mixin()
+        returns(k8s_ansible_mixin.client.request, api_error(DynamicApiError, 403, 'Forbidden'))
+
+        with pytest.raises(Failed):
+            scale(k8s_ansible_mixin, resource, definition(), 3, live=deployment('1'))
+        assert k8s_ansible_mixin.fail_json.call_args[1]['status'] == 403
+
+
+class TestReplicasOnly:
+
+    def test_replicas_only(self, resource):
+        assert replicas_only(resource, deployment('1', minReadySeconds=30), definition(replicas=3, minReadySeconds=30))
+
+    def test_other_fields(self, resource):
+        assert not replicas_only(resource, deployment('1'), definition(replicas=3, minReadySeconds=30))
+
+    def test_omitted_zero(self, resource):
+        # minReadySeconds: 0 is omitted by the API server
+        assert replicas_only(resource, deployment('1'), definition(replicas=3, minReadySeconds=0))
+
+    def test_without_replicas(self, resource):
+        test_def = definition()
+        del test_def['spec']['replicas']
+        assert not replicas_only(resource, deployment('1'), test_def)
+
+    def test_without_scale_subresource(self):
+        config_maps = typed_resource(MagicMock(), 'v1', 'ConfigMap')
+        assert not replicas_only(config_maps, deployment('1'), definition(replicas=3))
+
+
+class TestResume:
+
+    def test_resume(self, resource):
+        k8s_ansible_mixin = mixin(diff=True)
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('1', paused=True))
+        returns(client.patch, deployment('2', paused=False))
+
+        result = resume(k8s_ansible_mixin, resource, definition())
+
+        assert result['changed'] is True
+        assert result['method'] == 'patch'
+        assert result['diff'] == dict(before={'spec': {'paused': True}}, after={'spec': {'paused': False}})
+        assert client.patch.call_args[0][1] == {'spec': {'paused': False}}
+        assert client.patch.call_args[1] == dict(name='foo', namespace='default', content_type=MERGE_PATCH_CONTENT_TYPE,
+                                                 query_params=[])
+
+    def test_not_paused(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        # paused: false is omitted by the API server
+        returns(client.get, deployment('3'))
+
+        result = resume(k8s_ansible_mixin, resource, definition())
+
+        assert result['changed'] is False
+        assert result['method'] == 'skip'
+        client.patch.assert_not_called()
+
+    def test_check_mode(self, resource):
+        k8s_ansible_mixin = mixin(check_mode=True)
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('1', paused=True))
+        returns(client.patch, deployment('1', paused=False))
+
+        assert resume(k8s_ansible_mixin, resource, definition())['changed'] is True
+        assert client.patch.call_args[1]['query_params'] == [('dryRun', 'All')]
+
+    def test_not_found(self, resource):
+        k8s_ansible_mixin = mixin()
+        returns(k8s_ansible_mixin.client.get, api_error(NotFoundError, 404, 'Not Found'))
+
+        with pytest.raises(Failed):
+            resume(k8s_ansible_mixin, resource, definition())
+        assert 'rollout_batch=commit only resumes existing' in k8s_ansible_mixin.fail_json.call_args[1]['msg']
+
+    def test_error(self, resource):
+        k8s_ansible_mixin = mixin()
+        client = k8s_ansible_mixin.client
+        returns(client.get, deployment('1', paused=True))
+        returns(client.patch, api_error(DynamicApiError, 409, 'Conflict'))
+
+        with pytest.raises(Failed):
+            resume(k8s_ansible_mixin, resource, definition())
+        assert k8s_ansible_mixin.fail_json.call_args[1]['reason'] == 'Conflict'
+
+
+class TestTypedResource:
+
+    @pytest.mark.parametrize('api_version, kind, path, subresources', [
+        ('apps/v1', 'Deployment', '/apis/apps/v1/namespaces/default/deployments/foo', {'scale', 'status'}),
+        ('apps/v1', 'StatefulSet', '/apis/apps/v1/namespaces/default/statefulsets/foo', {'scale', 'status'}),
+        ('apps/v1', 'DaemonSet', '/apis/apps/v1/namespaces/default/daemonsets/foo', {'status'}),
+        ('batch/v1', 'Job', '/apis/batch/v1/namespaces/default/jobs/foo', {'status'}),
+        ('v1', 'ConfigMap', '/api/v1/namespaces/default/configmaps/foo', set()),
+    ])
+    def test_typed(self, api_version, kind, path, subresources):
+        resource = typed_resource(MagicMock(), api_version, kind)
+        assert resource.path(name='foo', namespace='default') == path
+        assert set(resource.subresources) == subresources
+
+    def test_unknown(self):
+        assert typed_resource(MagicMock(), 'example.com/v1', 'Widget') is None
+
+    def test_statefulset_replicas_only(self):
+        statefulsets = typed_resource(MagicMock(), 'apps/v1', 'StatefulSet')
+        live = dict(deployment('1', minReadySeconds=30), kind='StatefulSet')
+        assert replicas_only(statefulsets, live, dict(definition(replicas=3, minReadySeconds=30), kind='StatefulSet'))
+
+    def test_list_metadata(self):
+        client = MagicMock()
+        returns(client.request, {'items': [{'metadata': {'name': 'web'}}]})
+        items = [(MagicMock(params=dict(spec_hash=True, namespace='default')),
+                  {'apiVersion': 'apps/v1', 'kind': 'StatefulSet', 'metadata': {'name': name}})
+                 for name in ('web', 'db')]
+
+        listings = list_metadata(client, items)
+
+        assert listings == {('apps/v1', 'StatefulSet', 'default'): {'web': {'name': 'web'}}}
+        assert client.request.call_args[0] == ('get', '/apis/apps/v1/namespaces/default/statefulsets')
@@ -0,0 +1,193 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources.pod_template import (
+    argument_spec, canonicalize_template, image_pull_policy, selector_definition, template_definition,
+    validate_template)
+
+params = dict(
+    name='foo',
+    labels=dict(app='foo'),
+    containers=[dict(name='container-foo', image='test-image:1.0', env=[dict(name='FOO', value='bar')],
+                     volume_mounts=[dict(name='data', path='/data', read_only=False)])],
+    enable_service_links=True,
+    volumes=[dict(name='data', pvc=dict(claim_name='data', read_only=False))]
+)
+
+
+def test_template_definition():
+    assert template_definition(params) == {
+        'metadata': {'name': 'foo', 'labels': {'app': 'foo'}},
+        'spec': {
+            'containers': [{'name': 'container-foo', 'image': 'test-image:1.0',
+                            'env': [{'name': 'FOO', 'value': 'bar'}],
+                            'volumeMounts': [{'name': 'data', 'mountPath': '/data', 'readOnly': False}]}],
+            'enableServiceLinks': True,
+            'volumes': [{'name': 'data', 'persistentVolumeClaim': {'claimName': 'data', 'readOnly': False}}]
+        }
+    }
+    assert template_definition(dict(params, restart_policy='Never'))['spec']['restartPolicy'] == 'Never'
+
+
+def test_selector_definition():
+    assert selector_definition(None) is None
+    assert selector_definition(dict(match_labels=dict(app='foo'), match_expressions=None)) == {
+        'matchLabels': {'app': 'foo'}}
+
+
+def test_validate_template():
+    module = MagicMock()
+    validate_template(module, {'spec': {'template': template_definition(params)}})
+    module.fail_json.assert_not_called()
+
+    template = template_definition(dict(params, volumes=None))
+    validate_template(module, {'spec': {'template': template}})
+    assert module.fail_json.call_args[1]['msg'] == "containers[0].volume_mounts[0].name not found. Every name should " \
+                                                   "match the Name of a Volume."
+
+
+def test_canonicalize_template():
+    template = canonicalize_template(template_definition(dict(params, restart_policy='Never')))
+    assert template['spec']['restartPolicy'] == 'Never'
+    assert template['spec']['dnsPolicy'] == 'ClusterFirst'
+    assert template['spec']['containers'][0]['imagePullPolicy'] == 'IfNotPresent'
+    assert template['spec']['containers'][0]['terminationMessagePolicy'] == 'File'
+
+
+def test_image_pull_policy():
+    assert image_pull_policy('nginx') == 'Always'
+    assert image_pull_policy('nginx:latest') == 'Always'
+    assert image_pull_policy('registry:5000/nginx') == 'Always'
+    assert image_pull_policy('registry:5000/nginx:1.21') == 'IfNotPresent'
+    assert image_pull_policy('nginx@sha256:abc') == 'IfNotPresent'
+
+
+def test_argument_spec_cached():
+    assert argument_spec() is argument_spec()
+    assert set(argument_spec()) == {'containers', 'image_pull_secrets', 'enable_service_links', 'volumes'}
+
+
+def probe_template(**probe):
+    container = dict(params['containers'][0], ports=[dict(name='http', container_port=8080)], **probe)
+    return template_definition(dict(params, containers=[container]))
+
+
+def probe_error(**probe):
+    module = MagicMock()
+    validate_template(module, {'spec': {'template': probe_template(**probe)}})
+    return module.fail_json.call_args[1]['msg'] if module.fail_json.called else None
+
+
+def test_probe_definition():
+    container = probe_template(
+        readiness_probe=dict(http_get=dict(path='/ready', port='8080', scheme='HTTP',
+                                           http_headers=[dict(name='X-Probe', value='1')]), period_seconds=5),
+        liveness_probe=dict(tcp_socket=dict(port='http')),
+        startup_probe=dict(exec=dict(command=['cat', '/tmp/started']), failure_threshold=30)
+    )['spec']['containers'][0]
+    assert container['readinessProbe'] == {
+        'httpGet': {'path': '/ready', 'port': 8080, 'scheme': 'HTTP',
+                    'httpHeaders': [{'name': 'X-Probe', 'value': '1'}]},
+        'periodSeconds': 5
+    }
+    assert container['livenessProbe'] == {'tcpSocket': {'port': 'http'}}
+    assert container['startupProbe'] == {'exec': {'command': ['cat', '/tmp/started']}, 'failureThreshold': 30}
+
+
+def test_validate_probes():
+    assert probe_error(readiness_probe=dict(http_get=dict(port='http'), initial_delay_seconds=0),
+                       liveness_probe=dict(grpc=dict(port=9090)),
+                       startup_probe=dict(tcp_socket=dict(port='8080'), termination_grace_period_seconds=10)) is None
+
+    assert probe_error(readiness_probe=dict(period_seconds=5)) == \
+        "containers[0].readiness_probe must have exactly one handler. " \
+        "Only one of (http_get, tcp_socket, exec, grpc) can be present."
+    assert probe_error(liveness_probe=dict(http_get=dict(port='http'), exec=dict(command=['true']))) == \
+        "containers[0].liveness_probe must have exactly one handler. " \
+        "Only one of (http_get, tcp_socket, exec, grpc) can be present."
+    assert probe_error(readiness_probe=dict(tcp_socket=dict(port='70000'))) == \
+        "containers[0].readiness_probe.tcp_socket.port should be a valid port number, 0 < x < 65536, or a port name"
+    assert probe_error(startup_probe=dict(grpc=dict(port=0))) == \
+        "containers[0].startup_probe.grpc.port should be a valid port number, 0 < x < 65536"
+    assert probe_error(readiness_probe=dict(exec=dict(command=[]))) == \
+        "containers[0].readiness_probe.exec.command must not be empty"
+    assert probe_error(readiness_probe=dict(exec=dict(command=['true']), period_seconds=0)) == \
+        "containers[0].readiness_probe.period_seconds must be greater than 0"
+    assert probe_error(readiness_probe=dict(exec=dict(command=['true']), initial_delay_seconds=-1)) == \
+        "containers[0].readiness_probe.initial_delay_seconds must be greater than or equal to 0"
+    assert probe_error(readiness_probe=dict(exec=dict(command=['true']), termination_grace_period_seconds=5)) == \
+        "containers[0].readiness_probe.termination_grace_period_seconds must not be set"
+    assert probe_error(readiness_probe=dict(exec=dict(command=['true']), success_threshold=2)) is None
+    assert probe_error(liveness_probe=dict(exec=dict(command=['true']), success_threshold=2)) == \
+        "containers[0].liveness_probe.success_threshold must be 1"
+    assert probe_error(readiness_probe=dict(http_get=dict(port='metrics')),
+                       liveness_probe=dict(tcp_socket=dict(port='admin'))) == \
+        "containers[0] has no port named admin, metrics. " \
+        "Every named port of a probe should match the name of a port of the container."
+
+
+def test_canonicalize_probes():
+    container = canonicalize_template(probe_template(
+        readiness_probe=dict(http_get=dict(port='http', scheme='HTTP'), period_seconds=5)
+    ))['spec']['containers'][0]
+    assert container['readinessProbe'] == {
+        'httpGet': {'path': '/', 'port': 'http', 'scheme': 'HTTP'},
+        'timeoutSeconds': 1, 'periodSeconds': 5, 'successThreshold': 1, 'failureThreshold': 3
+    }
+    assert 'livenessProbe' not in container
+
+
+def hugepages_template(resource_limits, resource_requests=None, medium='HugePages'):
+    container = dict(params['containers'][0], resource_limits=resource_limits, resource_requests=resource_requests,
+                     volume_mounts=[dict(name='hugepages', path='/hugepages')])
+    return template_definition(dict(params, containers=[container],
+                                    volumes=[dict(name='hugepages', empty_dir=dict(medium=medium))]))
+
+
+def hugepages_error(*args, **kwargs):
+    module = MagicMock()
+    validate_template(module, {'spec': {'template': hugepages_template(*args, **kwargs)}})
+    return module.fail_json.call_args[1]['msg'] if module.fail_json.called else None
+
+
+def test_resources_definition():
+    container = hugepages_template({'hugepages-2Mi': '1024Mi', 'memory': '1Gi', 'cpu': 1},
+                                   {'cpu': 0.5, 'memory': None})['spec']['containers'][0]
+    assert container['resources'] == {'limits': {'hugepages-2Mi': '1Gi', 'memory': '1Gi', 'cpu': '1'},
+                                      'requests': {'cpu': '500m'}}
+
+
+def test_empty_dir():
+    template = template_definition(dict(params, volumes=[dict(name='data', empty_dir=dict(medium='')),
+                                                         dict(name='cache', empty_dir=dict(medium='Memory',
+                                                                                           size_limit='1024Mi'))]))
+    assert template['spec']['volumes'] == [{'name': 'data', 'emptyDir': {'medium': ''}},
+                                           {'name': 'cache', 'emptyDir': {'medium': 'Memory', 'sizeLimit': '1Gi'}}]
+    assert canonicalize_template(template)['spec']['volumes'][0] == {'name': 'data', 'emptyDir': {}}
+
+
+def test_validate_resources():
+    assert hugepages_error({'hugepages-2Mi': '1Gi', 'memory': '1Gi', 'example.com/gpu': '1'},
+                           {'hugepages-2Mi': '1Gi', 'example.com/gpu': '1'}) is None
+    assert hugepages_error({'hugepages-2Mi': '1Gi', 'memory': '1Gi'}, medium='HugePages-2Mi') is None
+
+    assert hugepages_error({'gpu': '1', 'memory': '1Gi'}).startswith(
+        "containers[0].resource_limits.gpu should be a standard resource name")
+    assert hugepages_error({'hugepages-2Mi': '1FooBar', 'memory': '1Gi'}) == \
+        "containers[0].resource_limits.hugepages-2Mi should be Quantities"
+    assert hugepages_error({'hugepages-2Mi': '1Gi', 'memory': '1Gi'}, {'hugepages-2Mi': '512Mi'}) == \
+        "containers[0].resource_requests.hugepages-2Mi must be equal to resource_limits, hugepages and extended " \
+        "resources may not be overcommitted"
+    assert hugepages_error({'memory': '1Gi'}, {'example.com/gpu': '1'}) == \
+        "containers[0].resource_requests.example.com/gpu must be equal to resource_limits, hugepages and extended " \
+        "resources may not be overcommitted"
+    assert hugepages_error({'hugepages-2Mi': '1Gi'}) == \
+        "containers[0] with hugepages in resource_limits must also have cpu or memory in resource_limits or " \
+        "resource_requests"
+    assert hugepages_error({'memory': '1Gi'}) == \
+        "volumes[0].empty_dir.medium is HugePages, but no container has hugepages in resource_limits"
+    assert hugepages_error({'hugepages-2Mi': '1Gi', 'memory': '1Gi'}, medium='HugePages-1Gi') == \
+        "volumes[0].empty_dir.medium is HugePages-1Gi, but no container has resource_limits.hugepages-1Gi"
+    assert hugepages_error({'hugepages-2Mi': '1Gi', 'hugepages-1Gi': '1Gi', 'memory': '1Gi'}) == \
+        "volumes[0].empty_dir.medium must be HugePages-<size>, when containers use several sizes of hugepages"
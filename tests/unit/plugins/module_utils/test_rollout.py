@@ -0,0 +1,123 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import DynamicApiError
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.rollout import parse_time, rollout_metrics, seconds
+
+REVISION = {'deployment.kubernetes.io/revision': '2'}
+
+DEPLOYMENT = {
+    'metadata': {'name': 'foo', 'namespace': 'default', 'uid': 'uid-1', 'annotations': REVISION},
+    'spec': {'replicas': 2, 'minReadySeconds': 5, 'selector': {'matchLabels': {'app': 'foo'}}}
+}
+
+REPLICA_SET = {
+    'metadata': {'name': 'foo-abc', 'ownerReferences': [{'uid': 'uid-1'}], 'annotations': REVISION,
+                 'creationTimestamp': '2024-05-02T10:00:00Z'},
+    'spec': {'selector': {'matchLabels': {'app': 'foo', 'pod-template-hash': 'abc'}}}
+}
+
+
+def pod(name, created, ready):
+    return {
+        'metadata': {'name': name, 'uid': f"uid-{name}", 'creationTimestamp': created},
+        'spec': {'nodeName': 'node-1'},
+        'status': {
+            'conditions': [
+                {'type': 'PodScheduled', 'status': 'True', 'lastTransitionTime': created},
+                {'type': 'Ready', 'status': 'True' if ready else 'False', 'lastTransitionTime': ready or created},
+            ],
+            'containerStatuses': [{'name': 'app', 'state': {'running': {'startedAt': '2024-05-02T10:00:09Z'}}}]
+        }
+    }
+
+
+def event(pod_name, reason, timestamp, uid=None):
+    return {'reason': reason, 'firstTimestamp': timestamp,
+            'involvedObject': {'kind': 'Pod', 'name': pod_name, 'uid': uid or f"uid-{pod_name}"}}
+
+
+def client(pods, events):
+    listings = {
+        '/apis/apps/v1/namespaces/default/replicasets': [REPLICA_SET],
+        '/api/v1/namespaces/default/pods': pods,
+    }
+
+    def request(method, path, query_params):
+        if path == '/api/v1/namespaces/default/events':
+            # field selector is applied by the server
+            selected = dict(field.split('=') for field in dict(query_params)['fieldSelector'].split(','))
+            items = [e for e in events
+                     if all(e['involvedObject'].get(key.split('.')[1]) == value for key, value in selected.items())]
+        else:
+            items = listings[path]
+        return MagicMock(to_dict=MagicMock(return_value={'items': items}))
+
+    mock = MagicMock()
+    mock.request.side_effect = request
+    return mock
+
+
+def test_parse_time():
+    assert seconds('2024-05-02T10:00:00Z', '2024-05-02T10:00:01.250000Z') == 1.25
+    assert parse_time(None) is None
+    assert seconds(None, '2024-05-02T10:00:00Z') is None
+
+
+def test_rollout_metrics():
+    pods = [pod('foo-abc-2', '2024-05-02T10:00:02Z', '2024-05-02T10:00:20Z'),
+            pod('foo-abc-1', '2024-05-02T10:00:01Z', '2024-05-02T10:00:12Z')]
+    events = [event('foo-abc-1', 'Pulling', '2024-05-02T10:00:03Z'),
+              event('foo-abc-1', 'Pulled', '2024-05-02T10:00:08Z'),
+              event('foo-abc-1', 'Started', '2024-05-02T10:00:09Z'),
+              event('foo-abc-2', 'Pulling', '2024-05-02T09:00:00Z', uid='uid-earlier')]
+    mock = client(pods, events)
+    metrics = rollout_metrics(mock, DEPLOYMENT)
+    assert metrics['replica_set'] == 'foo-abc'
+    assert metrics['time_to_first_ready'] == 12
+    assert metrics['time_to_available'] == 25
+    assert [p['name'] for p in metrics['pods']] == ['foo-abc-1', 'foo-abc-2']
+    assert metrics['pods'][0] == dict(name='foo-abc-1', node='node-1', created='2024-05-02T10:00:01Z',
+                                      scheduled='2024-05-02T10:00:01Z', pulling='2024-05-02T10:00:03Z',
+                                      pulled='2024-05-02T10:00:08Z', started='2024-05-02T10:00:09Z',
+                                      ready='2024-05-02T10:00:12Z')
+    assert metrics['pods'][1]['pulling'] is None
+    # events are selected per pod on the server, not listed for the whole namespace
+    event_requests = [call for call in mock.request.call_args_list if call[0][1].endswith('/events')]
+    assert [call[1]['query_params'] for call in event_requests] == [
+        [('fieldSelector', 'involvedObject.kind=Pod,involvedObject.name=foo-abc-2')],
+        [('fieldSelector', 'involvedObject.kind=Pod,involvedObject.name=foo-abc-1')],
+    ]
+
+
+def test_not_available():
+    pods = [pod('foo-abc-1', '2024-05-02T10:00:01Z', None)]
+    metrics = rollout_metrics(client(pods, list()), DEPLOYMENT)
+    assert metrics['time_to_first_ready'] is None
+    assert metrics['time_to_available'] is None
+
+
+def test_no_replica_set():
+    mock = MagicMock()
+    mock.request.return_value.to_dict.return_value = {'items': []}
+    assert rollout_metrics(mock, DEPLOYMENT) is None
+
+
+def test_events_forbidden():
+    pods = [pod('foo-abc-1', '2024-05-02T10:00:01Z', '2024-05-02T10:00:12Z')]
+    mock = client(pods, list())
+    listings = mock.request.side_effect
+
+    def request(method, path, query_params):
+        if path.endswith('/events'):
+            raise DynamicApiError(ApiException(status=403, reason='Forbidden'))
+        return listings(method, path, query_params)
+
+    mock.request.side_effect = request
+    metrics = rollout_metrics(mock, DEPLOYMENT)
+    assert metrics['time_to_first_ready'] == 12
+    assert metrics['pods'][0]['pulling'] is None
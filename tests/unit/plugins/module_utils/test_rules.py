@@ -0,0 +1,83 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import Check, Path, References, Rule, RuleTable, \
+    Unique
+
+K8S_DEF = {
+    'spec': {
+        'containers': [
+            {'name': 'a', 'ports': [{'name': 'http'}, {'name': 'grpc'}], 'volumeMounts': [{'name': 'data'}]},
+            {'name': 'b', 'ports': [{'name': 'http'}], 'volumeMounts': [{'name': 'cache'}]},
+        ],
+        'volumes': [{'name': 'data'}, {'name': 'logs'}],
+        'data': {'foo': 'bar', 'baz': 'qux'}
+    }
+}
+
+
+def test_path_select():
+    assert Path.compile('spec.containers[].ports[].name').select(K8S_DEF) == [
+        ((0, 0), 'http'), ((0, 1), 'grpc'), ((1, 0), 'http')
+    ]
+    assert Path.compile('spec.data{}').select(K8S_DEF) == [(('foo',), 'foo'), (('baz',), 'baz')]
+    assert Path.compile('spec.missing').select(K8S_DEF) == [((), None)]
+    assert Path.compile('spec.missing.name').select(K8S_DEF) == []
+    assert Path.compile('').select(K8S_DEF) == [((), K8S_DEF)]
+
+
+def test_path_shares_prefix():
+    names = Path.compile('spec.containers[].name')
+    ports = Path.compile('spec.containers[].ports[]')
+    assert names.parent is ports.parent.parent
+    selected = dict()
+    names.select(K8S_DEF, selected)
+    assert names.parent in selected
+    assert ports.select(K8S_DEF, selected) == [((0, 0), {'name': 'http'}), ((0, 1), {'name': 'grpc'}),
+                                               ((1, 0), {'name': 'http'})]
+
+
+def test_rule():
+    rule = Rule('spec.containers[].ports[].name', lambda name: name == 'http', "containers[{0}].ports[{1}]")
+    assert rule.error(K8S_DEF) == "containers[0].ports[1]"
+    assert Rule('spec.missing', lambda value: False, "missing").error(K8S_DEF) is None
+    assert Rule('spec.missing', lambda value: False, "missing", required=True).error(K8S_DEF) == "missing"
+    assert Rule('spec.data{}', lambda key: key != 'baz', lambda key, i: f"{key}:{i}").error(K8S_DEF) == "baz:baz"
+
+
+def test_check():
+    check = Check('spec', lambda spec: None if len(spec['volumes']) < 2 else "too many volumes")
+    assert check.error(K8S_DEF) == "too many volumes"
+
+
+def test_unique():
+    assert Unique('spec.containers[].name', "containers[{0}]").error(K8S_DEF) is None
+    assert Unique('spec.containers[].ports[].name', "containers[{0}].ports[{1}]").error(K8S_DEF) == \
+        "containers[1].ports[0]"
+
+
+def test_references():
+    rule = References('spec.containers[].volumeMounts[].name', 'spec.volumes[].name', "containers[{0}].mounts[{1}]")
+    assert rule.error(K8S_DEF) == "containers[1].mounts[0]"
+    keyed = References('spec.containers[].volumeMounts[].name', 'spec.volumes[]', "mounts",
+                       key=lambda volume: volume['name'].replace('logs', 'cache'))
+    assert keyed.error(K8S_DEF) is None
+
+
+def test_rule_table():
+    table = RuleTable(
+        Rule('spec.containers[].name', lambda name: name == 'a', "name {0}"),
+        Unique('spec.containers[].ports[].name', "port {0}.{1}"),
+        Rule('spec.volumes[].name', lambda name: True, "volume {0}"),
+    )
+    assert list(table.errors(K8S_DEF)) == ["name 1", "port 1.0"]
+
+    module = MagicMock()
+    table.validate(module, K8S_DEF)
+    module.fail_json.assert_called_once_with(msg="name 1")
+
+    module = MagicMock()
+    table.validate(module, {'spec': {'containers': [{'name': 'a'}]}})
+    module.fail_json.assert_not_called()
@@ -0,0 +1,120 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import io
+
+from unittest.mock import MagicMock
+
+from urllib3.response import HTTPResponse
+
+from ansible_collections.sodalite.k8s.plugins.module_utils import timings as timings_utils
+from ansible_collections.sodalite.k8s.plugins.module_utils.timings import Timings, instrument
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_nested_phases(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(timings_utils.time, 'monotonic', clock)
+    timings = Timings()
+    with timings.phase('write'):
+        clock.now += 1
+        with timings.phase('wait'):
+            clock.now += 3
+        clock.now += 1
+    assert timings.as_dict()['phases'] == dict(write=2.0, wait=3.0)
+
+
+def test_open_phases(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(timings_utils.time, 'monotonic', clock)
+    timings = Timings()
+    with timings.phase('write'):
+        clock.now += 1
+        with timings.phase('wait'):
+            clock.now += 2
+            assert timings.as_dict()['phases'] == dict(write=1.0, wait=2.0)
+
+
+def response():
+    http_response = MagicMock(_body=None)
+    http_response.read.return_value = b'{"kind": "ConfigMap"}'
+    return http_response
+
+
+def test_instrument():
+    client = MagicMock()
+    client.client.rest_client.pool_manager = MagicMock(spec=['request'])
+    client.client.rest_client.pool_manager.request.side_effect = [response(), response()]
+    instrument(client)
+    instrument(client)
+    pool_manager = client.client.rest_client.pool_manager
+
+    timings = Timings()
+    timings.activate(True)
+    pool_manager.request('PATCH', '/api/v1/configmaps', body='{"data": {}}').read()
+    timings.activate(False)
+    pool_manager.request('GET', '/api/v1/configmaps').read()
+
+    assert timings.requests == 1
+    assert timings.bytes_sent == 12
+    assert timings.bytes_received == 21
+
+
+class ChunkedResponse(HTTPResponse):
+    """
+    Response with chunked transfer encoding, like the one of a watch, with chunks of the body as they arrive.
+    """
+
+    def __init__(self, chunks):
+        super(ChunkedResponse, self).__init__(body=io.BytesIO(b''), preload_content=False,
+                                              headers={'transfer-encoding': 'chunked'})
+        self.chunks = chunks
+
+    def supports_chunked_reads(self):
+        return True
+
+    def read_chunked(self, amt=None, decode_content=None):
+        yield from self.chunks
+
+
+def streamed(request):
+    client = MagicMock()
+    client.client.rest_client.pool_manager = MagicMock(spec=['request'])
+    client.client.rest_client.pool_manager.request.side_effect = request
+    instrument(client)
+    return client.client.rest_client.pool_manager
+
+
+def test_instrument_stream():
+    events = [b'{"type": "ADDED"}\n', b'{"type": "MODIFIED"}\n']
+    pool_manager = streamed(lambda method, url, **kwargs: HTTPResponse(body=io.BytesIO(b''.join(events)),
+                                                                       preload_content=False))
+
+    timings = Timings()
+    timings.activate(True)
+    # watches do not preload, but stream the response
+    received = b''.join(pool_manager.request('GET', '/api/v1/pods?watch=true', preload_content=False).stream(8))
+    timings.activate(False)
+
+    assert received == b''.join(events)
+    assert timings.bytes_received == len(received)
+
+
+def test_instrument_chunked_stream():
+    events = [b'{"type": "ADDED"}\n', b'{"type": "MODIFIED"}\n']
+    pool_manager = streamed(lambda method, url, **kwargs: ChunkedResponse(events))
+
+    timings = Timings()
+    timings.activate(True)
+    received = list(pool_manager.request('GET', '/api/v1/pods?watch=true', preload_content=False).stream())
+    timings.activate(False)
+
+    assert received == events
+    assert timings.bytes_received == sum(len(event) for event in events)
@@ -2,7 +2,9 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
-from ansible_collections.sodalite.k8s.plugins.module_utils.common import Validators
+import pytest
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.common import Quantity, Validators
 
 
 def test_config_map_key():
@@ -135,6 +137,34 @@ def test_quantity():
     assert Validators.quantity('100m')
 
 
+@pytest.mark.parametrize('value,canonical', [
+    ('1024Mi', '1Gi'), ('1.5Gi', '1536Mi'), ('0.5Gi', '512Mi'), ('1023Ki', '1023Ki'), ('0.5', '500m'),
+    ('1000m', '1'), ('1000', '1k'), ('1500', '1500'), ('1e3', '1e3'), ('12e-3', '12e-3'), ('-1Gi', '-1Gi'),
+    ('0', '0'), ('5K', '5k'), ('1E', '1E'), ('1n', '1n'), ('1FooBar', '1FooBar')
+])
+def test_quantity_canonicalize(value, canonical):
+    assert Quantity.canonicalize(value) == canonical
+
+
+def test_quantity_compare():
+    assert Quantity.parse('1Gi') == Quantity.parse('1024Mi')
+    assert Quantity.parse('0.5') == Quantity.parse('500m')
+    assert Quantity.parse('1k') == Quantity.parse('1e3')
+    assert Quantity.parse('999m') < Quantity.parse('1') < Quantity.parse('1001m')
+    assert Quantity.parse('1Ki') > Quantity.parse('1k')
+    assert not Quantity.parse('1n').exact
+    assert Quantity.parse('1n').milli == 1
+    with pytest.raises(ValueError):
+        Quantity.parse('1.2.3')
+
+
+def test_exceeding_requests():
+    assert Validators.exceeding_requests({'limits': {'cpu': '1', 'memory': '1Gi'},
+                                          'requests': {'cpu': '1000m', 'memory': '1025Mi'}}) == ['memory']
+    assert Validators.exceeding_requests({'requests': {'cpu': '2'}}) == []
+    assert Validators.exceeding_requests({'limits': {'cpu': 'x'}, 'requests': {'cpu': '2'}}) == []
+
+
 def string_quantity_dict():
     assert Validators.string_quantity_dict({
         'foo': '5Gi'
@@ -183,3 +213,34 @@ def test_ip_range():
     assert Validators.ip_range('::/0')
     assert Validators.ip_range('2001:db8::/128')
     assert not Validators.ip_range('2001:db8::/129')
+
+
+def test_resource_name():
+    assert Validators.resource_name('cpu')
+    assert Validators.resource_name('memory')
+    assert Validators.resource_name('ephemeral-storage')
+    assert Validators.resource_name('hugepages-2Mi')
+    assert Validators.resource_name('hugepages-1Gi')
+    assert Validators.resource_name('nvidia.com/gpu')
+    assert Validators.resource_name('example.com/foo_bar.baz')
+
+    assert not Validators.resource_name('gpu')
+    assert not Validators.resource_name('hugepages-2Foo')
+    assert not Validators.resource_name('kubernetes.io/gpu')
+    assert not Validators.resource_name('node.kubernetes.io/gpu')
+    assert not Validators.resource_name('Example.com/gpu')
+    assert not Validators.resource_name('example.com/')
+    assert not Validators.resource_name('/gpu')
+    assert not Validators.resource_name(1)
+
+
+def test_overcommitted_requests():
+    assert Validators.overcommitted_requests(dict(
+        limits={'hugepages-2Mi': '1Gi', 'example.com/gpu': '1', 'memory': '1Gi'},
+        requests={'hugepages-2Mi': '1024Mi', 'example.com/gpu': '1', 'memory': '512Mi'}
+    )) == []
+    assert Validators.overcommitted_requests(dict(
+        limits={'hugepages-2Mi': '1Gi'},
+        requests={'hugepages-2Mi': '512Mi', 'example.com/gpu': '1', 'hugepages-1Gi': '1Gi'}
+    )) == ['example.com/gpu', 'hugepages-1Gi', 'hugepages-2Mi']
+    assert Validators.overcommitted_requests(dict(limits={'hugepages-2Mi': '1Gi'})) == []
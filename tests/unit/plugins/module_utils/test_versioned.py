@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.sodalite.k8s.plugins.module_utils.versioned import (VERSIONED_LABEL, content_hash,
+                                                                             versioned_definition)
+
+
+def config_map(data, labels=None):
+    return {'apiVersion': 'v1', 'kind': 'ConfigMap', 'metadata': {'name': 'foo', 'labels': labels or {'a': 'b'}},
+            'data': data}
+
+
+def test_content_hash():
+    assert content_hash(config_map({'a': '1', 'b': '2'})) == content_hash(config_map({'b': '2', 'a': '1'}))
+    assert content_hash(config_map({'a': '1'})) == content_hash(config_map({'a': '1'}, labels={'c': 'd'}))
+    assert content_hash(config_map({'a': '1'})) != content_hash(config_map({'a': '2'}))
+    assert len(content_hash(config_map({'a': '1'}))) == 10
+
+
+def test_versioned_definition():
+    k8s_def = versioned_definition(config_map({'a': '1'}))
+    assert k8s_def['metadata']['name'] == f"foo-{content_hash(config_map({'a': '1'}))}"
+    assert k8s_def['metadata']['labels'] == {'a': 'b', VERSIONED_LABEL: 'foo'}
+    assert k8s_def['immutable'] is True
@@ -0,0 +1,258 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+from unittest.mock import MagicMock
+
+from ansible_collections.sodalite.k8s.plugins.module_utils import waiter
+from ansible_collections.sodalite.k8s.plugins.module_utils.waiter import (RolloutFailed, deployment_failure,
+                                                                          job_failure, label_selector, predicate,
+                                                                          watch_wait)
+
+
+def deployment(resource_version, generation=2, observed_generation=2, available=1):
+    return {
+        'kind': 'Deployment',
+        'metadata': {'name': 'foo', 'namespace': 'default', 'resourceVersion': resource_version,
+                     'generation': generation},
+        'spec': {'replicas': 1},
+        'status': {'replicas': 1, 'availableReplicas': available, 'observedGeneration': observed_generation}
+    }
+
+
+def stream(batch):
+    yield from batch
+
+
+def events(*event_list):
+    return MagicMock(side_effect=[stream(batch) for batch in event_list])
+
+
+class TestPredicate:
+
+    @staticmethod
+    def test_deployment():
+        ready = predicate('Deployment')
+        assert ready(deployment('1'))
+        assert not ready(deployment('1', observed_generation=1))
+        assert not ready(deployment('1', available=0))
+        assert not ready(None)
+
+    @staticmethod
+    def test_absent():
+        gone = predicate('ConfigMap', state='absent')
+        assert gone(None)
+        assert not gone({'metadata': {'name': 'foo'}})
+
+    @staticmethod
+    def test_condition():
+        ready = predicate('Deployment', condition=dict(type='Available', status='True'))
+        available = {'status': {'conditions': [{'type': 'Available', 'status': 'True'}]}}
+        assert ready(available)
+        assert not ready({'status': {'conditions': [{'type': 'Available', 'status': 'False'}]}})
+        assert not ready({'status': {}})
+
+    @staticmethod
+    def test_exists():
+        assert predicate('ConfigMap')({'metadata': {'name': 'foo'}})
+
+
+class TestWatchWait:
+
+    @staticmethod
+    def test_ready_without_watch(monkeypatch):
+        watch_events = events()
+        monkeypatch.setattr(waiter, 'watch_events', watch_events)
+        success, result, duration = watch_wait(MagicMock(), MagicMock(), deployment('1'), 10)
+        assert success
+        assert result['metadata']['resourceVersion'] == '1'
+        watch_events.assert_not_called()
+
+    @staticmethod
+    def test_returns_on_ready_event(monkeypatch):
+        watch_events = events([
+            {'type': 'BOOKMARK', 'object': {'metadata': {'resourceVersion': '2'}}},
+            {'type': 'MODIFIED', 'object': deployment('3', observed_generation=1)},
+            {'type': 'MODIFIED', 'object': deployment('4')},
+            {'type': 'MODIFIED', 'object': deployment('5')},
+        ])
+        monkeypatch.setattr(waiter, 'watch_events', watch_events)
+        success, result, duration = watch_wait(MagicMock(), MagicMock(), deployment('1', observed_generation=1), 10)
+        assert success
+        assert result['metadata']['resourceVersion'] == '4'
+        assert watch_events.call_args[0][4] == '1'
+
+    @staticmethod
+    def test_resumes_from_bookmark(monkeypatch):
+        watch_events = events([
+            {'type': 'BOOKMARK', 'object': {'metadata': {'resourceVersion': '7'}}},
+        ], [
+            {'type': 'MODIFIED', 'object': deployment('8')},
+        ])
+        monkeypatch.setattr(waiter, 'watch_events', watch_events)
+        success, result, duration = watch_wait(MagicMock(), MagicMock(), deployment('1', observed_generation=1), 10)
+        assert success
+        assert watch_events.call_args_list[1][0][4] == '7'
+
+    @staticmethod
+    def test_relists_when_gone(monkeypatch):
+        watch_events = events([
+            {'type': 'ERROR', 'object': {'kind': 'Status', 'code': 410}},
+        ])
+        list_object = MagicMock(return_value=(deployment('9'), '9'))
+        monkeypatch.setattr(waiter, 'watch_events', watch_events)
+        monkeypatch.setattr(waiter, 'list_object', list_object)
+        success, result, duration = watch_wait(MagicMock(), MagicMock(), deployment('1', observed_generation=1), 10)
+        assert success
+        list_object.assert_called_once()
+
+    @staticmethod
+    def test_absent(monkeypatch):
+        watch_events = events([
+            {'type': 'DELETED', 'object': deployment('2')},
+        ])
+        monkeypatch.setattr(waiter, 'watch_events', watch_events)
+        success, result, duration = watch_wait(MagicMock(), MagicMock(), deployment('1'), 10, state='absent')
+        assert success
+        assert result == {}
+
+    @staticmethod
+    def test_timeout(monkeypatch):
+        monkeypatch.setattr(waiter, 'watch_events', MagicMock(side_effect=lambda *args: stream([])))
+        success, result, duration = watch_wait(MagicMock(), MagicMock(), deployment('1', observed_generation=1), 0.05)
+        assert not success
+        assert duration >= 0.05
+
+
+def rollout(conditions=None):
+    k8s_object = deployment('1')
+    k8s_object['metadata'].update(uid='uid-1', annotations={'deployment.kubernetes.io/revision': '2'})
+    k8s_object['spec']['selector'] = {'matchLabels': {'app': 'foo'}}
+    k8s_object['status']['conditions'] = conditions or list()
+    return k8s_object
+
+
+def replica_set(revision, pod_template_hash):
+    return {
+        'metadata': {'name': f"foo-{pod_template_hash}", 'ownerReferences': [{'uid': 'uid-1'}],
+                     'annotations': {'deployment.kubernetes.io/revision': revision}},
+        'spec': {'selector': {'matchLabels': {'app': 'foo', 'pod-template-hash': pod_template_hash}}}
+    }
+
+
+def pod(name, reason=None):
+    state = {'waiting': {'reason': reason, 'message': 'Back-off pulling image'}} if reason else {'running': {}}
+    return {'metadata': {'name': name}, 'status': {'containerStatuses': [{'name': 'app', 'state': state}]}}
+
+
+def rollout_client(pods):
+    client = MagicMock()
+    listings = {
+        '/apis/apps/v1/namespaces/default/replicasets': [replica_set('1', 'old'), replica_set('2', 'new')],
+        '/api/v1/namespaces/default/pods': pods
+    }
+    client.request.side_effect = lambda method, path, query_params: MagicMock(
+        to_dict=MagicMock(return_value={'items': listings[path]}))
+    return client
+
+
+class TestRolloutFailure:
+
+    @staticmethod
+    def test_label_selector():
+        assert label_selector({'matchLabels': {'app': 'foo'}, 'matchExpressions': [
+            {'key': 'tier', 'operator': 'In', 'values': ['a', 'b']},
+            {'key': 'env', 'operator': 'NotIn', 'values': ['dev']},
+            {'key': 'canary', 'operator': 'Exists'},
+            {'key': 'legacy', 'operator': 'DoesNotExist'},
+        ]}) == 'app=foo,tier in (a,b),env notin (dev),canary,!legacy'
+
+    @staticmethod
+    def test_progress_deadline_exceeded():
+        client = MagicMock()
+        error = deployment_failure(client, rollout([
+            {'type': 'Progressing', 'status': 'False', 'reason': 'ProgressDeadlineExceeded',
+             'message': 'ReplicaSet "foo-new" has timed out progressing.'}
+        ]))
+        assert error.reason == 'ProgressDeadlineExceeded'
+        assert 'exceeded its progress deadline' in str(error)
+        client.request.assert_not_called()
+
+    @staticmethod
+    def test_failed_pod_of_new_replica_set():
+        client = rollout_client([pod('foo-new-a'), pod('foo-new-b', 'ImagePullBackOff')])
+        error = deployment_failure(client, rollout())
+        assert error.reason == 'ImagePullBackOff'
+        assert error.pod == 'foo-new-b'
+        assert str(error) == "Rollout of Deployment foo failed, container app of pod foo-new-b is in " \
+                             "ImagePullBackOff: Back-off pulling image"
+        assert client.request.call_args[1]['query_params'] == [('labelSelector', 'app=foo,pod-template-hash=new')]
+
+    @staticmethod
+    def test_progressing():
+        assert deployment_failure(rollout_client([pod('foo-new-a'), pod('foo-new-b', 'ContainerCreating')]),
+                                  rollout()) is None
+        # new ReplicaSet is not observed yet
+        assert deployment_failure(MagicMock(), deployment('1', observed_generation=1)) is None
+        assert deployment_failure(MagicMock(), None) is None
+
+    @staticmethod
+    def test_watch_wait_fails_fast(monkeypatch):
+        monkeypatch.setattr(waiter, 'ROLLOUT_CHECK_INTERVAL', 0)
+        monkeypatch.setattr(waiter, 'watch_events', MagicMock(side_effect=lambda *args: stream([])))
+        client = rollout_client([pod('foo-new-a', 'CrashLoopBackOff')])
+        not_ready = rollout()
+        not_ready['status']['availableReplicas'] = 0
+        with pytest.raises(RolloutFailed) as e:
+            watch_wait(client, MagicMock(), not_ready, 10)
+        assert e.value.reason == 'CrashLoopBackOff'
+
+    @staticmethod
+    def test_watch_wait_without_rollout_check(monkeypatch):
+        monkeypatch.setattr(waiter, 'watch_events', MagicMock(side_effect=lambda *args: stream([])))
+        client = MagicMock()
+        success, result, duration = watch_wait(client, MagicMock(), {'kind': 'ConfigMap', 'metadata': {
+            'name': 'foo', 'resourceVersion': '1'}}, 0.05, state='absent')
+        assert not success
+        client.request.assert_not_called()
+
+
+def job(conditions=None):
+    return {
+        'kind': 'Job',
+        'metadata': {'name': 'foo', 'namespace': 'default', 'resourceVersion': '1'},
+        'spec': {'selector': {'matchLabels': {'controller-uid': 'uid-1'}}},
+        'status': {'conditions': conditions or list()}
+    }
+
+
+class TestJob:
+
+    @staticmethod
+    def test_complete():
+        ready = predicate('Job')
+        assert ready(job([{'type': 'Complete', 'status': 'True'}]))
+        assert not ready(job())
+        assert not ready(job([{'type': 'Failed', 'status': 'True'}]))
+
+    @staticmethod
+    def test_failed():
+        client = MagicMock()
+        error = job_failure(client, job([{'type': 'Failed', 'status': 'True', 'reason': 'BackoffLimitExceeded',
+                                          'message': 'Job has reached the specified backoff limit'}]))
+        assert error.reason == 'BackoffLimitExceeded'
+        assert str(error) == "Job foo failed: Job has reached the specified backoff limit"
+        client.request.assert_not_called()
+
+    @staticmethod
+    def test_stuck_pod():
+        client = rollout_client([pod('foo-a'), pod('foo-b', 'ErrImagePull')])
+        error = job_failure(client, job())
+        assert error.reason == 'ErrImagePull'
+        assert error.pod == 'foo-b'
+        assert client.request.call_args[1]['query_params'] == [('labelSelector', 'controller-uid=uid-1')]
+
+    @staticmethod
+    def test_running():
+        assert job_failure(rollout_client([pod('foo-a')]), job()) is None
+        assert job_failure(MagicMock(), None) is None
@@ -0,0 +1,164 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock, patch
+from ansible_collections.sodalite.k8s.plugins.module_utils import k8s_connector
+from ansible_collections.sodalite.k8s.plugins.modules.bulk import prepare
+
+items = [
+    dict(kind='config_map', params=dict(name='foo', data=dict(foo='bar'))),
+    dict(kind='secret', params=dict(name='foo', namespace='bar', string_data=dict(foo='bar'))),
+    dict(kind='pvc', params=dict(name='foo', access_modes=['ReadWriteOnce'], storage_request='1Gi')),
+]
+
+
+class TestPrepare:
+
+    @staticmethod
+    def test_valid():
+        module = MagicMock()
+        prepared, errors = prepare(module, items)
+
+        assert errors == []
+        assert [k8s_def['kind'] for _, k8s_def in prepared] == ['ConfigMap', 'Secret', 'PersistentVolumeClaim']
+        assert prepared[0][1]['data'] == {'foo': 'bar'}
+        # defaults of item argspec are applied
+        assert prepared[0][0].params['namespace'] == 'default'
+        assert prepared[0][0].params['immutable'] is False
+        assert prepared[1][0].params['namespace'] == 'bar'
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_invalid_params():
+        module = MagicMock()
+        test_items = items + [dict(kind='config_map', params=dict(data=dict(foo='bar')))]
+        prepared, errors = prepare(module, test_items)
+
+        assert len(prepared) == 3
+        assert len(errors) == 1
+        assert 'items[3]' in errors[0]
+        assert 'name' in errors[0]
+
+    @staticmethod
+    def test_required_if():
+        module = MagicMock()
+        test_items = [dict(kind='pvc', params=dict(name='foo'))]
+        prepared, errors = prepare(module, test_items)
+
+        assert prepared == []
+        assert 'access_modes' in errors[0]
+
+    @staticmethod
+    def test_invalid_definition():
+        module = MagicMock()
+        test_items = [dict(kind='config_map', params=dict(name='_foo', data=dict(foo='bar')))]
+        prepared, errors = prepare(module, test_items)
+
+        assert prepared == []
+        assert 'items[0]' in errors[0]
+        assert 'subdomain' in errors[0].lower()
+
+    @staticmethod
+    def test_absent_not_validated():
+        module = MagicMock()
+        test_items = [dict(kind='config_map', params=dict(name='_foo', state='absent'))]
+        prepared, errors = prepare(module, test_items)
+
+        assert errors == []
+        assert len(prepared) == 1
+
+    @staticmethod
+    def test_workloads():
+        module = MagicMock()
+        pod = dict(containers=[dict(name='foo', image='test-image')])
+        workload = dict(pod, labels=dict(app='foo'), selector=dict(match_labels=dict(app='foo')))
+        test_items = [
+            dict(kind='statefulset', params=dict(workload, name='foo', service_name='foo')),
+            dict(kind='daemonset', params=dict(workload, name='foo')),
+            dict(kind='job', params=dict(pod, name='foo', completions=4, completion_mode='Indexed')),
+        ]
+        prepared, errors = prepare(module, test_items)
+
+        assert errors == []
+        assert [k8s_def['kind'] for _, k8s_def in prepared] == ['StatefulSet', 'DaemonSet', 'Job']
+        assert prepared[2][1]['spec']['template']['spec']['restartPolicy'] == 'Never'
+
+    @staticmethod
+    def test_unsupported_options():
+        module = MagicMock()
+        deployment = dict(name='foo', labels=dict(app='foo'), selector=dict(match_labels=dict(app='foo')),
+                          containers=[dict(name='foo', image='test-image')])
+        test_items = [
+            dict(kind='deployment', params=dict(deployment, update_images=dict(foo='test-image:2'))),
+            dict(kind='deployment', params=dict(deployment, scale_only=True, replicas=2)),
+            dict(kind='deployment', params=dict(deployment, rollout_batch='begin')),
+            dict(kind='statefulset', params=dict(deployment, verify_references=True)),
+            dict(kind='deployment', params=deployment),
+        ]
+        prepared, errors = prepare(module, test_items)
+
+        assert len(prepared) == 1
+        assert errors == [
+            "items[0] (deployment foo): update_images not supported by bulk, use deployment module instead",
+            "items[1] (deployment foo): scale_only not supported by bulk, use deployment module instead",
+            "items[2] (deployment foo): rollout_batch not supported by bulk, use deployment module instead",
+            "items[3] (statefulset foo): verify_references not supported by bulk, use statefulset module instead",
+        ]
+
+    @staticmethod
+    def test_connection_options():
+        module = MagicMock()
+        test_items = [
+            dict(kind='config_map', params=dict(name='foo', data=dict(foo='bar'), host='https://other:6443')),
+            dict(kind='config_map', params=dict(name='bar', data=dict(foo='bar'), kubeconfig='other', context='dev')),
+        ]
+        prepared, errors = prepare(module, test_items)
+
+        assert prepared == []
+        assert errors == [
+            "items[0] (config_map foo): host not supported in items, set them on the bulk task instead",
+            "items[1] (config_map bar): kubeconfig, context not supported in items, set them on the bulk task instead",
+        ]
+
+
+class K8sAnsibleMixin:
+    """
+    Stand-in for K8sAnsibleMixin of kubernetes.core, with just what apply_item uses of it.
+    """
+
+    def __init__(self, module):
+        self.module = module
+
+    def find_resource(self, kind, api_version, fail=False):
+        return None
+
+    def wait(self, *args, **kwargs):
+        return True, dict(), 0
+
+    def check_library_version(self):
+        pass
+
+
+class TestApplyItem:
+
+    @staticmethod
+    def test_changed():
+        module = MagicMock(check_mode=False, _diff=True)
+        prepared, errors = prepare(module, [dict(kind='config_map', params=dict(name='foo', data=dict(foo='baz')))])
+        item_module, k8s_def = prepared[0]
+        live = dict(k8s_def, metadata=dict(name='foo', namespace='default', resourceVersion='1'), data=dict(foo='bar'))
+        patched = dict(live, metadata=dict(live['metadata'], resourceVersion='2'), data=dict(foo='baz'))
+        client = MagicMock()
+        client.get.return_value.to_dict.return_value = live
+        client.patch.return_value.to_dict.return_value = patched
+
+        with patch.object(k8s_connector.k8s_common, 'K8sAnsibleMixin', K8sAnsibleMixin, create=True):
+            result = k8s_connector.apply_item(item_module, client, k8s_def)
+
+        assert result['changed'] is True
+        assert result['result'] == patched
+        assert result['diff'] == dict(before=dict(data=dict(foo='bar')), after=dict(data=dict(foo='baz')))
+        # one read and one write
+        client.get.assert_called_once()
+        assert client.patch.call_args[0][1]['data'] == dict(foo='baz')
@@ -2,7 +2,13 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import base64
+
+import pytest
+
 from unittest.mock import MagicMock
+from ansible_collections.sodalite.k8s.plugins.module_utils.bulk import DefinitionError
+from ansible_collections.sodalite.k8s.plugins.module_utils.resources import config_map
 from ansible_collections.sodalite.k8s.plugins.modules.config_map import validate, definition
 
 from copy import deepcopy
@@ -136,3 +142,81 @@ class TestDefinition:
         }
         assert definition(test_params) == test_def, \
             print(f'test_def={test_def}, definition(test_params)={definition(test_params)}')
+
+
+class TestSources:
+
+    @staticmethod
+    def test_from_files(tmp_path):
+        (tmp_path / 'app.conf').write_text('listen: 8080\n')
+        (tmp_path / 'logo.png').write_bytes(b'\x89PNG\xff\x00')
+        (tmp_path / 'empty').write_bytes(b'')
+        test_params = dict(name='foo', data=dict(foo='bar'), from_files=[
+            str(tmp_path / 'app.conf'), f"image={tmp_path / 'logo.png'}", str(tmp_path / 'empty')
+        ])
+        test_def = definition(test_params)
+        assert test_def['data'] == {'foo': 'bar', 'app.conf': 'listen: 8080\n', 'empty': ''}
+        assert test_def['binaryData'] == {'image': base64.b64encode(b'\x89PNG\xff\x00').decode()}
+        assert test_params['data'] == dict(foo='bar')
+
+        module = MagicMock()
+        validate(module, test_def)
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_from_dir(tmp_path):
+        (tmp_path / 'b.txt').write_text('b')
+        (tmp_path / 'a.txt').write_text('a')
+        (tmp_path / 'nested').mkdir()
+        (tmp_path / 'nested' / 'c.txt').write_text('c')
+        test_def = definition(dict(name='foo', from_dir=str(tmp_path)))
+        assert list(test_def['data'].items()) == [('a.txt', 'a'), ('b.txt', 'b')]
+
+    @staticmethod
+    def test_absent_skips_sources():
+        test_def = definition(dict(name='foo', state='absent', from_dir='/nonexistent'))
+        assert 'data' not in test_def
+
+    @staticmethod
+    def test_duplicate_key(tmp_path):
+        (tmp_path / 'foo').write_text('a')
+        with pytest.raises(DefinitionError, match='more than once'):
+            definition(dict(name='foo', data=dict(foo='bar'), from_files=[str(tmp_path / 'foo')]))
+
+    @staticmethod
+    def test_missing_file(tmp_path):
+        with pytest.raises(DefinitionError, match='Cannot read'):
+            definition(dict(name='foo', from_files=[str(tmp_path / 'missing')]))
+        with pytest.raises(DefinitionError, match='Cannot read from_dir'):
+            definition(dict(name='foo', from_dir=str(tmp_path / 'missing')))
+
+    @staticmethod
+    def test_size_limit(tmp_path, monkeypatch):
+        (tmp_path / 'big').write_bytes(b'x' * 100)
+        read_file = MagicMock()
+        monkeypatch.setattr(config_map, 'MAX_DATA_SIZE', 100)
+        monkeypatch.setattr(config_map, 'read_file', read_file)
+        with pytest.raises(DefinitionError, match='more than limit'):
+            definition(dict(name='foo', binary_data=dict(a='eA=='), from_files=[str(tmp_path / 'big')]))
+        read_file.assert_not_called()
+
+
+class TestVersioned:
+
+    @staticmethod
+    def test_definition():
+        test_def = definition(dict(name='foo', versioned=True, immutable=False, data=dict(foo1='bar')))
+        assert test_def['metadata']['name'].startswith('foo-')
+        assert test_def['metadata']['labels'] == {'sodalite.k8s/versioned-name': 'foo'}
+        assert test_def['immutable'] is True
+
+        module = MagicMock()
+        validate(module, test_def)
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_long_name():
+        module = MagicMock()
+        validate(module, definition(dict(name='a' * 64, versioned=True, data=dict(foo1='bar'))))
+        module.fail_json.assert_called()
+        assert '63 characters' in module.fail_json.call_args[1]['msg']
@@ -0,0 +1,89 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+from ansible_collections.sodalite.k8s.plugins.modules.daemonset import validate, definition, canonicalize
+
+from copy import deepcopy
+
+params = dict(
+    name='foo',
+    labels=dict(app='foo'),
+    selector=dict(match_labels=dict(app='foo')),
+    containers=[dict(
+        name='container-foo',
+        image='test-image',
+        ports=[dict(container_port=6379, host_port=6379, protocol='TCP')]
+    )],
+    enable_service_links=True,
+    min_ready_seconds=0,
+    update_strategy=dict(type='RollingUpdate', max_unavailable='10%'),
+    revision_history_limit=10,
+)
+
+k8s_def = {
+    'apiVersion': 'apps/v1',
+    'kind': 'DaemonSet',
+    'metadata': {'name': 'foo', 'labels': {'app': 'foo'}},
+    'spec': {
+        'selector': {'matchLabels': {'app': 'foo'}},
+        'template': {
+            'metadata': {'name': 'foo', 'labels': {'app': 'foo'}},
+            'spec': {
+                'containers': [{'name': 'container-foo', 'image': 'test-image',
+                                'ports': [{'containerPort': 6379, 'hostPort': 6379, 'protocol': 'TCP'}]}],
+                'enableServiceLinks': True
+            }
+        },
+        'minReadySeconds': 0,
+        'updateStrategy': {'type': 'RollingUpdate', 'rollingUpdate': {'maxUnavailable': '10%'}},
+        'revisionHistoryLimit': 10
+    }
+}
+
+
+class TestDefinition:
+
+    @staticmethod
+    def test_params():
+        assert definition(params) == k8s_def
+
+
+class TestValid:
+
+    @staticmethod
+    def test_valid():
+        module = MagicMock()
+        validate(module, k8s_def)
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_rolling_update_with_on_delete():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        test_def['spec']['updateStrategy']['type'] = 'OnDelete'
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert 'can only be present if update_strategy.type==RollingUpdate' in fail_msg, fail_msg
+
+    @staticmethod
+    def test_missing_containers():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        del test_def['spec']['template']['spec']['containers']
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == "There must be at least one container in a Pod.", fail_msg
+
+
+class TestCanonicalize:
+
+    @staticmethod
+    def test_defaults():
+        test_def = canonicalize(deepcopy(k8s_def))
+        assert test_def['spec']['updateStrategy']['rollingUpdate'] == {'maxSurge': 0, 'maxUnavailable': '10%'}
+
+        test_def = canonicalize(definition(dict(params, update_strategy=None)))
+        assert test_def['spec']['updateStrategy'] == {'type': 'RollingUpdate',
+                                                      'rollingUpdate': {'maxSurge': 0, 'maxUnavailable': 1}}
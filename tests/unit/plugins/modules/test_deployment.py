@@ -3,8 +3,11 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from unittest.mock import MagicMock, patch, call
-from ansible_collections.sodalite.k8s.plugins.modules.deployment import validate, definition
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible_collections.sodalite.k8s.plugins.modules.deployment import validate, definition, canonicalize, \
+    references, validate_images, validate_scale, argument_spec, MUTUALLY_EXCLUSIVE, REQUIRED_IF
 from ansible_collections.sodalite.k8s.plugins.module_utils.common import CommonValidation
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import contains
 
 from copy import deepcopy
 
@@ -300,7 +303,7 @@ full_def = {
                                 'memory': '8Gi'
                             },
                             'requests': {
-                                'cpu': "0.1",
+                                'cpu': "100m",
                                 'memory': '4Gi'
                             }
                         }
@@ -447,6 +450,137 @@ class TestDefinition:
             print(f'test_def={min_def}, definition(test_params)={definition(min_params)}')
 
 
+class TestRolloutBatch:
+
+    @staticmethod
+    def test_paused_omitted():
+        params = dict(min_params, paused=None)
+        assert 'paused' not in definition(params)['spec']
+
+    @staticmethod
+    def test_begin_pauses():
+        params = dict(min_params, paused=None, rollout_batch='begin')
+        assert definition(params)['spec']['paused'] is True
+
+    @staticmethod
+    def test_commit_resumes():
+        params = dict(min_params, paused=None, rollout_batch='commit')
+        assert definition(params)['spec']['paused'] is False
+
+
+class TestCanonicalize:
+
+    @staticmethod
+    def test_server_defaults():
+        test_def = canonicalize(deepcopy(min_def))
+        assert test_def['spec']['strategy'] == {
+            'type': 'RollingUpdate', 'rollingUpdate': {'maxSurge': '25%', 'maxUnavailable': '25%'}
+        }
+        pod_spec = test_def['spec']['template']['spec']
+        assert pod_spec['restartPolicy'] == 'Always'
+        assert pod_spec['dnsPolicy'] == 'ClusterFirst'
+        assert pod_spec['terminationGracePeriodSeconds'] == 30
+        assert pod_spec['schedulerName'] == 'default-scheduler'
+        assert pod_spec['containers'][0]['imagePullPolicy'] == 'Always'
+        assert pod_spec['containers'][0]['terminationMessagePolicy'] == 'File'
+
+    @staticmethod
+    def test_keeps_values():
+        test_def = deepcopy(min_def)
+        test_def['spec']['strategy'] = {'type': 'RollingUpdate', 'rollingUpdate': {'maxUnavailable': '1'}}
+        test_def['spec']['template']['spec']['containers'][0]['imagePullPolicy'] = 'Never'
+        canonicalize(test_def)
+        assert test_def['spec']['strategy']['rollingUpdate'] == {'maxSurge': '25%', 'maxUnavailable': 1}
+        assert test_def['spec']['template']['spec']['containers'][0]['imagePullPolicy'] == 'Never'
+
+        test_def['spec']['strategy'] = {'type': 'Recreate'}
+        assert 'rollingUpdate' not in canonicalize(test_def)['spec']['strategy']
+
+    @staticmethod
+    def test_contained_in_live():
+        params = dict(full_params, min_ready_seconds=0, paused=False, volumes=deepcopy(full_params['volumes']))
+        params['volumes'][2]['pvc']['read_only'] = False
+        test_def = canonicalize(definition(params))
+
+        # as returned by the API server: server-side fields added, zero values of omitempty fields omitted
+        live = deepcopy(test_def)
+        live['metadata'].update(namespace='default', uid='6f2c', resourceVersion='42', generation=1)
+        del live['spec']['minReadySeconds']
+        del live['spec']['paused']
+        pod_spec = live['spec']['template']['spec']
+        pod_spec['securityContext'] = {}
+        del pod_spec['containers'][0]['volumeMounts'][1]['readOnly']
+        del pod_spec['volumes'][2]['persistentVolumeClaim']['readOnly']
+        live['status'] = {'observedGeneration': 1, 'replicas': 3, 'readyReplicas': 3}
+        assert contains(live, test_def)
+
+        pod_spec['containers'][0]['volumeMounts'][1]['readOnly'] = True
+        assert not contains(live, test_def)
+
+
+class TestReferences:
+
+    @staticmethod
+    def test_references():
+        assert references(full_def) == {
+            ('v1', 'ConfigMap'): {
+                'db-config': ['containers[0].env[1].config_map', 'containers[0].env_from[0].config_map'],
+                'app-config': ['volumes[0].config_map']
+            },
+            # secretKeyRef of containers[0].env[2] is optional
+            ('v1', 'Secret'): {
+                'db-secret-config': ['containers[0].env_from[1].secret'],
+                'app-secret': ['volumes[1].secret']
+            },
+            ('v1', 'PersistentVolumeClaim'): {
+                'pvc-clain': ['volumes[2].pvc']
+            }
+        }
+
+    @staticmethod
+    def test_no_references():
+        assert references(min_def) == dict()
+
+
+class TestUpdateImages:
+
+    @staticmethod
+    def test_valid():
+        module = MagicMock()
+        validate_images(module, dict(name='foo', update_images={'container-foo': 'test-image:2'}))
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_invalid_container_name():
+        module = MagicMock()
+        validate_images(module, dict(name='foo', update_images={'Container_Foo': 'test-image:2'}))
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert 'update_images key Container_Foo' in fail_msg, fail_msg
+
+    @staticmethod
+    def test_empty_image():
+        module = MagicMock()
+        validate_images(module, dict(name='foo', update_images={'container-foo': ''}))
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == 'update_images must map container names to images', fail_msg
+
+
+class TestScale:
+
+    @staticmethod
+    def test_valid():
+        module = MagicMock()
+        validate_scale(module, dict(name='foo', replicas=0, scale_only=True))
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_negative_replicas():
+        module = MagicMock()
+        validate_scale(module, dict(name='foo', replicas=-1, scale_only=True))
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == 'replicas must be greater than or equal to 0', fail_msg
+
+
 class TestValid:
 
     @staticmethod
@@ -492,6 +626,18 @@ class TestValid:
             validate(module, full_def)
             mock_selector.assert_called_once_with(module, full_def)
 
+    @staticmethod
+    def test_missing_labels_and_selector():
+        for key, test_def in (('labels', deepcopy(full_def)), ('selector', deepcopy(full_def))):
+            if key == 'labels':
+                del test_def['metadata']['labels']
+            else:
+                del test_def['spec']['selector']
+            module = MagicMock()
+            validate(module, test_def)
+            fail_msg = module.fail_json.call_args[1]['msg']
+            assert fail_msg == f"state is present but all of the following are missing: {key}", fail_msg
+
     @staticmethod
     def test_no_containers():
         module = MagicMock()
@@ -858,6 +1004,18 @@ class TestValid:
         assert 'resource_requests.memory' in fail_msg, fail_msg
         assert "Quantities" in fail_msg, fail_msg
 
+    @staticmethod
+    def test_requests_over_limits():
+        module = MagicMock()
+        test_def = deepcopy(full_def)
+        test_def['spec']['template']['spec']['containers'][0]['resources']['requests']['memory'] = '8193Mi'
+
+        validate(module, test_def)
+        module.fail_json.assert_called()
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert 'containers[0].resource_requests.memory' in fail_msg, fail_msg
+        assert 'less than or equal to resource_limits' in fail_msg, fail_msg
+
     @staticmethod
     def test_invalid_volume_name():
         module = MagicMock()
@@ -892,4 +1050,36 @@ class TestValid:
         module.fail_json.assert_called()
         fail_msg = module.fail_json.call_args[1]['msg'].lower()
         assert 'more then one volume source' in fail_msg, fail_msg
-        assert 'one of (pvc, config_map, secret)' in fail_msg, fail_msg
+        assert 'one of (pvc, config_map, secret, empty_dir)' in fail_msg, fail_msg
+
+
+class TestArgumentSpec:
+
+    @staticmethod
+    def validated(params):
+        validator = ArgumentSpecValidator(argument_spec(), mutually_exclusive=MUTUALLY_EXCLUSIVE,
+                                          required_if=REQUIRED_IF)
+        return validator.validate(dict(params, name='foo'))
+
+    def test_scale_only_requires_replicas(self):
+        result = self.validated(dict(scale_only=True))
+        assert result.error_messages == ['scale_only is True but all of the following are missing: replicas']
+        assert not self.validated(dict(scale_only=True, replicas=0)).error_messages
+
+    def test_replicas_omitted(self):
+        # API server sets 1 on create, patches keep replicas of the existing deployment
+        result = self.validated(dict(min_params, replicas=None))
+        assert not result.error_messages
+        assert 'replicas' not in definition(result.validated_parameters)['spec']
+
+    @staticmethod
+    def unpaused(**params):
+        return dict({key: value for key, value in min_params.items() if key != 'paused'}, **params)
+
+    def test_rollout_batch_excludes_apply(self):
+        result = self.validated(self.unpaused(rollout_batch='begin', apply=True))
+        assert result.error_messages == ['parameters are mutually exclusive: rollout_batch|apply']
+
+    def test_rollout_batch_excludes_server_side_apply(self):
+        result = self.validated(self.unpaused(rollout_batch='commit', server_side_apply=dict()))
+        assert result.error_messages == ['parameters are mutually exclusive: rollout_batch|server_side_apply']
@@ -0,0 +1,104 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+from ansible_collections.sodalite.k8s.plugins.modules.job import validate, definition, canonicalize
+
+from copy import deepcopy
+
+params = dict(
+    name='foo',
+    containers=[dict(name='worker', image='test-image', args=['--shard', '$(JOB_COMPLETION_INDEX)'])],
+    enable_service_links=True,
+    restart_policy='OnFailure',
+    parallelism=10,
+    completions=100,
+    completion_mode='Indexed',
+    backoff_limit=4,
+    ttl_seconds_after_finished=3600,
+)
+
+k8s_def = {
+    'apiVersion': 'batch/v1',
+    'kind': 'Job',
+    'metadata': {'name': 'foo'},
+    'spec': {
+        'template': {
+            'metadata': {'name': 'foo'},
+            'spec': {
+                'containers': [{'name': 'worker', 'image': 'test-image',
+                                'args': ['--shard', '$(JOB_COMPLETION_INDEX)']}],
+                'restartPolicy': 'OnFailure',
+                'enableServiceLinks': True
+            }
+        },
+        'parallelism': 10,
+        'completions': 100,
+        'completionMode': 'Indexed',
+        'backoffLimit': 4,
+        'ttlSecondsAfterFinished': 3600
+    }
+}
+
+
+class TestDefinition:
+
+    @staticmethod
+    def test_params():
+        assert definition(params) == k8s_def
+
+
+class TestValid:
+
+    @staticmethod
+    def test_valid():
+        module = MagicMock()
+        validate(module, k8s_def)
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_indexed_without_completions():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        del test_def['spec']['completions']
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == "completions is required with completion_mode=Indexed", fail_msg
+
+    @staticmethod
+    def test_indexed_too_many_completions():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        test_def['spec']['completions'] = 10 ** 5 + 1
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == "completions must be less than or equal to 100000 with completion_mode=Indexed", fail_msg
+
+    @staticmethod
+    def test_negative_parallelism():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        test_def['spec']['parallelism'] = -1
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == "parallelism must be greater than or equal to 0", fail_msg
+
+
+class TestCanonicalize:
+
+    @staticmethod
+    def test_defaults():
+        test_def = canonicalize(definition(dict(params, parallelism=None, completions=None, completion_mode=None,
+                                                backoff_limit=None)))
+        spec = test_def['spec']
+        assert (spec['parallelism'], spec['completions'], spec['completionMode'], spec['backoffLimit']) == \
+            (1, 1, 'NonIndexed', 6)
+        assert spec['suspend'] is False
+        assert spec['template']['spec']['restartPolicy'] == 'OnFailure'
+
+    @staticmethod
+    def test_work_queue():
+        spec = canonicalize(definition(dict(params, completions=None, completion_mode=None)))['spec']
+        assert spec['parallelism'] == 10
+        assert 'completions' not in spec
@@ -3,7 +3,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from unittest.mock import MagicMock
-from ansible_collections.sodalite.k8s.plugins.modules.namespace import validate, definition
+from ansible_collections.sodalite.k8s.plugins.modules.namespace import validate, definition, canonicalize
 
 from copy import deepcopy
 
@@ -80,3 +80,11 @@ class TestDefinition:
         test_def['metadata'].pop('annotations')
 
         assert definition(test_params) == test_def
+
+
+class TestCanonicalize:
+
+    @staticmethod
+    def test_name_label():
+        test_def = canonicalize(definition(dict(name='foo')))
+        assert test_def['metadata']['labels'] == {'kubernetes.io/metadata.name': 'foo'}
@@ -176,3 +176,10 @@ class TestDefinition:
 
         assert definition(min_params) == min_def, \
             print(f'test_def={min_def}, definition(test_params)={definition(min_params)}')
+
+    @staticmethod
+    def test_canonical_quantities():
+        test_params = deepcopy(full_params)
+        test_params['storage_request'] = '4096Mi'
+        test_params['storage_limit'] = '8.0Gi'
+        assert definition(test_params) == full_def
@@ -3,7 +3,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from unittest.mock import MagicMock
-from ansible_collections.sodalite.k8s.plugins.modules.secret import validate, definition
+from ansible_collections.sodalite.k8s.plugins.modules.secret import validate, definition, canonicalize
 
 from copy import deepcopy
 
@@ -135,3 +135,33 @@ class TestDefinition:
     def test_full_params():
         assert definition(test_params) == full_def, \
             print(f'full_def={full_def}, definition(test_params)={definition(test_params)}')
+
+
+class TestVersioned:
+
+    @staticmethod
+    def test_definition():
+        test_def = definition(dict(name='foo', versioned=True, immutable=False, data=dict(foo='YmFy')))
+        assert test_def['metadata']['name'].startswith('foo-')
+        assert test_def['metadata']['labels'] == {'sodalite.k8s/versioned-name': 'foo'}
+        assert test_def['immutable'] is True
+
+        module = MagicMock()
+        validate(module, test_def)
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_long_name():
+        module = MagicMock()
+        validate(module, definition(dict(name='a' * 64, versioned=True, data=dict(foo='YmFy'))))
+        module.fail_json.assert_called()
+        assert '63 characters' in module.fail_json.call_args[1]['msg']
+
+
+class TestCanonicalize:
+
+    @staticmethod
+    def test_string_data():
+        test_def = canonicalize(definition(dict(name='foo', data=dict(foo='YmFy'), string_data=dict(bar='bär'))))
+        assert 'stringData' not in test_def
+        assert test_def['data'] == {'foo': 'YmFy', 'bar': 'YsOkcg=='}
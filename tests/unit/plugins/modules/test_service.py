@@ -3,8 +3,10 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from unittest.mock import MagicMock, patch
-from ansible_collections.sodalite.k8s.plugins.modules.service import validate, definition
+from ansible_collections.sodalite.k8s.plugins.modules.service import validate, definition, canonicalize, \
+    removed_entries
 from ansible_collections.sodalite.k8s.plugins.module_utils.common import CommonValidation
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import contains
 
 from copy import deepcopy
 
@@ -175,6 +177,86 @@ class TestDefinition:
             print(f'test_def={min_def}, definition(test_params)={definition(min_params)}')
 
 
+class TestCanonicalize:
+
+    @staticmethod
+    def test_server_defaults():
+        test_def = deepcopy(min_def)
+        del test_def['spec']['ports'][0]['targetPort']
+        test_def['spec']['type'] = 'NodePort'
+        test_def['spec']['sessionAffinity'] = 'ClientIP'
+        canonicalize(test_def)
+        assert test_def['spec']['ports'][0]['targetPort'] == 8080
+        assert test_def['spec']['externalTrafficPolicy'] == 'Cluster'
+        assert test_def['spec']['sessionAffinityConfig'] == {'clientIP': {'timeoutSeconds': 10800}}
+
+    @staticmethod
+    def test_keeps_values():
+        test_def = canonicalize(deepcopy(min_def))
+        assert test_def['spec']['ports'][0]['targetPort'] == 'my-port'
+        assert 'externalTrafficPolicy' not in test_def['spec']
+
+    @staticmethod
+    def test_contained_in_live():
+        test_def = canonicalize(definition(dict(min_params, selector=dict(app='foo'))))
+        assert test_def['spec']['publishNotReadyAddresses'] is False
+
+        # as returned by the API server: allocated and defaulted fields added, publishNotReadyAddresses omitted
+        live = deepcopy(test_def)
+        live['metadata'].update(namespace='default', uid='6f2c', resourceVersion='42')
+        del live['spec']['publishNotReadyAddresses']
+        live['spec'].update(clusterIP='10.96.0.12', clusterIPs=['10.96.0.12'], ipFamilies=['IPv4'],
+                            ipFamilyPolicy='SingleStack')
+        live['status'] = {'loadBalancer': {}}
+        assert contains(live, test_def)
+
+        live['spec']['publishNotReadyAddresses'] = True
+        assert not contains(live, test_def)
+
+
+class TestCollapseRanges:
+    params = dict(min_params, type='LoadBalancer', external_ips=['1.2.3.4', '5.6.7.8', '1.2.3.4'],
+                  load_balancer_source_ranges=['10.0.1.0/24', '10.0.0.0/16', '10.1.0.0/16', '10.0.0.0/16'])
+
+    @staticmethod
+    def test_collapse():
+        params = dict(TestCollapseRanges.params, collapse_ranges=True)
+        test_def = definition(params)
+        assert test_def['spec']['externalIPs'] == ['1.2.3.4', '5.6.7.8']
+        assert test_def['spec']['loadBalancerSourceRanges'] == ['10.0.0.0/15']
+        assert removed_entries(params, test_def) == dict(external_ips=1, load_balancer_source_ranges=3)
+        assert params['load_balancer_source_ranges'] == TestCollapseRanges.params['load_balancer_source_ranges']
+
+    @staticmethod
+    def test_no_collapse():
+        test_def = definition(TestCollapseRanges.params)
+        assert test_def['spec']['externalIPs'] == TestCollapseRanges.params['external_ips']
+        assert test_def['spec']['loadBalancerSourceRanges'] == \
+            TestCollapseRanges.params['load_balancer_source_ranges']
+
+    @staticmethod
+    def test_invalid_not_collapsed():
+        params = dict(TestCollapseRanges.params, collapse_ranges=True, load_balancer_source_ranges=['foo', 'foo'])
+        assert definition(params)['spec']['loadBalancerSourceRanges'] == ['foo', 'foo']
+
+    @staticmethod
+    def test_warn_redundant():
+        module = MagicMock()
+        validate(module, definition(TestCollapseRanges.params))
+        module.fail_json.assert_not_called()
+        warnings = [call[0][0] for call in module.warn.call_args_list]
+        assert len(warnings) == 2, warnings
+        assert warnings[0].startswith("1 of 3 entries of external_ips are redundant, e.g. external_ips[2] (1.2.3.4) "
+                                      "is covered by external_ips[0] (1.2.3.4)"), warnings[0]
+        assert warnings[1].startswith("2 of 4 entries of load_balancer_source_ranges are redundant, "
+                                      "e.g. load_balancer_source_ranges[0] (10.0.1.0/24) is covered by "
+                                      "load_balancer_source_ranges[1] (10.0.0.0/16)"), warnings[1]
+
+        module = MagicMock()
+        validate(module, definition(dict(TestCollapseRanges.params, collapse_ranges=True)))
+        module.warn.assert_not_called()
+
+
 class TestValid:
     cluster_ip_max_def = {
         "apiVersion": "v1",
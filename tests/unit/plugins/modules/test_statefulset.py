@@ -0,0 +1,152 @@
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible_collections.sodalite.k8s.plugins.modules.statefulset import (argument_spec, validate, definition,
+                                                                          canonicalize, MUTUALLY_EXCLUSIVE)
+from ansible_collections.sodalite.k8s.plugins.module_utils.helper import contains
+
+from copy import deepcopy
+
+params = dict(
+    name='foo',
+    labels=dict(app='foo'),
+    selector=dict(match_labels=dict(app='foo')),
+    service_name='foo',
+    containers=[dict(
+        name='container-foo',
+        image='test-image',
+        volume_mounts=[dict(name='data', path='/data', read_only=False)]
+    )],
+    enable_service_links=True,
+    volume_claim_templates=[dict(
+        name='data',
+        access_modes=['ReadWriteOnce'],
+        storage_request='1Gi',
+        volume_mode='Filesystem'
+    )],
+    replicas=3,
+    min_ready_seconds=0,
+    pod_management_policy='Parallel',
+    update_strategy=dict(type='RollingUpdate', partition=1),
+    revision_history_limit=10,
+)
+
+k8s_def = {
+    'apiVersion': 'apps/v1',
+    'kind': 'StatefulSet',
+    'metadata': {'name': 'foo', 'labels': {'app': 'foo'}},
+    'spec': {
+        'selector': {'matchLabels': {'app': 'foo'}},
+        'serviceName': 'foo',
+        'template': {
+            'metadata': {'name': 'foo', 'labels': {'app': 'foo'}},
+            'spec': {
+                'containers': [{'name': 'container-foo', 'image': 'test-image',
+                                'volumeMounts': [{'name': 'data', 'mountPath': '/data', 'readOnly': False}]}],
+                'enableServiceLinks': True
+            }
+        },
+        'volumeClaimTemplates': [{
+            'apiVersion': 'v1',
+            'kind': 'PersistentVolumeClaim',
+            'metadata': {'name': 'data'},
+            'spec': {'accessModes': ['ReadWriteOnce'], 'resources': {'requests': {'storage': '1Gi'}},
+                     'volumeMode': 'Filesystem'}
+        }],
+        'replicas': 3,
+        'minReadySeconds': 0,
+        'podManagementPolicy': 'Parallel',
+        'updateStrategy': {'type': 'RollingUpdate', 'rollingUpdate': {'partition': 1}},
+        'revisionHistoryLimit': 10
+    }
+}
+
+
+class TestDefinition:
+
+    @staticmethod
+    def test_params():
+        assert definition(params) == k8s_def
+
+    @staticmethod
+    def test_replicas_omitted():
+        # API server sets 1 on create, patches keep replicas of the existing statefulset
+        validator = ArgumentSpecValidator(argument_spec(), mutually_exclusive=MUTUALLY_EXCLUSIVE)
+        result = validator.validate({key: value for key, value in params.items() if key != 'replicas'})
+        assert not result.error_messages
+        assert 'replicas' not in definition(result.validated_parameters)['spec']
+
+
+class TestValid:
+
+    @staticmethod
+    def test_valid():
+        module = MagicMock()
+        validate(module, k8s_def)
+        module.fail_json.assert_not_called()
+
+    @staticmethod
+    def test_mount_of_missing_claim():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        test_def['spec']['volumeClaimTemplates'][0]['metadata']['name'] = 'other'
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == "containers[0].volume_mounts[0].name not found. Every name should match the Name of a " \
+                           "Volume.", fail_msg
+
+    @staticmethod
+    def test_invalid_claim():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        test_def['spec']['volumeClaimTemplates'][0]['spec']['resources']['requests']['storage'] = 'lots'
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == "Storage_request should be map[string]Quantity", fail_msg
+
+    @staticmethod
+    def test_partition_with_on_delete():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        test_def['spec']['updateStrategy']['type'] = 'OnDelete'
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert 'can only be present if update_strategy.type==RollingUpdate' in fail_msg, fail_msg
+
+    @staticmethod
+    def test_missing_selector():
+        module = MagicMock()
+        test_def = deepcopy(k8s_def)
+        del test_def['spec']['selector']
+        validate(module, test_def)
+        fail_msg = module.fail_json.call_args[1]['msg']
+        assert fail_msg == "state is present but all of the following are missing: selector", fail_msg
+
+
+class TestCanonicalize:
+
+    @staticmethod
+    def test_defaults():
+        test_def = definition(dict(params, update_strategy=None))
+        canonicalize(test_def)
+        assert test_def['spec']['updateStrategy'] == {'type': 'RollingUpdate', 'rollingUpdate': {'partition': 0}}
+        assert test_def['spec']['template']['spec']['restartPolicy'] == 'Always'
+
+    @staticmethod
+    def test_contained_in_live():
+        test_def = canonicalize(definition(params))
+
+        # as returned by the API server: zero values of omitempty fields omitted, status of claim templates added
+        live = deepcopy(test_def)
+        live['metadata'].update(namespace='default', uid='6f2c', resourceVersion='42', generation=1)
+        del live['spec']['minReadySeconds']
+        del live['spec']['template']['spec']['containers'][0]['volumeMounts'][0]['readOnly']
+        live['spec']['volumeClaimTemplates'][0]['status'] = {'phase': 'Pending'}
+        live['status'] = {'observedGeneration': 1, 'replicas': 3}
+        assert contains(live, test_def)
+
+        live['spec']['minReadySeconds'] = 10
+        assert not contains(live, test_def)